@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""###############################################################################
+   P4 BATCH
+
+    Plots many Parameter files in one go, sharing them out between a number
+    of worker processes. Each Parameter file is plotted and saved exactly as
+    if P4_v02.py had been run on it from the cmd line, but a problem with one
+    file (for example a missing Input file or a style code out of range) only
+    stops that plot. The rest of the batch carries on.
+
+    Parameter files are given on the cmd line, as names or patterns such as
+    cores/*_Parameter.csv, and/or in a manifest file listing one Parameter
+    file per line (blank lines and lines starting with # are ignored,
+    relative names are found from the folder the manifest is in).
+
+    When all plots have finished a summary of each one (whether it was
+    saved, the time taken, the files saved and the problem if there was one)
+    is printed and saved as a csv file. Run for example as
+
+    python P4_batch.py cores/*_Parameter.csv --workers 4
+
+###############################################################################"""
+
+import os
+import io
+import sys
+import glob
+import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+import P4_v02
+
+###############################################################################
+###############################################################################
+# Create arguments for command line.
+parser = argparse.ArgumentParser(description = \
+                            "Plot many P4 Parameter files in one go")
+parser.add_argument('parameter_files', action = 'store', type = str, \
+                    nargs = '*', \
+                    help = "Parameter files or patterns of Parameter files.")
+parser.add_argument('--manifest', action = 'store', type = str, \
+                    help = "File listing one Parameter file per line.")
+parser.add_argument('--workers', action = 'store', type = int, \
+                    default = os.cpu_count(), \
+                    help = "Number of worker processes.")
+parser.add_argument('--summary', action = 'store', type = str, \
+                    default = "P4_batch_summary.csv", \
+                    help = "Name of the csv file the summary is saved to.")
+
+###############################################################################
+###############################################################################
+# Function to make the list of Parameter files from the cmd line names and
+# patterns and the manifest. Each file is only plotted once.
+def find_parameter_files(names, manifest):
+    if manifest is not None:
+        manifest_dir = os.path.dirname(manifest)
+
+        with open(manifest) as manifest_file:
+            for line in manifest_file:
+                if line.strip() != "" and line.strip().startswith("#") == \
+                    False:
+                    names = names + [os.path.join(manifest_dir, \
+                                                  line.strip())]
+
+    parameter_files = []
+
+    for name in names:
+        matches = sorted(glob.glob(name)) if glob.has_magic(name) else [name]
+
+        for parameter_file in matches:
+            parameter_file = os.path.abspath(parameter_file)
+
+            if parameter_file not in parameter_files:
+                parameter_files.append(parameter_file)
+
+    return parameter_files
+
+# Function to plot and save one Parameter file as the cmd line does. Runs
+# in a worker process. Anything P4 prints is kept so that if it stops on a
+# problem the message (everything printed after its last progress banner)
+# can go in the summary.
+def run_job(parameter_file):
+    printed = io.StringIO()
+    saved = []
+    start = time.perf_counter()
+
+    # The workers already share out the plots so each plot is drawn and
+    # saved in this process only. The png panels are drawn in one go rather
+    # than by forked panel workers (see --panel-workers in P4_v02.py) and
+    # the formats are saved in turn below rather than by forked workers, so
+    # no more processes are started than --workers.
+    P4_v02.panel_workers = 1
+
+    with contextlib.redirect_stdout(printed):
+        try:
+            par, parameter_dir = P4_v02.read_parameter_file(parameter_file)
+            par_dict = {Q: R for Q, R in zip(par["PARAMETERS"], \
+                                             par["ENTRY"])}
+
+            fig = P4_v02.render(parameter_file)
+
+            save_formats = P4_v02.read_save_formats(par_dict)
+            dpi_num = P4_v02.read_png_dpi(par_dict) if "png" in \
+                save_formats else None
+
+            output_name = os.path.join(parameter_dir, \
+                                       str(par_dict["Directory**"]), \
+                                       par_dict["Output file name**"])
+
+            for save_format in save_formats:
+                P4_v02.save_figure(fig, output_name, save_format, dpi_num)
+                saved.append(f"{output_name}.{save_format}")
+
+            result = "saved"
+            problem = ""
+        except SystemExit:
+            lines = [line.strip() for line in \
+                     printed.getvalue().split("\n") if line.strip() != ""]
+            banners = [i for i, line in enumerate(lines) if "**" in line]
+            lines = lines[banners[-1] + 1:] if len(banners) > 0 else lines
+            result = "failed"
+            problem = " ".join(lines) if len(lines) > 0 else "P4 stopped"
+        except Exception as error:
+            result = "failed"
+            problem = f"{type(error).__name__}: {error}"
+
+    return {"parameter_file": parameter_file, "result": result, \
+            "seconds": round(time.perf_counter() - start, 2), \
+            "saved": ";".join(saved), "problem": problem}
+
+# Function to summarise a job whose worker process died (for example out
+# of memory).
+def failed_job(parameter_file, error):
+    return {"parameter_file": parameter_file, "result": "failed", \
+            "seconds": None, "saved": "", \
+            "problem": f"{type(error).__name__}: {error}"}
+
+# Function to plot every Parameter file, sharing them out between the
+# workers, and print each result as it comes. A worker that dies breaks
+# the pool it is in and every job not yet finished in that pool with it, so
+# those jobs are plotted again one at a time, each in a pool of its own.
+# Only a job whose own worker dies is then reported as failed. Returns the
+# summary of each Parameter file in order.
+def run_batch(parameter_files, workers):
+    summary = {}
+    broken = []
+
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        jobs = {parameter_file: pool.submit(run_job, parameter_file) \
+                for parameter_file in parameter_files}
+
+        for parameter_file, job in jobs.items():
+            try:
+                summary[parameter_file] = job.result()
+            except BrokenProcessPool:
+                broken.append(parameter_file)
+                continue
+            except Exception as error:
+                summary[parameter_file] = failed_job(parameter_file, error)
+
+            print_job(summary[parameter_file])
+
+    for parameter_file in broken:
+        with ProcessPoolExecutor(max_workers = 1) as pool:
+            try:
+                summary[parameter_file] = \
+                    pool.submit(run_job, parameter_file).result()
+            except Exception as error:
+                summary[parameter_file] = failed_job(parameter_file, error)
+
+        print_job(summary[parameter_file])
+
+    return [summary[parameter_file] for parameter_file in parameter_files]
+
+# Function to print the result of a job.
+def print_job(job_summary):
+    print(f"{job_summary['result']}: {job_summary['parameter_file']} "
+          f"({job_summary['seconds']} s) {job_summary['problem']}")
+
+###############################################################################
+###############################################################################
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    parameter_files = find_parameter_files(args.parameter_files, \
+                                           args.manifest)
+
+    if len(parameter_files) == 0:
+        print("\nNo Parameter files found. Give Parameter file names, "
+              "patterns or a manifest.")
+        sys.exit(1)
+
+    print(f"\n **Plotting {len(parameter_files)} Parameter files with "
+          f"{args.workers} workers**")
+
+    start = time.perf_counter()
+    summary = run_batch(parameter_files, args.workers)
+
+    summary = pd.DataFrame(summary)
+    summary.to_csv(args.summary, index = False)
+
+    failed = (summary["result"] == "failed").sum()
+
+    print(f"\n **{len(summary) - failed} saved, {failed} failed in "
+          f"{round(time.perf_counter() - start, 1)} s. Summary saved as "
+          f"{args.summary}**")
+
+    sys.exit(1 if failed > 0 else 0)
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""###############################################################################
+   P4 BENCHMARK
+
+    Runs P4_v02.py end to end on the example Parameter files supplied with the
+    program and on synthetic scale-ups of the KM_Macro example so the time
+    taken to produce a plot can be measured in a repeatable way. Each run is
+    carried out in its own python process and the wall time, peak memory
+    (resident set size) and total size of the output files are recorded.
+
+    The synthetic runs change one thing at a time from the KM_Macro example,
+    the number of taxa, the number of samples or the png dpi, so a scaling
+    curve is produced for each. Synthetic taxa are copies of the KM_Macro
+    taxa (stack plot columns are not copied and the stack plots are switched
+    off) and synthetic samples are spread evenly over the KM_Macro depth
+    range reusing the KM_Macro sample values.
+
+    Results are printed and saved as a csv file. Run for example as
+
+    python P4_benchmark.py --taxa 10 30 60 120 --samples 100 1000 --dpi 150
+
+    Peak memory is only available on linux and mac.
+
+###############################################################################"""
+
+import numpy as np
+import pandas as pd
+import os
+import sys
+import time
+import tempfile
+import subprocess
+import argparse
+
+import P4_v02
+
+###############################################################################
+###############################################################################
+# Create arguments for command line. Each synthetic sweep can be given its
+# own list of values. Give an empty list (e.g. --samples with no values) to
+# skip a sweep.
+parser = argparse.ArgumentParser(description = \
+                            "Benchmark P4 on the examples and synthetic data")
+parser.add_argument('--taxa', action = 'store', type = int, nargs = '*', \
+                    default = [10, 30, 60, 120], \
+                    help = "Numbers of taxa for the synthetic taxa sweep.")
+parser.add_argument('--samples', action = 'store', type = int, nargs = '*', \
+                    default = [100, 1000, 10000, 50000], \
+                    help = "Numbers of samples for the synthetic sample sweep.")
+parser.add_argument('--dpi', action = 'store', type = int, nargs = '*', \
+                    default = [75, 150, 600, 1200], \
+                    help = "Png dpi values for the synthetic dpi sweep.")
+parser.add_argument('--no-examples', action = 'store_true', \
+                    help = "Do not run the example Parameter files.")
+parser.add_argument('--repeat', action = 'store', type = int, default = 1, \
+                    help = "Number of times each configuration is run.")
+parser.add_argument('--results', action = 'store', type = str, \
+                    default = "P4_benchmark_results.csv", \
+                    help = "Name of the csv file the results are saved to.")
+
+# The examples and the program itself are kept in the same directory as this
+# file.
+program_dir = os.path.dirname(os.path.abspath(__file__))
+program = os.path.join(program_dir, "P4_v02.py")
+
+# Example Parameter files run as supplied apart from the location of the
+# files and the output. Template_Parameter.csv is an empty template so P4
+# stops during its parameter checks. It is kept as a measure of start up
+# time and shows as "no output".
+examples = ["KM_Macro_Parameter.csv", "KM_Macro_Parameter_LOI.csv", \
+            "ARD_Testate_Parameter.csv", "Template_Parameter.csv"]
+
+# Settings the synthetic sweeps start from. Samples of None keeps the
+# KM_Macro samples as they are.
+base_taxa = 30
+base_samples = None
+base_dpi = 150
+
+###############################################################################
+###############################################################################
+# Function to write a copy of a Parameter file with the given entries
+# changed. The copy is saved into the run directory.
+def write_parameters(parameter_file, entries, run_dir):
+    par = pd.read_csv(os.path.join(program_dir, parameter_file))
+
+    for name, entry in entries.items():
+        par.loc[par["PARAMETERS"] == name, "ENTRY"] = entry
+
+    par.to_csv(os.path.join(run_dir, parameter_file), index = False)
+
+# Function to create a synthetic Input file from the KM_Macro Input file
+# with the given number of taxa and samples. Returns the taxa used.
+def write_synthetic_input(n_taxa, n_samples, run_dir):
+    data = pd.read_csv(os.path.join(program_dir, "KM_Macro_Input.csv"))
+
+    # The style rows (see style_rows in P4_v02.py) come first, the rest are
+    # the samples.
+    style_rows = P4_v02.file_style_rows(data)
+    stack_rows = [number for number, (name, _) in enumerate(style_rows) \
+                  if name.startswith("stack_")]
+    style = data.iloc[:len(style_rows)]
+    samples = data.iloc[len(style_rows):]
+
+    if n_samples is not None:
+        rows = np.arange(n_samples) * len(samples) // n_samples
+        depths = samples["Depth"]
+        samples = samples.iloc[rows].copy()
+        samples["Depth"] = np.linspace(depths.min(), depths.max(), n_samples)
+
+    data = pd.concat([style, samples], ignore_index = True)
+
+    # Copy the taxa (not stack plot columns) until there are enough. The
+    # first copy keeps the KM_Macro names. The stack plot style rows are
+    # cleared as the stack plots are not used.
+    taxa = [col for col in data.columns[2:-1] if data[col].iloc[0] != 7]
+    columns = {data.columns[0]: data.iloc[:,0], "Depth": data["Depth"]}
+    copy = 0
+
+    while len(columns) - 2 < n_taxa:
+        for taxon in taxa[:n_taxa - len(columns) + 2]:
+            name = taxon if copy == 0 else f"{taxon} {copy}"
+            columns[name] = data[taxon].copy()
+            columns[name].iloc[stack_rows] = 0
+
+        copy = copy + 1
+
+    columns["Zones"] = data["Zones"]
+
+    pd.DataFrame(columns).to_csv(os.path.join(run_dir, "Synthetic_Input.csv"), \
+                                 index = False)
+
+    return list(columns)[2:-1]
+
+# Function to run P4 on a Parameter file in the run directory and measure
+# it. Peak memory is read from the resource usage of the finished process
+# where the platform provides it.
+def run_p4(parameter_file, run_dir, output_name):
+    log_name = os.path.join(run_dir, "P4.log")
+
+    with open(log_name, "w") as log:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, program, "--input", \
+                                    run_dir, parameter_file], \
+                                   stdout = log, stderr = subprocess.STDOUT, \
+                                   cwd = run_dir)
+
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            wall = time.perf_counter() - start
+            process.returncode = os.waitstatus_to_exitcode(status)
+
+            # ru_maxrss is in kilobytes on linux and bytes on mac.
+            if sys.platform == "darwin":
+                peak_rss = usage.ru_maxrss / 1024 ** 2
+            else:
+                peak_rss = usage.ru_maxrss / 1024
+        else:
+            process.wait()
+            wall = time.perf_counter() - start
+            peak_rss = None
+
+    outputs = [f"{output_name}.{ext}" for ext in ["png", "pdf", "svg"] \
+               if os.path.exists(f"{output_name}.{ext}")]
+    output_size = sum(os.path.getsize(output) for output in outputs)
+
+    # P4 exits without an error code when it stops on a problem, so a run
+    # is only counted as ok if it has saved an output. The last line
+    # printed by P4 is kept to show why it stopped.
+    if len(outputs) > 0:
+        result = "ok"
+    else:
+        with open(log_name) as log:
+            lines = [line.strip() for line in log if line.strip() != ""]
+        result = "no output: " + (lines[-1] if len(lines) > 0 else "")
+
+    for output in outputs:
+        os.remove(output)
+
+    return {"wall_s": round(wall, 3), \
+            "peak_rss_mb": None if peak_rss is None else round(peak_rss, 1), \
+            "output_bytes": output_size, \
+            "formats": ",".join(os.path.splitext(x)[1][1:] for x in outputs), \
+            "result": result}
+
+# Function to run one example Parameter file as supplied.
+def run_example(parameter_file, run_dir):
+    output_name = os.path.join(run_dir, "output")
+    write_parameters(parameter_file, {"Directory**": program_dir, \
+                                      "Output file name**": output_name}, \
+                     run_dir)
+
+    return run_p4(parameter_file, run_dir, output_name)
+
+# Function to run one synthetic configuration built from KM_Macro. Any
+# grouping annotations starting on a taxon that is not used are moved to
+# the first taxon so the annotation is still drawn.
+def run_synthetic(n_taxa, n_samples, dpi, run_dir):
+    taxa = write_synthetic_input(n_taxa, n_samples, run_dir)
+    output_name = os.path.join(run_dir, "output")
+
+    entries = {"Directory**": run_dir, \
+               "Input file name**": "Synthetic_Input.csv", \
+               "Extra input file name**": "none", \
+               "Output file name**": output_name, \
+               "Save as**": "png", \
+               "Png dpi": dpi, \
+               "Stack plot 1 on/off**": "off", \
+               "Stack plot 2 on/off**": "off"}
+
+    par = pd.read_csv(os.path.join(program_dir, "KM_Macro_Parameter.csv"))
+    par_dict = {Q: R for Q, R in zip(par["PARAMETERS"], par["ENTRY"])}
+
+    for start in par_dict:
+        if str(start).startswith("Grouping annotation ") and \
+            str(start).endswith(" start") and \
+            pd.isnull(par_dict[start]) == False and \
+            str(par_dict[start]).strip() not in taxa:
+            entries[start] = taxa[0]
+
+    write_parameters("KM_Macro_Parameter.csv", entries, run_dir)
+
+    return run_p4("KM_Macro_Parameter.csv", run_dir, output_name)
+
+###############################################################################
+###############################################################################
+# Only run the benchmark from the cmd line, not when imported.
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    # Build the list of runs. Examples first then each synthetic sweep.
+    runs = []
+
+    if args.no_examples == False:
+        for parameter_file in examples:
+            runs.append({"name": parameter_file, "taxa": None, \
+                         "samples": None, "dpi": None})
+
+    for n_taxa in args.taxa:
+        runs.append({"name": "synthetic taxa", "taxa": n_taxa, \
+                     "samples": base_samples, "dpi": base_dpi})
+
+    for n_samples in args.samples:
+        runs.append({"name": "synthetic samples", "taxa": base_taxa, \
+                     "samples": n_samples, "dpi": base_dpi})
+
+    for dpi in args.dpi:
+        runs.append({"name": "synthetic dpi", "taxa": base_taxa, \
+                     "samples": base_samples, "dpi": dpi})
+
+    # Carry out each run in a fresh directory and print results as they come.
+    results = []
+
+    for run in runs:
+        for repeat in range(args.repeat):
+            with tempfile.TemporaryDirectory(prefix = "P4_benchmark_") \
+                as run_dir:
+                if run["name"] in examples:
+                    measures = run_example(run["name"], run_dir)
+                else:
+                    measures = run_synthetic(run["taxa"], run["samples"], \
+                                             run["dpi"], run_dir)
+
+            result = {**run, "repeat": repeat + 1, **measures}
+            results.append(result)
+
+            print(f"{result['name']} taxa={result['taxa']} "
+                  f"samples={result['samples']} dpi={result['dpi']}: "
+                  f"{result['wall_s']} s, {result['peak_rss_mb']} MB, "
+                  f"{result['output_bytes']} bytes, {result['result']}")
+
+    results = pd.DataFrame(results)
+    results.to_csv(args.results, index = False)
+
+    print("")
+    print(results.to_string(index = False))
+    print(f"\nResults saved as {args.results}")
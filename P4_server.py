@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""###############################################################################
+   P4 SERVER
+
+    Keeps P4 loaded in one long running python process so plots can be
+    requested over http on this computer without paying the start up cost of
+    python, numpy, pandas and matplotlib (and the font cache) for each plot.
+    Only the loopback address (127.0.0.1) is used so the server can not be
+    reached from other computers.
+
+    Plots are requested by posting a JSON job to /render. Each of the
+    Parameter, Input and Extra Input files can be given as a path or inline
+    as the text of the csv file:
+
+        {"parameters": "F:\\P4\\KM_Macro_Parameter.csv",
+         "input": "KM_Macro_Input.csv",     (or "input_csv": "...")
+         "extra": "none",                   (or "extra_csv": "...")
+         "format": "png",
+         "shared_depth": false}
+
+    Only "parameters" (or "parameters_csv") is required. Input and Extra
+    Input files not given are those named in the Parameter file. Relative
+    paths are found as P4 finds them, from the Directory in the Parameter
+    file. The format defaults to png.
+
+    The reply is the plot itself with an ETag made from the job and the
+    contents of every file used. A repeated job sending that ETag back in
+    If-None-Match gets 304 Not Modified and is not plotted again, and recent
+    plots are kept so an unchanged job is returned without plotting again.
+    If P4 stops on a problem in the files the reply is 400 with the message
+    P4 printed. GET /health replies ok once the server is ready.
+
+    Run for example as
+
+    python P4_server.py --port 8765
+
+###############################################################################"""
+
+import os
+import io
+import sys
+import json
+import hashlib
+import argparse
+import contextlib
+from collections import OrderedDict
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import pandas as pd
+from matplotlib.figure import Figure
+
+import P4_v02
+
+###############################################################################
+###############################################################################
+# Number of recent plots kept in memory unless the server is given its own
+# cache_size (see --cache-size).
+default_cache_size = 32
+
+# Create arguments for command line.
+parser = argparse.ArgumentParser(description = \
+                            "Serve P4 plots over http on this computer")
+parser.add_argument('--port', action = 'store', type = int, default = 8765, \
+                    help = "Port to listen on at 127.0.0.1.")
+parser.add_argument('--cache-size', action = 'store', type = int, \
+                    default = default_cache_size, \
+                    help = "Number of recent plots kept in memory.")
+
+# Content type for each output format.
+content_types = {"png": "image/png", "pdf": "application/pdf", \
+                 "svg": "image/svg+xml"}
+
+# Recent plots by ETag, oldest first.
+plot_cache = OrderedDict()
+
+# Changes to P4 itself must not return plots made by the old code so the
+# program file is part of every ETag.
+with open(P4_v02.__file__, "rb") as program_file:
+    program_hash = hashlib.sha256(program_file.read()).hexdigest()
+
+###############################################################################
+###############################################################################
+# Function to read one of the files of a job, given as a path or inline as
+# csv text. Returns the dataframe (None if not given or "none") and the
+# bytes the ETag is made from.
+def read_job_file(job, name, directory):
+    if job.get(f"{name}_csv") is not None:
+        text = job[f"{name}_csv"]
+        return pd.read_csv(io.StringIO(text)), text.encode()
+
+    path = job.get(name)
+
+    if path is None or str(path).strip() == "none":
+        return None, b"none"
+
+    with open(os.path.join(directory, str(path).strip()), "rb") as job_file:
+        content = job_file.read()
+
+    return pd.read_csv(io.BytesIO(content)), content
+
+# Function to load all the files of a job and make its ETag. Input and
+# Extra Input files not given in the job are those named in the Parameter
+# file and are found from its Directory entry as render does.
+def load_job(job):
+    par, par_content = read_job_file(job, "parameters", "")
+    par_dict = {Q: R for Q, R in zip(par["PARAMETERS"], par["ENTRY"])}
+
+    parameter_dir = "" if job.get("parameters") is None else \
+                    os.path.dirname(str(job["parameters"]))
+    directory = os.path.join(parameter_dir, str(par_dict["Directory**"]))
+
+    job = dict(job)
+    job.setdefault("input", par_dict["Input file name**"])
+    job.setdefault("extra", str(par_dict["Extra input file name**"]))
+
+    data, data_content = read_job_file(job, "input", directory)
+    data_extra, extra_content = read_job_file(job, "extra", directory)
+
+    settings = json.dumps([job.get("format", "png"), \
+                           bool(job.get("shared_depth", False))])
+
+    etag = hashlib.sha256()
+    for part in [program_hash.encode(), settings.encode(), par_content, \
+                 data_content, extra_content]:
+        etag.update(hashlib.sha256(part).digest())
+
+    return par, data, data_extra, f'"{etag.hexdigest()}"'
+
+# Function to plot a job. P4 output printed while plotting is kept so the
+# message can be returned if P4 stops on a problem.
+def render_job(par, data, data_extra, job):
+    printed = io.StringIO()
+
+    with contextlib.redirect_stdout(printed):
+        try:
+            plot = P4_v02.render(par, data, \
+                                 "none" if data_extra is None else \
+                                 data_extra, \
+                                 output_format = job.get("format", "png"), \
+                                 share_depth = \
+                                 bool(job.get("shared_depth", False)))
+        except SystemExit:
+            lines = [line for line in printed.getvalue().split("\n") \
+                     if line.strip() != ""]
+            return None, "\n".join(lines[-10:])
+
+    return plot, None
+
+###############################################################################
+###############################################################################
+# Http handler. One request is dealt with at a time as matplotlib settings
+# are shared by every plot in the process.
+class P4Handler(BaseHTTPRequestHandler):
+    def send(self, status, body, content_type = "text/plain", \
+             headers = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send(200, b"ok")
+        else:
+            self.send(404, b"Not found")
+
+    def do_POST(self):
+        if self.path != "/render":
+            self.send(404, b"Not found")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            job = json.loads(self.rfile.read(length))
+            output_format = job.get("format", "png")
+
+            if output_format not in content_types:
+                self.send(400, b"Format must be png, pdf or svg.")
+                return
+
+            par, data, data_extra, etag = load_job(job)
+        except Exception as problem:
+            self.send(400, f"Problem reading the job: {problem}".encode())
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send(304, b"", headers = {"ETag": etag})
+            return
+
+        if etag in plot_cache:
+            plot_cache.move_to_end(etag)
+            plot = plot_cache[etag]
+        else:
+            try:
+                plot, problem = render_job(par, data, data_extra, job)
+            except Exception as problem:
+                self.send(500, f"Problem plotting the job: {problem}" \
+                          .encode())
+                return
+
+            if plot is None:
+                self.send(400, problem.encode())
+                return
+
+            plot_cache[etag] = plot
+            cache_size = getattr(self.server, "cache_size", \
+                                 default_cache_size)
+
+            while len(plot_cache) > cache_size:
+                plot_cache.popitem(last = False)
+
+        self.send(200, plot, content_types[output_format], {"ETag": etag})
+
+###############################################################################
+###############################################################################
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    # Warm up the font cache and the png, pdf and svg backends before the
+    # first job arrives.
+    warm_up = Figure()
+    warm_up.text(0.5, 0.5, "P4")
+    for output_format in content_types:
+        warm_up.savefig(io.BytesIO(), format = output_format)
+
+    server = HTTPServer(("127.0.0.1", args.port), P4Handler)
+    server.cache_size = args.cache_size
+    print(f"P4 server ready at http://127.0.0.1:{args.port}/render")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
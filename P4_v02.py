@@ -33,7 +33,8 @@
     for each iteration of rebuilding the figure depends on the amount of data 
     but as an example the example plots in the manual take about 20 seconds from
     program run to product in the designated location at at 800 dpi. Output can 
-    be png, pdf or svg and that can be specified in the parameter file.
+    be png, pdf or svg and that can be specified in the parameter file. Running
+    with --draft saves a quicker, simpler png draft (see the README).
     
     Particularly fancy additions to the plots are best carried out in a drawing
     package after the main body of the plot is constructed here. However, zones
@@ -50,6 +51,12 @@
     is provided as part of the command when running the program . See manual for
     how to do this.
     
+    The program can also be imported and the render function called with the 
+    parameter file and input data (paths or dataframes). It returns the figure,
+    or the bytes of a png, pdf or svg, without changing the working directory.
+    Calling render again in the same python session only repeats the parsing,
+    validation, scaling and stack plot stages whose inputs have changed.
+    
     The program has been developed while using microsoft windows 10. However, 
     the code runs in mac or linux (see manual for instructions).
 
@@ -71,6895 +78,3452 @@ import matplotlib.ticker as ticker
 from matplotlib.ticker import (MultipleLocator, FormatStrFormatter, \
                AutoMinorLocator)
 from matplotlib.gridspec import GridSpec
-from matplotlib.patches import ConnectionPatch
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backend_bases import RendererBase, GraphicsContextBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+from matplotlib.transforms import Transform, TransformedPath, BboxBase, \
+                                   Bbox
+from matplotlib.font_manager import FontProperties
+import matplotlib.axis
+import matplotlib.image
+import matplotlib.path
+import matplotlib.colors
+from PIL import Image
 import matplotlib
 import sys
 from pathlib import Path
 import argparse
+import io
+import multiprocessing
+from multiprocessing import shared_memory
+import time
+import json
+import glob
+import copy
+import hashlib
+from collections import OrderedDict
+
+###############################################################################
+###############################################################################
+# Functions and settings for loading Input files.
+
+# The Input file and Extra Input file both start with 38 rows of per taxon 
+# style codes (see manual) above the palaeo data itself. Each style row is 
+# given a name here, in the order the rows appear in the Input file, and
+# the type it is held as once loaded. Codes that select a colour, style or
+# option are whole numbers, everything else (widths, sizes, transparency
+# and exaggeration multipliers) is held as a float.
+style_rows = [("graph", "int64"), 
+              ("bar_colour", "int64"), 
+              ("bar_width_g1", "float64"), 
+              ("bar_width_g2", "float64"),
+              ("line_style", "int64"), 
+              ("line_colour", "int64"), 
+              ("fill_colour", "int64"), 
+              ("fill_trans", "float64"), 
+              ("line_width", "float64"), 
+              ("marker_type", "int64"), 
+              ("marker_size", "float64"), 
+              ("marker_face_colour", "int64"), 
+              ("marker_edge_colour", "int64"),
+              ("marker_edge_width", "float64"), 
+              ("title_colour", "int64"), 
+              ("title_bold", "int64"), 
+              ("vs_width", "float64"), 
+              ("vs_style", "int64"), 
+              ("vs_colour", "int64"), 
+              ("ls_width", "float64"), 
+              ("ls_style", "int64"), 
+              ("ls_colour", "int64"),
+              ("rs_width", "float64"), 
+              ("rs_style", "int64"), 
+              ("rs_colour", "int64"), 
+              ("x_tick_maj_colour", "int64"), 
+              ("x_tick_min_colour", "int64"), 
+              ("y_tick_maj_colour", "int64"),
+              ("y_tick_min_colour", "int64"), 
+              ("exag", "float64"), 
+              ("exag_type", "int64"), 
+              ("exag_colour", "int64"), 
+              ("exag_trans", "float64"), 
+              ("exag_line_colour", "int64"), 
+              ("exag_lw", "float64"), 
+              ("exag_ls", "int64"), 
+              ("stack_1", "int64"), 
+              ("stack_2", "int64")]
+
+# Function to give the style rows of a loaded Input or Extra Input file. 
+# Rows straight after Stack plot 2 titled Stack plot 3, Stack plot 4 and so
+# on hold the groups of any further stack plots.
+def file_style_rows(data):
+    rows = list(style_rows)
+    titles = data.iloc[len(style_rows):, 0].astype(str).str.strip()
+    
+    for title in titles:
+        number = len(rows) - len(style_rows) + 3
+        
+        if title != f"Stack plot {number}":
+            break
+        
+        rows.append((f"stack_{number}", "int64"))
+    
+    return rows
+
+# Function to split a loaded Input or Extra Input file into the sample 
+# matrix (Depth plus each taxon as float64 columns, one row per sample) and
+# the style table (one row per taxon, one typed column per style row). This
+# is done in a single pass over the file rather than transposing each style
+# row out of the mixed dataframe separately. Zones is dropped from the 
+# style table if zones are not requested but kept in the sample matrix.
+def split_input_data(data, zones_on_off, file_label):
+    rows = file_style_rows(data)
+    num_style_rows = len(rows)
+    style_names = [name for name, dtype in rows]
+    
+    # Drop the row titles column, leaving Depth, the taxa and Zones.
+    values = data.iloc[:, 1:]
+    
+    try:
+        style_values = values.iloc[:num_style_rows].to_numpy(dtype = \
+                                                             "float64")
+        sample_values = values.iloc[num_style_rows:].to_numpy(dtype = \
+                                                              "float64")
+    except (TypeError, ValueError):
+        print(f"\nThere is a non numeric entry in the {file_label}. All "
+              "style codes and data need to be numeric.")
+        sys.exit()
+        
+    if len(style_values) != num_style_rows:
+        print(f"\nThe {file_label} should have {num_style_rows} style rows"
+              " above the data. See manual for correct setup.")
+        sys.exit()
+    
+    samples = pd.DataFrame(sample_values, columns = values.columns)
+    
+    style = pd.DataFrame(style_values.T, index = values.columns, \
+                         columns = style_names)
+    style = style.drop("Depth")
+    
+    if zones_on_off == "off":
+        style = style.drop("Zones", errors = "ignore")
+        
+    # Codes have to be whole numbers before they are held as integers. 
+    # Report every taxon with a fractional code rather than truncating.
+    code_names = [name for name, dtype in rows if dtype == "int64"]
+    codes = style[code_names]
+    fractional = codes.ne(np.floor(codes)).any(axis = 1)
+    
+    if fractional.any():
+        print(f"\nStyle codes in the {file_label} must be whole numbers. "
+              "Check the entries for "
+              f"{', '.join(fractional.index[fractional])}.")
+        sys.exit()
+        
+    style = style.astype(dict(rows))
+    
+    return samples, style
+
+# Function to check a loaded Input or Extra Input file for blank entries
+# and non numeric entries. The whole file is checked at once and every 
+# problem cell is listed by column and row (row 1 being the column titles,
+# as seen in a spreadsheet) so all problems can be fixed in one go before
+# the program exits. Returns the file with its columns converted to numbers.
+def check_input_cells(data, file_label):
+    blank = data.isna()
+    numeric = data.iloc[:, 1:].apply(pd.to_numeric, errors = "coerce")
+    non_numeric = numeric.isna() & ~blank.iloc[:, 1:]
+    
+    problems = []
+    
+    for mask, problem in [(blank, "Entry missing"), \
+                          (non_numeric, "Non numeric entry")]:
+        for name in mask.columns[mask.any()]:
+            rows = np.flatnonzero(mask[name].to_numpy()) + 2
+            problems.append(f"{problem} in the {name} column at row(s) "
+                            f"{', '.join(str(row) for row in rows)}.")
+            
+    if len(problems) > 0:
+        print(f"\nProblem entries found in the {file_label}. There should"
+              " be no blank entries and all style codes and data need to"
+              " be numeric. If it is a numeric value use a zero.")
+        for problem in problems:
+            print(problem)
+        sys.exit()
+        
+    return pd.concat([data.iloc[:, :1], numeric], axis = 1)
+
+# Function to check every entry of the style table against its allowed
+# range before any figure is created. Each rule gives the style row, its
+# lowest and highest allowed value, the graph types it applies to (None for
+# all graph types) and the text used in the message. Rules are checked down
+# the whole table at once and every problem found is listed together, so a
+# mistake in the last taxon is found without drawing any of the others. 
+# The Zones column is not checked as it is not a taxon.
+def check_style_table(style, col_max, file_label):
+    colour_range = f"1 - {col_max}"
+    
+    style_checks = [("graph", 1, 7, None, "plot type number", "1 - 7"), 
+                    ("title_colour", 0, col_max, None, \
+                     "plot title colour number", colour_range), 
+                    ("title_bold", 0, 1, None, "plot title taxon bold", \
+                     "0 - 1"),
+                    ("vs_style", 1, 4, None, \
+                     "plot taxon vertical spine style number", "1 - 4"), 
+                    ("vs_colour", 1, col_max, None, \
+                     "plot taxon vertical spine colour number", \
+                     colour_range),
+                    ("ls_style", 1, 4, None, \
+                     "plot taxon left spine style number", "1 - 4"), 
+                    ("ls_colour", 1, col_max, None, \
+                     "plot taxon left spine colour number", colour_range),
+                    ("rs_style", 1, 4, None, \
+                     "plot taxon right spine style number", "1 - 4"), 
+                    ("rs_colour", 1, col_max, None, \
+                     "plot taxon right spine colour number", \
+                     colour_range),
+                    ("x_tick_maj_colour", 1, col_max, None, \
+                     "plot x major tick colour number", colour_range),
+                    ("x_tick_min_colour", 1, col_max, None, \
+                     "plot x minor tick colour number", colour_range),
+                    ("bar_colour", 1, col_max, [1, 2], \
+                     "bar colour number", colour_range),
+                    ("line_style", 1, 4, [2, 3, 4, 5], "line type number", \
+                     "1 - 4"),
+                    ("line_colour", 1, col_max, [2, 3, 4, 5], \
+                     "line colour number", colour_range),
+                    ("fill_colour", 1, col_max, [2, 4], \
+                     "fill colour number", colour_range),
+                    ("fill_trans", 0, 1, [2, 4], \
+                     "fill colour transparency", "0 - 1"),
+                    ("marker_type", 1, 6, [5, 6], "marker type number", \
+                     "1 - 6"),
+                    ("marker_face_colour", 1, col_max, [5, 6], \
+                     "marker fill colour number", colour_range),
+                    ("marker_edge_colour", 1, col_max, [5, 6], \
+                     "marker edge colour number", colour_range)]
+    
+    taxa = style.drop("Zones", errors = "ignore")
+    graph = taxa["graph"]
+    
+    # Exaggeration aesthetics are only used for graph types 2, 3 and 4 
+    # when an exaggeration is given. Exaggeration type 3 is drawn as a line
+    # and type 4 as a filled area with an edge line.
+    exag_used = graph.isin([2, 3, 4]) & (taxa["exag"] > 0)
+    exag_line = exag_used & taxa["exag_type"].isin([3, 4])
+    exag_fill = exag_used & (taxa["exag_type"] == 4)
+    
+    exag_checks = [("exag_line_colour", 1, col_max, exag_line, \
+                    "exaggeration line colour number", colour_range),
+                   ("exag_ls", 1, 4, exag_line, \
+                    "exaggeration line style number", "1 - 4"),
+                   ("exag_colour", 1, col_max, exag_fill, \
+                    "exaggeration fill colour number", colour_range),
+                   ("exag_trans", 0, 1, exag_fill, \
+                    "exaggeration fill transparency", "0 - 1")]
+    
+    checks = [(name, low, high, \
+               graph == graph if types is None else graph.isin(types), \
+               text, allowed) \
+              for name, low, high, types, text, allowed in style_checks]
+    
+    problems = []
+    
+    for name, low, high, applies, text, allowed in checks + exag_checks:
+        values = taxa[name]
+        bad = applies & ((values < low) | (values > high))
+        
+        for taxon in bad.index[bad]:
+            problems.append(f"Error in {text} designation for {taxon} "
+                            f"({values[taxon]} given, allowed range is "
+                            f"{allowed}).")
+            
+    if len(problems) > 0:
+        print(f"\nStyle code errors found in the {file_label}. See manual "
+              "for allowed values.")
+        for problem in problems:
+            print(problem)
+        sys.exit()
+
+###############################################################################
+###############################################################################
+# Function to time the phases of the program if --profile is used. Each
+# call adds the time since the previous call to the named phase (or to an
+# item such as a taxon within the phase). The timings are saved as JSON 
+# next to the output once the plot has been saved.
+profile = False
+program_start = time.perf_counter()
+phase_start = program_start
+phase_times = {}
+
+def record_phase(phase, item = None):
+    global phase_start
+    
+    if profile == True:
+        now = time.perf_counter()
+        
+        if item is None:
+            phase_times[phase] = phase_times.get(phase, 0) + now - \
+                                 phase_start
+        else:
+            items = phase_times.setdefault(phase, {})
+            items[item] = items.get(item, 0) + now - phase_start
+            
+        phase_start = now
 
 ###############################################################################
 ###############################################################################
-# Create argument for command line so initial location for parameter file and
-# its name can be stated.
-parser = argparse.ArgumentParser(description = \
-                            "Variables for file and location" )
-parser.add_argument('--input', action ='store', type = str, nargs = 2)
+# Functions for aesthetics.
+
+# Colour numbers and the matplotlib colour each stands for. More colours 
+# can be numbered on from 24 with the Extra colours entry of the Parameter 
+# file (see colour_palette below). colour_table is the palette of the plot
+# being made.
+base_colours = {1: "black", 2: "gray", 3: "dimgray", 4: "darkgray", \
+                5: "slategray", 6: "lightgray", 7: "red", 8: "darkred", \
+                9: "orangered", 10: "coral", 11: "green", 12: "darkgreen", \
+                13: "olive", 14: "lightgreen", 15: "blue", 16: "darkblue", \
+                17: "lightblue", 18: "cyan", 19: "yellow", 20: "brown", \
+                21: "magenta", 22: "orange", 23: "white"}
+colour_table = dict(base_colours)
+
+# Line style, marker and bold codes. Can be added to if required.
+line_style_table = {1: "solid", 2: "dotted", 3: "dashed", 4: "dashdot"}
+marker_table = {1: "o", 2: "x", 3: "^", 4: "v", 5: "D", 6: "*"}
+bold_table = {"ON": "bold", "on": "bold", 1: "bold"}
+
+# Style table columns that hold colour, line style, marker and bold codes
+# (see style_rows above).
+colour_columns = ["bar_colour", "line_colour", "fill_colour", \
+                  "marker_face_colour", "marker_edge_colour", \
+                  "title_colour", "vs_colour", "ls_colour", "rs_colour", \
+                  "x_tick_maj_colour", "x_tick_min_colour", \
+                  "y_tick_maj_colour", "y_tick_min_colour", "exag_colour", \
+                  "exag_line_colour"]
+line_style_columns = ["line_style", "vs_style", "ls_style", "rs_style", \
+                      "exag_ls"]
+
+# Function to turn colour number to colour text (None if not a colour 
+# number).
+def colour (col):
+    return colour_table.get(col)
+
+# Function to turn line_style number to line_style text.
+def line_styles (style):
+    return line_style_table.get(style)
 
-args = parser.parse_args()
+# Function to convert marker number to marker type.
+def marker_type (mark):
+    return marker_table.get(mark)
+
+# Bold function.
+def bold_on_off (bold):
+    return bold_table.get(bold, "normal")
+
+# Function to make the colour palette of a plot. The Extra colours entry of
+# the Parameter file, if there is one, is a list of hex (e.g. #1f77b4) or
+# named matplotlib colours separated by commas, numbered on from 24.
+def colour_palette(par_dict):
+    palette = dict(base_colours)
+    extra = par_dict.get("Extra colours")
+    
+    if extra is None or pd.isnull(extra) == True or \
+        str(extra).strip().lower() in ["", "none"]:
+        return palette
+    
+    for name in str(extra).split(","):
+        if matplotlib.colors.is_color_like(name.strip()) == False:
+            print(f"\nExtra colours entry ({name.strip()}) in Parameter file "
+                  "is not a colour. Give hex (e.g. #1f77b4) or named "
+                  "matplotlib colours separated by commas.")
+            sys.exit()
+        
+        palette[len(palette) + 1] = name.strip()
+    
+    return palette
 
-location = args.input[0]
-file_name = args.input[1]
+# Function to turn every colour, line style, marker and bold code of a 
+# style table into what matplotlib is given, for every taxon at once, 
+# using colours as the palette. Codes with no entry are None (bold codes 
+# with no entry are normal).
+def resolve_styles(style, colours):
+    resolved = style.copy().astype(object)
+    tables = [(colour_columns, colours), \
+              (line_style_columns, line_style_table), \
+              (["marker_type"], marker_table)]
+    
+    for columns, table in tables:
+        for column in [col for col in columns if col in style.columns]:
+            codes = style[column].map(table)
+            resolved[column] = codes.astype(object).where(codes.notna(), None)
+    
+    if "title_bold" in style.columns:
+        resolved["title_bold"] = style["title_bold"].map(bold_table) \
+                                 .fillna("normal")
+    
+    return resolved
 
-# If using from an IDE comment out argparse part above and use the two lines
-# below. Fill them in with parameter file location separarted by \\. Fill in 
-# the parameter file name.
-# location = "F:\\P4"
-# file_name = "KM_Macro_Parameter.csv"
+###############################################################################
+###############################################################################
+# Draft mode (--draft) for quick checks of the layout while a plot is being
+# set up. Only a png is saved, at draft_dpi and with _draft added to the 
+# Output file name so the full plot is not overwritten. Minor ticks are 
+# left off, lines are simplified more than usual and, if draft_samples is
+# given, each taxon is plotted from at most about that many samples.
+draft = False
+draft_dpi = 75
+draft_samples = None
+
+# Function to change the Parameter file entries for a draft.
+def draft_parameters(par):
+    par = par.copy()
+    entries = {"Save as**": "png", "Png dpi": draft_dpi, \
+               "X minor ticks on/off**": "off", \
+               "Y minor ticks on/off**": "off"}
+    
+    for name, entry in entries.items():
+        par.loc[par["PARAMETERS"] == name, "ENTRY"] = entry
+    
+    output = par["PARAMETERS"] == "Output file name**"
+    par.loc[output, "ENTRY"] = par.loc[output, "ENTRY"].astype(str) + \
+                               "_draft"
+    
+    return par
+
+# Function to give the matplotlib settings a plot is made and saved with.
+# Lines are simplified to within a pixel rather than a tenth of a pixel in
+# a draft. The settings are only changed inside the with block so later 
+# plots made in the same process are not drafts.
+def draft_settings():
+    if draft == True:
+        return plt.rc_context({'path.simplify_threshold': 1.0})
+    
+    return plt.rc_context()
+
+# Function to keep at most about max_samples samples of a checked Input or
+# Extra Input file (data) and its sample matrix (data_2). Samples are kept
+# evenly down the core along with the sample where each taxon peaks, so 
+# every taxon keeps the scale and width it has in the full plot.
+def thin_samples(data, data_2, max_samples):
+    if len(data_2) <= max_samples:
+        return data, data_2
+    
+    keep = np.linspace(0, len(data_2) - 1, max_samples).round().astype(int)
+    keep = np.union1d(keep, data_2.iloc[:, 1:].to_numpy().argmax(axis = 0))
+    
+    num_style_rows = len(file_style_rows(data))
+    data = pd.concat([data.iloc[:num_style_rows], \
+                      data.iloc[num_style_rows:].iloc[keep]], \
+                     ignore_index = True)
+    
+    return data, data_2.iloc[keep].reset_index(drop = True)
 
 ###############################################################################
 ###############################################################################
-# Print out Program title, author and place of origin
-print("")
-print("P4 ")
-print("(PYTHON PALAEO PLOTTING PROGRAM) written by Dr Antony Blundell")
-print("School of Geography, University of Leeds, 2022")
-
-# The program uses a user preferences form the Parameter file, the location
-# of which is supplied in the information above from the cmd line.
-try:
-    os.chdir(location)
-except:
-    print("\nProblem with address of Parameter file. Is it spelt "
-          "correctly, in the correct location or actually exist?")
-    sys.exit()
-
-# The Parameter file holds information related to the parameters used
-# to construct the plot. This does not include the raw data of the 
-# palaeo-record being plotted which is held in the Input file. The name 
-# and location of which is stated in the Parameter file. 
-
-# Check file provided is a csv file and that it exists.
-if ".csv" in file_name:
-    try:
-        par = pd.read_csv(file_name)
-    except:
-        print("\nProblem with the Parameter file name. Is it spelt "
-              "correctly, in correct location or exist at all?")
-        sys.exit()
-else:
-    print("\nParameter file required in comma delimited csv format.")
-    sys.exit()
-
-# Print Gathering Paremeters to signify to user the program is commencing
-print("") 
-print("\n **Gathering Parameters**")
-print("")
-
-# Create lists of items from the columns in the Parameter file including the
-# users entries and the Title of the parameter itself
-par_list_0 = [x for x in par["PARAMETERS"][0::]]
-par_list_1 = [x for x in par["ENTRY"][0::]]
-
-# Create dictionary of parameter entries and associated values/text.
-par_dict = {Q: R for Q, R in zip(par_list_0, par_list_1)}
-
-# Initial error checking of essential entries from Parameter file. If any 
-# of these are blank then the program will stop. 
-# Create lists of values from Parameter file that are essential entries  
-# ready for checking.
-par_list_G1_values = par_list_1[4:9]
-par_list_G2_values = par_list_1[15:17]
-par_list_G3_values = par_list_1[21:22]
-par_list_G4_values = par_list_1[28:29]
-par_list_G5_values = par_list_1[42:43]
-par_list_G6_values = par_list_1[54:59]
-par_list_G7_values = par_list_1[64:67] + par_list_1[68:71] + \
-                     par_list_1[72:73] + par_list_1[74:77]
-par_list_G8_values = par_list_1[82:84]
-par_list_G9_values = par_list_1[89:90] + par_list_1[91:94] + \
-                     par_list_1[95:96] + par_list_1[97:101]
-par_list_G10_value = par_list_1[106:107]
-par_list_G11_value = par_list_1[138:139]
-par_list_G12_value = par_list_1[159:160]
-par_list_G13_values = par_list_1[187:188] + par_list_1[204:205] + \
-                     par_list_1[221:222] + par_list_1[238:239] + \
-                     par_list_1[255:256] + par_list_1[272:273] + \
-                     par_list_1[289:290] + par_list_1[306:307] + \
-                     par_list_1[323:324] + par_list_1[340:341]
-par_list_G14_values = par_list_1[361:366]
-
-# Initial general error checking of user preferences in Parameter file.
-for x in par_list_G1_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries/entry in Parameter file, Group 1 "
-              "is/are missing.")
-        sys.exit()
+# Decimation (--decimate) of dense records for line, filled line and marker
+# plots (graph types 2 to 6). Each series is cut down to the samples that
+# can be seen at the dpi it is saved at. The samples are split into one
+# group for each pixel of depth and only the first, last, lowest and
+# highest sample of each group are kept, so peaks are never lost. Vector
+# formats (pdf and svg) are treated as being decimate_dpi.
+decimate = False
+decimate_dpi = 300
+
+# Function to decimate one series of a panel. Depths must go down the core
+# (the samples are in depth order), otherwise the series is returned as it
+# is.
+def decimate_series(depths, values, depth_per_pixel):
+    depths = np.asarray(depths, dtype = float)
+    values = np.asarray(values, dtype = float)
+
+    if len(depths) < 5 or depth_per_pixel <= 0:
+        return depths, values
+
+    pixels = np.floor((depths - depths.min()) / depth_per_pixel)
+
+    if (np.diff(pixels) < 0).any() or len(np.unique(pixels)) * 4 >= \
+        len(depths):
+        return depths, values
+
+    starts = np.flatnonzero(np.r_[True, pixels[1:] != pixels[:-1]])
+    ends = np.r_[starts[1:], len(pixels)] - 1
+
+    # Samples ordered by value within each pixel, so the lowest and highest
+    # samples of a pixel are at its start and end in this order.
+    order = np.lexsort((values, pixels))
+
+    keep = np.unique(np.concatenate([starts, ends, order[starts], \
+                                     order[ends]]))
+
+    return depths[keep], values[keep]
 
-for x in par_list_G2_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries/entry in Parameter file, Group 2 "
-              "is/are missing.") 
+###############################################################################
+###############################################################################
+# Function to load the Parameter file. The Parameter file holds information
+# related to the parameters used to construct the plot. This does not 
+# include the raw data of the palaeo-record being plotted which is held in
+# the Input file. The name and location of which is stated in the 
+# Parameter file. Returns the Parameter file and the directory it is in.
+def read_parameter_file(parameters):
+    if isinstance(parameters, pd.DataFrame):
+        return parameters, ""
+    
+    # Check file provided is a csv file and that it exists.
+    if ".csv" in str(parameters):
+        try:
+            par = pd.read_csv(parameters)
+        except:
+            print("\nProblem with the Parameter file name. Is it spelt "
+                  "correctly, in correct location or exist at all?")
+            sys.exit()
+    else:
+        print("\nParameter file required in comma delimited csv format.")
         sys.exit()
     
-for x in par_list_G3_values:
-    if isinstance(x, str) == False:
-        print("\nEssential entry in Parameter file, Group 3 is incorrect."
-              " Check entry and format.")
-        sys.exit()
-    if pd.isnull(x) == True:
-        print("\nEssential entry in Parameter file, Group 3 is missing.") 
-        sys.exit()
+    # Parameter files read from disk are changed for a draft (see 
+    # draft_parameters), a dataframe passed in is used as given.
+    if draft == True:
+        par = draft_parameters(par)
+        
+    return par, os.path.dirname(str(parameters))
+
+###############################################################################
+###############################################################################
+# Functions for saving the figure. Obtain saving format from Parameter
+# file. Choose png, svg or pdf in the parameter file. Can choose to save as
+# all types in one go if state all separated by comma such as svg,png,pdf.
+def read_save_formats(par_dict):
+    save_list = par_dict["Save as**"].replace(" ","").lower()
+    save_list = list(save_list.split(","))
     
-for x in par_list_G4_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entry for Overall title on/off in Parameter "
-              "file is missing. Enter 'on' or 'off'.") 
+    # Error check entries.
+    if "pdf" not in save_list and "png" not in save_list and "svg" not in \
+        save_list:
+        print("\nImage format type is not recognised. Is not png, svg or "
+              "pdf. Check your parameter file entry.")
         sys.exit()
         
-for x in par_list_G5_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entry for Footer text on/off in Parameter file"
-              " is missing.") 
-        sys.exit()     
-        
-for x in par_list_G6_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries/entry in Parameter file, Group 6 "
-              "is/are missing.")
-        sys.exit()
-    
-for x in par_list_G7_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries / entry in Parameter file, Group 7 "
-              "is/are missing.") 
+    return [save_format for save_format in ["pdf", "png", "svg"] \
+            if save_format in save_list]
+
+# Function to obtain the dpi for png output and check it.
+def read_png_dpi(par_dict):
+    try:
+        dpi_num = float(str(par_dict["Png dpi"]).replace(" ",""))
+    except:
+        print("\nProblem with dpi entry in Parameter file. Check it is "
+              "numeric and a sensible value. Values between 75 for a"
+              " coarse resolution and 1000 for a high resolution image"
+              " are most likely.")
         sys.exit()
-    
-for x in par_list_G8_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries/entry in Parameter file, Group 8 "
-              "is/are missing.") 
+                    
+    if pd.isnull(dpi_num) == True:
+        print("\nDpi entry required in Parameter file if png is"
+              " specified as output format.")
         sys.exit()
         
-for x in par_list_G9_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries/entry in Parameter file, Group 9 "
-              "is/are missing.")
-        sys.exit()
+    return dpi_num
+
+# Function to save the figure in one output format.
+def save_figure(fig, output_name, save_format, dpi_num):
+    if save_format == "png" and tile_cache == True:
+        save_png_tiles(fig, output_name, dpi_num)
+    elif save_format == "png" and panel_workers > 1:
+        save_png_parallel(fig, output_name, dpi_num)
+    elif save_format == "png":
+        fig.savefig(f"{output_name}.png", dpi = dpi_num)
+    else:
+        fig.savefig(f"{output_name}.{save_format}")
 
-if pd.isnull(par_list_G10_value) == True:
-    print("\nZones on/off entry in Parameter file, Group 10 is missing.") 
-    sys.exit()
+# Function to return the figure as the bytes of one output format.
+def figure_bytes(fig, output_format, par_dict):
+    buffer = io.BytesIO()
     
-if pd.isnull(par_list_G11_value) == True:
-    print("\nRC ages on/off entry in Parameter file, Group 11 is missing.")
-    sys.exit()
+    if output_format == "png":
+        fig.savefig(buffer, format = "png", dpi = read_png_dpi(par_dict))
+    else:
+        fig.savefig(buffer, format = output_format)
         
-if pd.isnull(par_list_G12_value) == True:
-    print("\nINT ages on/off entry in Parameter file Group 12 is missing.")
-    sys.exit()
+    return buffer.getvalue()
+
+# Function to save the figure in each requested format. The figure is
+# built once. When several formats are requested and more than one
+# processor is available each format is saved by a forked worker, which
+# inherits the built figure, so the formats are drawn side by side. A
+# format is saved here instead if its worker fails.
+def export_figure(fig, output_name, save_formats, dpi_num):
+    use_workers = len(save_formats) > 1 and (os.cpu_count() or 1) > 1 \
+        and "fork" in multiprocessing.get_all_start_methods()
     
-for x in par_list_G13_values:
-    if pd.isnull(x) == True:
-        print("\nEssential entries/entry in Parameter file, Group 13 "
-              "is/are missing.")         
-        sys.exit()   
+    if use_workers == True:
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target = save_figure, \
+                                   args = (fig, output_name, save_format, \
+                                           dpi_num)) \
+                   for save_format in save_formats]
         
-for x in par_list_G14_values:
-    if pd.isnull(x) == True:
-        print("\nIf any NSC not being used add 'none' to the relevent NSC "
-              "1 - 5 entry in Parameter file, Group 14.") 
-        sys.exit() 
+        for worker in workers:
+            worker.start()
         
-# Colours are from 1-23. This can be added to by the user if 
-# required (look up matplotlib colours). Just add more to the colour 
-# function and change the maximum colour number here. Declare number here
-# as checks  require this value.
-col_max = 23 
-
-###########################################################################
-###########################################################################
-# Change working directory stated in Parameter file and load in raw data
-# to be plotted from Input file. 
-os.chdir(par_dict["Directory**"]) 
-input_filename = par_dict["Input file name**"]
-
-# Error checking for Input file import
-try:
-    data = pd.read_csv(par_dict["Input file name**"])
-except:
-    print(f"\nProblem loading in Input file. Is {input_filename} the "
-          "correct name and in correct location ? Check location and "
-          "spelling of name.")
-    sys.exit()
-
-# Look for blanks in the Input file. If there are blanks give message and 
-# exit the program. Entries if not required should be filled with values of
-# zero
-for name, values in data.items():
-    for x in values:
-        if pd.isnull(x) == True:
-            print(f"\nEntry missing in input file in the {name} column."
-                  " There should be no blank entries. If it is a numeric "
-                  "value use a zero.")
-            sys.exit()
-    
-# Load in Extra Input file if required. File with information for plots  
-# with multiple entries.
-extra_yn = str(par_dict["Extra input file name**"]).strip()
-extra_input_filename = str(par_dict["Extra input file name**"])
+        for save_format, worker in zip(save_formats, workers):
+            worker.join()
+            
+            if worker.exitcode != 0:
+                save_figure(fig, output_name, save_format, dpi_num)
+            
+            print("")
+            print(f"\n**The {save_format} has been saved**")
+            
+        record_phase("savefig", ",".join(save_formats) + " (in parallel)")
+    else:
+        for save_format in save_formats:
+            save_figure(fig, output_name, save_format, dpi_num)
+            record_phase("savefig", save_format)
+            print("")
+            print(f"\n**The {save_format} has been saved**")
 
-# Error check importing of Extra Input file if user needs to use it
-if extra_yn != "none":
-    try:
-        data_extra = pd.read_csv(par_dict["Extra input file name**"])
-    except:
-        print(f"\nProblem loading in Extra Input file. Is "
-              f"{extra_input_filename} the correct name and in correct "
-              "location ? Check location and spelling of name.")
-        sys.exit()
-        
-# Remove columns in dataframes if have no values other than zero. Palaeo 
-# data should not have sums of zero or no data for any taxa. Pointless 
-# being there.If any are then the program removes the column automatically
-# for use in the  program.
-for name, values in data.iloc[38::,2:].items():
-    if values.sum() == 0:
-        data.drop(name, axis = 1, inplace = True)
-        
-    # Check input data for non numeric values
-    for x in values:
-        if np.isreal(x) == False:
-            print(f"\nThere is a non numeric element in the {name} "
-                  "column in the data frame. Data needs to be numeric.")
-            sys.exit()
-        
-# As above but for Extra Input file
-if extra_yn != "none":
-
-# Look for blanks in the Extra Input file if used. If there are blanks give
-# message and exit the program.
-    for name, values in data_extra.items():
-        for x in values:
-            if pd.isnull(x) == True:
-                print(f"\nEntry missing in Extra input file in the {name}"
-                      " column.There should be no blank entries. If it is"
-                      " a numeric value use a zero.")
-                sys.exit()
-    
-    for name, values in data_extra.iloc[38::,2:].items():
-        if values.sum() == 0:
-            data_extra.drop(name, axis = 1, inplace = True)
-
-# Determine stated output file name for pdf, png and svg outputs from 
-# Parameters.csv file.
-output_name = par_dict["Output file name**"]
-
-###########################################################################
-###########################################################################
-# Determine if Zones are required or not as specified by user.
-zones_on_off = par_dict["Zones on/off**"].replace(" ","").lower()
-
-# Obtain list of titles of taxa to be plotted from the Input files
-# (standard and extra).
-data_list = [col for col in data.columns]
-
-# The first column must be called Depth and be the data used the x axis 
-# (portrait) and always be the first column once the data file has been 
-# trimmed. The last column whether Zones are required or not should always
-# be called Zones. If not create an error message.
-if data_list [1] != "Depth" or data_list [-1] != "Zones":
-    print("\nThe second and last column of the input file must be the "
-          "'Depth' and 'Zones' columns. One or both are incorrect. Make "
-          "sure there are no spaces before or after the word 'Depth' or "
-          "'Zones' See manual for correct setup.")
-    sys.exit()
-
-# Make list of all Palaeo data names (not including Depth) but including
-# Zones as Zones plots as their own column on plot like a taxa. Reverse 
-# the list.
-data_list = data_list[2:]
-data_list = data_list[::-1]
-
-# Create taxa lists for Extra Input file if required by user. Check that
-# is set up correctly like above with Depth and Zones columns at either
-# end and reverse list 
-if extra_yn != "none":
-    data_list_extra = [col for col in data_extra.columns]
-    
-    if data_list_extra [1] != "Depth" or data_list_extra [-1] != "Zones":
-        print("\nThe second and last column of the extra input file must "
-              "be the 'Depth' and 'Zones' columns. One or both are "
-              "incorrect. Make sure there are no spaces before or after "
-              "the word 'Depth' or 'Zones' See manual for correct setup.")
-        sys.exit()
+###############################################################################
+###############################################################################
+# Panel tile cache for png output if --tile-cache is used. Each taxon panel
+# is kept on disk as a tile, the pixels it covers, named by a hash of the
+# panel's data, style and place on the page at the png dpi. When the png is
+# saved again only panels whose hash has changed are drawn, the rest are 
+# read from their tiles. The png is built up as the figure is drawn, the 
+# page first, then each panel in turn and then the taxon names (which are
+# lined up across all panels), zone lines, title and footer over them. The 
+# tiles are kept in the folder {Output file name}_tiles and tiles no 
+# longer used are removed.
+tile_cache = False
+
+# Function to turn what is passed to a draw call into bytes for the hash.
+# Paths, transforms, boxes, fonts and graphics settings are reduced to 
+# their values.
+def draw_bytes(value):
+    if isinstance(value, np.ndarray):
+        return repr((value.dtype.str, value.shape)).encode() + \
+               np.ascontiguousarray(value).tobytes()
+    if isinstance(value, (list, tuple)):
+        return b"(" + b",".join(draw_bytes(x) for x in value) + b")"
+    if isinstance(value, dict):
+        return draw_bytes([(str(k), value[k]) for k in sorted(value)])
+    if isinstance(value, matplotlib.path.Path):
+        return draw_bytes((value.vertices, value.codes))
+    if isinstance(value, TransformedPath):
+        return draw_bytes(value.get_fully_transformed_path())
+    if isinstance(value, Transform):
+        return draw_bytes(value.get_matrix())
+    if isinstance(value, BboxBase):
+        return draw_bytes(value.bounds)
+    if isinstance(value, FontProperties):
+        return draw_bytes((value.get_family(), value.get_style(), \
+                           value.get_variant(), value.get_weight(), \
+                           value.get_stretch(), value.get_size(), \
+                           value.get_file(), value.get_math_fontfamily()))
+    if isinstance(value, GraphicsContextBase):
+        return draw_bytes(vars(value))
+    
+    return repr(value).encode()
+
+# Renderer that draws nothing but hashes every draw call of a panel. Text
+# sizes come from the real renderer so the panel is laid out exactly as it
+# will be drawn.
+class PanelHashRenderer(RendererBase):
+    def __init__(self, renderer):
+        super().__init__()
+        self.renderer = renderer
+        self.digest = hashlib.sha256()
+    
+    def add(self, *call):
+        self.digest.update(draw_bytes(call))
+    
+    def draw_path(self, gc, path, transform, rgbFace = None):
+        self.add("path", gc, path, transform, rgbFace)
+    
+    def draw_markers(self, gc, marker_path, marker_trans, path, trans, \
+                     rgbFace = None):
+        self.add("markers", gc, marker_path, marker_trans, path, trans, \
+                 rgbFace)
+    
+    def draw_path_collection(self, gc, *collection):
+        self.add("collection", gc, collection)
+    
+    def draw_quad_mesh(self, gc, *mesh):
+        self.add("mesh", gc, mesh)
+    
+    def draw_gouraud_triangles(self, gc, *triangles):
+        self.add("triangles", gc, triangles)
+    
+    def draw_image(self, gc, x, y, im):
+        self.add("image", gc, x, y, im)
+    
+    def draw_text(self, gc, x, y, s, prop, angle, ismath = False, \
+                  mtext = None):
+        self.add("text", gc, x, y, s, prop, angle, ismath)
+    
+    def get_text_width_height_descent(self, s, prop, ismath):
+        return self.renderer.get_text_width_height_descent(s, prop, ismath)
+    
+    def get_canvas_width_height(self):
+        return self.renderer.get_canvas_width_height()
+    
+    def points_to_pixels(self, points):
+        return self.renderer.points_to_pixels(points)
+    
+    def option_image_nocomposite(self):
+        return self.renderer.option_image_nocomposite()
+    
+    def option_scale_image(self):
+        return self.renderer.option_scale_image()
+
+# Function to describe the ticks and label of an axis without drawing it.
+# The ticks are made from the tick positions and labels and the tick 
+# settings, so this is all that is needed for the hash. Drawing the axis 
+# would make every tick, which takes much longer. Only the label position
+# along the axis is used as the position across it is set when drawn.
+def axis_state(axis):
+    major = axis.get_majorticklocs()
+    minor = axis.get_minorticklocs()
+    
+    return ("axis", axis.axis_name, axis.get_visible(), axis.get_scale(), \
+            axis.get_view_interval(), major, \
+            axis.major.formatter.format_ticks(major), \
+            axis.major.formatter.get_offset(), minor, \
+            axis.minor.formatter.format_ticks(minor), \
+            axis.get_tick_params(which = "major"), \
+            axis.get_tick_params(which = "minor"), \
+            axis.get_ticks_position(), axis.get_label_position(), \
+            axis.labelpad, axis.label.get_text(), \
+            axis.label.get_fontproperties(), axis.label.get_color(), \
+            axis.label.get_rotation(), axis.label.get_visible(), \
+            axis.label.get_position()[axis.axis_name == "y"])
+
+# Function to make the hash of a panel. Everything in the panel apart from
+# its axes is passed through the hash renderer and the axes are described
+# by axis_state.
+def panel_key(graph, renderer, page):
+    hasher = PanelHashRenderer(renderer)
+    hasher.digest.update(page)
+    graph.apply_aspect()
+    
+    for artist in graph.get_children():
+        if isinstance(artist, matplotlib.axis.Axis):
+            hasher.add(axis_state(artist))
+        else:
+            artist.draw(hasher)
+    
+    return hasher.digest.hexdigest()
+
+# Function to cut out the drawn part of the renderer as an image, returned
+# with its row and column in the png (None if nothing is drawn). Agg draws
+# RGBA with the colours not multiplied by alpha, as PIL expects.
+def drawn_tile(renderer):
+    pixels = np.asarray(renderer.buffer_rgba())
+    rows = np.flatnonzero(pixels[:, :, 3].any(axis = 1))
+    
+    if len(rows) == 0:
+        return None, 0, 0
+    
+    cols = np.flatnonzero(pixels[rows[0]:rows[-1] + 1, :, 3].any(axis = 0))
+    tile = Image.fromarray(pixels[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1])
+    
+    return tile, int(rows[0]), int(cols[0])
+
+# Function to place the taxon names (y axis labels) lined up as by 
+# fig.align_ylabels in render. This follows matplotlib's own placing of a 
+# lined up label but finds the tick labels of each panel once rather than 
+# once for every panel it is lined up with. The parts of matplotlib used
+# for this are private and may change in a later matplotlib, so if they are
+# missing the names are lined up by drawing the figure without rendering it.
+def place_taxon_names(fig, renderer):
+    if hasattr(fig, "_align_label_groups") == False or \
+        hasattr(matplotlib.axis.Axis, "_get_ticklabel_bboxes") == False or \
+        hasattr(matplotlib.axis.Axis, "_update_ticks") == False:
+        fig.draw_without_rendering()
+        return
+    
+    graphs = [graph for graph in fig.axes if graph.get_visible() == True]
+    groups = fig._align_label_groups["y"]
+    boxes = {}
+    
+    for graph in graphs:
+        boxes[graph] = graph.yaxis._get_ticklabel_bboxes( \
+                           graph.yaxis._update_ticks(), renderer)
+    
+    for graph in graphs:
+        siblings = [sibling for sibling in groups.get_siblings(graph) \
+                    if sibling in boxes]
+        pad = graph.yaxis.labelpad * fig.dpi / 72
+        y = graph.yaxis.label.get_position()[1]
+        
+        if graph.yaxis.get_label_position() == "left":
+            bbox = Bbox.union([box for sibling in siblings for box in \
+                               boxes[sibling][0]] + \
+                              [graph.spines.get("left", graph). \
+                               get_window_extent()])
+            graph.yaxis.label.set_position((bbox.x0 - pad, y))
+        else:
+            bbox = Bbox.union([box for sibling in siblings for box in \
+                               boxes[sibling][1]] + \
+                              [graph.spines.get("right", graph). \
+                               get_window_extent()])
+            graph.yaxis.label.set_position((bbox.x1 + pad, y))
+
+# Function to save the png from the panel tiles, drawing only the panels 
+# that have changed since their tiles were made.
+def save_png_tiles(fig, output_name, dpi_num):
+    tile_dir = f"{output_name}_tiles"
+    os.makedirs(tile_dir, exist_ok = True)
+    
+    figure_dpi = fig.dpi
+    figure_canvas = fig.canvas
+    used_tiles = []
+    reused = 0
     
-    data_list_extra = data_list_extra[2:]
-    data_list_extra = data_list_extra[::-1]   
-
-# If zones are not requested in Parameter file remove the Zones title 
-# from the list of taxa
-if zones_on_off == "off":
-    data_list = data_list[1::]
-
-# Data_list_1 is the first taxon and has depth plotted with it with labels 
-# etc. Data_list_1 is used to identify this later in code for plotting for 
-# main dataframe only not extra.
-data_list_1 = data_list[-1]
-
-# Create dataframe of taxa and graph type choices selecetd by user from 
-# Input file and remove Depth which always has zero value as is meaningless
-data_1 = data.iloc[0:1,1::].transpose()
-data_1 = data_1.drop("Depth")
-
-# If zones not requested by user remove from dataframe of taxa and graph 
-# type choices 
-if zones_on_off == "off":
-    data_1 = data_1.drop("Zones")
-
-# Change dataframe titles to Taxa and graph and sort alphabetically   
-data_1 = data_1.reset_index()
-data_1.rename(columns = {"index": "TAXA"}, inplace = True)
-data_1.rename(columns = {0: "graph"}, inplace = True)
-data_1 = data_1.sort_values("TAXA")
-
-# Create dictionary of taxa to be plotted and associated 'plot style' 
-# reference numbers, plot style numbers are from 1-7.
-# 1 is a barplot 
-# 2 is a bar and lineplot,
-# 3 lineplot 
-# 4 is a lineplot with shaded section under the line
-# 5 is a line and marker plot,
-# 6 is a marker plot only
-# 7 is a stack plot (only 2 of these are possible at present).
-# Plot style 1-7 is listed in row 2 of the input file by user.
-taxa, plot = list(data_1.iloc[:,0]), list(data_1.iloc[:,1])
-plot_type = {taxons: plot_styles for taxons, plot_styles \
-             in zip(taxa, plot)}
-
-# Error checking for plot type number 7. Only two instances of this plot
-# type are allowed at present. Can incresae with additional code.
-if sum(value == 7 for value in plot_type.values()) > 2:
-    print("\nOnly 2 stack style plots are available at present. More "
-          "than 2 have been specified.")
-    sys.exit()
-     
-# For 'extra' data obtain taxon names.
-if extra_yn != "none":
-    taxa_extra = data_list_extra
-
-# Create list of taxa to be plotted and the order number they are in the
-# data provided (this is reversed)
-data_list_dict = {k: v for k, v in zip(data_list, \
-                                       np.arange(0, len(data_list), 1))}
-
-###########################################################################
-###########################################################################
-# Get user options from the Input file
-
-###########################################################################
-# Get colour index values for bars for graph types 1, 2 from Input file.
-# These are 1-23 (see manual). More colours can be added if required.
-bar_col = data.iloc[1:2,1::].transpose()
-bar_col = bar_col.drop("Depth")
-
-if zones_on_off == "off":
-    bar_col = bar_col.drop("Zones")
-   
-bar_col = bar_col.reset_index()
-bar_col.rename(columns = {"index": "TAXA"}, inplace = True)
-bar_col.rename(columns = {1: "bar_colour"}, inplace = True)
-bar_col = bar_col.sort_values ("TAXA")
-
-# Create dictionary of taxa titles and plot colour indexes.
-taxa_bar_col, bar_colour = list(bar_col.iloc [:,0]), list(bar_col.iloc \
-                                                          [:,1])
-bar_col_type = {taxa_bar_cols: colours for taxa_bar_cols, colours \
-                in zip(taxa_bar_col, bar_colour)}
-
-###########################################################################
-# Get width values for bars for graph type 1 from Input file (see manual).
-bar_w_g1 = data.iloc[2:3,1::].transpose()
-bar_w_g1 = bar_w_g1.drop("Depth")
-
-if zones_on_off == "off":
-    bar_w_g1 = bar_w_g1.drop("Zones")
-    
-bar_w_g1 = bar_w_g1.reset_index()
-bar_w_g1.rename(columns = {"index": "TAXA"}, inplace = True)
-bar_w_g1.rename(columns = {1: "WIDTH"}, inplace = True)
-bar_w_g1 = bar_w_g1.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_bar_g1_width, bar_g1_width = list(bar_w_g1.iloc [:,0]), \
-                                  list(bar_w_g1.iloc [:,1])
-bar_wid_g1 = {taxa_bar_g1_widths: bar_g1_widths for taxa_bar_g1_widths, \
-              bar_g1_widths in zip(taxa_bar_g1_width, bar_g1_width)}
-
-###########################################################################
-# Get width values for bars for graph type 2 from Input file (see manual).
-bar_w = data.iloc[3:4,1::].transpose()
-bar_w = bar_w.drop("Depth")
-
-if zones_on_off == "off":
-    bar_w = bar_w.drop("Zones")
-    
-bar_w = bar_w.reset_index()
-bar_w.rename(columns = {"index": "TAXA"}, inplace = True)
-bar_w.rename(columns = {1: "WIDTH"}, inplace = True)
-bar_w = bar_w.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_bar_width, bar_width =list(bar_w.iloc [:,0]), list(bar_w.iloc [:,1])
-bar_wid = {taxa_bar_widths: bar_widths for taxa_bar_widths, bar_widths \
-           in zip(taxa_bar_width, bar_width)}
-
-###########################################################################
-# Get linestyle values for lines for graphs 2, 3, 4, and 5 from 
-# Input files (see manual).
-line_s = data.iloc[4:5,1::].transpose()
-line_s = line_s.drop("Depth")
-
-if zones_on_off == "off":
-    line_s = line_s.drop("Zones")
-    
-line_s = line_s.reset_index()
-line_s.rename(columns = {"index": "TAXA"}, inplace = True)
-line_s.rename(columns = {1: "style"}, inplace = True)
-line_s = line_s.sort_values ("TAXA")
-
-# Create dictionary of above.
-taxa_line_style, line_style = list(line_s.iloc [:,0]), \
-                              list(line_s.iloc [:,1])
-                              
-line_type = {taxa_line_styles: line_styles for taxa_line_styles, \
-             line_styles in zip(taxa_line_style, line_style)}
+    try:
+        fig.dpi = dpi_num
+        renderer = FigureCanvasAgg(fig).get_renderer()
+        page = draw_bytes((renderer.width, renderer.height, dpi_num, \
+                           matplotlib.__version__, \
+                           sorted(matplotlib.rcParams.items())))
+        
+        # The page (figure background) the panels are laid on. It is copied
+        # out of the renderer as the renderer is cleared for each panel.
+        fig.patch.draw(renderer)
+        image = Image.fromarray(np.array(renderer.buffer_rgba()))
+        
+        for graph in fig.axes:
+            if graph.get_visible() == False:
+                continue
+            
+            key = panel_key(graph, renderer, page)
+            found = glob.glob(os.path.join(tile_dir, f"{key}_*.png"))
+            
+            if len(found) > 0:
+                row, col = os.path.basename(found[0])[:-4].split("_")[1:]
+                tile = Image.open(found[0])
+                used_tiles.append(found[0])
+                reused = reused + 1
+            else:
+                # The taxon name is left out of the tile as it is lined up
+                # with the names of the other panels.
+                renderer.clear()
+                graph.yaxis.label.set_visible(False)
+                graph.draw(renderer)
+                graph.yaxis.label.set_visible(True)
+                tile, row, col = drawn_tile(renderer)
+                
+                if tile is None:
+                    continue
+                
+                tile_name = os.path.join(tile_dir, f"{key}_{row}_{col}.png")
+                tile.save(tile_name, compress_level = 1)
+                used_tiles.append(tile_name)
+            
+            image.alpha_composite(tile, (int(col), int(row)))
+        
+        # Taxon names, then the zone lines, title, footer and anything else
+        # drawn on the figure itself go over the panels.
+        renderer.clear()
+        place_taxon_names(fig, renderer)
+        
+        for graph in fig.axes:
+            if graph.get_visible() == True and \
+                graph.yaxis.get_visible() == True:
+                graph.yaxis.label.draw(renderer)
+        
+        for artist in sorted([artist for artist in fig.get_children() \
+                              if artist is not fig.patch and artist not in \
+                              fig.axes and artist.get_visible() == True], \
+                             key = lambda artist: artist.get_zorder()):
+            artist.draw(renderer)
+        
+        tile, row, col = drawn_tile(renderer)
+        
+        if tile is not None:
+            image.alpha_composite(tile, (col, row))
+        
+        matplotlib.image.imsave(f"{output_name}.png", np.asarray(image), \
+                                dpi = dpi_num)
+    finally:
+        fig.dpi = figure_dpi
+        fig.set_canvas(figure_canvas)
+    
+    # Remove tiles of panels that are no longer in the figure.
+    for tile_name in glob.glob(os.path.join(tile_dir, "*.png")):
+        if tile_name not in used_tiles:
+            os.remove(tile_name)
+    
+    print(f"\n **{reused} of {len(fig.axes)} panels reused from "
+          f"{tile_dir}**")
 
-# As above for extra data file if required by user
-if extra_yn != "none":
-    line_s_ex = data_extra.iloc[4:5,1::].transpose()
-    line_s_ex = line_s_ex.drop("Depth")
-    
-    if zones_on_off == "off":
-        line_s_ex = line_s_ex.drop("Zones")
-        
-    line_s_ex = line_s_ex.reset_index()
-    line_s_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    line_s_ex.rename(columns = {1: "style"}, inplace = True)
-    line_s_ex = line_s_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_line_style_ex, line_style_ex = list(line_s_ex.iloc[:,0]), \
-                                        list(line_s_ex.iloc[:,1])
-    line_type_ex = {taxa_line_style_exs: line_style_exs for \
-                    taxa_line_style_exs, line_style_exs in \
-                        zip(taxa_line_style_ex, line_style_ex)}
-
-###########################################################################
-# Get line colour values for lines for graphs 2, 3, 4, and 5 from Input
-# files (see manual).
-line_col = data.iloc[5:6,1::].transpose()
-line_col = line_col.drop("Depth")
-
-if zones_on_off == "off":
-    line_col = line_col.drop("Zones")
-    
-line_col = line_col.reset_index()
-line_col.rename(columns = {"index": "TAXA"}, inplace = True)
-line_col.rename(columns = {1: "colour"}, inplace = True)
-line_col = line_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_line_col, line_colour = list(line_col.iloc[:,0]), \
-                             list(line_col.iloc[:,1])
-line_colour_type = {taxa_line_cols: line_colours for taxa_line_cols, \
-                    line_colours in zip(taxa_line_col, line_colour)}
-
-# As above for extra data file if required by user
-if extra_yn != "none":
-    line_col_ex = data_extra.iloc[5:6,1::].transpose()
-    line_col_ex = line_col_ex.drop("Depth")
-    
-    if zones_on_off == "off":
-        line_col_ex = line_col_ex.drop("Zones")
-        
-    line_col_ex = line_col_ex.reset_index()
-    line_col_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    line_col_ex.rename(columns = {1: "colour"}, inplace = True)
-    line_col_ex = line_col_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_line_col_ex, line_colour_ex = list(line_col_ex.iloc[:,0]), \
-                                       list(line_col_ex.iloc[:,1])
-    line_colour_type_ex= {taxa_line_col_exs: line_colour_exs for \
-                          taxa_line_col_exs, line_colour_exs \
-                          in zip(taxa_line_col_ex, line_colour_ex)}
-
-###########################################################################
-# Get fill colour values for graphs 2 and 4 from Input files (see manual).
-fill_col= data.iloc[6:7,1::].transpose()
-fill_col= fill_col.drop("Depth")
-
-if zones_on_off == "off":
-    fill_col= fill_col.drop("Zones")
-    
-fill_col= fill_col.reset_index()
-fill_col.rename(columns = {"index": "TAXA"}, inplace = True)
-fill_col.rename(columns = {1: "colour"}, inplace = True)
-fill_col= fill_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_fill_col, fill_colour = list(fill_col.iloc[:,0]), \
-                             list(fill_col.iloc[:,1])
-fill_colour_type = {taxa_fill_cols: fill_colours for taxa_fill_cols, \
-                    fill_colours in zip(taxa_fill_col, fill_colour)}
-
-###########################################################################
-# Get fill colour transparency values for graphs 2 and 4 from Input files 
-# (see manual).
-fill_t = data.iloc[7:8,1::].transpose()
-fill_t = fill_t.drop("Depth")
-
-if zones_on_off == "off":
-    fill_t= fill_t.drop("Zones")
-    
-fill_t= fill_t.reset_index()
-fill_t.rename(columns = {"index": "TAXA"}, inplace = True)
-fill_t.rename(columns = {1: "TRANS"}, inplace = True)
-fill_t= fill_t.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_fill_tran, fill_tran = list(fill_t.iloc[:,0]), \
-                            list(fill_t.iloc[:,1])
-fill_trans_type = {taxa_fill_trans: fill_trans for taxa_fill_trans, \
-                   fill_trans in zip(taxa_fill_tran, fill_tran)}
-
-###########################################################################
-# Get line width values for graphs 2, 3, 4, 5 and 7 from Input files (see 
-# manual).
-line_wid = data.iloc[8:9,1::].transpose()
-line_wid = line_wid.drop("Depth")
-
-if zones_on_off == "off":
-    line_wid = line_wid.drop("Zones")
-    
-line_wid = line_wid.reset_index()
-line_wid.rename(columns = {"index": "TAXA"}, inplace = True)
-line_wid.rename(columns = {1: "WIDTH"}, inplace = True)
-line_wid = line_wid.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_line_width, line_width = list(line_wid.iloc[:,0]), \
-                              list(line_wid.iloc[:,1])
-line_width_type = {taxa_line_widths: line_widths for taxa_line_widths, \
-                   line_widths in zip(taxa_line_width, line_width)}
-
-# As above for extra data file if requested by user
-if extra_yn != "none":
-    line_wid_ex = data_extra.iloc[8:9,1::].transpose()
-    line_wid_ex = line_wid_ex.drop("Depth")
+###############################################################################
+###############################################################################
+# Parallel drawing of png output if --panel-workers is more than 1. Each 
+# worker is forked so it has the built figure, and the data in it, without
+# anything being copied or pickled. The panels are shared out down the page
+# and each worker draws its share on its own copy of the page, noting the
+# pixel rows each panel covers. Rows covered only by panels of one worker
+# are copied by that worker into a block of shared memory holding the png.
+# Rows covered by panels of more than one worker (where tick labels, taxon
+# names or grouping annotations of one share reach into another) are drawn
+# again with every panel covering them, in the order the figure draws them,
+# so the png is the same pixel for pixel as one drawn in one go. The zone 
+# lines, title and footer are then drawn over the panels. The png is drawn
+# in one go instead where forked workers are not available (windows) or a
+# worker fails.
+panel_workers = 1
+
+# Renderer that passes every draw call to the page and to a clear renderer,
+# so the pixels covered can be found from the clear renderer without 
+# changing how anything is drawn on the page.
+class PanelCoverRenderer(RendererBase):
+    def __init__(self, renderer, cover):
+        super().__init__()
+        self.renderer = renderer
+        self.cover = cover
+    
+    def draw_path(self, gc, path, transform, rgbFace = None):
+        self.cover.draw_path(gc, path, transform, rgbFace)
+        self.renderer.draw_path(gc, path, transform, rgbFace)
+    
+    def draw_markers(self, gc, marker_path, marker_trans, path, trans, \
+                     rgbFace = None):
+        self.cover.draw_markers(gc, marker_path, marker_trans, path, trans, \
+                                rgbFace)
+        self.renderer.draw_markers(gc, marker_path, marker_trans, path, \
+                                   trans, rgbFace)
+    
+    def draw_path_collection(self, gc, *collection):
+        self.cover.draw_path_collection(gc, *collection)
+        self.renderer.draw_path_collection(gc, *collection)
+    
+    def draw_quad_mesh(self, gc, *mesh):
+        self.cover.draw_quad_mesh(gc, *mesh)
+        self.renderer.draw_quad_mesh(gc, *mesh)
+    
+    def draw_gouraud_triangles(self, gc, *triangles):
+        self.cover.draw_gouraud_triangles(gc, *triangles)
+        self.renderer.draw_gouraud_triangles(gc, *triangles)
+    
+    def draw_image(self, gc, x, y, im):
+        self.cover.draw_image(gc, x, y, im)
+        self.renderer.draw_image(gc, x, y, im)
+    
+    def draw_text(self, gc, x, y, s, prop, angle, ismath = False, \
+                  mtext = None):
+        self.cover.draw_text(gc, x, y, s, prop, angle, ismath, mtext)
+        self.renderer.draw_text(gc, x, y, s, prop, angle, ismath, mtext)
+    
+    def get_text_width_height_descent(self, s, prop, ismath):
+        return self.renderer.get_text_width_height_descent(s, prop, ismath)
+    
+    def get_canvas_width_height(self):
+        return self.renderer.get_canvas_width_height()
+    
+    def points_to_pixels(self, points):
+        return self.renderer.points_to_pixels(points)
+    
+    def option_image_nocomposite(self):
+        return self.renderer.option_image_nocomposite()
+    
+    def option_scale_image(self):
+        return self.renderer.option_scale_image()
+
+# Function to keep the taxon names where place_taxon_names put them, so a
+# worker does not line them up again against every other panel.
+def hold_taxon_names(graphs):
+    for graph in graphs:
+        graph.yaxis.set_label_coords(*graph.yaxis.label.get_position(), \
+                                     transform = \
+                                     graph.yaxis.label.get_transform())
+
+# Function run by a worker to draw its share of the panels. The first and
+# last rows each panel covers are noted (-1 if none) and the rows covered
+# are copied into the png. The clear renderer is set to zero so any pixel 
+# drawn on is no longer zero.
+def draw_panel_share(renderer, graphs, share, cover_rows, png):
+    hold_taxon_names(graphs)
+    
+    cover = RendererAgg(renderer.width, renderer.height, renderer.dpi)
+    cover_pixels = np.asarray(cover.buffer_rgba()).view(np.uint32)[:, :, 0]
+    cover_pixels[:] = 0
+    page_renderer = PanelCoverRenderer(renderer, cover)
+    
+    for number in share:
+        graphs[number].draw(page_renderer)
+        rows = np.flatnonzero(cover_pixels.any(axis = 1))
+        
+        if len(rows) > 0:
+            cover_rows[number] = rows[0], rows[-1]
+            cover_pixels[rows[0]:rows[-1] + 1] = 0
+    
+    page = np.asarray(renderer.buffer_rgba())
+    
+    for first, last in cover_rows[share]:
+        if first >= 0:
+            png[first:last + 1] = page[first:last + 1]
+
+# Function run by a worker to draw again the rows covered by panels of more
+# than one worker, drawing every panel that covers them.
+def draw_panel_seams(renderer, graphs, numbers, rows, png):
+    hold_taxon_names(graphs)
+    
+    for number in numbers:
+        graphs[number].draw(renderer)
+    
+    png[rows] = np.asarray(renderer.buffer_rgba())[rows]
+
+# Function to run each job (a function and its arguments) in a forked
+# worker and wait for them all. Returns False if any worker failed.
+def run_forked(jobs):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target = target, args = args) \
+               for target, args in jobs]
+    
+    for worker in workers:
+        worker.start()
+    
+    for worker in workers:
+        worker.join()
+    
+    return all(worker.exitcode == 0 for worker in workers)
+
+# Function to draw the png with the panels shared out between the workers.
+# Returns the pixels, or None if the png has to be drawn in one go.
+def draw_png_parallel(fig):
+    renderer = FigureCanvasAgg(fig).get_renderer()
     
-    if zones_on_off == "off":
-        line_wid_ex = line_wid_ex.drop("Zones")
-        
-    line_wid_ex = line_wid_ex.reset_index()
-    line_wid_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    line_wid_ex.rename(columns = {1: "WIDTH"}, inplace = True)
-    line_wid_ex = line_wid_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_line_width_ex, line_width_ex = list(line_wid_ex.iloc[:,0]), \
-                                        list(line_wid_ex.iloc[:,1])
-    line_width_type_ex = {taxa_line_width_exs:line_width_exs for \
-                          taxa_line_width_exs, line_width_exs\
-                           in zip(taxa_line_width_ex, line_width_ex)}
-
-###########################################################################
-# Get marker type values for graphs 5 and 6 from Input files (see manual).
-marker_typ = data.iloc[9:10,1::].transpose()
-marker_typ = marker_typ.drop("Depth")
-
-if zones_on_off == "off":
-    marker_typ = marker_typ.drop("Zones")
-    
-marker_typ = marker_typ.reset_index()
-marker_typ.rename(columns = {"index": "TAXA"}, inplace = True)
-marker_typ.rename(columns = {1: "TYPE"}, inplace = True)
-marker_typ = marker_typ.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_marker_type, marker_type = list(marker_typ.iloc[:,0]), \
-                                list(marker_typ.iloc[:,1])
-marker_typ_type = {taxa_marker_types: marker_types for taxa_marker_types, \
-                   marker_types in zip(taxa_marker_type, marker_type)}
-
-# As above for extra data file if requested by user
-if extra_yn != "none":
-    marker_typ_ex = data_extra.iloc[9:10,1::].transpose()
-    marker_typ_ex = marker_typ_ex.drop("Depth")
+    # Everything on the figure in the order the figure draws it.
+    for graph in fig.axes:
+        graph.apply_aspect()
     
-    if zones_on_off == "off":
-        marker_typ_ex = marker_typ_ex.drop("Zones")
-        
-    marker_typ_ex = marker_typ_ex.reset_index()
-    marker_typ_ex.rename(columns = {"index":"TAXA"}, inplace = True)
-    marker_typ_ex.rename(columns = {1: "TYPE"}, inplace = True)
-    marker_typ_ex = marker_typ_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_marker_type_ex, marker_type_ex = list(marker_typ_ex.iloc[:,0]), \
-                                          list(marker_typ_ex.iloc[:,1])
-    marker_typ_type_ex = {taxa_marker_type_exs: marker_type_exs for \
-                          taxa_marker_type_exs, marker_type_exs \
-                          in zip(taxa_marker_type_ex, marker_type_ex)}
-
-###########################################################################
-# Get marker size values for graphs 5 and 6 from Input files (see manual).
-marker_s = data.iloc[10:11,1::].transpose()
-marker_s = marker_s.drop("Depth")
-
-if zones_on_off == "off":
-    marker_s = marker_s.drop("Zones")
-    
-marker_s = marker_s.reset_index()
-marker_s.rename(columns = {"index": "TAXA"}, inplace = True)
-marker_s.rename(columns = {1: "SIZE"}, inplace = True)
-marker_s = marker_s.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_marker_size, marker_size = list(marker_s.iloc[:,0]), \
-                                list(marker_s.iloc[:,1])
-marker_s_size = {taxa_marker_sizes: marker_sizes for taxa_marker_sizes, \
-                 marker_sizes in zip(taxa_marker_size, marker_size)}
-
-# As above for extra data file if requested by user
-if extra_yn != "none":
-    marker_s_ex = data_extra.iloc[10:11,1::].transpose()
-    marker_s_ex = marker_s_ex.drop("Depth")
+    artists = sorted([artist for artist in fig.get_children() \
+                      if artist is not fig.patch and \
+                      artist.get_animated() == False], \
+                     key = lambda artist: artist.get_zorder())
+    graphs = [artist for artist in artists if artist in fig.axes]
     
-    if zones_on_off == "off":
-        marker_s_ex = marker_s_ex.drop("Zones")
-        
-    marker_s_ex = marker_s_ex.reset_index()
-    marker_s_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    marker_s_ex.rename(columns = {1: "SIZE"}, inplace = True)
-    marker_s_ex = marker_s_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_marker_size_ex, marker_size_ex = list(marker_s_ex.iloc[:,0]), \
-                                          list(marker_s_ex.iloc[:,1])
-    marker_s_size_ex = {taxa_marker_size_exs: marker_size_exs \
-                        for taxa_marker_size_exs, \
-                        marker_size_exs in zip(taxa_marker_size_ex, \
-                        marker_size_ex)}
-
-###########################################################################
-# Get marker face colour values for graphs 5 and 6 from Input files (see 
-# manual).
-marker_f = data.iloc[11:12,1::].transpose()
-marker_f = marker_f.drop("Depth")
-
-if zones_on_off == "off":
-    marker_f = marker_f.drop("Zones")
-    
-marker_f = marker_f.reset_index()
-marker_f.rename(columns = {"index": "TAXA"}, inplace = True)
-marker_f.rename(columns = {1: "colour"}, inplace = True)
-marker_f = marker_f.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_marker_f_col, marker_f_col = list(marker_f.iloc[:,0]), \
-                                  list(marker_f.iloc[:,1])
-marker_f_col = {taxa_marker_f_cols: marker_f_cols for taxa_marker_f_cols, \
-                marker_f_cols in zip(taxa_marker_f_col, marker_f_col)}
-
-# As above for extra data file if requested by user
-if extra_yn != "none":
-    marker_f_ex = data_extra.iloc[11:12,1::].transpose()
-    marker_f_ex = marker_f_ex.drop("Depth")
+    # Panels can only be shared out if nothing else is drawn before or 
+    # between them.
+    if len(graphs) < 2 or artists[:len(graphs)] != graphs:
+        return None
     
-    if zones_on_off == "off":
-        marker_f_ex = marker_f_ex.drop("Zones")
-        
-    marker_f_ex = marker_f_ex.reset_index()
-    marker_f_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    marker_f_ex.rename(columns = {1: "colour"}, inplace = True)
-    marker_f_ex = marker_f_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_marker_f_col_ex, marker_f_col_ex = list(marker_f_ex.iloc[:,0]), \
-                                            list(marker_f_ex.iloc[:,1])
-    marker_f_col_ex = {taxa_marker_f_col_exs: marker_f_col_exs \
-                       for taxa_marker_f_col_exs, marker_f_col_exs \
-                           in zip(taxa_marker_f_col_ex, marker_f_col_ex)}
-
-###########################################################################
-# Get marker edge colour values for graphs 5 and 6 from Input files (see 
-# manual).
-marker_e = data.iloc[12:13,1::].transpose()
-marker_e = marker_e.drop("Depth")
-
-if zones_on_off == "off":
-    marker_e= marker_e.drop("Zones")
-    
-marker_e = marker_e.reset_index()
-marker_e.rename(columns = {"index": "TAXA"}, inplace = True)
-marker_e.rename(columns = {1: "colour"}, inplace = True)
-marker_e = marker_e.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_marker_e_col, marker_e_col = list(marker_e.iloc[:,0]), \
-                                  list(marker_e.iloc[:,1])
-marker_e_col = {taxa_marker_e_cols: marker_e_cols for taxa_marker_e_cols, \
-                marker_e_cols in zip(taxa_marker_e_col, marker_e_col)}
-
-# As above for extra data file if requested by user.
-if extra_yn != "none":
-    marker_e_ex = data_extra.iloc[12:13,1::].transpose()
-    marker_e_ex = marker_e_ex.drop("Depth")
+    place_taxon_names(fig, renderer)
+    renderer.clear()
+    fig.patch.draw(renderer)
+    page = np.asarray(renderer.buffer_rgba())
+    height = page.shape[0]
     
-    if zones_on_off == "off":
-        marker_e_ex = marker_e_ex.drop("Zones")
-        
-    marker_e_ex = marker_e_ex.reset_index()
-    marker_e_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    marker_e_ex.rename(columns = {1: "colour"}, inplace = True)
-    marker_e_ex = marker_e_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_marker_e_col_ex, marker_e_col_ex = list(marker_e_ex.iloc[:,0]), \
-                                            list(marker_e_ex.iloc[:,1])
-    marker_e_col_ex = {taxa_marker_e_col_exs: marker_e_col_exs for \
-                       taxa_marker_e_col_exs, marker_e_col_exs \
-                       in zip(taxa_marker_e_col_ex, marker_e_col_ex)}
-
-###########################################################################
-# Get marker edge width values for graphs 5 and 6 from Input files (see 
-# manual).
-marker_e_w = data.iloc[13:14,1::].transpose()
-marker_e_w = marker_e_w.drop("Depth")
-
-if zones_on_off == "off":
-    marker_e_w = marker_e_w.drop("Zones")
-    
-marker_e_w = marker_e_w.reset_index()
-marker_e_w.rename(columns = {"index": "TAXA"}, inplace = True)
-marker_e_w.rename(columns = {1: "WIDTH"}, inplace = True)
-marker_e_w = marker_e_w.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_marker_e_w_wid, marker_e_w_wid = list(marker_e_w.iloc[:,0]), \
-                                      list(marker_e_w.iloc[:,1])
-marker_e_w_wid = {taxa_marker_e_w_wids: marker_e_w_wids for \
-                  taxa_marker_e_w_wids, marker_e_w_wids \
-                  in zip(taxa_marker_e_w_wid, marker_e_w_wid)}
-
-# As above for extra data file if requested by user.
-if extra_yn != "none":
-    marker_e_w_ex = data_extra.iloc[13:14,1::].transpose()
-    marker_e_w_ex = marker_e_w_ex.drop("Depth")
+    memory = shared_memory.SharedMemory(create = True, size = page.nbytes + \
+                                        len(graphs) * 16)
     
-    if zones_on_off == "off":
-        marker_e_w_ex = marker_e_w_ex.drop("Zones")
-        
-    marker_e_w_ex = marker_e_w_ex.reset_index()
-    marker_e_w_ex.rename(columns = {"index": "TAXA"}, inplace = True)
-    marker_e_w_ex.rename(columns = {1: "WIDTH"}, inplace = True)
-    marker_e_w_ex = marker_e_w_ex.sort_values("TAXA")
-    
-    # Create dictionary of above.
-    taxa_marker_e_w_wid_ex, marker_e_w_wid_ex \
-                            = list(marker_e_w_ex.iloc[:,0]), \
-                              list(marker_e_w_ex.iloc[:,1])
-    marker_e_w_wid_ex = {taxa_marker_e_w_wid_exs: marker_e_w_wid_exs \
-                         for taxa_marker_e_w_wid_exs, marker_e_w_wid_exs \
-                         in zip(taxa_marker_e_w_wid_ex, \
-                         marker_e_w_wid_ex)}
-
-###########################################################################
-# Obtain colour value for taxon title colour from 1-23 (see manual) from
-# Input files.
-taxon_c = data.iloc[14:15,1::].transpose()
-taxon_c = taxon_c.drop("Depth")
-
-if zones_on_off == "off":
-    taxon_c = taxon_c.drop("Zones")
-    
-taxon_c = taxon_c.reset_index()
-taxon_c.rename(columns = {"index": "TAXA"}, inplace = True)
-taxon_c.rename(columns = {1: "colour"}, inplace = True)
-taxon_c = taxon_c.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_taxon_col, taxon_col = list(taxon_c.iloc[:,0]), \
-                            list(taxon_c.iloc[:,1])
-taxon_col = [x + 1 if x == 0  else x for x in taxon_col]
-
-taxa_taxon_c_col = {taxa_taxon_c_cols: taxon_cols for taxa_taxon_c_cols, \
-                    taxon_cols in zip(taxa_taxon_col, taxon_col)}
-
-###########################################################################
-# Obtain bold value for taxon title value of 0 or 1 from Input files.
-taxon_b = data.iloc[15:16,1::].transpose()
-taxon_b = taxon_b.drop("Depth")
-
-if zones_on_off == "off":
-    taxon_b = taxon_b.drop("Zones")
-    
-taxon_b = taxon_b.reset_index()
-taxon_b.rename(columns = {"index": "TAXA"}, inplace = True)
-taxon_b.rename(columns = {1: "bold"}, inplace = True)
-taxon_b = taxon_b.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_taxon_bold, taxon_bold = list(taxon_b.iloc[:,0]), \
-                              list(taxon_b.iloc[:,1])
-taxa_taxon_b_bold = {taxa_taxon_bolds: taxon_bolds for taxa_taxon_bolds, \
-                     taxon_bolds in zip(taxa_taxon_bold, taxon_bold)}
-
-###########################################################################
-# Obtain vertical spine width value for taxon from input files. If
-# required suggest values between 0.5 and 2.
-plot_vsw = data.iloc[16:17,1::].transpose()
-plot_vsw = plot_vsw.drop("Depth")
-
-if zones_on_off == "off":
-    plot_vsw = plot_vsw.drop("Zones")
-    
-plot_vsw = plot_vsw.reset_index()
-plot_vsw.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_vsw.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_vsw = plot_vsw.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_vsw, taxon_plot_vsw = list(plot_vsw.iloc[:,0]), \
-                                list(plot_vsw.iloc[:,1])
-taxa_plot_vs_width = {taxa_plot_vsws: taxon_plot_vsws for \
-                      taxa_plot_vsws, taxon_plot_vsws in \
-                      zip(taxa_plot_vsw, taxon_plot_vsw)}
-
-###########################################################################
-# Obtain vertical spine style value for taxon from Input files. If
-# required values between 1-4 see manual for codes.
-plot_vsty = data.iloc[17:18,1::].transpose()
-plot_vsty = plot_vsty.drop("Depth")
-
-if zones_on_off == "off":
-    plot_vsty = plot_vsty.drop("Zones")
-    
-plot_vsty = plot_vsty.reset_index()
-plot_vsty.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_vsty.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_vsty =plot_vsty.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_vsty, taxon_plot_vsty = list(plot_vsty.iloc[:,0]), \
-                                  list(plot_vsty.iloc[:,1])
-taxa_plot_vstyle = {taxa_plot_vstys: taxon_plot_vstys for \
-                    taxa_plot_vstys, taxon_plot_vstys in \
-                    zip(taxa_plot_vsty, taxon_plot_vsty)}
-
-###########################################################################
-# Obtain vertical spine colour value for taxon from input files if
-# required values between 1-23. See manual for colour codes.
-plot_vs_col = data.iloc[18:19,1::].transpose()
-plot_vs_col = plot_vs_col.drop("Depth")
-
-if zones_on_off == "off":
-    plot_vs_col = plot_vs_col.drop("Zones")
-    
-plot_vs_col =plot_vs_col.reset_index()
-plot_vs_col.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_vs_col.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_vs_col = plot_vs_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_vs_col, taxon_plot_vs_col = list(plot_vs_col.iloc[:,0]), \
-                                      list(plot_vs_col.iloc[:,1])
-taxa_plot_vs_colour = {taxa_plot_vs_cols:taxon_plot_vs_cols for \
-                       taxa_plot_vs_cols, taxon_plot_vs_cols \
-                       in zip(taxa_plot_vs_col, taxon_plot_vs_col)}
-
-###########################################################################
-# Obtain left spine width value for taxon from Input files. If rquired
-# suggest values between 0.5 and 2.
-plot_lsw = data.iloc[19:20,1::].transpose()
-plot_lsw = plot_lsw.drop("Depth")
-
-if zones_on_off == "off":
-    plot_lsw = plot_lsw.drop("Zones")
-    
-plot_lsw = plot_lsw.reset_index()
-plot_lsw.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_lsw.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_lsw = plot_lsw.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_lsw, taxon_plot_lsw = list(plot_lsw.iloc[:,0]), \
-                                list(plot_lsw.iloc[:,1])
-taxa_plot_ls_width = {taxa_plot_lsws:taxon_plot_lsws for \
-                      taxa_plot_lsws, taxon_plot_lsws in \
-                      zip(taxa_plot_lsw, taxon_plot_lsw)}
-  
-###########################################################################
-# Obtain left spine style value for taxon from Input files.
-plot_lsty = data.iloc[20:21,1::].transpose()
-plot_lsty = plot_lsty.drop("Depth")
-
-if zones_on_off == "off":
-    plot_lsty = plot_lsty.drop("Zones")
-    
-plot_lsty = plot_lsty.reset_index()
-plot_lsty.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_lsty.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_lsty = plot_lsty.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_lsty, taxon_plot_lsty = list(plot_lsty.iloc[:,0]), \
-                                  list(plot_lsty.iloc[:,1])
-taxa_plot_lstyle = {taxa_plot_lstys: taxon_plot_lstys for \
-                    taxa_plot_lstys, taxon_plot_lstys in \
-                    zip(taxa_plot_lsty, taxon_plot_lsty)}
-
-###########################################################################
-# Obtain left spine colour value for taxon from Input files. If required 
-# values between 1 - 23. See manual for colour codes.
-plot_ls_col= data.iloc[21:22,1::].transpose()
-plot_ls_col= plot_ls_col.drop("Depth")
-
-if zones_on_off == "off":
-    plot_ls_col= plot_ls_col.drop("Zones")
-    
-plot_ls_col=plot_ls_col.reset_index()
-plot_ls_col.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_ls_col.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_ls_col= plot_ls_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_ls_col, taxon_plot_ls_col= list(plot_ls_col.iloc[:,0]), \
-                                     list(plot_ls_col.iloc[:,1])
-taxa_plot_ls_colour = {taxa_plot_ls_cols: taxon_plot_ls_cols \
-                       for taxa_plot_ls_cols, taxon_plot_ls_cols \
-                       in zip(taxa_plot_ls_col, taxon_plot_ls_col)}
-
-###########################################################################
-# Obtain right spine width value for taxon from Input files. If required 
-# suggest values between 0.5 and 2.
-plot_rsw = data.iloc[22:23,1::].transpose()
-plot_rsw = plot_rsw.drop("Depth")
-
-if zones_on_off == "off":
-    plot_rsw = plot_rsw.drop("Zones")
-    
-plot_rsw = plot_rsw.reset_index()
-plot_rsw.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_rsw.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_rsw = plot_rsw.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rsw, taxon_plot_rsw = list(plot_rsw.iloc[:,0]), \
-                                list(plot_rsw.iloc[:,1])
-taxa_plot_rs_width = {taxa_plot_rsws: taxon_plot_rsws for \
-                      taxa_plot_rsws, taxon_plot_rsws in \
-                      zip(taxa_plot_rsw, taxon_plot_rsw)}
-
-###########################################################################
-# Obtain right spine style value for taxon from Input files. If required 
-# values between 1 - 4. See manual for codes.
-plot_rsty = data.iloc[23:24,1::].transpose()
-plot_rsty = plot_rsty.drop("Depth")
-
-if zones_on_off == "off":
-    plot_rsty = plot_rsty.drop("Zones")
-    
-plot_rsty =plot_rsty.reset_index()
-plot_rsty.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_rsty.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_rsty = plot_rsty.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rsty, taxon_plot_rsty = list(plot_rsty.iloc[:,0]), \
-                                  list(plot_rsty.iloc[:,1])
-taxa_plot_rstyle = {taxa_plot_rstys: taxon_plot_rstys for \
-                    taxa_plot_rstys, taxon_plot_rstys in \
-                    zip(taxa_plot_rsty, taxon_plot_rsty)}
-
-###########################################################################
-# Obtain right spine colour value for taxon from Input files. If required 
-# values between 1 - 23. See manual for colour codes.
-plot_rs_col = data.iloc[24:25,1::].transpose()
-plot_rs_col = plot_rs_col.drop("Depth")
-
-if zones_on_off == "off":
-    plot_rs_col = plot_rs_col.drop("Zones")
-    
-plot_rs_col =plot_rs_col.reset_index()
-plot_rs_col.rename(columns = {"index": "TAXA"}, inplace = True)
-plot_rs_col.rename(columns = {1: "WIDTH"}, inplace = True)
-plot_rs_col = plot_rs_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rs_col, taxon_plot_rs_col = list(plot_rs_col.iloc[:,0]), \
-                                      list(plot_rs_col.iloc[:,1])
-taxa_plot_rs_colour = {taxa_plot_rs_cors: taxon_plot_rs_cors for \
-                       taxa_plot_rs_cors, taxon_plot_rs_cors \
-                       in zip(taxa_plot_rs_col, taxon_plot_rs_col)}
-
-###########################################################################
-# Obtain x major tick colour value for taxon from Input files. If required 
-# values between 1 - 23. See manual for colour codes black is 1.
-x_tick_maj_col = data.iloc[25:26,1::].transpose()
-x_tick_maj_col = x_tick_maj_col.drop("Depth")
-
-if zones_on_off == "off":
-    x_tick_maj_col = x_tick_maj_col.drop("Zones")
-    
-x_tick_maj_col = x_tick_maj_col.reset_index()
-x_tick_maj_col.rename(columns = {"index": "TAXA"}, inplace = True)
-x_tick_maj_col.rename(columns = {1: "WIDTH"}, inplace = True)
-x_tick_maj_col = x_tick_maj_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rs_col, taxon_plot_rs_col = list(x_tick_maj_col.iloc[:,0]), \
-                                      list(x_tick_maj_col.iloc[:,1])
-taxa_x_tick_maj_colour = {taxa_x_tick_maj_cols: taxon_x_tick_maj_cols for \
-                          taxa_x_tick_maj_cols, taxon_x_tick_maj_cols \
-                          in zip(taxa_plot_rs_col, taxon_plot_rs_col)}
-
-###########################################################################
-# Obtain x minor tick colour value for taxon from Input files. if required 
-# values between 1 - 23. See manual for colour codes black is 1.
-x_tick_min_col = data.iloc[26:27,1::].transpose()
-x_tick_min_col = x_tick_min_col.drop("Depth")
-
-if zones_on_off == "off":
-    x_tick_min_col = x_tick_min_col.drop("Zones")
-    
-x_tick_min_col = x_tick_min_col.reset_index()
-x_tick_min_col.rename(columns = {"index": "TAXA"}, inplace = True)
-x_tick_min_col.rename(columns = {1: "WIDTH"}, inplace = True)
-x_tick_min_col = x_tick_min_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rs_col, taxon_plot_rs_col = list(x_tick_min_col.iloc[:,0]), \
-                                      list(x_tick_min_col.iloc[:,1])
-taxa_x_tick_min_colour = {taxa_x_tick_min_cols: taxon_x_tick_min_cols \
-                          for taxa_x_tick_min_cols, taxon_x_tick_min_cols \
-                          in zip(taxa_plot_rs_col, taxon_plot_rs_col)}
-
-###########################################################################
-# Obtain y major tick colour value for taxon from Input files. If required 
-# values between 1 - 23. See manual for colour codes black is 1.
-y_tick_maj_col = data.iloc[27:28,1::].transpose()
-y_tick_maj_col = y_tick_maj_col.drop("Depth")
-
-if zones_on_off == "off":
-    y_tick_maj_col = y_tick_maj_col.drop("Zones")
-    
-y_tick_maj_col = y_tick_maj_col.reset_index()
-y_tick_maj_col.rename(columns = {"index": "TAXA"}, inplace = True)
-y_tick_maj_col.rename(columns = {1: "Y MAJ col"}, inplace = True)
-y_tick_maj_col = y_tick_maj_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rs_col, taxon_plot_rs_col = list(y_tick_maj_col.iloc[:,0]), \
-                                      list(y_tick_maj_col.iloc[:,1])
-taxa_y_tick_maj_colour = {taxa_y_tick_maj_cols: taxon_y_tick_maj_cols \
-                          for taxa_y_tick_maj_cols, taxon_y_tick_maj_cols \
-                          in zip(taxa_plot_rs_col, taxon_plot_rs_col)}
-
-###########################################################################
-# Obtain y minor tick colour value for taxon from Input files. If required 
-# values between 1 - 23. See manual for colour codes black is 1.
-y_tick_min_col = data.iloc[28:29,1::].transpose()
-y_tick_min_col = y_tick_min_col.drop("Depth")
-
-if zones_on_off == "off":
-    y_tick_min_col = y_tick_min_col.drop("Zones")
-    
-y_tick_min_col = y_tick_min_col.reset_index()
-y_tick_min_col.rename(columns = {"index": "TAXA"}, inplace = True)
-y_tick_min_col.rename(columns = {1: "Y min col"}, inplace = True)
-y_tick_min_col = y_tick_min_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_rs_col, taxon_plot_rs_col = list(y_tick_min_col.iloc[:,0]), \
-                                      list(y_tick_min_col.iloc[:,1])
-taxa_y_tick_min_colour = {taxa_y_tick_min_cols: taxon_y_tick_min_cols for \
-                          taxa_y_tick_min_cols, taxon_y_tick_min_cols in \
-                          zip(taxa_plot_rs_col, taxon_plot_rs_col)}
-
-###########################################################################
-# Obtain whether taxa is to have exaggeration or not from Input file. 0 is
-# no exaggeration, any other number is number to multiply original to get 
-# exaggeration.
-exag = data.iloc[29:30,1::].transpose()
-exag = exag.drop("Depth")
-
-if zones_on_off == "off":
-    exag = exag.drop("Zones")
-    
-exag = exag.reset_index()
-exag.rename(columns = {"index":"TAXA"}, inplace = True)
-exag.rename(columns = {1:"exag"}, inplace = True)
-exag.rename(columns = {29:"exag"}, inplace = True)
-#exag = exag.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag, taxon_plot_exag = list(exag.iloc[:,0]), \
-                                  list(exag.iloc[:,1])
-taxa_exag = {taxa_plot_exags: taxon_plot_exags for taxa_plot_exags, \
-             taxon_plot_exags in zip(taxa_plot_exag, taxon_plot_exag)}
-
-taxa_exag_1 = taxa_exag.copy() 
-###########################################################################
-# If exaggeration is required this dictates the type, either graph type 3 
-# or 4 is permitted. Obtain from Input file.
-exag_type = data.iloc[30:31,1::].transpose()
-exag_type = exag_type.drop("Depth")
-
-if zones_on_off == "off":
-    exag_type = exag_type.drop("Zones")
-    
-exag_type = exag_type.reset_index()
-exag_type.rename(columns = {"index": "TAXA"}, inplace = True)
-exag_type.rename(columns = {1: "exag_type"}, inplace = True)
-exag_type = exag_type.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag_type, taxon_plot_exag_type = list(exag_type.iloc[:,0]), \
-                                            list(exag_type.iloc[:,1])
-taxa_exag_type = {taxa_plot_exags_type: taxon_plot_exags_type for \
-                  taxa_plot_exags_type, taxon_plot_exags_type in \
-                  zip(taxa_plot_exag_type, taxon_plot_exag_type)}
-
-###########################################################################
-# Obtain colour code of exaggeration fill from Input file. If required
-# values between 1 - 23. See manual for colour codes black is 1.
-exag_col = data.iloc[31:32,1::].transpose()
-exag_col = exag_col.drop("Depth")
-
-if zones_on_off == "off":
-    exag_col = exag_col.drop("Zones")
-    
-exag_col = exag_col.reset_index()
-exag_col.rename(columns = {"index": "TAXA"}, inplace = True)
-exag_col.rename(columns = {1: "exag col"}, inplace = True)
-exag_col = exag_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag_col, taxon_plot_exag_col = list(exag_col.iloc[:,0]), \
-                                          list(exag_col.iloc[:,1])
-taxa_exag_col = {taxa_plot_exags_col: taxon_plot_exags_col for \
-                 taxa_plot_exags_col, taxon_plot_exags_col in \
-                 zip(taxa_plot_exag_col, taxon_plot_exag_col)}
-
-###########################################################################
-# Obtain transparency of exaggeration fill from Input file. If required
-# values between 0 - 1. 0 fully tranparent, 1 not at all transparent.
-exag_trans = data.iloc[32:33,1::].transpose()
-exag_trans = exag_trans.drop("Depth")
-
-if zones_on_off == "off":
-    exag_trans = exag_trans.drop("Zones")
-    
-exag_trans = exag_trans.reset_index()
-exag_trans.rename(columns = {"index": "TAXA"}, inplace = True)
-exag_trans.rename(columns = {1: "EXAG TRANS"}, inplace = True)
-exag_trans = exag_trans.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag_trans, taxon_plot_exag_trans = list(exag_trans.iloc[:,0]), \
-                                              list(exag_trans.iloc[:,1])
-taxa_exag_trans = {taxa_plot_exags_trans: taxon_plot_exags_trans for \
-                   taxa_plot_exags_trans, taxon_plot_exags_trans in \
-                   zip(taxa_plot_exag_trans, taxon_plot_exag_trans)}
-
-###########################################################################
-# Obtain colour code of exaggeration line from Input file, if required
-# values  between 1 - 23. See manual for colour codes black is 1.
-exag_line_col = data.iloc[33:34,1::].transpose()
-exag_line_col = exag_line_col.drop("Depth")
-
-if zones_on_off == "off":
-    exag_line_col = exag_line_col.drop("Zones")
-    
-exag_line_col = exag_line_col.reset_index()
-exag_line_col.rename(columns = {"index": "TAXA"}, inplace = True)
-exag_line_col.rename(columns = {1: "EXAG_LINE_COL"}, inplace = True)
-exag_line_col = exag_line_col.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag_line_col, taxon_plot_exag_line_col \
-                         = list(exag_line_col.iloc[:,0]), \
-                           list(exag_line_col.iloc[:,1])
-taxa_exag_line_col = {taxa_plot_exags_line_col:taxon_plot_exags_line_col \
-                      for taxa_plot_exags_line_col, \
-                      taxon_plot_exags_line_col in zip \
-                      (taxa_plot_exag_line_col, \
-                       taxon_plot_exag_line_col)}
-
-###########################################################################
-# Obtain line width for exaggeration line from Input file. If required
-# suggest values between 0.5 and 2.
-exag_lw = data.iloc[34:35,1::].transpose()
-exag_lw = exag_lw.drop("Depth")
-
-if zones_on_off == "off":
-    exag_lw = exag_lw.drop("Zones")
-    
-exag_lw = exag_lw.reset_index()
-exag_lw.rename(columns = {"index": "TAXA"}, inplace = True)
-exag_lw.rename(columns = {1: "EXAG LW"}, inplace = True)
-exag_lw = exag_lw.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag_lw, taxon_plot_exag_lw = list(exag_lw.iloc[:,0]), \
-                                        list(exag_lw.iloc[:,1])
-taxa_exag_lw = {taxa_plot_exags_lw: taxon_plot_exags_lw for \
-                taxa_plot_exags_lw, taxon_plot_exags_lw in \
-                zip(taxa_plot_exag_lw, taxon_plot_exag_lw)}
-
-###########################################################################
-# Obtain line style for exaggeration line from Input File. If required
-# values between 1 - 4. See manual for codes.
-exag_ls = data.iloc[35:36,1::].transpose()
-exag_ls = exag_ls.drop("Depth")
-
-if zones_on_off == "off":
-    exag_ls = exag_ls.drop("Zones")
-    
-exag_ls = exag_ls.reset_index()
-exag_ls.rename(columns = {"index": "TAXA"}, inplace = True)
-exag_ls.rename(columns = {1: "exag LS"}, inplace = True)
-exag_ls = exag_ls.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_exag_ls, taxon_plot_exag_ls = list(exag_ls.iloc[:,0]), \
-                                        list(exag_ls.iloc[:,1])
-taxa_exag_ls = {taxa_plot_exags_ls: taxon_plot_exags_ls for \
-                taxa_plot_exags_ls, taxon_plot_exags_ls in \
-                zip(taxa_plot_exag_ls, taxon_plot_exag_ls)}
-
-###########################################################################
-# Obtain whether stack plot 1 is required from Input file.
-stack_plot_1 = data.iloc[36:37,1::].transpose()
-stack_plot_1 = stack_plot_1.drop("Depth")
-
-if zones_on_off == "off":
-    stack_plot_1 = stack_plot_1.drop("Zones")
-    
-stack_plot_1 = stack_plot_1.reset_index()
-stack_plot_1.rename(columns = {"index": "TAXA"}, inplace = True)
-stack_plot_1.rename(columns = {1: "STACK_Y_N"}, inplace = True)
-stack_plot_1 = stack_plot_1.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_stack_plot_1, taxon_plot_stack_plot_1 = \
-                       list(stack_plot_1.iloc[:,0]), \
-                       list(stack_plot_1.iloc[:,1])
-taxa_stack_plot_1 = {taxa_plot_1_stacks_plot: taxon_plot_1_stacks_plot \
-                     for taxa_plot_1_stacks_plot, \
-                         taxon_plot_1_stacks_plot \
-                     in zip(taxa_plot_stack_plot_1, \
-                            taxon_plot_stack_plot_1)}
-
-# Find unique values of stack plot groupings and remove zero values
-stack_plot_1_uni = np.unique(taxon_plot_stack_plot_1)
-stack_plot_1_uni = list(stack_plot_1_uni)
-if 0.0 in stack_plot_1_uni:
-    stack_plot_1_uni.remove(0.0)
-
-###########################################################################
-# Obtain whether stack plot 2 is required from Input file.
-stack_plot_2 = data.iloc[37:38,1::].transpose()
-stack_plot_2 = stack_plot_2.drop("Depth")
-
-if zones_on_off == "off":
-    stack_plot_2 = stack_plot_2.drop("Zones")
-    
-stack_plot_2 = stack_plot_2.reset_index()
-stack_plot_2.rename(columns = {"index": "TAXA"}, inplace = True)
-stack_plot_2.rename(columns = {1: "exag LS"}, inplace = True)
-stack_plot_2 = stack_plot_2.sort_values("TAXA")
-
-# Create dictionary of above.
-taxa_plot_stack_plot_2, taxon_plot_stack_plot_2 \
-                        = list(stack_plot_2.iloc[:,0]), \
-                          list(stack_plot_2.iloc[:,1])
-taxa_stack_plot_2 = {taxa_plot_2_stacks_plot: taxon_plot_2_stacks_plot \
-                     for taxa_plot_2_stacks_plot, \
-                         taxon_plot_2_stacks_plot \
-                     in zip(taxa_plot_stack_plot_2, \
-                            taxon_plot_stack_plot_2)}
-
-# Find unique values of stack plot groupings and remove zero values
-stack_plot_2_uni = np.unique(taxon_plot_stack_plot_2)
-stack_plot_2_uni = list(stack_plot_2_uni)
-if 0.0 in stack_plot_2_uni:
-    stack_plot_2_uni.remove(0.0)
-
-###########################################################################
-###########################################################################
-# Create a set of values to 'scale' the y axis of each plot correctly, 
-# 'the abundance' axis. To do this the program needs to know if any non 
-# standard scaling graphs are required before can do this. This is done
-# with a  list of non std 
-non_std_scaling_1 = str(par_dict["NSC 1**"]).strip()
-non_std_scaling_2 = str(par_dict["NSC 2**"]).strip()
-non_std_scaling_3 = str(par_dict["NSC 3**"]).strip()
-non_std_scaling_4 = str(par_dict["NSC 4**"]).strip()
-non_std_scaling_5 = str(par_dict["NSC 5**"]).strip()
-
-non_std_list = [non_std_scaling_1, non_std_scaling_2, non_std_scaling_3, \
-                       non_std_scaling_4, non_std_scaling_5]
-non_std_list = ["none" if x == "NONE" else x for x in non_std_list]
-
-non_std_list = [x for x in non_std_list if x != "none" and \
-                pd.isnull(x) == False]
-
-# Find the minimum value for each taxa in data and the taxa names
-min_list = list(data.iloc[38:,2:].min())
-taxa_list = list(data.iloc[0:,2:])
- 
-# Create a dummy diff list with all elements to update later to preserve 
-# the order. This list here is taxa and the minimum values
-diff_list_ratios_dict = {k: v for k, v in zip(taxa_list, min_list)}
- 
-# Create another list as above and call it min_taxa_dict
-min_taxa_dict = {k: v for k, v in zip(taxa_list, min_list)}
-
-# Create another list as above and call it min_taxa_dict and use if non std 
-# scaling elements are requested
-min_taxa_dict_1 = {k: v for k, v in zip(taxa_list, min_list)}
-
-# Remove non std scaling elements from min taxa dict so not used later for 
-# scaling of plots for other taxa
-for x in non_std_list:
-    min_taxa_dict_1.pop(x)
-
-# Create list of minimum taxa values without non std scaling elements
-min_list = [x for x in min_taxa_dict_1.values()]
-
-# If zones have not been specified this value is removed
-if zones_on_off == "off":
-    min_list = min_list[:-1]
-
-# Reverse the order of minimum values list and round the value
-min_list = min_list[::-1] 
-min_list_round = list(np.round(min_list, decimals = -1))
-
-# Determine the minimum of all minimum abundance values
-min_list_min = np.round(min(min_list), decimals = -1)
-
-# Determine maximum values for each taxa
-max_list = list(data.iloc[38:,2:].max())
-
-# If zones are not specified remove from list of maximum values  
-if zones_on_off == "off":
-    max_list = max_list[:-1]
-
-# Create dictionaries of taxa and maximum values
-max_taxa_dict = {k: v for k, v in zip(taxa_list, max_list)}
-max_taxa_dict_1 = {k: v for k, v in zip(taxa_list, max_list)}
-
-# Remove non std scaling elements from min taxa dict so not used later for 
-# scaling of plots for other taxa
-for x in non_std_list:
-    max_taxa_dict_1.pop(x)
-# Remove non std scaling elements from taxa exageration dictionary
-for x in non_std_list:
-    taxa_exag_1.pop(x)
-
-# Create a list of maximum taxa values and get the maximum of all maximum 
-# values
-max_list = [v for v in max_taxa_dict_1.values()]    
-max_list_round = np.round(max_list, decimals = -1)
-max_list_max = np.round(max(max_list), decimals = -1)
-
-# Find ratios of the max of each taxa to the max of all maximums 
-max_list_ratios = [x / max_list_max for x in max_list]
-max_list_ratios = max_list_ratios[::-1]
-max_list_round = max_list_round[::-1]
-max_list = max_list[::-1]
-
-# Create taxa lists from maximum list
-taxa_list = list(max_taxa_dict_1.keys())
-taxa_list = taxa_list[::-1]
-
-# Account for whether exaggerations are requested. If they are create a 
-# new maximum list
-if exag["exag"].max() > 0: 
-    new_max_list = [] 
-    taxa_exag_1_v = list(taxa_exag_1.values())
-    taxa_exag_1_v.reverse()
-    
-    # For exaggerated taxa make the max value greater so very low values
-    # can be seen more easily on the plots. Here we add 20. Could be 
-    # adjusted here if user does not like that. Can be increased or 
-    # decreased but this appears  the best compromise
-    for x, y in zip(max_list, taxa_exag_1_v):
-
-        if x < 20 and y > 0:
-            new_max_list.append(x + 20)
-        else:
-            new_max_list.append(x)
-    
-    # Create a diff list. List of the difference between max and min 
-    # values here for data with exaggeration specified and create a new
-    # maximum taxa value dictionary
-    diff_list = [x - y for x, y in zip(new_max_list, min_list)]
-    new_max_taxa_dict = {k: v for k, v in zip(taxa_list, new_max_list)}
-    
-# If no exaggeration specified craete a diff list with previous variables
-# and a maximum taxa value dictionary.
-else:
-    diff_list = [x - y for x, y in zip(max_list, min_list)]
-    max_taxa_dict = {k: v for k, v in zip(taxa_list, max_list)}
-
-# Create variable of the maximum diff between min and max values    
-diff_list_max = np.round(max(diff_list),decimals = -1)
-
-# Create list of ratios of diff between min and max and max diff. This and 
-# later variants are used for the plot width scaling for each taxa plot
-diff_list_ratios = [x / diff_list_max for x in diff_list]
-diff_list_ratios_dict_1 = {k: v for k, v in zip(taxa_list, \
-                                                diff_list_ratios)}
-diff_list_ratios_dict.update(diff_list_ratios_dict_1)
-
-min_list = list(data.iloc[38:,2:].min())
-
-min_list_round = list(np.round(min_list,decimals = - 1))
-min_list = min_list[::-1]
-min_list_round = min_list_round[::-1]
-
-###########################################################################
-###########################################################################
-# Remove plot style and colour indexes from the Input file and Extra Input 
-# file if specified ready for plotting.
-data_2 = data.drop(np.arange(0, 38, 1), axis = 0)
-
-if extra_yn != "none":
-    data_extra_2 = data_extra.drop(np.arange(0, 36, 1), axis = 0)
-
-###########################################################################
-###########################################################################
-# Read in groups for stack plots if stack plots are required.
-stack_plot_1_on_off = par_dict["Stack plot 1 on/off**"]. \
-                              strip().lower()
-stack_plot_2_on_off = par_dict["Stack plot 2 on/off**"]. \
-                              strip().lower()
-
-# Obtain parameters for stack plot 1 if required and error check entries.
-if pd.isnull(stack_plot_1_on_off) == True or stack_plot_1_on_off not in \
-    ["on", "off"]:
-    print("\nStack plot 1 on/off in Parameter file "
-          "requires an entry of 'on' or 'off'.")
-    sys.exit()
-    
-if stack_plot_1_on_off == "on":
-    
-    if max(taxa_stack_plot_1.values()) <= 0:
-        print("\nStack plot 1 has been requested in the "
-              "the Parameter file but there is no groupings in the input "
-              "file.")
-        sys.exit()
-        
     try:
-        stack_plot_1_title = par_dict \
-        ["Stack plot title 1"].strip()
+        png = np.ndarray(page.shape, np.uint8, memory.buf)
+        cover_rows = np.ndarray((len(graphs), 2), np.int64, memory.buf, \
+                                offset = page.nbytes)
+        png[:] = page
+        cover_rows[:] = -1
         
-        if pd.isnull(stack_plot_1_title) == True:
-            print("\nStack plot title 1 entry in Parameter file "
-                  "is empty. Is an entry required ?")
-    except:
-        print("\nStack plot title 1 entry in Parameter file is "
-              "missing or incorrect.")
-        sys.exit()
+        shares = np.array_split(np.arange(len(graphs)), \
+                                min(panel_workers, len(graphs)))
         
-    # Check colour entries in Parameter file when provided as list.
-    try:
-        stack_plot_1_colours = par_dict["Stack plot col list "
-                                       "1"].replace(" ","").split(",")
-        stack_plot_1_colours = [float(x) for x in stack_plot_1_colours]
+        if run_forked([(draw_panel_share, (renderer, graphs, share, \
+                                           cover_rows, png)) \
+                       for share in shares]) == False:
+            return None
         
-    except:
-        print("\nEntry for Stack plot col list 1 in Parameter "
-              "file is missing or incorrect.")
-        sys.exit()
+        # Rows covered by the panels of more than one worker, in runs.
+        share_rows = np.zeros((len(shares), height), dtype = bool)
         
-    if any(pd.isnull(stack_plot_1_colours)) == False:
-        if any (i < 0 or i > col_max for i in stack_plot_1_colours):
-            print("\n A colour entry for Stack plot col list in "
-                  "Parameter file is out of bounds.")
-            sys.exit()
-            
-    # Check stack plot size entry
-    try:
-        stack_plot_1_size = float(par_dict["Stack plot size 1"])
+        for worker, share in enumerate(shares):
+            for first, last in cover_rows[share]:
+                if first >= 0:
+                    share_rows[worker, first:last + 1] = True
         
-        if pd.isnull(stack_plot_1_size) == True:
-            print("\nStack plot 1 entry in Parameter file is "
-                  "required.")
-            sys.exit()
-    except:
-        print("\nStack plot size 1 entry in Parameter file is "
-              "missing or incorrect.")
-        sys.exit()
+        seams = np.diff(np.concatenate([[0], share_rows.sum(axis = 0) > 1, \
+                                        [0]]).astype(int))
+        starts = np.flatnonzero(seams == 1)
+        ends = np.flatnonzero(seams == -1)
+        jobs = []
         
-    # Check stack plot line width and colour entry          
-    try:
-        stack_plot_1_lw = float(par_dict \
-                               ["Stack plot line width 1"])
+        for group in np.array_split(np.arange(len(starts)), \
+                                    min(panel_workers, max(len(starts), 1))):
+            if len(group) == 0:
+                continue
             
-        if pd.isnull(stack_plot_1_lw) == False:
+            rows = np.zeros(height, dtype = bool)
             
-            try:
-                stack_plot_1_line_colour = float(par_dict\
-                                                ["Stack "
-                                                "plot line colour 1"])
-
-                if stack_plot_1_line_colour < 0 or \
-                   stack_plot_1_line_colour > col_max or \
-                   pd.isnull(stack_plot_1_line_colour) == True:
-                    print("\nStack plot line colour 1 entry in "
-                          "Parameter file is missing or out of bounds.")
-                    sys.exit()
-            except:
-                print("\nStack plot line colour 1 entry in "
-                      "Parameter file is missing or incorrect.")
-                sys.exit()
-    except:
-        print("\nStack plot line width 1 entry in Parameter file "
-              "is missing or incorrect if not required use zero as entry.")
-        sys.exit()
+            for start, end in zip(starts[group], ends[group]):
+                rows[start:end] = True
+            
+            numbers = [number for number, (first, last) in \
+                       enumerate(cover_rows) if first >= 0 and \
+                       rows[first:last + 1].any() == True]
+            jobs.append((draw_panel_seams, (renderer, graphs, numbers, rows, \
+                                            png)))
+        
+        if run_forked(jobs) == False:
+            return None
         
-    stack_plot_1_line_colour = float(par_dict["Stack "
-                                             "plot line colour 1"])
+        page[:] = png
+    finally:
+        png = None
+        cover_rows = None
+        memory.close()
+        memory.unlink()
     
-    if stack_plot_1_line_colour <= 0 or stack_plot_1_line_colour > \
-            col_max:
-        print("\nStack plot line colour 1 entry in Parameter file "
-              "is missing or incorrect.")
-        sys.exit()
+    for artist in artists[len(graphs):]:
+        artist.draw(renderer)
+    
+    return page
 
-    stack_plot_1_yn = par_dict["Stack plot title 1"].strip()
+# Function to save the png drawn by panel_workers workers.
+def save_png_parallel(fig, output_name, dpi_num):
+    page = None
+    
+    if "fork" in multiprocessing.get_all_start_methods():
+        figure_dpi = fig.dpi
+        figure_canvas = fig.canvas
+        
+        try:
+            fig.dpi = dpi_num
+            page = draw_png_parallel(fig)
+        finally:
+            fig.dpi = figure_dpi
+            fig.set_canvas(figure_canvas)
+    
+    if page is None:
+        fig.savefig(f"{output_name}.png", dpi = dpi_num)
+    else:
+        matplotlib.image.imsave(f"{output_name}.png", page, dpi = dpi_num)
 
-    # Check stack plot calculation entry
-    try:
-        stack_calc_1 = par_dict["Stack plot calculation 1"]. \
-                              strip().lower()
-                              
-        if pd.isnull(stack_calc_1) == True or stack_calc_1 not in \
-                ["yes","no"]:
-            print("\nEntry for Stack plot calculation 1 is "
-                  "required. Entry should be yes or no.")
+###############################################################################
+###############################################################################
+# Stages of the plot. Parsing the Parameter file, validating the Input files,
+# scaling the taxa and aggregating the stack plots are each a function of 
+# their inputs only. The result of each stage is kept against a hash of its
+# inputs so, when the same process plots again (for example with --watch or
+# P4_server.py), a stage is only carried out again if one of its inputs has
+# changed. Drawing the axes, panels and annotations and saving the figure 
+# follow in render.
+
+# Results of recent stages by stage name and hash of inputs, oldest first.
+stage_cache = OrderedDict()
+stage_cache_size = 32
+
+# Function to make a hash of the inputs of a stage. Dataframes are hashed by
+# their columns, types and contents, other inputs by their repr.
+def stage_hash(inputs):
+    digest = hashlib.sha256()
+
+    for value in inputs:
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode())
+            digest.update(repr(list(value.dtypes)).encode())
+            digest.update(pd.util.hash_pandas_object(value).values.tobytes())
+        else:
+            digest.update(repr(value).encode())
+
+    return digest.hexdigest()
+
+# Function to run a stage or return its result from the last time it was 
+# run with the same inputs. A copy is returned as render changes some of
+# the results. A stage that stops on a problem is not kept.
+def run_stage(stage, function, *inputs):
+    key = (stage, function.__name__, stage_hash(inputs))
+
+    if key in stage_cache:
+        stage_cache.move_to_end(key)
+    else:
+        stage_cache[key] = function(*inputs)
+
+        while len(stage_cache) > stage_cache_size:
+            stage_cache.popitem(last = False)
+
+    return copy.deepcopy(stage_cache[key])
+
+# Function for the parameter parse stage. Makes the dictionary of Parameter
+# file entries and checks the essential entries are there.
+def parse_parameters(par):
+    # Create lists of items from the columns in the Parameter file including the
+    # users entries and the Title of the parameter itself
+    par_list_0 = [x for x in par["PARAMETERS"][0::]]
+    par_list_1 = [x for x in par["ENTRY"][0::]]
+
+    # Create dictionary of parameter entries and associated values/text.
+    par_dict = {Q: R for Q, R in zip(par_list_0, par_list_1)}
+
+    # Initial error checking of essential entries from Parameter file. If any 
+    # of these are blank then the program will stop. 
+    # Create lists of values from Parameter file that are essential entries  
+    # ready for checking.
+    par_list_G1_values = par_list_1[4:9]
+    par_list_G2_values = par_list_1[15:17]
+    par_list_G3_values = par_list_1[21:22]
+    par_list_G4_values = par_list_1[28:29]
+    par_list_G5_values = par_list_1[42:43]
+    par_list_G6_values = par_list_1[54:59]
+    par_list_G7_values = par_list_1[64:67] + par_list_1[68:71] + \
+                         par_list_1[72:73] + par_list_1[74:77]
+    par_list_G8_values = par_list_1[82:84]
+    par_list_G9_values = par_list_1[89:90] + par_list_1[91:94] + \
+                         par_list_1[95:96] + par_list_1[97:101]
+    par_list_G10_value = par_list_1[106:107]
+    par_list_G11_value = par_list_1[138:139]
+    par_list_G12_value = par_list_1[159:160]
+    par_list_G13_values = par_list_1[187:188] + par_list_1[204:205] + \
+                         par_list_1[221:222] + par_list_1[238:239] + \
+                         par_list_1[255:256] + par_list_1[272:273] + \
+                         par_list_1[289:290] + par_list_1[306:307] + \
+                         par_list_1[323:324] + par_list_1[340:341]
+    par_list_G14_values = par_list_1[361:366]
+
+    # Initial general error checking of user preferences in Parameter file.
+    for x in par_list_G1_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries/entry in Parameter file, Group 1 "
+                  "is/are missing.")
             sys.exit()
-            
-    except:
-        print("\nEntry for Stack plot calculation 1 entry in the "
-              "Parameter file is missing or incorrect.") 
-        sys.exit()
-        
-    if len(stack_plot_1_colours) != len(stack_plot_1_uni):
-        print("\nNumber of Stack 1 plot groups are different to "
-              "number of colours prescribed in Parameter file.")
-        sys.exit()
 
-# Obtain parameters for stack plot 2 if required and error check entries.
-if stack_plot_2_on_off == "on":
-    if max(taxa_stack_plot_2.values()) <= 0:
-        print("\nStack plot 2 has been requested in the "
-              "Parameter file but there is no groupings in the input "
-              "file.")
-        sys.exit()
+    for x in par_list_G2_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries/entry in Parameter file, Group 2 "
+                  "is/are missing.") 
+            sys.exit()
+    
+    for x in par_list_G3_values:
+        if isinstance(x, str) == False:
+            print("\nEssential entry in Parameter file, Group 3 is incorrect."
+                  " Check entry and format.")
+            sys.exit()
+        if pd.isnull(x) == True:
+            print("\nEssential entry in Parameter file, Group 3 is missing.") 
+            sys.exit()
+    
+    for x in par_list_G4_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entry for Overall title on/off in Parameter "
+                  "file is missing. Enter 'on' or 'off'.") 
+            sys.exit()
         
-    # Error check stack plot 2 title entry
-    try:
-        stack_plot_2_title = par_dict \
-        ["Stack plot title 2"].strip()
+    for x in par_list_G5_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entry for Footer text on/off in Parameter file"
+                  " is missing.") 
+            sys.exit()     
         
-        if pd.isnull(stack_plot_2_title) == True:
-            print("\nStack plot title 2 entry is empty. Is an "
-                  "entry required ?")
+    for x in par_list_G6_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries/entry in Parameter file, Group 6 "
+                  "is/are missing.")
             sys.exit()
-            
-    except:
-        print("\nStack plot title 2 entry in Parameter file is "
-              "missing or incorrect.")
-        sys.exit()
-        
-    # Check stack plot 2 colour entries in Parameter file when provided as 
-    # list.
-    try:
-        stack_plot_2_colours = par_dict["Stack plot col "
-                                       "list 2"].replace(" ","") \
-                                                .split(",")
-        stack_plot_2_colours = [float(x) for x in stack_plot_2_colours]
-        
-        if any(pd.isnull(stack_plot_2_colours)) == False:
-            if any (i < 0 or i > col_max for i in stack_plot_2_colours):
-                print("\nA colour entry for Zone line col list in"
-                      " Parameter file is out of bounds.")
-                sys.exit()
-                
-    except:
-        print("\nEntry for Stack plot col list 2 in Parameter "
-              "file is missing or incorrect. Make sure all required"
-              " entries are filled.")
-        sys.exit()
     
-    # Check stack plot 2 size entry
-    try:
-        stack_plot_2_size = float(par_dict["Stack plot size 2"])
-        if pd.isnull(stack_plot_2_size) == True:
-            print("\nStack plot 2 entry in Parameter file is "
-                  "required.")
+    for x in par_list_G7_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries / entry in Parameter file, Group 7 "
+                  "is/are missing.") 
+            sys.exit()
+    
+    for x in par_list_G8_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries/entry in Parameter file, Group 8 "
+                  "is/are missing.") 
             sys.exit()
-            
-    except:
-        print("\nStack plot size 2 entry in Parameter file is "
-              "missing or incorrect.")
-        sys.exit()
         
-    # Check stack plot 2 line width and colour entry
-    try:
-        stack_plot_2_lw = float(par_dict \
-                               ["Stack plot line width 2"])
-        if pd.isnull(stack_plot_2_lw) == False:
-            try:
-                stack_plot_2_line_colour = float(par_dict\
-                                                ["Stack "
-                                                "plot line colour 2"])
-                    
-                if stack_plot_2_line_colour < 0 or \
-                    stack_plot_2_line_colour > col_max or \
-                    pd.isnull(stack_plot_2_line_colour) == True:
-                    print("\nStack plot line colour 2 in "
-                          "Parameter file is missing or out of bounds.")
-                    sys.exit()
-                    
-            except:
-                print("\nStack plot line colour 2 entry in "
-                      "Parameter file is missing or incorrect.")
-                sys.exit()
-    except:
-        print("\nStack plot line width 2 entry in Parameter file "
-              "is missing or incorrect if not required use zero as entry.")
-        sys.exit()
-
-    stack_plot_2_line_colour = float(par_dict["Stack "
-                                             "plot line colour 2"])
+    for x in par_list_G9_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries/entry in Parameter file, Group 9 "
+                  "is/are missing.")
+            sys.exit()
 
-    if stack_plot_2_line_colour <= 0 or stack_plot_2_line_colour > \
-            col_max:
-        print("\nStack plot line colour 2 entry in Parameter file "
-              "is missing or incorrect.")
+    if pd.isnull(par_list_G10_value) == True:
+        print("\nZones on/off entry in Parameter file, Group 10 is missing.") 
         sys.exit()
-
-    stack_plot_2_yn = par_dict["Stack plot title 2"].strip()
     
-    # Check stack plot 2 calculation entry
-    try:
-        stack_calc_2 = par_dict["Stack plot calculation 2"]. \
-                              strip().lower()
-                              
-        if pd.isnull(stack_calc_2) == True or stack_calc_2 not in \
-                ["yes","no"]:
-            print("\nEntry for Stack plot calculation 2 in "
-                  "Parameter file is required. Entry should be 'yes' or "
-                  "'no'.")
-            sys.exit()
-    except:
-        print("\nEntry for Stack plot calculation 2 entry in "
-              "Parameter file is missing or incorrect.") 
-        sys.exit()
-
-    if len(stack_plot_2_colours) != len(stack_plot_2_uni):
-        print("\nNumber of Stack 2 plot groups are different to "
-              "number of colours prescribed in Parameter file.")
+    if pd.isnull(par_list_G11_value) == True:
+        print("\nRC ages on/off entry in Parameter file, Group 11 is missing.")
         sys.exit()
-
-# Determine number of stack plots asked for by user 0, 1 or 2. Employed
-# later in program 
-stack_plots_yn = [stack_plot_1_on_off, stack_plot_2_on_off]
-num_stack_plots = sum([1 if x !="off" and pd.isnull(x) == False \
-                      else 0 for x in stack_plots_yn])
-    
-# Create marker for stack plots ready for later in the program
-num_stack = 1
-
-# Stack plot 1 must be used if only one is specified. Can not have one 
-# instance and use the Stack plot 2 entries in the Paramater file so error 
-# message is given if that happens.
-if num_stack_plots > 0 and stack_plot_1_on_off =="off":
-    print("\nUse available Stack plot 1 entries before "
-          "Stack plot 2 entries if only one Stack plot "
-          "required.")
-    sys.exit()
-
-# Prep data for later stack plots if required. Has palaeo data and stack 
-# groupings for Stack plots 1 and 2
-if num_stack_plots > 0:
-    data_3 = data.drop(np.arange(0, 36, 1),axis = 0) 
-    data_3 = data_3.transpose()
-    data_3 = data_3.drop(["Unnamed: 0"], axis = 0)
-    data_3 = data_3.rename(columns=data_3.iloc[0])
-    data_stack_1 = list(data_3.iloc[::,0])
-    data_stack_2 = list(data_3.iloc[::,1])
-    
-###########################################################################
-    # Stack plot 1 can have up to 5 groups. Can expand this if required by
-    # adding extra code.
-    
-    # Find number of taxa and depth
-    length = len(data_3.columns)
-    
-    # Create empty lists for each possible stack group for Stack plot 1. 
-    # Limited to 5 groups at present. Can be expanded with additional code.
-    if stack_plot_1_on_off == "on":
-        stack_1_sums_1 = []
-        stack_1_sums_2 = []
-        stack_1_sums_3 = []
-        stack_1_sums_4 = []
-        stack_1_sums_5 = []
-    
-        # Create a ratio for the stack plot so is correctly scaled 
-        # on y axis. The initial size is goverened by max value in the 
-        # column used in the input file and then adjusted by size
-        # specified in  parameter file by user
-        diff_list_ratios_dict[stack_plot_1_title] = 1 * (stack_plot_1_size)
-        
-        a = 2
-        
-        # Get data for stack plots and error check.
-        for x in range (length - 2):
-            stack_list_1_1, stack_list_1_2, stack_list_1_3, \
-            stack_list_1_4, stack_list_1_5 = [],[],[],[],[]
-            
-            for values, grouping in zip(data_3.iloc[::,a], data_stack_1):
-                if grouping == 1:
-                    stack_list_1_1.append(values)
-                if grouping == 2:
-                    stack_list_1_2.append(values)
-                if grouping == 3:
-                    stack_list_1_3.append(values)
-                if grouping == 4:
-                    stack_list_1_4.append(values)
-                if grouping == 5:
-                    stack_list_1_5.append(values)
-                    
-                if grouping > 5 or pd.isnull(grouping) \
-                    == True:
-                        print("\nStack plot 1 groupings are "
-                              "limited to 5 groups maximim at present. "
-                              "Error in grouping numbers. If not required"
-                              " add a zero.")
-                        sys.exit()
-
-            stack_1_sums_1.append(sum(stack_list_1_1))
-            stack_1_sums_2.append(sum(stack_list_1_2))
-            stack_1_sums_3.append(sum(stack_list_1_3))
-            stack_1_sums_4.append(sum(stack_list_1_4))
-            stack_1_sums_5.append(sum(stack_list_1_5))
-            
-            a += 1
-
-        # If percentage calculations are required (ie the groups of data 
-        # do not add up to 100. Does not matter but if the user want to 
-        # re calculate so they do is carried out here).
-        if stack_calc_1 == "yes":
-            stack_1_list = [stack_1_sums_1, stack_1_sums_2, \
-                            stack_1_sums_3, stack_1_sums_4, stack_1_sums_5]
-            
-            stack_1_all_sum = [v + w + x + y + z for v, w, x, y, z \
-                              in zip(stack_1_sums_1, stack_1_sums_2, \
-                                     stack_1_sums_3, stack_1_sums_4, \
-                                     stack_1_sums_5)]
-            
-            stack_1_sums_1_calc = []
-            stack_1_sums_2_calc = []
-            stack_1_sums_3_calc = []
-            stack_1_sums_4_calc = []
-            stack_1_sums_5_calc = []
-            
-            stack_1_list_calc = [stack_1_sums_1_calc, \
-                                 stack_1_sums_2_calc, \
-                                 stack_1_sums_3_calc, \
-                                 stack_1_sums_4_calc, \
-                                 stack_1_sums_5_calc]
-            
-            for w, x in zip(stack_1_list, stack_1_list_calc):
-                for y, z in zip(w, stack_1_all_sum):
-                    x.append(y/z * 100)
-
-###########################################################################
-    # Stack plot 2 can have up to 5 groups as part of the stack 
-    # plots. Can expand this if required by adding extra code.
-    if stack_plot_2_on_off == "on":
-        
-        stack_2_sums_1 = []
-        stack_2_sums_2 = []
-        stack_2_sums_3 = []
-        stack_2_sums_4 = []
-        stack_2_sums_5 = []
-        
-        # Create a ratio for the stack plot so is correctly scaled 
-        # on y axis.
-        diff_list_ratios_dict[stack_plot_2_title] = 1 * \
-            (stack_plot_2_size)
-    
-        a = 2
-        
-        # Get data for stack plots and error check.
-        for x in range (length - 2):
-            stack_list_2_1, stack_list_2_2, stack_list_2_3, \
-                stack_list_2_4, stack_list_2_5 = [], [], [], [], []
-            
-            for values, grouping in zip(data_3.iloc[::,a], data_stack_2):
-                if grouping == 1:
-                    stack_list_2_1.append(values)
-                if grouping == 2:
-                    stack_list_2_2.append(values)
-                if grouping == 3:
-                    stack_list_2_3.append(values)
-                if grouping == 4:
-                    stack_list_2_4.append(values)
-                if grouping == 5:
-                    stack_list_2_5.append(values) 
-                    
-                if grouping > 5 or pd.isnull(grouping) == True:
-                        print("\nStack plot 1 groupings are "
-                              "limited to 5 groups maximim at present. "
-                              "Error in grouping numbers. If not required"
-                              " add a zero.")
-                        sys.exit()
-                        
-            stack_2_sums_1.append(sum(stack_list_2_1))
-            stack_2_sums_2.append(sum(stack_list_2_2))
-            stack_2_sums_3.append(sum(stack_list_2_3))
-            stack_2_sums_4.append(sum(stack_list_2_4))
-            stack_2_sums_5.append(sum(stack_list_2_5))
         
-            a += 1
-            
-        # If percentage calculations are required (ie the groups of data 
-        # do not add up to 100. Does not matter but if the user want to 
-        # re calculate so they do is carried out here).
-        if stack_calc_2 == "yes":
-            stack_2_list = [stack_2_sums_1, stack_2_sums_2, \
-                            stack_2_sums_3, stack_2_sums_4, stack_2_sums_5]
-            
-            stack_2_all_sum = [v + w + x + y + z for v, w, x, y, z \
-                              in zip(stack_2_sums_1, stack_2_sums_2, \
-                                     stack_2_sums_3, stack_2_sums_4, \
-                                     stack_2_sums_5)]
-            
-            stack_2_sums_1_calc = []
-            stack_2_sums_2_calc = []
-            stack_2_sums_3_calc = []
-            stack_2_sums_4_calc = []
-            stack_2_sums_5_calc = []
-            
-            stack_2_list_calc = [stack_2_sums_1_calc, \
-                                 stack_2_sums_2_calc, \
-                                 stack_2_sums_3_calc, \
-                                 stack_2_sums_4_calc, \
-                                 stack_2_sums_5_calc]
-            
-            for w, x in zip(stack_2_list, stack_2_list_calc):
-                for y, z in zip(w, stack_2_all_sum):
-                    x.append(y/z * 100)
-
-###########################################################################
-###########################################################################
-# Obtain axis preferences from Input file such as axis limits, intervals 
-# and font style at present one font style is specified for the 
-# entire plot. More fonts are available in python and can be added to the
-# code. At present the program uses Arial, Calibri, Dejavu sans or
-# Times New Roman.
-
-# Get dictionary entry for text font style and check it.
-try:
-    font_style = par_dict["Font style**"].strip().lower()
-except:
-    print("\nProblem with font style entry in Parameter file Group 3. "
-          "Check entry for format and spelling.")
-    sys.exit()
-    
-Font_check = ["arial", "calibri", "dejavu sans", "times new roman"]
-
-if font_style not in Font_check:
-    print("\nCheck font style entry in Parameter file. Is not one of the"
-          " 4 presently available.")
-    sys.exit()
-    
-# Obtain height and widths of entire figure and check.
-try:
-    overall_x = float(par_dict["Overall figure size X**"].replace(" ",""))
-    overall_y = float(par_dict["Overall figure size Y**"].replace(" ",""))
-except:
-    print("\nProblem with Parameter file Group 2 entry. Check entry."
-          " Is it numeric?")
-    sys.exit()
-
-# Obtain X and Y axis limits and check.
-try:
-    x_limit_top = int(par_dict["X limit top**"].replace(" ","")) 
-    x_limit_base = int(par_dict["X limit base**"].replace(" ","")) 
-    x_limit_diff = x_limit_base - x_limit_top
-except:
-    print("\nProblem with X limit top and X limit base entries in"
-          " Parameter file. Check these entries are numeric and not "
-          "strings.")
-    sys.exit()
-
-###########################################################################
-# Obtain user specified X and Y tick and interval parameters and check.
-# Obtain space between plots parameter and check.
-try:
-    h_space = float(par_dict["Space between plots**"].replace(" ",""))
-except:
-    print("\nCheck Space between plots entry in Parameter file. Check"
-          " entry and format.")
-    sys.exit()
-
-# Obtain axis tick parameter controls from the Parameter file and check.
-try:
-    x_major_int = int(par_dict["X major interval**"].replace(" ",""))
-    y_major_int_0 = int(par_dict["Y major tick interval**"] \
-                        .replace(" ",""))
-except:
-    print("\nProblem with X major interval or Y major tick interval in "
-          "Parameter file. Check these entries are numeric.")
-    sys.exit()
-
-try:
-    x_major_tick_len = float(par_dict["X major tick length**"] \
-                             .replace(" ",""))
-    y_major_tick_len = float(par_dict["Y major tick length**"] \
-                             .replace(" ",""))
-    x_major_tick_wid = float(par_dict["X major tick width**"] \
-                             .replace(" ",""))
-    y_major_tick_wid = float(par_dict["Y major tick width**"] \
-                             .replace(" ",""))
-except:
-    print("\nProblem with X major tick length, Y major tick length,"
-          " X major tick width or Y major tick width in Parameter file."
-          " Check these entries are numeric.")
-    sys.exit()    
-    
-try:
-    x_all_ticks = par_dict["X ticks depth axis only**"].replace(" ","") \
-                         .lower()
-    y_ticks_l_r = par_dict["Y ticks both ends of plot on/off**"] \
-                          .replace(" ","").lower()
-    x_minor_ticks_on_off = par_dict["X minor ticks on/off**"]. \
-                           replace(" ","").lower()
-    y_minor_ticks_on_off = par_dict["Y minor ticks on/off**"]. \
-                           replace(" ","").lower()
-except:
-    print("\nProblem with X ticks depth axis only, Y ticks both ends of "
-          "plot on/off, X minor ticks on/off or Y minor ticks on/off"
-          " entries in Parameter file. Check these entries are strings"
-          " and are either 'on' or 'off'.")
-    sys.exit() 
-
-x_y_tick_checks = [x_all_ticks ,y_ticks_l_r, x_minor_ticks_on_off, \
-                   y_minor_ticks_on_off ]
-
-if any(i != "on" and i != "off" for i in x_y_tick_checks) == True:
-    print("\nProblem with X ticks depth axis only, Y ticks both ends of "
-          "plot on/off, X minor ticks on/off or Y minor ticks on/off"
-          " entries in Parameter file. Check these entries are strings"
-          " and are either 'on' or 'off'.")
-    sys.exit() 
-
-# Check entries for x minor parameters if specified and load in parameters.
-if x_minor_ticks_on_off == "on":
-    try:
-        x_minor_int = int(par_dict["X minor interval"].replace(" ",""))
-        x_minor_tick_len = float(par_dict["X minor tick length"]. \
-                                 replace(" ",""))
-        x_minor_tick_wid = float(par_dict["X minor tick width"]. \
-                                 replace(" ",""))
-    except:
-        print("\nProblem with X minor interval, X minor tick length or X "
-              "minor tick width in Parameter file. Check these entries"
-              " are numeric.")
-        sys.exit()         
+    if pd.isnull(par_list_G12_value) == True:
+        print("\nINT ages on/off entry in Parameter file Group 12 is missing.")
+        sys.exit()
     
-    x_min_par_dict = {k: v for k, v in par_dict.items() \
-                      if "X minor" in str(k)}
+    for x in par_list_G13_values:
+        if pd.isnull(x) == True:
+            print("\nEssential entries/entry in Parameter file, Group 13 "
+                  "is/are missing.")         
+            sys.exit()   
         
-    for k,v in x_min_par_dict.items():
-        if pd.isnull(v) == True and k != "Zone X minor tick colour":
-            print(f"\nEntry for {k} is missing in Parameter file.")
+    for x in par_list_G14_values:
+        if pd.isnull(x) == True:
+            print("\nIf any NSC not being used add 'none' to the relevent NSC "
+                  "1 - 5 entry in Parameter file, Group 14.") 
+            sys.exit() 
+
+    return par_dict
+
+# Function for the validation stage of the Input file or Extra Input file.
+# Looks for blanks and non numeric entries (entries if not required should
+# be filled with values of zero), removes taxa with no values, checks the
+# Depth and Zones columns and splits the file into the sample matrix and 
+# style table. The style codes are checked against col_max unless it is 
+# None.
+def validate_input(data, zones_on_off, file_label, col_max):
+    data = check_input_cells(data, file_label)
+
+    # Remove columns in dataframes if have no values other than zero. Palaeo 
+    # data should not have sums of zero or no data for any taxa. Pointless 
+    # being there.If any are then the program removes the column automatically
+    # for use in the  program.
+    data_sums = data.iloc[len(file_style_rows(data)):,2:].sum()
+    data = data.drop(columns = data_sums.index[data_sums == 0])
+
+    # The first column must be called Depth and be the data used the x axis 
+    # (portrait) and always be the first column once the data file has been 
+    # trimmed. The last column whether Zones are required or not should always
+    # be called Zones. If not create an error message.
+    data_list = [col for col in data.columns]
+
+    if data_list [1] != "Depth" or data_list [-1] != "Zones":
+        print(f"\nThe second and last column of the {file_label.lower()} "
+              "must be the 'Depth' and 'Zones' columns. One or both are "
+              "incorrect. Make sure there are no spaces before or after the "
+              "word 'Depth' or 'Zones' See manual for correct setup.")
+        sys.exit()
+
+    # Split the file once into the numeric sample matrix used for plotting 
+    # and the per taxon style table. See style_rows above for the names of 
+    # the style rows. Depth is not part of the style table and Zones is only
+    # included if requested.
+    data_2, taxa_style = split_input_data(data, zones_on_off, file_label)
+
+    # Check all style codes are within range before anything is plotted.
+    if col_max is not None:
+        check_style_table(taxa_style, col_max, file_label)
+
+    return data, data_2, taxa_style
+
+# Function to read the non standard scaling (NSC) entries of the Parameter
+# file into a table of overrides with one row per taxon. There can be any 
+# number of NSC slots, each with the same entries starting "NSC N", used in
+# order. A slot not being used is entered as 'none'. The table is indexed 
+# by taxon and holds the y min and max, major and minor tick intervals, 
+# spine on/off, size and spine start of each, along with where the spine 
+# goes (the y min if the spine start is 'mini', otherwise 0).
+def nsc_table(par_dict, data_list):
+    numbers = sorted(int(str(k)[len("NSC "):-len("**")]) for k in par_dict \
+                     if str(k).startswith("NSC ") and str(k).endswith("**") \
+                     and str(k)[len("NSC "):-len("**")].isdigit() == True)
+    
+    columns = ["y_min", "y_max", "y_major_int", "y_minor_int", "spine", \
+               "size", "spine_start", "spine_position"]
+    rows = {}
+    unused = None
+    
+    for number in numbers:
+        name = str(par_dict[f"NSC {number}**"]).strip()
+        
+        if name == "nan" or len(name) == 0:
+            print(f"\nFill NSC {number}** entries in Parameter file with "
+                  "'none' if not being used.")
             sys.exit()
-            
-# Check entries for y minor parameters if specified and load in parameters 
-# and check.
-if y_minor_ticks_on_off == "on":
-    try:
-        y_minor_int_0 = int(par_dict["Y minor tick interval"] \
-                            .replace(" ",""))
-        y_minor_tick_wid = float(par_dict["Y minor tick width"] \
-                                 .replace(" ",""))        
-        y_minor_tick_len = float(par_dict["Y minor tick length"] \
-                                 .replace(" ","")) 
-    except:
-        print("\nProblem with Y minor tick interval, Y minor tick width"
-              " or Y minor tick length in Parameter file. Check these"
-              " entries are numeric.")
-        sys.exit()     
         
-    y_min_par_dict = {k: v for k, v in par_dict.items() \
-                      if "Y minor" in str(k)} 
+        if name.lower() == "none":
+            unused = number if unused is None else unused
+            continue
         
-    for k,v in y_min_par_dict.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry for {k} is missing in Parameter file.")
-            sys.exit()    
-
-# Check all required x and y parameters have entries.
-x_y_check_list_1 = [h_space, x_major_int, y_major_int_0, x_all_ticks, \
-                    y_ticks_l_r, x_major_tick_len, y_major_tick_len, \
-                    x_major_tick_wid, y_major_tick_wid]
-    
-if any(i == pd.isnull for i in x_y_check_list_1):
-    print("\nMissing value for Group 7 or 8 in Parameter file.")
-
-###########################################################################
-###########################################################################
-# Obtaining overall title and footer parameters.
-title_text_on_off = par_dict["Overall title text on/off**"]. \
-                             replace(" ","").lower()
-footer_text_on_off = par_dict["Footer text on/off**"]. \
-                              replace(" ","").lower()
-
-# Initial checks of Overall title entries from parameter file
-if title_text_on_off not in ["on", "off"] and  \
-    pd.isnull(title_text_on_off) == False:
-    print("\nTitle text on/off in Parameter file has an incorrect entry. "
-          "Entry needs to be either 'on' or 'off'.")
-    sys.exit()              
-    
-if title_text_on_off == "on":
-    dict_title_values = {k: v for k, v in par_dict.items() \
-                         if "Overall title" in str(k)} 
-    
-    for k,v in dict_title_values.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry for {k} in Parameter file is missing or "
-                  "incorrect.")
+        # User input error checking. Make sure the slots are used in order.
+        if unused is not None:
+            print(f"\nUse earlier NSC slots before NSC {number} if they are "
+                  "listed as none in Parameter file.")
             sys.exit()
-    
-    try:
-        title_text_gap = float(par_dict["Overall title gap"])
-    except:
-        print("\nProblem with Overall title gap entry in Parameter file. "
-              "Check it is numeric.")
-        sys.exit()
-            
-    try:
-        title_text = par_dict["Overall title text"]
-    except:
-        print("\nProblem with Overall title text entry. Check it is a "
-              "string.")
         
-    try:
-        title_text_colour = float(par_dict["Overall title text colour"] \
-                                 .replace(" ",""))
-    except:
-        print("\nProblem with Overall title text colour entry in "
-              "Parameter file. Check entry is numeric.")
-        sys.exit()
+        if name not in data_list:
+            print(f"\nThe nominated NSC ({name}) in Parameter file is not "
+                  "called any of the available element names or is mispelt.")
+            sys.exit()
         
-    if title_text_colour < 1 or title_text_colour > col_max:
-        print("\nOverall title text colour entry in Parameter file is"
-              " out of bounds or incorrect. See manual for range of"
-              " colour codes. These are presently 1-23.")
-        sys.exit()
+        if name in rows:
+            print(f"\nThe nominated NSC {number} ({name}) in Parameter file is"
+                  " already nominated in an earlier NSC slot.")
+            sys.exit()
         
-    try:
-        title_text_bold = par_dict["Overall title text bold on/off"]. \
-                              replace(" ","").lower()
-    except:
-        print("\nProblem with Overall title text entry. Check it is a "
-              "string.")
-        sys.exit()
-                              
-    if title_text_bold not in ["on", "off"]:
-        print("\nOverall title text bold on/off in Parameter file"
-              " needs to be either 'on' or 'off'.")
-        sys.exit()
+        for k, v in par_dict.items():
+            if str(k).startswith(f"NSC {number} ") and pd.isnull(v) == True:
+                print(f"\nEntry missing for {k} in Group 14 in Parameter"
+                      " file.")
+                sys.exit()
         
-    try:
-        title_font_size = float(par_dict["Overall title font size"]. \
-                                replace(" ",""))
-        title_rotation = float(par_dict["Overall title rotation"]. \
-                               replace(" ",""))
-    except:
-        print("\nProblem with Overall title position entry / entries in "
-              "Parameter file. Check these are numeric.")
-        sys.exit()          
-    
-    if title_rotation < 0 or title_rotation > 360:
-        print("\nOverall title rotation in Parameter file is out of "
-              "bounds or incorrect.")
-        sys.exit()
-
-    try:
-        title_y_pos = float(par_dict["Overall title Y position"]. \
-                            replace(" ",""))
-        title_x_pos = float(par_dict["Overall title X position"]. \
-                                replace(" ",""))
-    except:
-        print("\nProblem with Overall title position entry / entries in "
-              "Parameter file. Check these are numeric.")
-        sys.exit()  
-          
-# Initial checks of footer entries from Parameter file
-if footer_text_on_off not in ["on", "off"] and \
-    pd.isnull(footer_text_on_off) == False:
-    print("\nTitle text on/off has an incorrect entry. Enter 'off' if not"
-          " required. Entry should be either 'on' or 'off'.")
-    sys.exit()              
-    
-if footer_text_on_off == "on":
-    dict_footer_values = {k: v for k, v in par_dict.items() \
-                          if "Footer" in str(k)} 
-    
-    for k,v in dict_footer_values.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry for {k} in Parameter file is missing or "
-                  " incorrect.")
+        try:
+            row = {"y_min": float(par_dict[f"NSC {number} y min"]), \
+                   "y_max": float(par_dict[f"NSC {number} y max"]), \
+                   "y_major_int": float(par_dict[f"NSC {number} y major "
+                                                 "tick interval"]), \
+                   "y_minor_int": float(par_dict[f"NSC {number} y minor "
+                                                 "tick interval"]), \
+                   "spine": str(par_dict[f"NSC {number} spine on/off"]) \
+                            .replace(" ","").lower(), \
+                   "size": float(str(par_dict[f"NSC {number} size"]) \
+                                 .replace(" ","")), \
+                   "spine_start": str(par_dict[f"NSC {number} spine "
+                                               "start"]).replace(" ","")}
+        except:
+            print(f"\nCheck NSC {number} y major tick interval, NSC {number} "
+                  f"y minor tick interval, NSC {number} y min, NSC {number} "
+                  f"y max, NSC {number} spine on/off, NSC {number} size or "
+                  f"NSC {number} spine start. A problem exists with one of "
+                  "these entries. Check entry and format.")
             sys.exit()
-
-    try:
-        footer_text = par_dict["Footer text"]
-    except:
-        print("\nProblem with Footer text entry Check it is a string.")
-        sys.exit()
         
-    try:
-        footer_text_colour = float(par_dict["Footer text colour"] \
-                               .replace(" ",""))
-    except:
-        print("\nProblem with Footer text colour entry in Parameter file."
-              " Check entry is numeric.")
-        sys.exit()          
-    
-    if footer_text_colour < 1 or footer_text_colour > col_max:
-        print("\nOverall footer text colour entry in Parameter file "
-              "is out of bounds or incorrect. See manual for range of "
-              "colour codes. These are presently 1-23.")
-        sys.exit()
-
-    try:
-        footer_text_bold = par_dict["Footer text bold on/off"] \
-                                   .replace(" ","").lower()
-    except:
-        print("\nProblem with Overall title text entry. Check it is a "
-              "string.")
-        sys.exit()
-                                
-    if footer_text_bold not in ["on", "off"]:
-        print("\nOverall footer text bold on/off in Parameter file needs"
-              " to be either 'on' or 'off'.")
-        sys.exit() 
-                               
-    try:                                                                
-        footer_font_size = float(par_dict["Footer font size"] \
-                                 .replace(" ",""))
-        footer_rotation = float(par_dict["Footer rotation"] \
-                                .replace(" ",""))
-    except:
-        print("\nProblem with footer font size or rotation entries in "
-              "Parameter file. Check these are numeric.")
-        sys.exit() 
+        if row["spine"] not in ["on","off"]:
+            print(f"\nEntry for NSC {number} spine on/off must be either 'on'"
+                  " or 'off'. Check entry.")
+            sys.exit()
         
-    if footer_rotation < 0 or footer_rotation > 360:
-        print("\nOverall footer rotation is out of bounds or incorrect.")
-        sys.exit()
+        if row["spine_start"] not in ["mini","0"]:
+            print(f"\nNSC {number} spine start entry in Parameter file must "
+                  "be either 'mini' or '0'. Check for spaces in entry.")
+            sys.exit()
         
-    try:
-        footer_y_pos = float(par_dict["Footer Y position"] \
-                             .replace(" ",""))
-        footer_x_pos = float(par_dict["Footer X position"] \
-                             .replace(" ",""))
-    except:
-        print("\nProblem with Footer position entry / entries in "
-              "Parameter file. Check these are numeric.")
-        sys.exit()         
+        row["spine_position"] = row["y_min"] if row["spine_start"] == \
+                                "mini" else 0.0
+        rows[name] = row
+    
+    nsc = pd.DataFrame.from_dict(rows, orient = "index", columns = columns)
+    
+    return nsc.astype({"y_min": float, "y_max": float, \
+                       "y_major_int": float, "y_minor_int": float, \
+                       "size": float, "spine_position": float})
+
+# Function to make the NSC adjustments (see nsc_table above) to the bottom 
+# spine of a panel. override is the row of the NSC table for the taxon or 
+# None if the taxon is not NSC. Panels that are not exaggerated and have 
+# the spine starting at the y min are set to the NSC y range again as the
+# spine position can move the limits.
+def apply_nsc_spine(graph, override, exag_type):
+    if override is None:
+        return
+    
+    graph.spines['bottom'].set_position(("data", override["spine_position"]))
+    
+    if override["spine"] == "off":
+        graph.spines['bottom'].set_visible(False)
+    
+    if exag_type == 0 and override["spine_start"] == "mini":
+        graph.set_ylim(override["y_min"], override["y_max"])
+
+# Function for the scaling stage. Works on the whole sample matrix at once
+# and returns, for every column, its minimum and rounded minimum (where its
+# panel starts from), the maximum its y axis goes up to and its height ratio
+# in the GridSpec. Exaggerated taxa with a maximum below 20 go up to 20 
+# more so very low values can be seen more easily. Ratios are the range of
+# each column over the largest range (rounded to 10) of the columns with 
+# standard scaling. Columns with non standard scaling (the index of nsc, 
+# see nsc_table above) are left out of the largest range and take their NSC
+# size as their ratio. Zones, if zones are not requested, is also left out 
+# and keeps its minimum as a ratio. Each is returned as a Series indexed by
+# column name.
+def scale_taxa(data_2, taxa_style, nsc, zones_on_off):
+    samples = data_2.iloc[:, 1:]
+    mins = samples.min()
+    maxs = samples.max()
+    
+    exag = taxa_style["exag"].reindex(mins.index)
+    limits = maxs.where(~((maxs < 20) & (exag > 0)), maxs + 20)
+    
+    standard = ~mins.index.isin(nsc.index)
     
-# Obtaining X and Y title parameters and checks. Null values been checked 
-# earlier.
-try:
-    x_title = par_dict["X title text**"]
-except:
-    print("\nProblem with X title text entry. Check it is a string.")
-    sys.exit()
-
-try:    
-    y_title_rotation = float(par_dict["Y title rotation**"] \
-                             .replace(" ",""))
-    x_title_rotation = float(par_dict["X title rotation**"] \
-                             .replace(" ",""))
-    x_title_fontsize  = float(par_dict["X title font size**"] \
-                              .replace(" ",""))
-    y_title_fontsize = float(par_dict["Y title font size**"] \
-                             .replace(" ",""))
-    x_title_text_colour = float(par_dict["X title text colour**"] \
-                               .replace(" ",""))
-except:
-    print("\nProblem with X or Y title numeric entries. Check entries are"
-          " numeric.")
-    sys.exit()  
-
-x_y_title_rotation_check = [y_title_rotation, x_title_rotation]
-
-if any(i < 0 or i > 360 for i in x_y_title_rotation_check) == True:
-    print("\nCheck Y title rotation or X title rotation entries in "
-          "Parameter file as they are out of range (0 to 360 degrees).")
-    sys.exit()
-
-if x_title_text_colour < 0 or x_title_text_colour > col_max:
-    print("\nX title text colour is out of range. See manual for range of"
-          " colour codes. Presently these are from 1-23.")
-    sys.exit()
-    
-try:    
-    x_title_text_bold = par_dict["X title bold on/off**"].replace(" ","") \
-                                .lower()
-except:
-    print("\nProblem with X title bold on/off entry. Check entry is a "
-          "string.")
-    sys.exit()
-
-if x_title_text_bold not in ["on", "off"]:
-    print("\nX title bold on/off entry in Parameter file needs to be"
-          " either 'on' or 'off'.")
-    sys.exit()
-
-###########################################################################
-###########################################################################
-# Obtain X and Y tick label parameters and check. Null values been checked 
-# earlier.
-try:
-    x_lab_font = float(par_dict["X label font size**"].replace(" ",""))
-    y_lab_font = float(par_dict["Y label font size**"].replace(" ",""))
-    x_lab_colour = float(par_dict["X label colour**"].replace(" ",""))
-    x_lab_rot = float(par_dict["X label rotation**"].replace(" ",""))
-    y_lab_rot = float(par_dict["Y label rotation**"].replace(" ",""))
-    y_lab_gap = float(par_dict["Y label gap**"].replace(" ",""))
-except:
-    print("\nProblem with numeric entry for X or Y labels. Check entries "
-          " for X label font size, Y label font size, X label colour, X "
-          "label rotation, Y label rotation and Y label gap are numeric.")
-    sys.exit()
-
-x_y_lab_rot = [x_lab_rot, y_lab_rot]    
-
-if any(i >360 or i < 0 for i in x_y_lab_rot) == True:
-    print("\nX label rotation or Y label rotation are out of bounds of 0"
-          " to 360 degrees range. Check numbers and formats.")
-    sys.exit()
-    
-###########################################################################
-###########################################################################
-# Odd scaling taxa. Find what the user wants to use as non_std_scaling
-# and get associated parameters and check. Can be up to 5 non_std_scaling
-# graphs at present. Could be expanded in the future but doubt would be
-# required.
-non_std_list = [non_std_scaling_1, non_std_scaling_2, non_std_scaling_3,\
-                 non_std_scaling_4, non_std_scaling_5]
-non_std_list = ["none" if x == "NONE" else x for x in non_std_list]
-
-non_std_list_num = ["NSC_1", "NSC_2", "NSC_3", "NSC_4", "NSC_5"]
-
-nsc_diff = {x: y for x, y in zip(non_std_list_num, non_std_list)}
-
-# User input error checking for NSC values.
-for value, key in zip(nsc_diff.values(), nsc_diff.keys()):
-    if value == "nan" or len(value) == 0:
-        print("")
-        print(f"\nFill {key} entries in Parameter file with 'none' if not"
-              " being used.")
-        sys.exit()
-        
-    if any(value in w for w in data_list) != True and value != "none":
-        print("")
-        print(f"\nThe nominated NSC ({value}) in Parameter file is not "
-              "called any of the available element names or is mispelt.")
-        sys.exit()
-
-# If any of the 5 non standard scaling options are selected load in the 
-# parameters required need to alter diff_list_ratios so are correctly
-# scaled based on user choices.
-if non_std_list[4] != "none" :
-    if pd.isnull(non_std_list[4]) == False:
-        diff_list_ratios_dict[non_std_scaling_5] = 1
-        diff_list_ratios_dict[non_std_scaling_4] = 1
-        diff_list_ratios_dict[non_std_scaling_3] = 1
-        diff_list_ratios_dict[non_std_scaling_2] = 1
-        diff_list_ratios_dict[non_std_scaling_1] = 1
-
-if non_std_list[3] != "none" and non_std_list[4] == "none":
-    if pd.isnull(non_std_list[4]) == False and \
-        pd.isnull(non_std_list[3]) == False:
-        diff_list_ratios_dict[non_std_scaling_4] = 1
-        diff_list_ratios_dict[non_std_scaling_3] = 1
-        diff_list_ratios_dict[non_std_scaling_2] = 1
-        diff_list_ratios_dict[non_std_scaling_1] = 1
-    
-    for x in range(ST, EN - 1):
-        diff_list_ratios_dict[x] = diff_list_ratios_dict_1
-
-if non_std_list[2] != "none" and non_std_list[3] == "none":
-    if pd.isnull(non_std_list[2]) == False and \
-        pd.isnull(non_std_list[3]) == False:
-        diff_list_ratios_dict[non_std_scaling_3] = 1
-        diff_list_ratios_dict[non_std_scaling_2] = 1
-        diff_list_ratios_dict[non_std_scaling_1] = 1
-    
-if non_std_list[1] != "none" and non_std_list[2] == "none":
-    if pd.isnull(non_std_list[1]) == False and \
-        pd.isnull(non_std_list[2]) == False:
-        diff_list_ratios_dict[non_std_scaling_2] = 1
-        diff_list_ratios_dict[non_std_scaling_1] = 1
-        
-if non_std_list[0] != "none" and non_std_list[1] == "none":
-    if pd.isna(non_std_list[0]) == False and \
-        pd.isna(non_std_list[1]) == False:
-        diff_list_ratios_dict[non_std_scaling_1] = 1
-
-###########################################################################
-# Get user options for NON_STD_SCALING 1 and check.
-non_std_spine_start_list = []
-
-if non_std_list[0] != "none":
-    try:
-        non_std_scaling_y_maj_int_1 = float(par_dict["NSC 1 y major tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_int_1 = float(par_dict["NSC 1 y minor tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_1 = float(par_dict["NSC 1 y min"])
-        non_std_scaling_y_max_1 = float(par_dict["NSC 1 y max"])
-        non_std_spine_on_off_1 = str(par_dict["NSC 1 spine on/off"]) \
-                                              .replace(" ","").lower()
-        non_std_scaling_1_size = float(par_dict["NSC 1 size"] \
-                                       .replace(" ",""))
-        non_std_spine_start_1 = str(par_dict["NSC 1 spine start"]). \
-                                              replace(" ","")
-        non_std_spine_start_list.append(non_std_spine_start_1)
-    except:
-        print("\nCheck NSC 1 y major tick interval, NSC 1 y minor tick "
-              "interval, NSC 1 y min, NSC 1 y max, NSC 1 spine on/off,"
-              " NSC 1 size or NSC spine start 1. A problem exists with"
-              " one of these entries. Check entry and format.")
-        sys.exit()
+    if zones_on_off == "off":
+        standard = standard & (mins.index != "Zones")
+    
+    ranges = limits - mins
+    ratios = mins.where(~standard, ranges / \
+                        np.round(ranges[standard].max(), decimals = -1))
+    
+    if len(nsc) > 0:
+        ratios.loc[nsc.index] = nsc["size"].astype(float)
+    
+    return {"mins": mins, "mins_round": np.round(mins, decimals = -1), \
+            "limits": limits, "ratios": ratios}
+
+# Function to sum the taxa in each group of a stack plot for every sample.
+# groups holds the group number of each taxon (0 if not in the stack plot)
+# and the groups are stacked in number order. The sums of every group at 
+# every depth are found in one matrix product of the samples and the group
+# membership of the taxa, and are turned into percentages of the total of 
+# the groups if percent is True (samples with a total of zero stay zero).
+def stack_sums(samples, groups, percent):
+    codes = np.unique(groups[groups > 0])
+    membership = (groups.to_numpy()[:, None] == codes).astype(float)
+    sums = samples[groups.index].to_numpy() @ membership
+    
+    if percent == True:
+        totals = sums.sum(axis = 1, keepdims = True)
+        sums = np.divide(sums, totals, out = np.zeros_like(sums), \
+                         where = totals != 0) * 100
+    
+    return sums
+
+# Function for the stack aggregation stage. Checks the Stack plot entries of
+# the Parameter file (par_dict here only holds the Stack plot entries) and
+# sums the taxa in each group of each stack plot for every sample. There 
+# can be any number of stack plots, each with any number of groups. Stack 
+# plots 1 and 2 take their groups from the Stack plot 1 and 2 rows of the 
+# Input file and any further stack plot from a Stack plot 3, 4 ... row 
+# added after them. The settings and sums of each stack plot switched on 
+# are returned in order, to be drawn by the stack plot columns in turn.
+def stack_plots(data_2, taxa_style, par_dict, col_max):
+    stack_ratios = {}
+    stacks = []
+    
+    numbers = sorted(int(k[len("Stack plot "):-len(" on/off**")]) \
+                     for k in par_dict if str(k).startswith("Stack plot ") \
+                     and str(k).endswith(" on/off**") and \
+                     k[len("Stack plot "):-len(" on/off**")].isdigit())
+    
+    for number in numbers:
+        on_off = par_dict[f"Stack plot {number} on/off**"]
+        
+        if pd.isnull(on_off) == True or str(on_off).strip().lower() not in \
+            ["on", "off"]:
+            print(f"\nStack plot {number} on/off in Parameter file "
+                  "requires an entry of 'on' or 'off'.")
+            sys.exit()
         
-    if non_std_spine_on_off_1 not in ["on","off"]:
-        print("\nEntry for NSC 1 spine on/off must be either 'on' or" 
-              " 'off'. Check entry.")
-        sys.exit()
+        if str(on_off).strip().lower() == "off":
+            continue
         
-    non_std_scaling_dict_1 = {k: v for k, v in par_dict.items() \
-                      if "NSC 1" in str(k)}
-    
-    for k,v in non_std_scaling_dict_1.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry missing for {k} in Group 14 in Parameter"
-                  " file.")
-            sys.exit() 
-        if k == "NSC 1 y minor tick interval" and v == str(0) and \
-                 y_minor_ticks_on_off == "on":
-            print("\nY minor ticks have been selected as on so zero is"
-                  " not permitted as entry for NSC 1 y min. Choose"
-                  " sensible number that is a division of the interval"
-                  " stated in the NSC 1 y max entry.")
+        # Stack plots must be used in order. Can not have one instance and
+        # use the Stack plot 2 entries in the Paramater file so error 
+        # message is given if that happens.
+        if number != len(stacks) + 1:
+            print(f"\nUse available Stack plot {len(stacks) + 1} entries "
+                  f"before Stack plot {number} entries.")
             sys.exit()
-        if k == "NSC 1 spine start" and v not in ["mini","0"]:
-            print("\nNSC spine start 1 entry in Parameter file must be "
-                  "either 'mini' or '0'. Check for spaces in entry.")
+        
+        if f"stack_{number}" not in taxa_style or \
+            taxa_style[f"stack_{number}"].max() <= 0:
+            print(f"\nStack plot {number} has been requested in the "
+                  "Parameter file but there is no groupings in the input "
+                  "file.")
             sys.exit()
-            
-    # Apply size choices from user to graph scaling
-    diff_list_ratios_dict[non_std_scaling_1] = \
-        diff_list_ratios_dict[non_std_scaling_1] \
-        * (non_std_scaling_1_size)
-
-# User input error checking. Make sure the slots for NSC are used in order
-if non_std_list[1] !="none":
-    if nsc_diff["NSC_1"] == "none":
-        print("")
-        print("\nUse earlier NSC slots before NSC 2 if they are listed as"
-              " none in Parameter file.")
-        sys.exit()
-
-###########################################################################
-# Get user options for NON_STD_SCALING 2 and check.
-if non_std_list[1] != "none":
-    try:
-        non_std_scaling_y_maj_int_2 = float(par_dict["NSC 2 y major tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_int_2 = float(par_dict["NSC 2 y minor tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_2 = float(par_dict["NSC 2 y min"])
-        non_std_scaling_y_max_2 = float(par_dict["NSC 2 y max"])
-        non_std_spine_on_off_2 = str(par_dict["NSC 2 spine on/off"]) \
-                                              .replace(" ","").lower()
-        non_std_scaling_2_size = float(par_dict["NSC 2 size"] \
-                                       .replace(" ",""))
-        non_std_spine_start_2 = str(par_dict["NSC 2 spine start"]) \
-                                              .replace(" ","")
-        non_std_spine_start_list.append(non_std_spine_start_2)
-    except:
-        print("\nCheck NSC 2 y major tick interval, NSC 2 y minor tick "
-              "interval, NSC 2 y min, NSC 2 y max NSC 2 spine on/off,"
-              " NSC 2 size or NSC spine start 2. A problem exists with"
-              " one of these entries. Check entry and format.")
-        sys.exit()
         
-    if non_std_spine_on_off_2 not in ["on","off"]:
-        print("\nEntry for NSC 2 spine on/off must be either 'on'" 
-              " or 'off'. Check entry.")
-        sys.exit()
+        groups = taxa_style[f"stack_{number}"]
         
-    non_std_scaling_dict_2 = {k: v for k, v in par_dict.items() \
-                      if "NSC 2" in str(k)}
-    
-    for k,v in non_std_scaling_dict_2.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry missing for {k} in Group 14 in Parameter "
-                  "file.")
-            sys.exit() 
-        if k == "NSC 2 y minor tick interval" and v == str(0) and \
-                 y_minor_ticks_on_off == "on":
-            print("\nY minor ticks have been selected as on so zero is"
-                  " not permitted as entry for NSC 2 y min. Choose"
-                  " sensible number that is a division of the interval"
-                  " stated in the NSC 2 y max entry.")
+        try:
+            title = par_dict[f"Stack plot title {number}"].strip()
+        except:
+            print(f"\nStack plot title {number} entry in Parameter file is"
+                  " missing or incorrect.")
             sys.exit()
-        if k == "NSC 2 spine start" and v not in ["mini","0"]:
-            print("\nNSC spine start 2 entry in Parameter file must be "
-                  "either 'mini' or '0'. Check for spaces in entry.")
+        
+        # Check colour entries in Parameter file when provided as list.
+        try:
+            colours = par_dict[f"Stack plot col list {number}"] \
+                      .replace(" ","").split(",")
+            colours = [float(x) for x in colours]
+        except:
+            print(f"\nEntry for Stack plot col list {number} in Parameter "
+                  "file is missing or incorrect. Make sure all required "
+                  "entries are filled.")
             sys.exit()
-
-    # Apply size choices from user to graph scaling.
-    diff_list_ratios_dict[non_std_scaling_2] = \
-        diff_list_ratios_dict[non_std_scaling_2] * (non_std_scaling_2_size)
-    
-# User input error checking. Make sure the slots for NSC are used in order.
-if non_std_list[2] !="none":
-    if nsc_diff["NSC_1"] == "none" or nsc_diff["NSC_2"] == "none":
-        print("")
-        print("\nUse earlier NSC slots before NSC 3 if they are listed as"
-              " none in Parameter file.")
-        sys.exit()
         
-###########################################################################
-# Get user options for NON_STD_SCALING 3 and check.
-if non_std_list[2] != "none":
-    try:
-        non_std_scaling_y_maj_int_3 = float(par_dict["NSC 3 y major tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_int_3 = float(par_dict["NSC 3 y minor tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_3 = float(par_dict["NSC 3 y min"])
-        non_std_scaling_y_max_3 = float(par_dict["NSC 3 y max"])
-        non_std_spine_on_off_3 = str(par_dict["NSC 3 spine on/off"]) \
-                                              .replace(" ","").lower()
-        non_std_scaling_3_size = float(par_dict["NSC 3 size"] \
-                                       .replace(" ",""))
-        non_std_spine_start_3 = str(par_dict["NSC 3 spine start"]) \
-                                              .replace(" ","")
-        non_std_spine_start_list.append(non_std_spine_start_3)
-    except:
-        print("\nCheck NSC 3 y major tick interval, NSC 3 y minor tick "
-              "interval, NSC 3 y min, NSC 3 y max NSC 3 spine on/off,"
-              " NSC 3 size or NSC spine start 3. A problem exists with"
-              " one of these entries. Check entry and format.")
-        sys.exit()
+        if any(i < 0 or i > col_max for i in colours):
+            print(f"\nA colour entry for Stack plot col list {number} in "
+                  "Parameter file is out of bounds.")
+            sys.exit()
         
-    if non_std_spine_on_off_3 not in ["on","off"]:
-        print("\nEntry for NSC 3 spine on/off must be either 'on' " 
-              "or 'off'. Check entry.")
-        sys.exit()
+        # Check stack plot size entry.
+        try:
+            size = float(par_dict[f"Stack plot size {number}"])
+        except:
+            size = np.nan
         
-    non_std_scaling_dict_3 = {k: v for k, v in par_dict.items() \
-                      if "NSC 3" in str(k)}
-    
-    for k,v in non_std_scaling_dict_3.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k} in Group 14 in Parameter file.")
-            sys.exit() 
-        if k == "NSC 3 y minor tick interval" and v == str(0) and \
-                 y_minor_ticks_on_off == "on":
-            print("\nY minor ticks have been selected as on so zero is"
-                  " not permitted as entry for NSC 3 y min. Choose"
-                  " sensible number that is a division of the interval"
-                  " stated in the NSC 3 y max entry.")
-            sys.exit()
-        if k == "NSC 3 spine start" and v not in ["mini","0"]:
-            print("\nNSC spine start 3 entry in Parameter file must be "
-                  "either 'mini' or '0'. Check for spaces in entry.")
+        if pd.isnull(size) == True:
+            print(f"\nStack plot size {number} entry in Parameter file is "
+                  "missing or incorrect.")
             sys.exit()
-
-    diff_list_ratios[3] = diff_list_ratios[3] * \
-                          (non_std_scaling_3_size / 100)
-    non_std_spine_start_list.append(non_std_spine_start_3)
-    
-    # Apply size choices from user to graph scaling.
-    diff_list_ratios_dict[non_std_scaling_3] = \
-        diff_list_ratios_dict[non_std_scaling_3] * (non_std_scaling_3_size)
-    
-# User input error checking. Make sure the slots for NSC are used in order.
-if non_std_list[3] != "none":
-    if nsc_diff["NSC_1"] == "none" or nsc_diff["NSC_2"] == "none" or \
-        nsc_diff["NSC_3"] == "none":
-        print("")        
-        print("\nUse earlier NSC slots before NSC 4 if they are listed as"
-              " none in Parameter file.")
-        sys.exit()
-
-###########################################################################
-# Get user options for NON_STD_SCALING 4 and check.
-if non_std_list[3]!= "none":
-    try:
-        non_std_scaling_y_maj_int_4 = float(par_dict["NSC 4 y major tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_int_4 = float(par_dict["NSC 4 y minor tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_4 = float(par_dict["NSC 4 y min"])
-        non_std_scaling_y_max_4 = float(par_dict["NSC 4 y max"])
-        non_std_spine_on_off_4 = str(par_dict["NSC 4 spine on/off"]) \
-                                              .replace(" ","").lower()
-        non_std_scaling_4_size = float(par_dict["NSC 4 size"] \
-                                       .replace(" ",""))
-        non_std_spine_start_4 = str(par_dict["NSC 4 spine start"]). \
-                                              replace(" ","")
-        non_std_spine_start_list.append(non_std_spine_start_4)
-    except:
-        print("\nCheck NSC 4 y major tick interval, NSC 4 y minor tick "
-              "interval, NSC 4 y min, NSC 4 y max NSC 4 spine on/off,"
-              " NSC 4 size or NSC spine start 4. A problem exists with"
-              " one of these entries. Check entry and format.")
-        sys.exit()
         
-    if non_std_spine_on_off_4 not in ["on","off"]:
-        print("\nEntry for NSC 4 spine on/off must be either 'on' or" 
-              " 'off'. Check entry.")
-        sys.exit()
+        # Check stack plot line width and colour entry.
+        try:
+            line_width = float(par_dict[f"Stack plot line width {number}"])
+        except:
+            print(f"\nStack plot line width {number} entry in Parameter "
+                  "file is missing or incorrect if not required use zero as"
+                  " entry.")
+            sys.exit()
         
-    non_std_scaling_dict_4 = {k: v for k, v in par_dict.items() \
-                      if "NSC 4" in str(k)}
-    
-    for k,v in non_std_scaling_dict_4.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry missing for {k} in Group 14 in Parameter "
-                  "file.")
-            sys.exit() 
-        if k == "NSC 4 y minor tick interval" and v == str(0) and \
-                 y_minor_ticks_on_off == "on":
-            print("\nY minor ticks have been selected as on so zero is"
-                  " not permitted as entry for NSC 4 y min. Choose"
-                  " sensible number that is a division of the interval"
-                  " stated in the NSC 4 y max entry.")
+        try:
+            line_colour = float(par_dict[f"Stack plot line colour {number}"])
+        except:
+            print(f"\nStack plot line colour {number} entry in Parameter "
+                  "file is missing or incorrect.")
             sys.exit()
-        if k == "NSC 4 spine start" and v not in ["mini","0"]:
-            print("\nNSC spine start 4 entry in Parameter file must be "
-                  "either 'mini' or '0'. Check for spaces in entry.")
+            
+        if line_colour <= 0 or line_colour > col_max:
+            print(f"\nStack plot line colour {number} entry in Parameter "
+                  "file is out of bounds.")
             sys.exit()
-    
-    # Apply size choices from user to graph scaling.
-    diff_list_ratios_dict[non_std_scaling_4] = \
-        diff_list_ratios_dict[non_std_scaling_3] * (non_std_scaling_4_size)
-        
-# User input error checking. Make sure the slots for NSC are used in order.
-if non_std_list[4] != "none": 
-    if nsc_diff["NSC_1"] == "none" or nsc_diff["NSC_2"] == "none" or \
-        nsc_diff["NSC_3"] == "none" or nsc_diff["NSC_4"] == "none":
-        print("")        
-        print("\nUse earlier NSC slots before NSC 5 if they are listed as"
-              " none in Parameter file.")
-        sys.exit()
         
-###########################################################################
-# Get user options for NON_STD_SCALING 5 and check.
-if non_std_list[4] != "none":
-    try:
-        non_std_scaling_y_maj_int_5 = float(par_dict["NSC 5 y major tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_int_5 = float(par_dict["NSC 5 y minor tick " 
-                                                     "interval"])
-        non_std_scaling_y_min_5 = float(par_dict["NSC 5 y min"])
-        non_std_scaling_y_max_5 = float(par_dict["NSC 5 y max"])
-        non_std_spine_on_off_5 = str(par_dict["NSC 5 spine on/off"]). \
-                                              replace(" ","").lower()
-        non_std_scaling_5_size = float(par_dict["NSC 5 size"] \
-                                       .replace(" ",""))
-        non_std_spine_start_5 = str(par_dict["NSC 5 spine start"]) \
-                                              .replace(" ","")
-        non_std_spine_start_list.append(non_std_spine_start_5)
-    except:
-        print("\nCheck NSC 5 y major tick interval, NSC 5 y minor tick "
-              "interval, NSC 5 y min, NSC 5 y max NSC 5 spine on/off,"
-              " NSC 5 size or NSC spine start 5. A problem exists with"
-              " one of these entries. Check entry and format.")
-        sys.exit()
+        # Check stack plot calculation entry. If percentage calculations 
+        # are required (ie the groups of data do not add up to 100) they 
+        # are made from the sums of the groups.
+        try:
+            calc = par_dict[f"Stack plot calculation {number}"].strip() \
+                   .lower()
+        except:
+            calc = None
         
-    if non_std_spine_on_off_5 not in ["on","off"]:
-        print("\nEntry for NSC 5 spine on/off must be either 'on' or" 
-              " 'off'. Check entry.")
-        sys.exit()
+        if calc not in ["yes", "no"]:
+            print(f"\nEntry for Stack plot calculation {number} in "
+                  "Parameter file is required. Entry should be 'yes' or "
+                  "'no'.")
+            sys.exit()
         
-    non_std_scaling_dict_5 = {k: v for k, v in par_dict.items() \
-                      if "NSC 5" in str(k)}
-    
-    for k,v in non_std_scaling_dict_5.items():
-        if pd.isnull(v) == True:
-            print(f"\nEntry missing for {k} in Group 14 in Parameter "
-                  "file.")
-            sys.exit() 
-        if k == "NSC 5 y minor tick interval" and v == str(0) and \
-                 y_minor_ticks_on_off == "on":
-            print("\nY minor ticks have been selected as on so zero is"
-                  " not permitted as entry for NSC 5 y min. Choose"
-                  " sensible number that is a division of the interval"
-                  " stated in the NSC 5 y max entry.")
+        if len(colours) != len(np.unique(groups[groups > 0])):
+            print(f"\nNumber of Stack {number} plot groups are different to "
+                  "number of colours prescribed in Parameter file.")
             sys.exit()
-        if k == "NSC 5 spine start" and v not in ["mini","0"]:
-            print("\nNSC spine start 5 entry in Parameter file must be "
-                  "either 'mini' or '0'. Check for spaces in entry. ")
+        
+        # Create a ratio for the stack plot so is correctly scaled on y
+        # axis. Adjusted by the size specified in parameter file by user.
+        stack_ratios[title] = 1 * size
+        
+        stacks.append({"colours": colours, "line_width": line_width, \
+                       "line_colour": line_colour, \
+                       "sums": stack_sums(data_2, groups, calc == "yes")})
+    
+    return {"num_stack_plots": len(stacks), "stack_ratios": stack_ratios, \
+            "stacks": stacks}
+
+# Function to draw the zone lines across the figure from the bottom of the
+# bottom panel (graph_a, at y bottom) to the top of the top panel (graph_b,
+# at y 1) at each zone depth. The ends are worked out once in figure inches
+# from the layout and the lines sharing a colour, line style and width are
+# drawn together as one LineCollection.
+def add_zone_lines(fig, graph_a, graph_b, depths, bottom, colours, styles, \
+                   widths):
+    # Reading the limits of the panels works them out if they are still to
+    # be autoscaled.
+    for graph in [graph_a, graph_b]:
+        graph.get_xlim()
+        graph.get_ylim()
+    
+    to_inches = fig.dpi_scale_trans.inverted()
+    starts = (graph_a.transData + to_inches).transform( \
+                 [(depth, bottom) for depth in depths])
+    ends = (graph_b.transData + to_inches).transform( \
+               [(depth, 1) for depth in depths])
+    
+    batches = {}
+    
+    for start, end, style in zip(starts, ends, zip(colours, styles, widths)):
+        batches.setdefault(style, []).append([start, end])
+    
+    for (zone_colour, zone_style, zone_width), segments in batches.items():
+        fig.add_artist(LineCollection(segments, \
+                                      colors = colour(zone_colour), \
+                                      linestyles = line_styles(zone_style), \
+                                      linewidths = zone_width, \
+                                      capstyle = "butt", \
+                                      transform = fig.dpi_scale_trans))
+
+# Function to read the Grouping annotation entries of the Parameter file. 
+# There can be any number of grouping annotations, each with the same 
+# entries starting "Grouping annotation N" (annotation 10 of the supplied
+# Parameter files is "Grouping annotation *10"). Each annotation switched 
+# on is checked and returned as a dictionary of its entries, in order.
+def group_annotations(par_dict, data_list, col_max):
+    prefixes = [str(k)[:-len(" on/off**")] for k in par_dict if \
+                str(k).startswith("Grouping annotation ") and \
+                str(k).endswith(" on/off**")]
+    prefixes = sorted(prefixes, key = lambda prefix: \
+                      int(prefix[len("Grouping annotation "):].strip("*")))
+    
+    numeric_entries = {"title_colour": "title colour", \
+                       "title_font_size": "title font size", \
+                       "line_colour": "line colour", \
+                       "line_width": "line width", \
+                       "line_start_x": "line start x", \
+                       "line_start_y": "line start y", \
+                       "line_end_x": "line end x", \
+                       "line_end_y": "line end y", \
+                       "tag_end_x": "tag end x", \
+                       "tag_end_y": "tag end y", \
+                       "tag_correction": "tag correction", \
+                       "line_correction": "line correction"}
+    
+    annotations = []
+    
+    for prefix in prefixes:
+        number = prefix[len("Grouping annotation "):].strip("*")
+        
+        if str(par_dict[f"{prefix} on/off**"]).replace(" ","").lower() != \
+            "on":
+            continue
+        
+        # Check for missing entries.
+        for k, v in par_dict.items():
+            if str(k).startswith(f"{prefix} ") and pd.isnull(v) == True:
+                print(f"Entry missing for {k}.")
+                sys.exit()
+        
+        try:
+            annotation = {"start": str(par_dict[f"{prefix} start"]).strip(), \
+                          "title": str(par_dict[f"{prefix} title"]).strip(), \
+                          "title_bold": str(par_dict[f"{prefix} title bold "
+                                                     "on/off"]) \
+                                        .replace(" ","").lower()}
+        except:
+            print(f"\nCheck entries for Grouping annotation {number} start,"
+                  f" Grouping annotation {number} title and Grouping "
+                  f"annotation {number} title bold on/off. One of these is "
+                  "erroneous. Check entry and format.")
             sys.exit()
-   
-    # Apply size choices from user to graph scaling.
-    diff_list_ratios_dict[non_std_scaling_5] = \
-        diff_list_ratios_dict[non_std_scaling_5] * (non_std_scaling_5_size)
-
-###########################################################################
-# Non standard spine starts at either 0 or the min of data.
-non_std_spine_start_list = [x.lower() if x != 0 else x for x in \
-                            non_std_spine_start_list]
-
-###########################################################################
-###########################################################################
-# RC ages if supplied. Bring in all required parameters and check what
-# user has entered in Parameter file.
-rc_ages_on_off = par_dict["RC ages on/off**"].replace(" ","").lower()
-
-# Check entry is provided.
-rc_check_list = ["on", "off"]
-
-if rc_ages_on_off not in rc_check_list:
-    print("\nIncorrect entry for RC ages on/off. If not using feature "
-          "provide an entry of 'off' in Parameter file. Entry needs to be"
-          " either 'on' or 'off'.")
-    sys.exit()         
-
-# Check RC entries
-if rc_ages_on_off == "on":
-
-    rc_age_title_on_off = par_dict["RC age title on/off"]
-    
-    if pd.isnull(rc_age_title_on_off) == True:
-        print("\nEntry for RC age title on/off is required. Entry should"
-              " be 'on' or off'.")
-        sys.exit()
         
-    try:    
-        rc_age_depths = par_dict["RC age depth label positions"] \
-                         .replace(" ","").split(",")
-        rc_age_depths = [float(x) for x in rc_age_depths]
-    except:
-        print("\nEntries for RC age depth label positions are required.")
-        sys.exit() 
+        try:
+            for name, entry in numeric_entries.items():
+                annotation[name] = float(par_dict[f"{prefix} {entry}"])
+        except:
+            print(f"\nCheck entries for Group {number} annotation in "
+                  "Parameter file. One of the numeric entries is missing or "
+                  "erroneous. Check entries and formats.")
+            sys.exit()
         
-    try:
-        rc_age_location_offset = float(par_dict \
-                                       ["RC age label position "
-                                        "offset"].replace(" ",""))
-        if pd.isnull(rc_age_location_offset) == True:
-            print("\nEntry for RC age label position offset in Parameter "
-                  "file is required.")
+        # Further entry error checks.
+        if annotation["start"] not in data_list:
+            print(f"\nGrouping annotation {number} start in Parameter file "
+                  f"({annotation['start']}) is not one of the taxa plotted."
+                  " Check entry and spelling.")
             sys.exit()
-    except:
-        print("\nEntry for RC age label position offset in Parameter"
-              " file is required.")              
-        sys.exit()        
         
-    try:
-        rc_age_labels = par_dict["RC age labels"].split(",")
-    except:
-        print("\nProblem with RC age labels. Check entries for these in "
-              "Parameter file.")
-        sys.exit()        
+        if annotation["title_bold"] not in ["on","off"]:
+            print(f"\nEntry for Grouping annotation {number} title bold "
+                  "on/off in Parameter file is required. Entry should be "
+                  "either 'on' or 'off'.")
+            sys.exit()
+        
+        for name in ["title_colour", "line_colour"]:
+            if annotation[name] < 0 or annotation[name] > col_max:
+                print(f"\nEntry for Grouping annotation {number} "
+                      f"{numeric_entries[name]} in Parameter file is out of"
+                      " bounds. Refer to manual for colour codes. Colour "
+                      f"codes presently range from 1-{col_max}.")
+                sys.exit()
         
+        annotations.append(annotation)
+    
+    return annotations
+
+# Function to draw the grouping annotations. Each is a bracket beside the
+# panels made of a line from the line start to the line end, a tag from 
+# the line start to the tag end and a tag from the tag end (moved down by
+# the length of the line) to the line end, with the title by the line. 
+# Positions are in the data coordinates of the panel of the start taxon
+# (group_axes gives the panel of each taxon). The brackets of every 
+# annotation are drawn as one LineCollection in figure inches, each line 
+# shortened by 2 points at both ends as an annotate arrow is, and the
+# titles are added to the figure in the same pass.
+def add_group_annotations(fig, group_axes, annotations):
+    segments = []
+    colours = []
+    widths = []
+    shrink = 2 / 72
+    
+    for annotation in annotations:
+        graph = group_axes[annotation["start"]]
+        
+        # Reading the limits of the panel works them out if they are still 
+        # to be autoscaled.
+        graph.get_xlim()
+        graph.get_ylim()
+        
+        to_inches = graph.transData + fig.dpi_scale_trans.inverted()
+        
+        start_x = annotation["line_start_x"]
+        start_y = annotation["line_start_y"]
+        end_x = annotation["line_end_x"]
+        end_y = annotation["line_end_y"]
+        correction = annotation["tag_correction"]
+        line_colour = colour(annotation["line_colour"])
+        
+        # A colour code with no colour (e.g. 0) is drawn in the default 
+        # black as the annotate arrows were.
+        if line_colour is None:
+            line_colour = "black"
+        
+        lines = [[(start_x, start_y + annotation["line_correction"]), \
+                  (end_x, end_y)], \
+                 [(start_x - correction, start_y), \
+                  (annotation["tag_end_x"], annotation["tag_end_y"])], \
+                 [(annotation["tag_end_x"], annotation["tag_end_y"] + \
+                   end_y - start_y), (end_x - correction, end_y)]]
+        
+        for line in lines:
+            line_start, line_end = to_inches.transform(line)
+            length = np.hypot(*(line_end - line_start))
+            
+            if length > 2 * shrink:
+                step = (line_end - line_start) / length * shrink
+                segments.append([line_start + step, line_end - step])
+                colours.append(line_colour)
+                widths.append(annotation["line_width"])
+        
+        title_x, title_y = to_inches.transform((start_x - 5, start_y + \
+                                                (end_y - start_y) / 2))
+        
+        fig.text(title_x, title_y, annotation["title"], \
+                 transform = fig.dpi_scale_trans, rotation = 90, \
+                 ha = "center", va = "top", \
+                 weight = bold_on_off(annotation["title_bold"]), \
+                 fontsize = annotation["title_font_size"], \
+                 color = colour(annotation["title_colour"]))
+    
+    if len(segments) > 0:
+        fig.add_artist(LineCollection(segments, colors = colours, \
+                                      linewidths = widths, \
+                                      capstyle = "butt", \
+                                      transform = fig.dpi_scale_trans))
+
+###############################################################################
+###############################################################################
+# Function to build the figure. The Parameter file is given as the path to
+# it or as a dataframe already read from it. The Input and Extra Input 
+# data can be given as paths or dataframes, otherwise the files named in 
+# the Parameter file are used. The working directory is never changed. The
+# figure is returned, or its bytes in output_format ("png", "pdf" or 
+# "svg") if one is given. Problems are printed and stop the program with
+# sys.exit() as when run from the cmd line.
+def render(parameters, input_data = None, extra_data = None, \
+           output_format = None, share_depth = False):
+    par, parameter_dir = read_parameter_file(parameters)
+    
+    # Print Gathering Paremeters to signify to user the program is commencing
+    print("") 
+    print("\n **Gathering Parameters**")
+    print("")
+
+    # Create dictionary of parameter entries and check the essential entries
+    # (see parse_parameters above).
+    par_dict = run_stage("parameter parse", parse_parameters, par)
+
+    # Colours are from 1-23 plus any Extra colours given in the Parameter 
+    # file (see colour_palette above). Declare number here as checks 
+    # require this value.
+    colour_table.clear()
+    colour_table.update(colour_palette(par_dict))
+    col_max = len(colour_table)
+
+    record_phase("parameter parse")
+
+    ###########################################################################
+    ###########################################################################
+    # Load in raw data to be plotted from Input file. File names are found in
+    # the directory stated in the Parameter file, which if not a full path is
+    # taken from where the Parameter file is. Data already loaded can be given
+    # to render instead of the files named in the Parameter file.
+    directory = os.path.join(parameter_dir, str(par_dict["Directory**"]))
+
+    if input_data is None:
+        input_data = par_dict["Input file name**"]
+
+    input_filename = input_data
+
     try:
-        rc_age_labels_font_size = float(par_dict["RC age label font "
-                                        "size"].replace(" ",""))
-        rc_age_labels_colour = float(par_dict["RC age labels colour"] \
-                                  .replace(" ",""))
-        rc_age_labels_bold = par_dict["RC age labels bold on/off"] \
-                                  .replace(" ","").lower()
-        rc_age_labels_rotation = float(par_dict["RC age labels "
-                                        "rotation"].replace(" ",""))
+        if isinstance(input_data, pd.DataFrame):
+            data = input_data.copy()
+        else:
+            data = pd.read_csv(os.path.join(directory, input_data))
     except:
-        print("\nProblem with one of the entries in Parameter file for "
-              "either RC age label font size, RC age labels colour,"
-              " RC age labels bold on/off or RC age labels rotation"
-              " entries. Check formats are correct.")
+        print(f"\nProblem loading in Input file. Is {input_filename} the "
+              "correct name and in correct location ? Check location and "
+              "spelling of name.")
         sys.exit()
-        
-    par_dict_rc_labels_values = {k: v for k, v in par_dict.items() \
-                  if "RC age labels" in str(k)} 
 
-    for k,v in par_dict_rc_labels_values.items():
-        if pd.isnull(v) == True:
-            print(f" \nEntry missing for {k}.")
-            sys.exit()                      
-    
-    if rc_age_labels_bold not in ["on", "off"]:
-        print("\nEntry for RC age labels bold on/off in Parameter file is"
-              " required. Enter 'on' or 'off'.")
-        sys.exit()            
-        
-    if rc_age_labels_rotation < 0 or rc_age_labels_rotation > 360:
-        print("\nEntry for RC age labels rotation in Parameter file is"
-              " not between 0 and 360.")
-        sys.exit()                 
+    record_phase("input load")
 
-    # User input error checking for length of list of labels and ages.
-    # Must be the same length.
-    if len(rc_age_labels) != len(rc_age_depths):
-        print("")
-        print("\nError in RC label depths in Parameter file. Unequal"
-              " number of depths and labels.")
-        sys.exit()
+    # Determine if Zones are required or not as specified by user.
+    zones_on_off = par_dict["Zones on/off**"].replace(" ","").lower()
+
+    # Check the Input file, remove empty taxa and split it into the sample
+    # matrix used for plotting (data_2) and the per taxon style table (see
+    # validate_input above).
+    data, data_2, taxa_style = run_stage("validation", validate_input, data, \
+                                         zones_on_off, "Input file", col_max)
+    
+    record_phase("validation")
+    
+    # Fewer samples are plotted in a draft if asked for (see thin_samples).
+    if draft == True and draft_samples is not None:
+        data, data_2 = thin_samples(data, data_2, draft_samples)
+    
+    # Load in Extra Input file if required. File with information for plots  
+    # with multiple entries.
+    if extra_data is None:
+        extra_data = str(par_dict["Extra input file name**"]).strip()
 
-# Load in data for RC age title if it is specified as being 'on' and check.
-    if rc_age_title_on_off == "on":
-        rc_age_title = par_dict["RC age title"]
+    if isinstance(extra_data, pd.DataFrame):
+        extra_yn = "supplied"
+    else:
+        extra_yn = str(extra_data).strip()
+    
+    extra_input_filename = extra_yn
 
+    # Error check importing of Extra Input file if user needs to use it
+    if extra_yn != "none":
         try:
-            rc_age_title_depth = float(par_dict["RC age title depth "
-                                      "position"].replace(" ",""))
-            rc_age_title_offset = float(par_dict["RC age title offset "
-                                        "position"].replace(" ",""))
-            rc_age_title_font_size = float(par_dict["RC age title font "
-                                          "size"].replace(" ",""))
-            rc_age_title_colour = float(par_dict["RC age title colour"]. \
-                                        replace(" ",""))
-            rc_age_title_bold = par_dict["RC age title bold on/off"]. \
-                                        replace(" ","").lower()
-            rc_age_title_rotation = float(par_dict["RC age title rotation"]. \
-                                          replace(" ",""))
+            if isinstance(extra_data, pd.DataFrame):
+                data_extra = extra_data.copy()
+            else:
+                data_extra = pd.read_csv(os.path.join(directory, extra_data))
         except:
-            print("\nProblem with one of the entries in Parameter file"
-                  " for either RC age title depth position, RC age title"
-                  " offset position, RC age title font size, RC age title"
-                  " colour, RC age title bold on/off or RC age title"
-                  " rotation entries.Check formats are correct.")
+            print(f"\nProblem loading in Extra Input file. Is "
+                  f"{extra_input_filename} the correct name and in correct "
+                  "location ? Check location and spelling of name.")
             sys.exit()
-            
-        par_dict_RC_title_values = {k: v for k, v in par_dict.items() \
-                      if "RC age title" in str(k)} 
     
-        for k,v in par_dict_RC_title_values.items():
-            if pd.isnull(v) == True:
-                print(f" \n Entry missing for {k}.")
-                sys.exit()            
+        record_phase("input load")
         
-        if rc_age_title_colour < 0 or rc_age_title_colour > col_max:
-            print("\nEntry for RC age title colour in Parameter file is"
-                  " out of bounds.")
-            sys.exit()
-            
-        if rc_age_title_bold not in ["on", "off"]:
-            print("\nEntry for RC age title bold on/off in Parameter file"
-                  " is required. Enter 'on' or 'off'.")
-            sys.exit()            
-            
-        if rc_age_title_rotation < 0 or rc_age_title_rotation > 360:
-            print("\nEntry for RC age title rotation in Parameter file is"
-                  " not between 0 and 360.")
-            sys.exit()
+        # The style codes of the Extra Input file are not checked as only
+        # some of them are used.
+        data_extra, data_extra_2, taxa_style_ex = \
+            run_stage("validation", validate_input, data_extra, zones_on_off, \
+                      "Extra Input file", None)
+        
+        record_phase("validation")
+        
+        if draft == True and draft_samples is not None:
+            data_extra, data_extra_2 = thin_samples(data_extra, data_extra_2, \
+                                                    draft_samples)
 
-###########################################################################
-###########################################################################
-# Date line ages if supplied bring in all required parameters from
-# Parameter file and check.
-int_ages_on_off = par_dict["INT ages on/off**"].replace(" ","").lower()
+    ###########################################################################
+    ###########################################################################
+    # Make list of all Palaeo data names (not including Depth) but including
+    # Zones as Zones plots as their own column on plot like a taxa. Reverse 
+    # the list. As above for the Extra Input file if required.
+    data_list = [col for col in data.columns]
+    data_list = data_list[2:]
+    data_list = data_list[::-1]
 
-# Check entry is provided.
-if int_ages_on_off not in ["on", "off"]:
-    print("\nIncorrect entry for INT ages on or off in Parameter file. If"
-          " not using feature provide an entry of 'off' in Parameter"
-          " file. Entries should be 'on' or 'off'.")
-    sys.exit()
+    if extra_yn != "none":
+        data_list_extra = [col for col in data_extra.columns]
+        data_list_extra = data_list_extra[2:]
+        data_list_extra = data_list_extra[::-1]   
 
-# Obtain INT parameters from Parameter file and check entries.
-if int_ages_on_off == "on":
-    
-    int_age_title_on_off = str(par_dict["INT age title on/off"]). \
-                           replace(" ",""). lower()
-                           
-    if int_age_title_on_off not in ["on","off"]:
-        print("\nINT age title on/off entry should be either 'on' or"
-              " 'off'.")
-        sys.exit()
-    
+    # If zones are not requested in Parameter file remove the Zones title 
+    # from the list of taxa
+    if zones_on_off == "off":
+        data_list = data_list[1::]
+
+    # Data_list_1 is the first taxon and has depth plotted with it with labels 
+    # etc. Data_list_1 is used to identify this later in code for plotting for 
+    # main dataframe only not extra.
+    data_list_1 = data_list[-1]
+
+    # Create dictionary of taxa to be plotted and associated 'plot style' 
+    # reference numbers, plot style numbers are from 1-7.
+    # 1 is a barplot 
+    # 2 is a bar and lineplot,
+    # 3 lineplot 
+    # 4 is a lineplot with shaded section under the line
+    # 5 is a line and marker plot,
+    # 6 is a marker plot only
+    # 7 is a stack plot (any number, see stack_plots above).
+    # Plot style 1-7 is listed in row 2 of the input file by user.
+    plot_type = taxa_style["graph"].to_dict()
+
+    # For 'extra' data obtain taxon names.
+    if extra_yn != "none":
+        taxa_extra = data_list_extra
+
+    # Create list of taxa to be plotted and the order number they are in the
+    # data provided (this is reversed)
+    data_list_dict = {k: v for k, v in zip(data_list, \
+                                           np.arange(0, len(data_list), 1))}
+
+    ###########################################################################
+    ###########################################################################
+    # Get user options from the Input file. Create dictionaries of each taxon 
+    # and its style code from the style table for use throughout the program.
+    # Colour, line style, marker and bold codes are looked up for every taxon
+    # at once (see resolve_styles above) so the dictionaries hold what 
+    # matplotlib is given. A taxon title colour of zero is taken as black.
+    taxa_resolved = resolve_styles(taxa_style.replace({"title_colour": \
+                                                       {0: 1}}), colour_table)
+
+    if extra_yn != "none":
+        taxa_resolved_ex = resolve_styles(taxa_style_ex, colour_table)
+
+    # Colour index values for bars for graph types 1, 2 and bar widths for
+    # graph types 1 and 2. Colours are 1-23 (see manual). More colours can be
+    # added with the Extra colours entry of the Parameter file.
+    bar_col_type = taxa_resolved["bar_colour"].to_dict()
+    bar_wid_g1 = taxa_style["bar_width_g1"].to_dict()
+    bar_wid = taxa_style["bar_width_g2"].to_dict()
+
+    # Line style, colour and width values for graphs 2, 3, 4, and 5.
+    line_type = taxa_resolved["line_style"].to_dict()
+    line_colour_type = taxa_resolved["line_colour"].to_dict()
+    line_width_type = taxa_style["line_width"].to_dict()
+
+    # Fill colour and transparency values for graphs 2 and 4.
+    fill_colour_type = taxa_resolved["fill_colour"].to_dict()
+    fill_trans_type = taxa_style["fill_trans"].to_dict()
+
+    # Marker type, size, face colour, edge colour and edge width for graphs 5
+    # and 6.
+    marker_typ_type = taxa_resolved["marker_type"].to_dict()
+    marker_s_size = taxa_style["marker_size"].to_dict()
+    marker_f_col = taxa_resolved["marker_face_colour"].to_dict()
+    marker_e_col = taxa_resolved["marker_edge_colour"].to_dict()
+    marker_e_w_wid = taxa_style["marker_edge_width"].to_dict()
+
+    # As above for extra data file if required by user.
+    if extra_yn != "none":
+        line_type_ex = taxa_resolved_ex["line_style"].to_dict()
+        line_colour_type_ex = taxa_resolved_ex["line_colour"].to_dict()
+        line_width_type_ex = taxa_style_ex["line_width"].to_dict()
+        marker_typ_type_ex = taxa_resolved_ex["marker_type"].to_dict()
+        marker_s_size_ex = taxa_style_ex["marker_size"].to_dict()
+        marker_f_col_ex = taxa_resolved_ex["marker_face_colour"].to_dict()
+        marker_e_col_ex = taxa_resolved_ex["marker_edge_colour"].to_dict()
+        marker_e_w_wid_ex = taxa_style_ex["marker_edge_width"].to_dict()
+
+    # Taxon title colour and bold.
+    taxa_taxon_c_col = taxa_resolved["title_colour"].to_dict()
+    taxa_taxon_b_bold = taxa_resolved["title_bold"].to_dict()
+
+    # Vertical, left and right spine widths, styles and colours.
+    taxa_plot_vs_width = taxa_style["vs_width"].to_dict()
+    taxa_plot_vstyle = taxa_resolved["vs_style"].to_dict()
+    taxa_plot_vs_colour = taxa_resolved["vs_colour"].to_dict()
+    taxa_plot_ls_width = taxa_style["ls_width"].to_dict()
+    taxa_plot_lstyle = taxa_resolved["ls_style"].to_dict()
+    taxa_plot_ls_colour = taxa_resolved["ls_colour"].to_dict()
+    taxa_plot_rs_width = taxa_style["rs_width"].to_dict()
+    taxa_plot_rstyle = taxa_resolved["rs_style"].to_dict()
+    taxa_plot_rs_colour = taxa_resolved["rs_colour"].to_dict()
+
+    # X and Y major and minor tick colours.
+    taxa_x_tick_maj_colour = taxa_resolved["x_tick_maj_colour"].to_dict()
+    taxa_x_tick_min_colour = taxa_resolved["x_tick_min_colour"].to_dict()
+    taxa_y_tick_maj_colour = taxa_resolved["y_tick_maj_colour"].to_dict()
+    taxa_y_tick_min_colour = taxa_resolved["y_tick_min_colour"].to_dict()
+
+    # Exaggeration settings. 0 is no exaggeration, any other number is number
+    # to multiply original to get exaggeration. If exaggeration is required 
+    # the type is either graph type 3 or 4.
+    taxa_exag = taxa_style["exag"].to_dict()
+    taxa_exag_type = taxa_style["exag_type"].to_dict()
+    taxa_exag_col = taxa_resolved["exag_colour"].to_dict()
+    taxa_exag_trans = taxa_style["exag_trans"].to_dict()
+    taxa_exag_line_col = taxa_resolved["exag_line_colour"].to_dict()
+    taxa_exag_lw = taxa_style["exag_lw"].to_dict()
+    taxa_exag_ls = taxa_resolved["exag_ls"].to_dict()
+
+    ###########################################################################
+    ###########################################################################
+    # Create a set of values to 'scale' the y axis of each plot correctly, 
+    # 'the abundance' axis. To do this the program needs to know if any non 
+    # standard scaling (NSC) graphs are required before can do this. This
+    # is done with a table of the NSC settings of each NSC taxon (see 
+    # nsc_table above).
+    nsc = nsc_table(par_dict, data_list)
+    nsc_overrides = nsc.to_dict("index")
+
+    # Find the minimum, maximum and width ratio of each taxon (see 
+    # scale_taxa above).
+    scales = run_stage("scaling computation", scale_taxa, data_2, \
+                       taxa_style, nsc, zones_on_off)
+    
+    diff_list_ratios_dict = scales["ratios"].to_dict()
+    new_max_taxa_dict = scales["limits"].to_dict()
+
+    record_phase("scaling computation")
+
+    ###########################################################################
+    ###########################################################################
+    # Read in groups for stack plots if stack plots are required and sum the
+    # taxa in each group (see stack_plots above).
+    stack_entries = {k: v for k, v in par_dict.items() if \
+                     str(k).startswith("Stack plot")}
+    stacks = run_stage("stack aggregation", stack_plots, data_2, \
+                       taxa_style, stack_entries, col_max)
+
+    num_stack_plots = stacks["num_stack_plots"]
+    diff_list_ratios_dict.update(stacks["stack_ratios"])
+
+    # Create marker for stack plots ready for later in the program
+    num_stack = 1
+
+    record_phase("stack aggregation")
+
+    ###########################################################################
+    ###########################################################################
+    # Obtain axis preferences from Input file such as axis limits, intervals 
+    # and font style at present one font style is specified for the 
+    # entire plot. More fonts are available in python and can be added to the
+    # code. At present the program uses Arial, Calibri, Dejavu sans or
+    # Times New Roman.
+
+    # Get dictionary entry for text font style and check it.
     try:
-        int_age_depths = par_dict["INT age depth labels positions"] \
-                                 .replace(" ","").split(",")
-        int_age_depths = [float(x) for x in int_age_depths]
+        font_style = par_dict["Font style**"].strip().lower()
     except:
-        print("\nCheck entries and formats for INT age depth labels "
-              "positions.")
+        print("\nProblem with font style entry in Parameter file Group 3. "
+              "Check entry for format and spelling.")
         sys.exit()
     
-    if any(pd.isnull(int_age_depths)):
-        print("\nEntries for INT age depth labels positions in Parameter "
-              "file required.")
+    Font_check = ["arial", "calibri", "dejavu sans", "times new roman"]
+
+    if font_style not in Font_check:
+        print("\nCheck font style entry in Parameter file. Is not one of the"
+              " 4 presently available.")
         sys.exit()
     
+    # Obtain height and widths of entire figure and check.
     try:
-        int_age_location_offset = float(par_dict \
-                                        ["INT age labels position offset"] \
-                                            .replace(" ",""))
+        overall_x = float(par_dict["Overall figure size X**"].replace(" ",""))
+        overall_y = float(par_dict["Overall figure size Y**"].replace(" ",""))
     except:
-        print("\nCheck entry and format for INT age labels position"
-              " offset in Parameter file.")
-        sys.exit()        
-        
-    if pd.isnull(int_age_location_offset) == True:
-        print("\nEntry for INT age labels position offset in Parameter"
-              " file is required.")
+        print("\nProblem with Parameter file Group 2 entry. Check entry."
+              " Is it numeric?")
         sys.exit()
-    
+
+    # Obtain X and Y axis limits and check.
     try:
-        int_age_labels = par_dict["INT age labels"].replace(" ","") \
-                                                   .split(",")
+        x_limit_top = int(par_dict["X limit top**"].replace(" ","")) 
+        x_limit_base = int(par_dict["X limit base**"].replace(" ","")) 
+        x_limit_diff = x_limit_base - x_limit_top
     except:
-        print("\nCheck Entry for INT age labels.")
+        print("\nProblem with X limit top and X limit base entries in"
+              " Parameter file. Check these entries are numeric and not "
+              "strings.")
         sys.exit()
 
+    ###########################################################################
+    # Obtain user specified X and Y tick and interval parameters and check.
+    # Obtain space between plots parameter and check.
     try:
-        int_age_labels_font_size = float(par_dict["INT age labels font "
-                                        "size"].replace(" ",""))
-        int_age_labels_colour = float(par_dict["INT age labels colour"]. \
-                                      replace(" ",""))
-        int_age_labels_bold = par_dict["INT age labels bold on/off"]. \
-                                      replace(" ","").lower()
-        int_age_labels_rotation = float(par_dict["INT age labels "
-                                        "rotation"].replace(" ",""))
+        h_space = float(par_dict["Space between plots**"].replace(" ",""))
     except:
-        print("\nProblem with entry for INT age labels font size, INT age"
-              " labels colour, INT age labels bold on/off, or INT age"
-              " labels rotation. Check entries and formats.")
+        print("\nCheck Space between plots entry in Parameter file. Check"
+              " entry and format.")
         sys.exit()
-            
-    par_dict_int_labels_values = {k: v for k, v in par_dict.items() \
-                  if "INT age labels" in str(k)} 
-
-    for k,v in par_dict_int_labels_values.items():
-        if pd.isnull(v) == True:
-            print(f" \nEntry missing for {k} in Parameter file.")
-            sys.exit()                      
-    
-    if int_age_labels_bold not in ["on", "off"]:
-        print("\nEntry for INT age labels bold on/off in Parameter file"
-              " is required. Enter 'on' or 'off'.")
-        sys.exit()            
-        
-    if int_age_labels_rotation < 0 or int_age_labels_rotation > 360:
-        print("\nEntry for INT age labels rotation in Parameter file is"
-              " not between 0 and 360.")
+
+    # Obtain axis tick parameter controls from the Parameter file and check.
+    try:
+        x_major_int = int(par_dict["X major interval**"].replace(" ",""))
+        y_major_int_0 = int(par_dict["Y major tick interval**"] \
+                            .replace(" ",""))
+    except:
+        print("\nProblem with X major interval or Y major tick interval in "
+              "Parameter file. Check these entries are numeric.")
         sys.exit()
-            
-    int_age_depth_labels = par_dict["INT age depth labels positions"]. \
-                           replace(" ","").split(",")
-        
-    if any(pd.isnull(int_age_depth_labels)) == True:
-        print("\nThere is a missing value or an empty space in the INT"
-              " age depth labels positions entry in Parameter file.")
+
+    try:
+        x_major_tick_len = float(par_dict["X major tick length**"] \
+                                 .replace(" ",""))
+        y_major_tick_len = float(par_dict["Y major tick length**"] \
+                                 .replace(" ",""))
+        x_major_tick_wid = float(par_dict["X major tick width**"] \
+                                 .replace(" ",""))
+        y_major_tick_wid = float(par_dict["Y major tick width**"] \
+                                 .replace(" ",""))
+    except:
+        print("\nProblem with X major tick length, Y major tick length,"
+              " X major tick width or Y major tick width in Parameter file."
+              " Check these entries are numeric.")
         sys.exit()    
+    
+    try:
+        x_all_ticks = par_dict["X ticks depth axis only**"].replace(" ","") \
+                             .lower()
+        y_ticks_l_r = par_dict["Y ticks both ends of plot on/off**"] \
+                              .replace(" ","").lower()
+        x_minor_ticks_on_off = par_dict["X minor ticks on/off**"]. \
+                               replace(" ","").lower()
+        y_minor_ticks_on_off = par_dict["Y minor ticks on/off**"]. \
+                               replace(" ","").lower()
+    except:
+        print("\nProblem with X ticks depth axis only, Y ticks both ends of "
+              "plot on/off, X minor ticks on/off or Y minor ticks on/off"
+              " entries in Parameter file. Check these entries are strings"
+              " and are either 'on' or 'off'.")
+        sys.exit() 
+
+    x_y_tick_checks = [x_all_ticks ,y_ticks_l_r, x_minor_ticks_on_off, \
+                       y_minor_ticks_on_off ]
+
+    if any(i != "on" and i != "off" for i in x_y_tick_checks) == True:
+        print("\nProblem with X ticks depth axis only, Y ticks both ends of "
+              "plot on/off, X minor ticks on/off or Y minor ticks on/off"
+              " entries in Parameter file. Check these entries are strings"
+              " and are either 'on' or 'off'.")
+        sys.exit() 
 
-    if int_age_title_on_off == "on":
-        int_age_title = par_dict["INT age title"]
+    # Check entries for x minor parameters if specified and load in parameters.
+    if x_minor_ticks_on_off == "on":
+        try:
+            x_minor_int = int(par_dict["X minor interval"].replace(" ",""))
+            x_minor_tick_len = float(par_dict["X minor tick length"]. \
+                                     replace(" ",""))
+            x_minor_tick_wid = float(par_dict["X minor tick width"]. \
+                                     replace(" ",""))
+        except:
+            print("\nProblem with X minor interval, X minor tick length or X "
+                  "minor tick width in Parameter file. Check these entries"
+                  " are numeric.")
+            sys.exit()         
+    
+        x_min_par_dict = {k: v for k, v in par_dict.items() \
+                          if "X minor" in str(k)}
+        
+        for k,v in x_min_par_dict.items():
+            if pd.isnull(v) == True and k != "Zone X minor tick colour":
+                print(f"\nEntry for {k} is missing in Parameter file.")
+                sys.exit()
+            
+    # Check entries for y minor parameters if specified and load in parameters 
+    # and check.
+    if y_minor_ticks_on_off == "on":
+        try:
+            y_minor_int_0 = int(par_dict["Y minor tick interval"] \
+                                .replace(" ",""))
+            y_minor_tick_wid = float(par_dict["Y minor tick width"] \
+                                     .replace(" ",""))        
+            y_minor_tick_len = float(par_dict["Y minor tick length"] \
+                                     .replace(" ","")) 
+        except:
+            print("\nProblem with Y minor tick interval, Y minor tick width"
+                  " or Y minor tick length in Parameter file. Check these"
+                  " entries are numeric.")
+            sys.exit()     
+        
+        y_min_par_dict = {k: v for k, v in par_dict.items() \
+                          if "Y minor" in str(k)} 
         
-        par_dict_INT_title_values = {k: v for k, v in par_dict.items() \
-                      if "INT age title" in str(k)} 
+        for k,v in y_min_par_dict.items():
+            if pd.isnull(v) == True:
+                print(f"\nEntry for {k} is missing in Parameter file.")
+                sys.exit()    
+
+    # Check all required x and y parameters have entries.
+    x_y_check_list_1 = [h_space, x_major_int, y_major_int_0, x_all_ticks, \
+                        y_ticks_l_r, x_major_tick_len, y_major_tick_len, \
+                        x_major_tick_wid, y_major_tick_wid]
+    
+    if any(i == pd.isnull for i in x_y_check_list_1):
+        print("\nMissing value for Group 7 or 8 in Parameter file.")
+
+    ###########################################################################
+    ###########################################################################
+    # Obtaining overall title and footer parameters.
+    title_text_on_off = par_dict["Overall title text on/off**"]. \
+                                 replace(" ","").lower()
+    footer_text_on_off = par_dict["Footer text on/off**"]. \
+                                  replace(" ","").lower()
+
+    # Initial checks of Overall title entries from parameter file
+    if title_text_on_off not in ["on", "off"] and  \
+        pd.isnull(title_text_on_off) == False:
+        print("\nTitle text on/off in Parameter file has an incorrect entry. "
+              "Entry needs to be either 'on' or 'off'.")
+        sys.exit()              
+    
+    if title_text_on_off == "on":
+        dict_title_values = {k: v for k, v in par_dict.items() \
+                             if "Overall title" in str(k)} 
     
-        for k,v in par_dict_INT_title_values.items():
+        for k,v in dict_title_values.items():
             if pd.isnull(v) == True:
-                print(f" \nEntry missing for {k} in Parameter file.")
+                print(f"\nEntry for {k} in Parameter file is missing or "
+                      "incorrect.")
                 sys.exit()
+    
         try:
-            int_age_title_depth = float(par_dict["INT age title depth "
-                                       "position"].replace(" ",""))
-            int_age_title_offset = float(par_dict["INT age title offset "
-                                        "position"].replace(" ",""))
-            int_age_title_font_size = float(par_dict["INT age title font "
-                                            "size"].replace(" ",""))
-            int_age_title_colour = float(par_dict["INT age title colour"] \
-                                        .replace(" ","")) 
+            title_text_gap = float(par_dict["Overall title gap"])
         except:
-            print("\nProblem with INT age title depth position, INT age "
-                  "title offset position, INT age title font size or INT"
-                  " age title colour entry. Check these entries and their "
-                  " format.")
-            sys.exit()
-            
-        if int_age_title_colour < 0 or int_age_title_colour > col_max:
-            print("\nEntry for INT age title colour in Parameter file is"
-                  " out of range.")
+            print("\nProblem with Overall title gap entry in Parameter file. "
+                  "Check it is numeric.")
             sys.exit()
             
-        int_age_title_bold = par_dict["INT age title bold on/off"] \
-                                 .replace(" ","").lower()
-                                 
-        if int_age_title_bold not in ["on", "off"]:
-            print("\nEntry for INT age title bold on/off in Parameter"
-                  " file required to be 'on' or 'off'.")
+        try:
+            title_text = par_dict["Overall title text"]
+        except:
+            print("\nProblem with Overall title text entry. Check it is a "
+                  "string.")
+        
+        try:
+            title_text_colour = float(par_dict["Overall title text colour"] \
+                                     .replace(" ",""))
+        except:
+            print("\nProblem with Overall title text colour entry in "
+                  "Parameter file. Check entry is numeric.")
             sys.exit()
-            
-        int_age_title_rotation = float(par_dict["INT age title "
-                                      "rotation"].replace(" ",""))
-            
-        if int_age_title_rotation < 0 or int_age_title_rotation > 360:
-            print("\nEntry for INT age title rotation in Parameter file "
-                  "must be between 0 and 360.")
+        
+        if title_text_colour < 1 or title_text_colour > col_max:
+            print("\nOverall title text colour entry in Parameter file is"
+                  " out of bounds or incorrect. See manual for range of"
+                  " colour codes. These are presently 1-23.")
             sys.exit()
         
-    
-    par_dict_int_lines_values = {k: v for k, v in par_dict.items() \
-                      if "INT lines" in str(k)}
-
-    try:
-        int_lines_colour = float(par_dict["INT lines colour"] \
-                                 .replace(" ",""))
-        int_lines_offset = float(par_dict["INT lines offset"] \
-                                 .replace(" ",""))
-        int_lines_width = float(par_dict["INT lines width"] \
-                                .replace(" ",""))
-        int_lines_depth_length = float(par_dict["INT lines depth length"] \
-                                     .replace(" ","")) 
-        int_lines_corr = float(par_dict["INT lines width correction"] \
-                              .replace(" ",""))  
-        int_lines_corr_l = float(par_dict["INT lines length correction"] \
-                                .replace(" ",""))
-    except:
-        print("\nCheck entries for INT lines colour, INT lines offset INT"
-              " lines width, INT lines depth length, INT lines width "
-              "correction and INT lines length correction. One of these "
-              "entries is erroneous. Check entries and formats.")
-        sys.exit()             
-        
-    for k,v in par_dict_int_lines_values.items():
-        if pd.isnull(v) == True:
-                print(f" \n Entry missing for {k}")
+        try:
+            title_text_bold = par_dict["Overall title text bold on/off"]. \
+                                  replace(" ","").lower()
+        except:
+            print("\nProblem with Overall title text entry. Check it is a "
+                  "string.")
+            sys.exit()
+                              
+        if title_text_bold not in ["on", "off"]:
+            print("\nOverall title text bold on/off in Parameter file"
+                  " needs to be either 'on' or 'off'.")
+            sys.exit()
+        
+        try:
+            title_font_size = float(par_dict["Overall title font size"]. \
+                                    replace(" ",""))
+            title_rotation = float(par_dict["Overall title rotation"]. \
+                                   replace(" ",""))
+        except:
+            print("\nProblem with Overall title position entry / entries in "
+                  "Parameter file. Check these are numeric.")
+            sys.exit()          
+    
+        if title_rotation < 0 or title_rotation > 360:
+            print("\nOverall title rotation in Parameter file is out of "
+                  "bounds or incorrect.")
+            sys.exit()
+
+        try:
+            title_y_pos = float(par_dict["Overall title Y position"]. \
+                                replace(" ",""))
+            title_x_pos = float(par_dict["Overall title X position"]. \
+                                    replace(" ",""))
+        except:
+            print("\nProblem with Overall title position entry / entries in "
+                  "Parameter file. Check these are numeric.")
+            sys.exit()  
+          
+    # Initial checks of footer entries from Parameter file
+    if footer_text_on_off not in ["on", "off"] and \
+        pd.isnull(footer_text_on_off) == False:
+        print("\nTitle text on/off has an incorrect entry. Enter 'off' if not"
+              " required. Entry should be either 'on' or 'off'.")
+        sys.exit()              
+    
+    if footer_text_on_off == "on":
+        dict_footer_values = {k: v for k, v in par_dict.items() \
+                              if "Footer" in str(k)} 
+    
+        for k,v in dict_footer_values.items():
+            if pd.isnull(v) == True:
+                print(f"\nEntry for {k} in Parameter file is missing or "
+                      " incorrect.")
                 sys.exit()
-                
-    if int_lines_colour < 0 or int_lines_colour > col_max:
-        print("\nEntry for INT lines colour in Parameter file is out of "
-              "range.")
-        sys.exit()
 
-    try:
-        int_umd_age = int(par_dict["INT upper most depth age"]. \
-                            replace(" ",""))
-    except:
-        print("\nEntry for INT upper most depth age is required. Check "
-              "entry and format.")
-        sys.exit()
-    
-    if pd.isnull(int_umd_age) == True:
-        print("\nEntry missing for INT upper most depth age in Parameter "
-              "file.")
-        sys.exit()
+        try:
+            footer_text = par_dict["Footer text"]
+        except:
+            print("\nProblem with Footer text entry Check it is a string.")
+            sys.exit()
         
-    # User input error checking.Labels and depths need to have same length
-    if len(int_age_labels) != len(int_age_depths):
-        print("")
-        print("\nError in INT label depths in Parameter file. Unequal "
-              "number of depths and labels.")
-        sys.exit()
+        try:
+            footer_text_colour = float(par_dict["Footer text colour"] \
+                                   .replace(" ",""))
+        except:
+            print("\nProblem with Footer text colour entry in Parameter file."
+                  " Check entry is numeric.")
+            sys.exit()          
+    
+        if footer_text_colour < 1 or footer_text_colour > col_max:
+            print("\nOverall footer text colour entry in Parameter file "
+                  "is out of bounds or incorrect. See manual for range of "
+                  "colour codes. These are presently 1-23.")
+            sys.exit()
 
-###########################################################################
-###########################################################################
-# Grouping annotation data 1-10. Bring in required parameters from 
-# Parameter file for any grouping annotations required for possible
-# groups 1-10 and  check.
-try:
-    group_anno_1 = str(par_dict["Grouping annotation 1 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_2 = str(par_dict["Grouping annotation 2 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_3 = str(par_dict["Grouping annotation 3 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_4 = str(par_dict["Grouping annotation 4 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_5 = str(par_dict["Grouping annotation 5 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_6 = str(par_dict["Grouping annotation 6 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_7 = str(par_dict["Grouping annotation 7 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_8 = str(par_dict["Grouping annotation 8 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_9 = str(par_dict["Grouping annotation 9 on/off**"]). \
-                           replace(" ","").lower()
-    group_anno_10 = str(par_dict["Grouping annotation *10 on/off**"]). \
-                            replace(" ","").lower()
-except:
-    print("\nGrouping annotation on/off entries must be filled in with "
-          "either 'on' or 'off'. Check all 10 entries Grouping annotation"
-          " on/off 1-10 and eneter either 'on' or 'off'.")
-    sys.exit()
-
-# Create various empy lists to be used subsequently for groupings.
-group_list = []
-group_lw = []
-group_corr =[ ]
-group_corr_line = []
-
-###########################################################################
-# Group 1 annotation.
-if group_anno_1 == "on":
-    # Create dictionary of grouping entries
-    par_dict_G1_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 1" in str(k)} 
-    
-    # Check for missing entries
-    for k,v in par_dict_G1_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
+        try:
+            footer_text_bold = par_dict["Footer text bold on/off"] \
+                                       .replace(" ","").lower()
+        except:
+            print("\nProblem with Overall title text entry. Check it is a "
+                  "string.")
+            sys.exit()
+                                
+        if footer_text_bold not in ["on", "off"]:
+            print("\nOverall footer text bold on/off in Parameter file needs"
+                  " to be either 'on' or 'off'.")
             sys.exit() 
-            
-    # Check entries are provided
-    try:
-        group_anno_1_start = str(par_dict["Grouping annotation 1 start"]) \
-                                .strip()
-        group_anno_1_title = str(par_dict["Grouping annotation 1 title"]) \
-                                .strip()
-        group_anno_1_title_bold = str(par_dict["Grouping annotation 1 "
-                                     "title bold on/off"]).replace(" ","") \
-                                      .lower()
-    except:
-        print("\nCheck entries for Grouping annotation 1 start, Grouping "
-              "annotation 1 title and Grouping annotation 1 title bold "
-              "on/off. One of these is erroneous. Check entry and format.")
-        sys.exit()
-    
-    # Check entries
-    try:
-        group_anno_1_title_colour = float(par_dict["Grouping annotation 1 "
-                                                   "title colour"])
-        group_anno_1_title_font_size = float(par_dict["Grouping annotation"
-                                                      " 1 title font size"])    
-        group_anno_1_line_colour = float(par_dict["Grouping annotation 1 "
-                                                  "line colour"])
-        group_anno_1_line_width = float(par_dict["Grouping annotation 1 "
-                                                 "line width"])    
-        group_anno_1_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 1 "
-                                                "line start x"])
-        group_anno_1_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 1 "
-                                                          "line start y"])
-        group_anno_1_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 1 line end x"])
-        group_anno_1_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "1 line end y"])
-        group_anno_1_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 1 "
-                                                     "tag end x"])
-        group_anno_1_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 1 "
-                                                     "tag end y"])
-        group_anno_1_corr = float(par_dict["Grouping annotation 1 tag "
-                                           "correction"])
-        group_anno_1_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation 1 line"
-                                                        " correction"])
-    except:
-        print("\nCheck entries for Group 1 annotation in Parameter file."
-              " One of the numeric entries is missing or erroneous. Check"
-              " entries and formats.")
-        sys.exit()
-    
-    group_list.append("G1")
-    group_lw.append(group_anno_1_line_width)
-    group_corr.append(group_anno_1_corr)
-    group_corr_line.append(group_anno_1_line_y_correction)
-
-    # Further entry error checks
-    if group_anno_1_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 1 title bold on/off "
-              "in Parameter file is required. Entry should be either 'on'"
-              " or 'off'.")
-        sys.exit()
-        
-    if group_anno_1_title_colour < 0 or group_anno_1_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 1 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
-        
-    if group_anno_1_line_colour < 0 or group_anno_1_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 1 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
-        
-###########################################################################
-# Group 2 annotation.
-if group_anno_2 == "on":
-    
-    # Create dictionary of group entries
-    par_dict_G2_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 2" in str(k)} 
-        
-    # Check entries exist
-    for k,v in par_dict_G2_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
+                               
+        try:                                                                
+            footer_font_size = float(par_dict["Footer font size"] \
+                                     .replace(" ",""))
+            footer_rotation = float(par_dict["Footer rotation"] \
+                                    .replace(" ",""))
+        except:
+            print("\nProblem with footer font size or rotation entries in "
+                  "Parameter file. Check these are numeric.")
             sys.exit() 
-            
-   # Check grouping entries
-    try:
-        group_anno_2_start = str(par_dict["Grouping annotation 2 start"]) \
-                                .strip()
-        group_anno_2_title = str(par_dict["Grouping annotation 2 title"]) \
-                                .strip()
-        group_anno_2_title_bold = str(par_dict["Grouping annotation 2 "
-                                     "title bold on/off"]) \
-                                      .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 2 start, "
-              "Grouping annotation 2 title and Grouping annotation 2"
-              " title bold on/off. One of these is erroneous. Check"
-              " entry and format.")
-        sys.exit()
-    
-    try:
-        group_anno_2_title_colour = float(par_dict["Grouping annotation 2 "
-                                                   "title colour"])
-        group_anno_2_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 2 "
-                                                      "title font size"])    
-        group_anno_2_line_colour = float(par_dict["Grouping annotation 2 "
-                                                  "line colour"])
-        group_anno_2_line_width = float(par_dict["Grouping annotation 2 "
-                                                 "line width"])    
-        group_anno_2_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 2 "
-                                                "line start x"])
-        group_anno_2_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 2 "
-                                                          "line start y"])
-        group_anno_2_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 2 line end x"])
-        group_anno_2_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "2 line end y"])
-        group_anno_2_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 2 "
-                                                     "tag end x"])
-        group_anno_2_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 2 "
-                                                     "tag end y"])
-        group_anno_2_corr = float(par_dict["Grouping annotation 2 tag "
-                                           "correction"])
-        group_anno_2_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation 2 line"
-                                                        " correction"])
-    except:
-        print("\nCheck entries for Group 2 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
-        sys.exit()
-    
-    group_list.append("G2")
-    group_lw.append(group_anno_2_line_width)
-    group_corr.append(group_anno_2_corr)
-    group_corr_line.append(group_anno_2_line_y_correction)
-    
-    # Futher entry checks
-    if group_anno_2_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 2 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' or"
-              " 'off'.")
-        sys.exit()
-        
-    if group_anno_2_title_colour < 0 or group_anno_2_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 2 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
         
-    if group_anno_2_line_colour < 0 or group_anno_2_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 2 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+        if footer_rotation < 0 or footer_rotation > 360:
+            print("\nOverall footer rotation is out of bounds or incorrect.")
+            sys.exit()
         
-###########################################################################
-# Group 3 annotation.
-if group_anno_3 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G3_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 3" in str(k)} 
+        try:
+            footer_y_pos = float(par_dict["Footer Y position"] \
+                                 .replace(" ",""))
+            footer_x_pos = float(par_dict["Footer X position"] \
+                                 .replace(" ",""))
+        except:
+            print("\nProblem with Footer position entry / entries in "
+                  "Parameter file. Check these are numeric.")
+            sys.exit()         
     
-    # Check entries exist
-    for k,v in par_dict_G3_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
-            
-   # Error checks on grouping entries
+    # Obtaining X and Y title parameters and checks. Null values been checked 
+    # earlier.
     try:
-        group_anno_3_start = str(par_dict["Grouping annotation 3 start"]) \
-                                .strip()
-        group_anno_3_title = str(par_dict["Grouping annotation 3 title"]) \
-                                .strip()
-        group_anno_3_title_bold = str(par_dict["Grouping annotation 3 "
-                                     "title bold on/off"]) \
-                                     .replace(" ","").lower()
+        x_title = par_dict["X title text**"]
     except:
-        print("\nCheck entries for Grouping annotation 3 start, Grouping "
-              "annotation 3 title and Grouping annotation 3 title bold "
-              "on/off. One of these is erroneous. Check entry and format.")
+        print("\nProblem with X title text entry. Check it is a string.")
         sys.exit()
-    
-    try:
-        group_anno_3_title_colour = float(par_dict["Grouping annotation 3 "
-                                                   "title colour"])
-        group_anno_3_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 3 "
-                                                      "title font size"])    
-        group_anno_3_line_colour = float(par_dict["Grouping annotation 3 "
-                                                  "line colour"])
-        group_anno_3_line_width = float(par_dict["Grouping annotation 3 "
-                                                 "line width"])    
-        group_anno_3_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 3 "
-                                                "line start x"])
-        group_anno_3_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 3 "
-                                                          "line start y"])
-        group_anno_3_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 3 line end x"])
-        group_anno_3_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "3 line end y"])
-        group_anno_3_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 3 "
-                                                     "tag end x"])
-        group_anno_3_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 3 "
-                                                     "tag end y"])
-        group_anno_3_corr = float(par_dict["Grouping annotation 3 tag "
-                                           "correction"])
-        group_anno_3_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation 3 "
-                                                        "line correction"])
+
+    try:    
+        y_title_rotation = float(par_dict["Y title rotation**"] \
+                                 .replace(" ",""))
+        x_title_rotation = float(par_dict["X title rotation**"] \
+                                 .replace(" ",""))
+        x_title_fontsize  = float(par_dict["X title font size**"] \
+                                  .replace(" ",""))
+        y_title_fontsize = float(par_dict["Y title font size**"] \
+                                 .replace(" ",""))
+        x_title_text_colour = float(par_dict["X title text colour**"] \
+                                   .replace(" ",""))
     except:
-        print("\nCheck entries for Group 3 annotation in Parameter file."
-              " One of the numeric entries is missing or erroneous."
-              " Check entries and formats.")
-        sys.exit()
-    
-    group_list.append("G3")
-    group_lw.append(group_anno_3_line_width)
-    group_corr.append(group_anno_3_corr)
-    group_corr_line.append(group_anno_3_line_y_correction)
+        print("\nProblem with X or Y title numeric entries. Check entries are"
+              " numeric.")
+        sys.exit()  
 
-    # Further grouping entry error checks
-    if group_anno_3_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 3 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' "
-              "or 'off'.")
-        sys.exit()
-        
-    if group_anno_3_title_colour < 0 or group_anno_3_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 3 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
-        
-    if group_anno_3_line_colour < 0 or group_anno_3_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 3 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
+    x_y_title_rotation_check = [y_title_rotation, x_title_rotation]
+
+    if any(i < 0 or i > 360 for i in x_y_title_rotation_check) == True:
+        print("\nCheck Y title rotation or X title rotation entries in "
+              "Parameter file as they are out of range (0 to 360 degrees).")
         sys.exit()
-        
-###########################################################################
-# Group 4  annotation.
-if group_anno_4 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G4_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 4" in str(k)} 
-    
-    # Check entries exist
-    for k,v in par_dict_G4_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
-   
-    # Error check entries for grouping
-    try:
-        group_anno_4_start = str(par_dict["Grouping annotation 4 start"]) \
-                                .strip()
-        group_anno_4_title = str(par_dict["Grouping annotation 4 title"]) \
-                                .strip()
-        group_anno_4_title_bold = str(par_dict["Grouping annotation 4 "
-                                     "title bold on/off"]) \
-                                     .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 4 start, "
-              "Grouping annotation 4 title and Grouping annotation 4 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
+
+    if x_title_text_colour < 0 or x_title_text_colour > col_max:
+        print("\nX title text colour is out of range. See manual for range of"
+              " colour codes. Presently these are from 1-23.")
         sys.exit()
     
-    try:
-        group_anno_4_title_colour = float(par_dict["Grouping annotation 4 "
-                                                   "title colour"])
-        group_anno_4_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 4 "
-                                                      "title font size"])    
-        group_anno_4_line_colour = float(par_dict["Grouping annotation 4 "
-                                                  "line colour"])
-        group_anno_4_line_width = float(par_dict["Grouping annotation 4 "
-                                                 "line width"])    
-        group_anno_4_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 4 "
-                                                "line start x"])
-        group_anno_4_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 4 "
-                                                          "line start y"])
-        group_anno_4_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 4 line end x"])
-        group_anno_4_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "4 line end y"])
-        group_anno_4_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 4 "
-                                                     "tag end x"])
-        group_anno_4_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 4 "
-                                                     "tag end y"])
-        group_anno_4_corr = float(par_dict["Grouping annotation 4 tag "
-                                           "correction"])
-        group_anno_4_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 4 line "
-                                                        "correction"])
+    try:    
+        x_title_text_bold = par_dict["X title bold on/off**"].replace(" ","") \
+                                    .lower()
     except:
-        print("\nCheck entries for Group 4 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
+        print("\nProblem with X title bold on/off entry. Check entry is a "
+              "string.")
         sys.exit()
-    
-    group_list.append("G4")
-    group_lw.append(group_anno_4_line_width)
-    group_corr.append(group_anno_4_corr)
-    group_corr_line.append(group_anno_4_line_y_correction)
 
-    # Further error checks on grouping entries
-    if group_anno_4_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 4 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' or"
-              " 'off'.")
-        sys.exit()
-        
-    if group_anno_4_title_colour < 0 or group_anno_4_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 4 title colour in "
-              " colour Parameter file is out of bounds. Refer to manual"
-              " forcodes. Colour codes presently range from 1-23.")
-        sys.exit()
-        
-    if group_anno_4_line_colour < 0 or group_anno_4_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 4 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
+    if x_title_text_bold not in ["on", "off"]:
+        print("\nX title bold on/off entry in Parameter file needs to be"
+              " either 'on' or 'off'.")
         sys.exit()
-        
-###########################################################################
-# Group 5 annotation.
-if group_anno_5 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G5_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 5" in str(k)} 
-    
-    # Check entries exist
-    for k,v in par_dict_G5_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
-            
-    # Error check grouping entries
+
+    ###########################################################################
+    ###########################################################################
+    # Obtain X and Y tick label parameters and check. Null values been checked 
+    # earlier.
     try:
-        group_anno_5_start = str(par_dict["Grouping annotation 5 start"]) \
-                                .strip()
-        group_anno_5_title = str(par_dict["Grouping annotation 5 title"]) \
-                                .strip()
-        group_anno_5_title_bold = str(par_dict["Grouping annotation 5 "
-                                     "title bold on/off"]) \
-                                     .replace(" ","") \
-                                     .lower()
+        x_lab_font = float(par_dict["X label font size**"].replace(" ",""))
+        y_lab_font = float(par_dict["Y label font size**"].replace(" ",""))
+        x_lab_colour = float(par_dict["X label colour**"].replace(" ",""))
+        x_lab_rot = float(par_dict["X label rotation**"].replace(" ",""))
+        y_lab_rot = float(par_dict["Y label rotation**"].replace(" ",""))
+        y_lab_gap = float(par_dict["Y label gap**"].replace(" ",""))
     except:
-        print("\nCheck entries for Grouping annotation 5 start, "
-              "Grouping annotation 5 title and Grouping annotation 5 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
+        print("\nProblem with numeric entry for X or Y labels. Check entries "
+              " for X label font size, Y label font size, X label colour, X "
+              "label rotation, Y label rotation and Y label gap are numeric.")
         sys.exit()
-    
-    try:
-        group_anno_5_title_colour = float(par_dict["Grouping "
-                                                   "annotation 5 "
-                                                   "title colour"])
-        group_anno_5_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 5 "
-                                                      "title font size"])    
-        group_anno_5_line_colour = float(par_dict["Grouping "
-                                                  "annotation 5 "
-                                                  "line colour"])
-        group_anno_5_line_width = float(par_dict["Grouping annotation 5 "
-                                                 "line width"])    
-        group_anno_5_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 5 "
-                                                "line start x"])
-        group_anno_5_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 5 "
-                                                          "line start y"])
-        group_anno_5_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 5 line end x"])
-        group_anno_5_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "5 line end y"])
-        group_anno_5_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 5 "
-                                                     "tag end x"])
-        group_anno_5_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 5 "
-                                                     "tag end y"])
-        group_anno_5_corr = float(par_dict["Grouping annotation 5 tag "
-                                           "correction"])
-        group_anno_5_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 5 line "
-                                                        "correction"])
-    except:
-        print("\nCheck entries for Group 5 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
+
+    x_y_lab_rot = [x_lab_rot, y_lab_rot]    
+
+    if any(i >360 or i < 0 for i in x_y_lab_rot) == True:
+        print("\nX label rotation or Y label rotation are out of bounds of 0"
+              " to 360 degrees range. Check numbers and formats.")
         sys.exit()
     
-    group_list.append("G5")
-    group_lw.append(group_anno_5_line_width)
-    group_corr.append(group_anno_5_corr)
-    group_corr_line.append(group_anno_5_line_y_correction)
+    ###########################################################################
+    ###########################################################################
+    # Odd scaling taxa. The NSC entries were read and checked into the NSC 
+    # table before scaling (see nsc_table above). Zero minor tick intervals 
+    # can only be checked now the y minor ticks entry is known.
+    for taxon, override in nsc_overrides.items():
+        if override["y_minor_int"] == 0 and y_minor_ticks_on_off == "on":
+            print("\nY minor ticks have been selected as on so zero is not "
+                  f"permitted as the NSC y minor tick interval of {taxon}. "
+                  "Choose sensible number that is a division of the NSC y "
+                  "major tick interval.")
+            sys.exit()
 
-    # Further grouping error checks
-    if group_anno_5_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 5 title bold on/off "
-              "in Parameter file is required. Entry should be either 'on'"
-              " or 'off'.")
-        sys.exit()
-        
-    if group_anno_5_title_colour < 0 or group_anno_5_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 5 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+    ###########################################################################
+    ###########################################################################
+    # RC ages if supplied. Bring in all required parameters and check what
+    # user has entered in Parameter file.
+    rc_ages_on_off = par_dict["RC ages on/off**"].replace(" ","").lower()
+
+    # Check entry is provided.
+    rc_check_list = ["on", "off"]
+
+    if rc_ages_on_off not in rc_check_list:
+        print("\nIncorrect entry for RC ages on/off. If not using feature "
+              "provide an entry of 'off' in Parameter file. Entry needs to be"
+              " either 'on' or 'off'.")
+        sys.exit()         
+
+    # Check RC entries
+    if rc_ages_on_off == "on":
+
+        rc_age_title_on_off = par_dict["RC age title on/off"]
+    
+        if pd.isnull(rc_age_title_on_off) == True:
+            print("\nEntry for RC age title on/off is required. Entry should"
+                  " be 'on' or off'.")
+            sys.exit()
         
-    if group_anno_5_line_colour < 0 or group_anno_5_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 5 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
-                
-###########################################################################
-# Group 6 annotation.
-if group_anno_6 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G6_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 6" in str(k)} 
-
-    # Check grouping entries exist
-    for k,v in par_dict_G6_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
+        try:    
+            rc_age_depths = par_dict["RC age depth label positions"] \
+                             .replace(" ","").split(",")
+            rc_age_depths = [float(x) for x in rc_age_depths]
+        except:
+            print("\nEntries for RC age depth label positions are required.")
             sys.exit() 
-            
-    # Check grouping entries
-    try:
-        group_anno_6_start = str(par_dict["Grouping annotation 6 start"]) \
-                                .strip()
-        group_anno_6_title = str(par_dict["Grouping annotation 6 title"]) \
-                                .strip()
-        group_anno_6_title_bold = str(par_dict["Grouping annotation 6 "
-                                     "title bold on/off"]) \
-                                     .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 6 start, "
-              "Grouping annotation 6 title and Grouping annotation 6 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
-        sys.exit()
-    
-    try:
-        group_anno_6_title_colour = float(par_dict["Grouping "
-                                                   "annotation 6 "
-                                                   "title colour"])
-        group_anno_6_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 6 "
-                                                      "title font size"])    
-        group_anno_6_line_colour = float(par_dict["Grouping annotation 6 "
-                                                  "line colour"])
-        group_anno_6_line_width = float(par_dict["Grouping annotation 6 "
-                                                 "line width"])    
-        group_anno_6_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 6 "
-                                                "line start x"])
-        group_anno_6_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 6 "
-                                                          "line start y"])
-        group_anno_6_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 6 line end x"])
-        group_anno_6_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "6 line end y"])
-        group_anno_6_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 6 "
-                                               "tag end x"])
-        group_anno_6_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 6 "
-                                                     "tag end y"])
-        group_anno_6_corr = float(par_dict["Grouping annotation 6 tag "
-                                           "correction"])
-        group_anno_6_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 6 line "
-                                                        "correction"])
-    except:
-        print("\nCheck entries for Group 6 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
-        sys.exit()
-    
-    group_list.append("G6")
-    group_lw.append(group_anno_6_line_width)
-    group_corr.append(group_anno_6_corr)
-    group_corr_line.append(group_anno_6_line_y_correction)
-
-    # Further error checks of grouping entries
-    if group_anno_6_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 6 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' or "
-              "'off'.")
-        sys.exit()
         
-    if group_anno_6_title_colour < 0 or group_anno_6_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 6 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+        try:
+            rc_age_location_offset = float(par_dict \
+                                           ["RC age label position "
+                                            "offset"].replace(" ",""))
+            if pd.isnull(rc_age_location_offset) == True:
+                print("\nEntry for RC age label position offset in Parameter "
+                      "file is required.")
+                sys.exit()
+        except:
+            print("\nEntry for RC age label position offset in Parameter"
+                  " file is required.")              
+            sys.exit()        
         
-    if group_anno_6_line_colour < 0 or group_anno_6_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 6 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+        try:
+            rc_age_labels = par_dict["RC age labels"].split(",")
+        except:
+            print("\nProblem with RC age labels. Check entries for these in "
+                  "Parameter file.")
+            sys.exit()        
         
-###########################################################################
-# Group 7 annotation.
-if group_anno_7 == "on":
+        try:
+            rc_age_labels_font_size = float(par_dict["RC age label font "
+                                            "size"].replace(" ",""))
+            rc_age_labels_colour = float(par_dict["RC age labels colour"] \
+                                      .replace(" ",""))
+            rc_age_labels_bold = par_dict["RC age labels bold on/off"] \
+                                      .replace(" ","").lower()
+            rc_age_labels_rotation = float(par_dict["RC age labels "
+                                            "rotation"].replace(" ",""))
+        except:
+            print("\nProblem with one of the entries in Parameter file for "
+                  "either RC age label font size, RC age labels colour,"
+                  " RC age labels bold on/off or RC age labels rotation"
+                  " entries. Check formats are correct.")
+            sys.exit()
+        
+        par_dict_rc_labels_values = {k: v for k, v in par_dict.items() \
+                      if "RC age labels" in str(k)} 
+
+        for k,v in par_dict_rc_labels_values.items():
+            if pd.isnull(v) == True:
+                print(f" \nEntry missing for {k}.")
+                sys.exit()                      
     
-    # Create dictionary of grouping entries
-    par_dict_G7_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 7" in str(k)} 
+        if rc_age_labels_bold not in ["on", "off"]:
+            print("\nEntry for RC age labels bold on/off in Parameter file is"
+                  " required. Enter 'on' or 'off'.")
+            sys.exit()            
+        
+        if rc_age_labels_rotation < 0 or rc_age_labels_rotation > 360:
+            print("\nEntry for RC age labels rotation in Parameter file is"
+                  " not between 0 and 360.")
+            sys.exit()                 
 
-    # Check grouping entries exist
-    for k,v in par_dict_G7_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
+        # User input error checking for length of list of labels and ages.
+        # Must be the same length.
+        if len(rc_age_labels) != len(rc_age_depths):
+            print("")
+            print("\nError in RC label depths in Parameter file. Unequal"
+                  " number of depths and labels.")
+            sys.exit()
+
+    # Load in data for RC age title if it is specified as being 'on' and check.
+        if rc_age_title_on_off == "on":
+            rc_age_title = par_dict["RC age title"]
+
+            try:
+                rc_age_title_depth = float(par_dict["RC age title depth "
+                                          "position"].replace(" ",""))
+                rc_age_title_offset = float(par_dict["RC age title offset "
+                                            "position"].replace(" ",""))
+                rc_age_title_font_size = float(par_dict["RC age title font "
+                                              "size"].replace(" ",""))
+                rc_age_title_colour = float(par_dict["RC age title colour"]. \
+                                            replace(" ",""))
+                rc_age_title_bold = par_dict["RC age title bold on/off"]. \
+                                            replace(" ","").lower()
+                rc_age_title_rotation = float(par_dict["RC age title rotation"]. \
+                                              replace(" ",""))
+            except:
+                print("\nProblem with one of the entries in Parameter file"
+                      " for either RC age title depth position, RC age title"
+                      " offset position, RC age title font size, RC age title"
+                      " colour, RC age title bold on/off or RC age title"
+                      " rotation entries.Check formats are correct.")
+                sys.exit()
             
-    # Error check grouping entries 
-    try:
-        group_anno_7_start = str(par_dict["Grouping annotation 7 start"]) \
-                                .strip()
-        group_anno_7_title = str(par_dict["Grouping annotation 7 title"]) \
-                                .strip()
-        group_anno_7_title_bold = str(par_dict["Grouping annotation 7 "
-                                     "title bold on/off"]) \
-                                     .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 7 start, "
-              "Grouping annotation 7 title and Grouping annotation 7 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
-        sys.exit()
-    
-    try:
-        group_anno_7_title_colour = float(par_dict["Grouping "
-                                                   "annotation 7 "
-                                                   "title colour"])
-        group_anno_7_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 7 "
-                                                      "title font size"])    
-        group_anno_7_line_colour = float(par_dict["Grouping "
-                                                  "annotation 7 "
-                                                  "line colour"])
-        group_anno_7_line_width = float(par_dict["Grouping annotation 7 "
-                                                 "line width"])    
-        group_anno_7_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 7 "
-                                                "line start x"])
-        group_anno_7_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 7 "
-                                                          "line start y"])
-        group_anno_7_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 7 line end x"])
-        group_anno_7_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "7 line end y"])
-        group_anno_7_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 7 "
-                                               "tag end x"])
-        group_anno_7_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 7 "
-                                                     "tag end y"])
-        group_anno_7_corr = float(par_dict["Grouping annotation 7 tag "
-                                           "correction"])
-        group_anno_7_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 7 line "
-                                                        "correction"])
-    except:
-        print("\nCheck entries for Group 7 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
-        sys.exit()
+            par_dict_RC_title_values = {k: v for k, v in par_dict.items() \
+                          if "RC age title" in str(k)} 
     
-    group_list.append("G7")
-    group_lw.append(group_anno_7_line_width)
-    group_corr.append(group_anno_7_corr)
-    group_corr_line.append(group_anno_7_line_y_correction)
-
-    # Further error checks of grouping entries
-    if group_anno_7_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 7 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' or "
-              "'off'.")
-        sys.exit()
-        
-    if group_anno_7_title_colour < 0 or group_anno_7_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 7 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+            for k,v in par_dict_RC_title_values.items():
+                if pd.isnull(v) == True:
+                    print(f" \n Entry missing for {k}.")
+                    sys.exit()            
         
-    if group_anno_7_line_colour < 0 or group_anno_7_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 7 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
+            if rc_age_title_colour < 0 or rc_age_title_colour > col_max:
+                print("\nEntry for RC age title colour in Parameter file is"
+                      " out of bounds.")
+                sys.exit()
+            
+            if rc_age_title_bold not in ["on", "off"]:
+                print("\nEntry for RC age title bold on/off in Parameter file"
+                      " is required. Enter 'on' or 'off'.")
+                sys.exit()            
+            
+            if rc_age_title_rotation < 0 or rc_age_title_rotation > 360:
+                print("\nEntry for RC age title rotation in Parameter file is"
+                      " not between 0 and 360.")
+                sys.exit()
+
+    ###########################################################################
+    ###########################################################################
+    # Date line ages if supplied bring in all required parameters from
+    # Parameter file and check.
+    int_ages_on_off = par_dict["INT ages on/off**"].replace(" ","").lower()
+
+    # Check entry is provided.
+    if int_ages_on_off not in ["on", "off"]:
+        print("\nIncorrect entry for INT ages on or off in Parameter file. If"
+              " not using feature provide an entry of 'off' in Parameter"
+              " file. Entries should be 'on' or 'off'.")
         sys.exit()
-        
-###########################################################################
-# Group 8 annotation.
-if group_anno_8 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G8_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 8" in str(k)} 
 
-    for k,v in par_dict_G8_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
+    # Obtain INT parameters from Parameter file and check entries.
+    if int_ages_on_off == "on":
     
-    # Error check grouping entries
-    try:
-        group_anno_8_start = str(par_dict["Grouping annotation 8 start"]) \
-                                .strip()
-        group_anno_8_title = str(par_dict["Grouping annotation 8 title"]) \
-                                .strip()
-        group_anno_8_title_bold = str(par_dict["Grouping annotation 8 "
-                                     "title bold on/off"]) \
-                                     .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 8 start, "
-              "Grouping annotation 8 title and Grouping annotation 8 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
-        sys.exit()
+        int_age_title_on_off = str(par_dict["INT age title on/off"]). \
+                               replace(" ",""). lower()
+                           
+        if int_age_title_on_off not in ["on","off"]:
+            print("\nINT age title on/off entry should be either 'on' or"
+                  " 'off'.")
+            sys.exit()
     
-    try:
-        group_anno_8_title_colour = float(par_dict["Grouping "
-                                                   "annotation 8 "
-                                                   "title colour"])
-        group_anno_8_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 8 "
-                                                      "title font size"])    
-        group_anno_8_line_colour = float(par_dict["Grouping annotation 8 "
-                                                  "line colour"])
-        group_anno_8_line_width = float(par_dict["Grouping annotation 8 "
-                                                 "line width"])    
-        group_anno_8_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 8 "
-                                                "line start x"])
-        group_anno_8_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 8 "
-                                                          "line start y"])
-        group_anno_8_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 8 line end x"])
-        group_anno_8_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "8 line end y"])
-        group_anno_8_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 8 "
-                                               "tag end x"])
-        group_anno_8_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 8 "
-                                                     "tag end y"])
-        group_anno_8_corr = float(par_dict["Grouping annotation 8 tag "
-                                           "correction"])
-        group_anno_8_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 8 line "
-                                                        "correction"])
-    except:
-        print("\nCheck entries for Group 8 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
-        sys.exit()
+        try:
+            int_age_depths = par_dict["INT age depth labels positions"] \
+                                     .replace(" ","").split(",")
+            int_age_depths = [float(x) for x in int_age_depths]
+        except:
+            print("\nCheck entries and formats for INT age depth labels "
+                  "positions.")
+            sys.exit()
     
-    group_list.append("G8")
-    group_lw.append(group_anno_8_line_width)
-    group_corr.append(group_anno_8_corr)
-    group_corr_line.append(group_anno_8_line_y_correction)
-
-    # Further error checks on grouping entries
-    if group_anno_8_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 8 title bold on/off "
-              "in Parameter file is required. Entry should be either 'on'"
-              " or 'off'.")
-        sys.exit()
+        if any(pd.isnull(int_age_depths)):
+            print("\nEntries for INT age depth labels positions in Parameter "
+                  "file required.")
+            sys.exit()
+    
+        try:
+            int_age_location_offset = float(par_dict \
+                                            ["INT age labels position offset"] \
+                                                .replace(" ",""))
+        except:
+            print("\nCheck entry and format for INT age labels position"
+                  " offset in Parameter file.")
+            sys.exit()        
         
-    if group_anno_8_title_colour < 0 or group_anno_8_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 8 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+        if pd.isnull(int_age_location_offset) == True:
+            print("\nEntry for INT age labels position offset in Parameter"
+                  " file is required.")
+            sys.exit()
+    
+        try:
+            int_age_labels = par_dict["INT age labels"].replace(" ","") \
+                                                       .split(",")
+        except:
+            print("\nCheck Entry for INT age labels.")
+            sys.exit()
+
+        try:
+            int_age_labels_font_size = float(par_dict["INT age labels font "
+                                            "size"].replace(" ",""))
+            int_age_labels_colour = float(par_dict["INT age labels colour"]. \
+                                          replace(" ",""))
+            int_age_labels_bold = par_dict["INT age labels bold on/off"]. \
+                                          replace(" ","").lower()
+            int_age_labels_rotation = float(par_dict["INT age labels "
+                                            "rotation"].replace(" ",""))
+        except:
+            print("\nProblem with entry for INT age labels font size, INT age"
+                  " labels colour, INT age labels bold on/off, or INT age"
+                  " labels rotation. Check entries and formats.")
+            sys.exit()
+            
+        par_dict_int_labels_values = {k: v for k, v in par_dict.items() \
+                      if "INT age labels" in str(k)} 
+
+        for k,v in par_dict_int_labels_values.items():
+            if pd.isnull(v) == True:
+                print(f" \nEntry missing for {k} in Parameter file.")
+                sys.exit()                      
+    
+        if int_age_labels_bold not in ["on", "off"]:
+            print("\nEntry for INT age labels bold on/off in Parameter file"
+                  " is required. Enter 'on' or 'off'.")
+            sys.exit()            
         
-    if group_anno_8_line_colour < 0 or group_anno_8_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 8 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+        if int_age_labels_rotation < 0 or int_age_labels_rotation > 360:
+            print("\nEntry for INT age labels rotation in Parameter file is"
+                  " not between 0 and 360.")
+            sys.exit()
+            
+        int_age_depth_labels = par_dict["INT age depth labels positions"]. \
+                               replace(" ","").split(",")
         
-###########################################################################
-# Group 9 annotation.
-if group_anno_9 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G9_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation 9" in str(k)} 
+        if any(pd.isnull(int_age_depth_labels)) == True:
+            print("\nThere is a missing value or an empty space in the INT"
+                  " age depth labels positions entry in Parameter file.")
+            sys.exit()    
 
-    for k,v in par_dict_G9_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
+        if int_age_title_on_off == "on":
+            int_age_title = par_dict["INT age title"]
+        
+            par_dict_INT_title_values = {k: v for k, v in par_dict.items() \
+                          if "INT age title" in str(k)} 
     
-    # Error check grouping entries
-    try:
-        group_anno_9_start = str(par_dict["Grouping annotation 9 start"]) \
-                                .strip()
-        group_anno_9_title = str(par_dict["Grouping annotation 9 title"]) \
-                                .strip()
-        group_anno_9_title_bold = str(par_dict["Grouping annotation 9 "
-                                     "title bold on/off"]) \
+            for k,v in par_dict_INT_title_values.items():
+                if pd.isnull(v) == True:
+                    print(f" \nEntry missing for {k} in Parameter file.")
+                    sys.exit()
+            try:
+                int_age_title_depth = float(par_dict["INT age title depth "
+                                           "position"].replace(" ",""))
+                int_age_title_offset = float(par_dict["INT age title offset "
+                                            "position"].replace(" ",""))
+                int_age_title_font_size = float(par_dict["INT age title font "
+                                                "size"].replace(" ",""))
+                int_age_title_colour = float(par_dict["INT age title colour"] \
+                                            .replace(" ","")) 
+            except:
+                print("\nProblem with INT age title depth position, INT age "
+                      "title offset position, INT age title font size or INT"
+                      " age title colour entry. Check these entries and their "
+                      " format.")
+                sys.exit()
+            
+            if int_age_title_colour < 0 or int_age_title_colour > col_max:
+                print("\nEntry for INT age title colour in Parameter file is"
+                      " out of range.")
+                sys.exit()
+            
+            int_age_title_bold = par_dict["INT age title bold on/off"] \
                                      .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 9 start, "
-              "Grouping annotation 9 title and Grouping annotation 9 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
-        sys.exit()
-    
-    try:
-        group_anno_9_title_colour = float(par_dict["Grouping "
-                                                   "annotation 9 "
-                                                   "title colour"])
-        group_anno_9_title_font_size = float(par_dict["Grouping "
-                                                      "annotation 9 "
-                                                      "title font size"])    
-        group_anno_9_line_colour = float(par_dict["Grouping "
-                                                  "annotation 9 "
-                                                  "line colour"])
-        group_anno_9_line_width = float(par_dict["Grouping "
-                                                 "annotation 9 "
-                                                 "line width"])    
-        group_anno_9_line_x_offset_start = float(par_dict["Grouping "
-                                                "annotation 9 "
-                                                "line start x"])
-        group_anno_9_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation 9 "
-                                                          "line start y"])
-        group_anno_9_line_x_offset_end = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 9 line end x"])
-        group_anno_9_line_y_offset_end = float(par_dict["Grouping "
-                                                        "annotation "
-                                                        "9 line end y"])
-        group_anno_9_line_x_tag_end = float(par_dict["Grouping "
-                                                     "annotation 9 "
-                                                     "tag end x"])
-        group_anno_9_line_y_tag_end = float(par_dict["Grouping "
-                                                     "annotation 9 "
-                                                     "tag end y"])
-        group_anno_9_corr = float(par_dict["Grouping annotation 9 tag "
-                                           "correction"])
-        group_anno_9_line_y_correction = float(par_dict["Grouping "
-                                                        "annotation"
-                                                        " 9 line "
-                                                        "correction"])
-    except:
-        print("\nCheck entries for Group 9 annotation in Parameter file. "
-              "One of the numeric entries is missing or erroneous. Check "
-              "entries and formats.")
-        sys.exit()
-    
-    group_list.append("G9")
-    group_lw.append(group_anno_9_line_width)
-    group_corr.append(group_anno_9_corr)
-    group_corr_line.append(group_anno_9_line_y_correction)
-
-    # Further grouping entry error checks
-    if group_anno_9_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 9 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' or"
-              " 'off'.")
-        sys.exit()
-        
-    if group_anno_9_title_colour < 0 or group_anno_9_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 9 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
-        
-    if group_anno_9_line_colour < 0 or group_anno_9_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 9 line colour in "
-              "Parameter file is out of bounds. Refer to manual for "
-              "colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+                                 
+            if int_age_title_bold not in ["on", "off"]:
+                print("\nEntry for INT age title bold on/off in Parameter"
+                      " file required to be 'on' or 'off'.")
+                sys.exit()
+            
+            int_age_title_rotation = float(par_dict["INT age title "
+                                          "rotation"].replace(" ",""))
+            
+            if int_age_title_rotation < 0 or int_age_title_rotation > 360:
+                print("\nEntry for INT age title rotation in Parameter file "
+                      "must be between 0 and 360.")
+                sys.exit()
         
-###########################################################################
-# Group 10 annotation.
-if group_anno_10 == "on":
-    
-    # Create dictionary of grouping entries
-    par_dict_G10_values = {k: v for k, v in par_dict.items() \
-                      if "Grouping annotation *10" in str(k)} 
-    
-    # Check entries exist
-    for k,v in par_dict_G10_values.items():
-        if pd.isnull(v) == True:
-            print(f"Entry missing for {k}.")
-            sys.exit() 
-    
-    # Error check grouping entries
-    try:
-        group_anno_10_start = str(par_dict["Grouping annotation *10 "
-                                           "start"]).strip()
-        group_anno_10_title = str(par_dict["Grouping annotation *10 "
-                                           "title"]). strip()
-        group_anno_10_title_bold = str(par_dict["Grouping annotation"
-                                                " *10 title bold "
-                                                "on/off"]) \
-                                                .replace(" ","").lower()
-    except:
-        print("\nCheck entries for Grouping annotation 10 start, "
-              "Grouping annotation 10 title and Grouping annotation 10 "
-              "title bold on/off. One of these is erroneous. Check entry "
-              "and format.")
-        sys.exit()
     
-    try:
-        group_anno_10_title_colour = float(par_dict["Grouping "
-                                                    "annotation *10 "
-                                                   "title colour"])
-        group_anno_10_title_font_size = float(par_dict["Grouping "
-                                                       "annotation "
-                                                       "*10 title "
-                                                       "font size"])    
-        group_anno_10_line_colour = float(par_dict["Grouping "
-                                                   "annotation *10 "
-                                                  "line colour"])
-        group_anno_10_line_width = float(par_dict["Grouping "
-                                                  "annotation *10 "
-                                                  "line width"])    
-        group_anno_10_line_x_offset_start = float(par_dict["Grouping "
-                                                           "annotation "
-                                                           "*10 "
-                                                           "line start x"])
-        group_anno_10_line_y_offset_start = float(par_dict["Grouping "
-                                                          "annotation *10 "
-                                                          "line start y"])
-        group_anno_10_line_x_offset_end = float(par_dict["Grouping "
-                                                         "annotation"
-                                                         " *10 line "
-                                                         "end x"])
-        group_anno_10_line_y_offset_end = float(par_dict["Grouping "
-                                                         "annotation"
-                                                         " *10 line "
-                                                         "end y"])
-        group_anno_10_line_x_tag_end = float(par_dict["Grouping "
-                                                      "annotation "
-                                                      "*10 tag end x"])
-        group_anno_10_line_y_tag_end = float(par_dict["Grouping "
-                                                      "annotation "
-                                                      "*10 tag end y"])
-        group_anno_10_corr = float(par_dict["Grouping annotation *10 tag "
-                                           "correction"])
-        group_anno_10_line_y_correction = float(par_dict["Grouping "
-                                                         "annotation"
-                                                        " *10 line "
-                                                        "correction"])
-    except:
-        print("\nCheck entries for Group 10 annotation in Parameter file."
-              " One of the numeric entries is missing or erroneous. Check"
-              " entries and formats.")
-        sys.exit()
-    
-    group_list.append("G10")
-    group_lw.append(group_anno_10_line_width)
-    group_corr.append(group_anno_10_corr)
-    group_corr_line.append(group_anno_10_line_y_correction)
+        par_dict_int_lines_values = {k: v for k, v in par_dict.items() \
+                          if "INT lines" in str(k)}
 
-    # Further grouping error checks
-    if group_anno_10_title_bold not in ["on","off"]:
-        print("\nEntry for Grouping annotation 10 title bold on/off in "
-              "Parameter file is required. Entry should be either 'on' or"
-              " 'off'.")
-        sys.exit()
-        
-    if group_anno_10_title_colour < 0 or group_anno_10_title_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 10 title colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
-        
-    if group_anno_10_line_colour < 0 or group_anno_10_line_colour > \
-        col_max:
-        print("\nEntry for Grouping annotation 10 line colour in "
-              "Parameter file is out of bounds. Refer to manual for"
-              " colour codes. Colour codes presently range from 1-23.")
-        sys.exit()
+        try:
+            int_lines_colour = float(par_dict["INT lines colour"] \
+                                     .replace(" ",""))
+            int_lines_offset = float(par_dict["INT lines offset"] \
+                                     .replace(" ",""))
+            int_lines_width = float(par_dict["INT lines width"] \
+                                    .replace(" ",""))
+            int_lines_depth_length = float(par_dict["INT lines depth length"] \
+                                         .replace(" ","")) 
+            int_lines_corr = float(par_dict["INT lines width correction"] \
+                                  .replace(" ",""))  
+            int_lines_corr_l = float(par_dict["INT lines length correction"] \
+                                    .replace(" ",""))
+        except:
+            print("\nCheck entries for INT lines colour, INT lines offset INT"
+                  " lines width, INT lines depth length, INT lines width "
+                  "correction and INT lines length correction. One of these "
+                  "entries is erroneous. Check entries and formats.")
+            sys.exit()             
         
-###########################################################################
-###########################################################################
-# Palaeo plots often have zones drawn. Zones can be specified in the 
-# Parameter file. Obtain parameters regarding zones and check user entries
-# as much as possible.
-zones_on_off = par_dict["Zones on/off**"].replace(" ","").lower() 
+        for k,v in par_dict_int_lines_values.items():
+            if pd.isnull(v) == True:
+                    print(f" \n Entry missing for {k}")
+                    sys.exit()
+                
+        if int_lines_colour < 0 or int_lines_colour > col_max:
+            print("\nEntry for INT lines colour in Parameter file is out of "
+                  "range.")
+            sys.exit()
 
-if zones_on_off not in ["on", "off"] or pd.isnull(zones_on_off) == True:
-    print("\nEntry for Zones on/off in Parameter file must be either 'on'"
-          " or 'off'.")
-    sys.exit()
+        try:
+            int_umd_age = int(par_dict["INT upper most depth age"]. \
+                                replace(" ",""))
+        except:
+            print("\nEntry for INT upper most depth age is required. Check "
+                  "entry and format.")
+            sys.exit()
     
-if zones_on_off == "on":
-    # Obtain depths of zones from Parameter file and check all entries
-    try:
-        zone_lines = par_dict["Zone depths"].replace(" ","").split(",")
-        zone_lines = [float(x) for x in zone_lines]
-    except:
-        print("\nEntry required for Zone depths in Parameter file. Either"
-              " entry is missing or there is a formatting problem. Check "
-              "entry.")
+        if pd.isnull(int_umd_age) == True:
+            print("\nEntry missing for INT upper most depth age in Parameter "
+                  "file.")
+            sys.exit()
+        
+        # User input error checking.Labels and depths need to have same length
+        if len(int_age_labels) != len(int_age_depths):
+            print("")
+            print("\nError in INT label depths in Parameter file. Unequal "
+                  "number of depths and labels.")
+            sys.exit()
+
+    ###########################################################################
+    ###########################################################################
+    # Grouping annotations. Bring in and check the entries of every grouping
+    # annotation switched on (see group_annotations above).
+    annotations = group_annotations(par_dict, data_list, col_max)
+
+    ###########################################################################
+    ###########################################################################
+    # Palaeo plots often have zones drawn. Zones can be specified in the 
+    # Parameter file. Obtain parameters regarding zones and check user entries
+    # as much as possible.
+    zones_on_off = par_dict["Zones on/off**"].replace(" ","").lower() 
+
+    if zones_on_off not in ["on", "off"] or pd.isnull(zones_on_off) == True:
+        print("\nEntry for Zones on/off in Parameter file must be either 'on'"
+              " or 'off'.")
         sys.exit()
     
-    # Zone main title font and rotation.
-    zone_title = par_dict["Zone title"]
+    if zones_on_off == "on":
+        # Obtain depths of zones from Parameter file and check all entries
+        try:
+            zone_lines = par_dict["Zone depths"].replace(" ","").split(",")
+            zone_lines = [float(x) for x in zone_lines]
+        except:
+            print("\nEntry required for Zone depths in Parameter file. Either"
+                  " entry is missing or there is a formatting problem. Check "
+                  "entry.")
+            sys.exit()
+    
+        # Zone main title font and rotation.
+        zone_title = par_dict["Zone title"]
     
-    try:
-        zone_title_font = float(par_dict["Zone title font size"] \
-                                .replace(" ",""))
-    except:
-        print("\nEntry required for Zone title font size in Parameter"
-              " file. Check format and that there is a numeric entry.")
-        sys.exit()
+        try:
+            zone_title_font = float(par_dict["Zone title font size"] \
+                                    .replace(" ",""))
+        except:
+            print("\nEntry required for Zone title font size in Parameter"
+                  " file. Check format and that there is a numeric entry.")
+            sys.exit()
         
-    try:
-        zone_title_rot = float(par_dict["Zone title rotation"] \
-                               .replace(" ",""))
-    except:
-        print("\nEntry required for Zone title font rotation in Parameter"
-              " file.Check format and that there is a numeric entry.")
-        sys.exit()
+        try:
+            zone_title_rot = float(par_dict["Zone title rotation"] \
+                                   .replace(" ",""))
+        except:
+            print("\nEntry required for Zone title font rotation in Parameter"
+                  " file.Check format and that there is a numeric entry.")
+            sys.exit()
         
-    if zone_title_rot < 0 or zone_title_rot > 360:
-        print("\nZone title rotation entry in Parameter file is out of "
-              "bounds. Requires entry between 0 and 360 degrees.")
-        sys.exit()
+        if zone_title_rot < 0 or zone_title_rot > 360:
+            print("\nZone title rotation entry in Parameter file is out of "
+                  "bounds. Requires entry between 0 and 360 degrees.")
+            sys.exit()
         
-    try:
-        zone_title_colour = float(par_dict["Zone title colour"] \
-                                 .replace(" ",""))
-    except:
-        print("\nEntry required for Zone title colour in Parameter file. "
-              "Check format and that there is a numeric entry.")
-        sys.exit()
+        try:
+            zone_title_colour = float(par_dict["Zone title colour"] \
+                                     .replace(" ",""))
+        except:
+            print("\nEntry required for Zone title colour in Parameter file. "
+                  "Check format and that there is a numeric entry.")
+            sys.exit()
         
-    try:
-        zone_title_bold = par_dict["Zone title bold on/off"] \
-                      .replace(" ","").lower()
-    except:
-        print("\nEntry required for Zone title bold on/off in Parameter "
-              "file. Entry should be 'on' or 'off'.")
-        sys.exit()
+        try:
+            zone_title_bold = par_dict["Zone title bold on/off"] \
+                          .replace(" ","").lower()
+        except:
+            print("\nEntry required for Zone title bold on/off in Parameter "
+                  "file. Entry should be 'on' or 'off'.")
+            sys.exit()
         
-    if zone_title_bold not in ["on", "off"]:
-        print("\nZone title bold on/off entry in Parameter file is "
-              "incorrect. Entry should be 'on' or 'off'.")
-        sys.exit()
+        if zone_title_bold not in ["on", "off"]:
+            print("\nZone title bold on/off entry in Parameter file is "
+                  "incorrect. Entry should be 'on' or 'off'.")
+            sys.exit()
         
-    try:
-        par_col_list_values_1 = par_dict["Zone line col list"].split(",")
-        par_col_list_values_1 = [float(x) for x in par_col_list_values_1]
-    except: 
+        try:
+            par_col_list_values_1 = par_dict["Zone line col list"].split(",")
+            par_col_list_values_1 = [float(x) for x in par_col_list_values_1]
+        except: 
+                print("\nZone line col list entries in Parameter file are "
+                      "missing or incorrect.")
+                sys.exit()
+    
+        if any (i < 0 or i > col_max or pd.isnull(i) for i in \
+                par_col_list_values_1):
             print("\nZone line col list entries in Parameter file are "
-                  "missing or incorrect.")
+                  "out of bounds or missing.")
             sys.exit()
-    
-    if any (i < 0 or i > col_max or pd.isnull(i) for i in \
-            par_col_list_values_1):
-        print("\nZone line col list entries in Parameter file are "
-              "out of bounds or missing.")
-        sys.exit()
 
-    if pd.isnull(par_dict["Zone line col list"]) == True:
-        print("\n Colour entries for Zone line col list in Parameter file"
-              " are required.")
-        sys.exit()
+        if pd.isnull(par_dict["Zone line col list"]) == True:
+            print("\n Colour entries for Zone line col list in Parameter file"
+                  " are required.")
+            sys.exit()
 
-    # Line style width and colour for zone lines.
-    # Valid entries are 1,2,3 or 4". See manual for definitions.
-    try:
-        zone_line_style = par_dict["Zone line style"].replace(" ","") \
-                                   .split(",")
-        zone_line_style  = [float(x) for x in zone_line_style]
-    except:
-        print("\nEntry required for Zone line style in Parameter file."
-              " Check entries.") 
-        sys.exit()
+        # Line style width and colour for zone lines.
+        # Valid entries are 1,2,3 or 4". See manual for definitions.
+        try:
+            zone_line_style = par_dict["Zone line style"].replace(" ","") \
+                                       .split(",")
+            zone_line_style  = [float(x) for x in zone_line_style]
+        except:
+            print("\nEntry required for Zone line style in Parameter file."
+                  " Check entries.") 
+            sys.exit()
 
-    if any (i < 1 or i > 4 or pd.isnull(i) for i in \
-            zone_line_style):
-        print("\nZone line style list entries in Parameter file are"
-              " out of bounds or missing.")
-        sys.exit()        
+        if any (i < 1 or i > 4 or pd.isnull(i) for i in \
+                zone_line_style):
+            print("\nZone line style list entries in Parameter file are"
+                  " out of bounds or missing.")
+            sys.exit()        
 
-    try:
-        zone_line_width = par_dict["Zone line width"].replace(" ","") \
-                                   .split(",")
-        zone_line_width = [float(x) for x in zone_line_width]
-    except:
-        print("\nEntries required for Zone line width in Parameter file.")
-        sys.exit()
+        try:
+            zone_line_width = par_dict["Zone line width"].replace(" ","") \
+                                       .split(",")
+            zone_line_width = [float(x) for x in zone_line_width]
+        except:
+            print("\nEntries required for Zone line width in Parameter file.")
+            sys.exit()
         
-    try:
-        zone_line_colour = par_dict["Zone line col list"]. \
-                                    replace(" ","").split(",") 
-        zone_line_colour  = [float(x) for x in zone_line_colour]
-    except:
-        print("\nEntry required for Zone line col list in Parameter file.")
-        sys.exit()
+        try:
+            zone_line_colour = par_dict["Zone line col list"]. \
+                                        replace(" ","").split(",") 
+            zone_line_colour  = [float(x) for x in zone_line_colour]
+        except:
+            print("\nEntry required for Zone line col list in Parameter file.")
+            sys.exit()
         
-    try:
-        zone_boundary_line_top = par_dict["Zone boundary line left "
-                                          "on/off"].replace(" ","").lower()
-        zone_boundary_line_bottom = par_dict["Zone boundary line right "
-                                            "on/off"].replace(" ",""). \
-                                             lower()
-        zone_boundary_line_left = par_dict["Zone boundary line top "
-                                           "on/off"].replace(" ",""). \
-                                            lower()
-        zone_boundary_line_right = par_dict["Zone boundary line bottom "
-                                            "on/off"].replace(" ",""). \
-                                             lower()        
-    except:
-        print("\nCheck all four of the Zone boundary line on/off"
-              " entries in the Parameter file.")
-        sys.exit()
+        try:
+            zone_boundary_line_top = par_dict["Zone boundary line left "
+                                              "on/off"].replace(" ","").lower()
+            zone_boundary_line_bottom = par_dict["Zone boundary line right "
+                                                "on/off"].replace(" ",""). \
+                                                 lower()
+            zone_boundary_line_left = par_dict["Zone boundary line top "
+                                               "on/off"].replace(" ",""). \
+                                                lower()
+            zone_boundary_line_right = par_dict["Zone boundary line bottom "
+                                                "on/off"].replace(" ",""). \
+                                                 lower()        
+        except:
+            print("\nCheck all four of the Zone boundary line on/off"
+                  " entries in the Parameter file.")
+            sys.exit()
         
-    zone_boundary_line_list = [zone_boundary_line_top, \
-                               zone_boundary_line_bottom, \
-                               zone_boundary_line_left, \
-                               zone_boundary_line_right]
+        zone_boundary_line_list = [zone_boundary_line_top, \
+                                   zone_boundary_line_bottom, \
+                                   zone_boundary_line_left, \
+                                   zone_boundary_line_right]
         
-    if any(pd.isnull(i) or i not in ["on","off"] for i in \
-           zone_boundary_line_list ):
-        print("\nCheck all four of the Zone boundary line on/off"
-              " entries in the Parameter file. Entry should be"
-              " 'on' or 'off'.")
-        sys.exit()
+        if any(pd.isnull(i) or i not in ["on","off"] for i in \
+               zone_boundary_line_list ):
+            print("\nCheck all four of the Zone boundary line on/off"
+                  " entries in the Parameter file. Entry should be"
+                  " 'on' or 'off'.")
+            sys.exit()
         
-    try:
-        zone_boundary_line_style = float(par_dict["Zone boundary line "
-                                        "style"].replace(" ",""))
+        try:
+            zone_boundary_line_style = float(par_dict["Zone boundary line "
+                                            "style"].replace(" ",""))
     
-        zone_boundary_line_colour = float(par_dict["Zone boundary line"
-                                          " colour"].replace(" ",""))
+            zone_boundary_line_colour = float(par_dict["Zone boundary line"
+                                              " colour"].replace(" ",""))
             
-        zone_boundary_line_width = float(par_dict["Zone boundary line "
-                                        "width"].replace(" ",""))   
-    except:
-        print("\nProblem with Zone boundary entry. Check all zone"
-              " boundary entries and formats.")
-        sys.exit()
+            zone_boundary_line_width = float(par_dict["Zone boundary line "
+                                            "width"].replace(" ",""))   
+        except:
+            print("\nProblem with Zone boundary entry. Check all zone"
+                  " boundary entries and formats.")
+            sys.exit()
         
-    if zone_boundary_line_style < 0 or zone_boundary_line_style > 4 \
-        or pd.isnull(zone_boundary_line_style) == True:
-        print("\nZone boundary line style entry in Parameter file is "
-              "incorrect, missing or out of bounds (1-4).")
-        sys.exit() 
+        if zone_boundary_line_style < 0 or zone_boundary_line_style > 4 \
+            or pd.isnull(zone_boundary_line_style) == True:
+            print("\nZone boundary line style entry in Parameter file is "
+                  "incorrect, missing or out of bounds (1-4).")
+            sys.exit() 
         
-    if zone_boundary_line_colour <= 0 or zone_boundary_line_colour > \
-        col_max or pd.isnull(zone_boundary_line_colour) == True:
-        print("\nZone boundary line colour entry in Parameter file is"
-              " out of bounds or missing.")
-        sys.exit()
+        if zone_boundary_line_colour <= 0 or zone_boundary_line_colour > \
+            col_max or pd.isnull(zone_boundary_line_colour) == True:
+            print("\nZone boundary line colour entry in Parameter file is"
+                  " out of bounds or missing.")
+            sys.exit()
            
-    # Obtain parameters for individual zone labels from Parameter file and 
-    # check.
-    try:
-        zone_labels_on_off = par_dict["Zone labels on/off"] \
-                         .replace(" ","").lower()
-    except:
-        print("\nZone labels on/off entry in Parameter file is incorrect."
-              "Entry should be either 'on' or 'off.'")
-        sys.exit()
-        
-    if zone_labels_on_off not in ["on", "off"]:
-        print("\nZone labels on/off needs to be either 'on' or 'off'.")
-        sys.exit()
-                         
-    if zone_labels_on_off == "on":
+        # Obtain parameters for individual zone labels from Parameter file and 
+        # check.
         try:
-            zone_lab_font = float(par_dict["Zone label font size"]. \
-                          replace(" ",""))
+            zone_labels_on_off = par_dict["Zone labels on/off"] \
+                             .replace(" ","").lower()
         except:
-            print("\nEntry for zone label font size in Parameter file is "
-                  "required. Check entry and format.")
+            print("\nZone labels on/off entry in Parameter file is incorrect."
+                  "Entry should be either 'on' or 'off.'")
             sys.exit()
-            
-        try:
-            zone_lab_rot = float(par_dict["Zone label rotation"]\
-                                 .replace(" ",""))
-        except:
-            print("\nEntry for zone label rotation in Parameter file "
-                  "required. Check entry and format.")
+        
+        if zone_labels_on_off not in ["on", "off"]:
+            print("\nZone labels on/off needs to be either 'on' or 'off'.")
             sys.exit()
+                         
+        if zone_labels_on_off == "on":
+            try:
+                zone_lab_font = float(par_dict["Zone label font size"]. \
+                              replace(" ",""))
+            except:
+                print("\nEntry for zone label font size in Parameter file is "
+                      "required. Check entry and format.")
+                sys.exit()
             
-        if zone_lab_rot < 0 or zone_lab_rot > 360:
-            print("\nZone label rotation in Parameter file must be"
-                  " between 0 and 360 degrees.")
-            sys.exit()
+            try:
+                zone_lab_rot = float(par_dict["Zone label rotation"]\
+                                     .replace(" ",""))
+            except:
+                print("\nEntry for zone label rotation in Parameter file "
+                      "required. Check entry and format.")
+                sys.exit()
             
-        try:
-            zone_lab_pos = float(par_dict["Zone label position"]\
-                                 .replace(" ",""))
-        except:
-            print("\nEntry for zone label position in Parameter file "
-                  "required. Check entry and format.")
-            sys.exit() 
+            if zone_lab_rot < 0 or zone_lab_rot > 360:
+                print("\nZone label rotation in Parameter file must be"
+                      " between 0 and 360 degrees.")
+                sys.exit()
+            
+            try:
+                zone_lab_pos = float(par_dict["Zone label position"]\
+                                     .replace(" ",""))
+            except:
+                print("\nEntry for zone label position in Parameter file "
+                      "required. Check entry and format.")
+                sys.exit() 
 
-        try:
-            zone_label_colour = float(par_dict["Zone label colour"] \
-                              .replace(" ",""))
-        except:
-            print("\nEntry for zone label colour in Parameter file "
-                  "required. Check entry and format.")
-            sys.exit() 
+            try:
+                zone_label_colour = float(par_dict["Zone label colour"] \
+                                  .replace(" ",""))
+            except:
+                print("\nEntry for zone label colour in Parameter file "
+                      "required. Check entry and format.")
+                sys.exit() 
 
-        if zone_label_colour < 0 or zone_label_colour > col_max:
-            print("\nZone label colour code in Parameter file must be "
-                  "between 1 - 23. See colour codes in manual.")
-            sys.exit()
+            if zone_label_colour < 0 or zone_label_colour > col_max:
+                print("\nZone label colour code in Parameter file must be "
+                      "between 1 - 23. See colour codes in manual.")
+                sys.exit()
             
-        try:
-            zone_label_bold = par_dict["Zone label bold on/off"]. \
-                                      replace(" ","").lower()
-        except:
-            print("\nEntry for zone label bold on/off in Parameter file "
-                  "required.")
-            sys.exit() 
+            try:
+                zone_label_bold = par_dict["Zone label bold on/off"]. \
+                                          replace(" ","").lower()
+            except:
+                print("\nEntry for zone label bold on/off in Parameter file "
+                      "required.")
+                sys.exit() 
 
-        if zone_label_bold not in ["on", "off"]:
-            print("\nZone label bold entry in Parameter file must "
-                  "be 'on' or 'off'.")
-            sys.exit()            
+            if zone_label_bold not in ["on", "off"]:
+                print("\nZone label bold entry in Parameter file must "
+                      "be 'on' or 'off'.")
+                sys.exit()            
           
-        try:
-            zone_lab_pos_corr = float(par_dict["Zone label position "
-                                               "correction"]. \
-                                                replace(" ",""))
-        except:
-            print("\nEntry for zone label position in Parameter file "
-                  "required. If no correction required enter a zero."
-                  " Check entry and format.")
-            sys.exit()
+            try:
+                zone_lab_pos_corr = float(par_dict["Zone label position "
+                                                   "correction"]. \
+                                                    replace(" ",""))
+            except:
+                print("\nEntry for zone label position in Parameter file "
+                      "required. If no correction required enter a zero."
+                      " Check entry and format.")
+                sys.exit()
 
-        # Obtain names of zones from Parameter file and check.
-        zones = []
+            # Obtain names of zones from Parameter file and check.
+            zones = []
         
-        try:
-            zone_labels = par_dict["Zone labels"].split(",")
-        except:
-            print("\nZone labels entry in Parameter file is incorrect."
-                  " Check entries. Is the entry blank?")
-            sys.exit()
+            try:
+                zone_labels = par_dict["Zone labels"].split(",")
+            except:
+                print("\nZone labels entry in Parameter file is incorrect."
+                      " Check entries. Is the entry blank?")
+                sys.exit()
 
-    # Alter here if ticks are specified for depth axis on zones too by 
-    # X ticks depth axis only** being off in Parameter file. Obtain 
-    # entries and check.
-    if x_all_ticks == "off":
-        try:
-            zone_x_tick_maj_colour = float(par_dict \
-                                           ["Zone X major tick colour"] \
-                                           .replace(" ",""))                
-        except:
-            print("\nZone X major tick colour entry in Parameter file is"
-                  " incorrect.")
-            sys.exit()
-            
-        if zone_x_tick_maj_colour < 0 or zone_x_tick_maj_colour > \
-            col_max or pd.isnull(zone_x_tick_maj_colour) == True:
-            print("\nZone X major tick colour entry in Parameter file"
-                  " is out of bounds or missing.")
-            sys.exit()  
-                
-        if x_minor_ticks_on_off == "on":
+        # Alter here if ticks are specified for depth axis on zones too by 
+        # X ticks depth axis only** being off in Parameter file. Obtain 
+        # entries and check.
+        if x_all_ticks == "off":
             try:
-                zone_x_tick_min_colour = \
-                    float(par_dict["Zone X minor tick colour"] \
-                                   .replace(" ",""))
+                zone_x_tick_maj_colour = float(par_dict \
+                                               ["Zone X major tick colour"] \
+                                               .replace(" ",""))                
             except:
-                print("\nZone X minor tick colour entry in Parameter"
-                      " file is incorrect.")
-                sys.exit() 
-            
-            if zone_x_tick_min_colour <= 0 or zone_x_tick_min_colour \
-                > col_max or pd.isnull(zone_x_tick_min_colour) == True:
-                print("\nZone X minor tick colour entry in Parameter"
-                      " file is out of bounds or missing.")
+                print("\nZone X major tick colour entry in Parameter file is"
+                      " incorrect.")
                 sys.exit()
+            
+            if zone_x_tick_maj_colour < 0 or zone_x_tick_maj_colour > \
+                col_max or pd.isnull(zone_x_tick_maj_colour) == True:
+                print("\nZone X major tick colour entry in Parameter file"
+                      " is out of bounds or missing.")
+                sys.exit()  
+                
+            if x_minor_ticks_on_off == "on":
+                try:
+                    zone_x_tick_min_colour = \
+                        float(par_dict["Zone X minor tick colour"] \
+                                       .replace(" ",""))
+                except:
+                    print("\nZone X minor tick colour entry in Parameter"
+                          " file is incorrect.")
+                    sys.exit() 
+            
+                if zone_x_tick_min_colour <= 0 or zone_x_tick_min_colour \
+                    > col_max or pd.isnull(zone_x_tick_min_colour) == True:
+                    print("\nZone X minor tick colour entry in Parameter"
+                          " file is out of bounds or missing.")
+                    sys.exit()
 
-    # Further error checking user input for zones.
-    for zlc in zone_line_colour:
-        if zlc > col_max or zlc < 1:
-            print("")
-            print(f"\nZone line colour in Parameter file is out of "
-                  f"range (1 - {col_max}).")
-            sys.exit()
+        # Further error checking user input for zones.
+        for zlc in zone_line_colour:
+            if zlc > col_max or zlc < 1:
+                print("")
+                print(f"\nZone line colour in Parameter file is out of "
+                      f"range (1 - {col_max}).")
+                sys.exit()
             
-    for zls in zone_line_style:
-        if zls > 4 or zls < 1:
-            print("")
-            print("\nZone line style in Parameter file is out of range. "
-                  "(1 - 4)")
-            sys.exit()
+        for zls in zone_line_style:
+            if zls > 4 or zls < 1:
+                print("")
+                print("\nZone line style in Parameter file is out of range. "
+                      "(1 - 4)")
+                sys.exit()
 
-###########################################################################
-# Obtain zone depths and upmost and deepest depths from Parameter file and 
-# Input file.
-if zones_on_off == "on":
-    zones = zone_lines
-    zones.insert(0,0)
-    zones.insert(len(zones) + 1, np.max(data["Depth"] [2::]))
-    zones = zones[::-1]
+    ###########################################################################
+    # Obtain zone depths and upmost and deepest depths from Parameter file and 
+    # Input file.
+    if zones_on_off == "on":
+        zones = zone_lines
+        zones.insert(0,0)
+        zones.insert(len(zones) + 1, data_2["Depth"].max())
+        zones = zones[::-1]
     
-    # Create a central location for the zone labels in the zone column
-    # of the plot.
-    zone_place = []
+        # Create a central location for the zone labels in the zone column
+        # of the plot.
+        zone_place = []
     
-    a = 0
+        a = 0
     
-    for Z in range(len(zones) - 1):
-        zone_place.append(((zones[a]-zones[a + 1]) / 2 + zones[a + 1]))
-        a+=1
+        for Z in range(len(zones) - 1):
+            zone_place.append(((zones[a]-zones[a + 1]) / 2 + zones[a + 1]))
+            a+=1
         
-    zone_place = zone_place[::-1]
+        zone_place = zone_place[::-1]
     
-    # Check if zones are to be used there are the correct number of data 
-    # points. Should be one more label than there are lines. Check right
-    # number of data points for style, width etc.
-    if zones_on_off == "on":
-        if len(zone_lines[1:-1]) - len(zone_labels) != -1:
-            print("")
-            print("\nError in zonation, too many or too few zone names / "
-                  "lines in Parameter file.")
-            sys.exit()
+        # Check if zones are to be used there are the correct number of data 
+        # points. Should be one more label than there are lines. Check right
+        # number of data points for style, width etc.
+        if zones_on_off == "on":
+            if len(zone_lines[1:-1]) - len(zone_labels) != -1:
+                print("")
+                print("\nError in zonation, too many or too few zone names / "
+                      "lines in Parameter file.")
+                sys.exit()
             
-        if len(zone_line_style) != len(zone_line_width) or \
-            len(zone_line_style) != len(zone_lines[1:-1]):
-            print("")
-            print("\nError in zonation, too many or too few zone styles"
-                  " or line widths in Parameter file.")
-            sys.exit()
+            if len(zone_line_style) != len(zone_line_width) or \
+                len(zone_line_style) != len(zone_lines[1:-1]):
+                print("")
+                print("\nError in zonation, too many or too few zone styles"
+                      " or line widths in Parameter file.")
+                sys.exit()
             
-        if len(zone_line_width) != len(zone_line_colour) or \
-            len(zone_line_width) != len(zone_lines[1:-1]):
-            print("")
-            print("\nError in zonation, too many or too few line colours"
-                  " or line widths in Parameter file.")
-            sys.exit()
+            if len(zone_line_width) != len(zone_line_colour) or \
+                len(zone_line_width) != len(zone_lines[1:-1]):
+                print("")
+                print("\nError in zonation, too many or too few line colours"
+                      " or line widths in Parameter file.")
+                sys.exit()
             
-        if len(zone_line_style) != len(zone_line_colour) or \
-            len(zone_line_style) != len(zone_lines[1:-1]):
-            print("")
-            print("\nError in zonation, too many or too few zone styles"
-                  " or colours in Parameter file.")
-            sys.exit()
+            if len(zone_line_style) != len(zone_line_colour) or \
+                len(zone_line_style) != len(zone_lines[1:-1]):
+                print("")
+                print("\nError in zonation, too many or too few zone styles"
+                      " or colours in Parameter file.")
+                sys.exit()
 
-# Alter diff ratios if stack plots are specified as well as zones and if 
-# without zones. Give default value of 1 for now. This is used to give
-# plots their scaled widths.
-if zones_on_off == "on":
-    if num_stack_plots == 1:
-        diff_list_ratios [1] = 1
-        
-    if num_stack_plots == 2:
-        diff_list_ratios [1] = 1
-        diff_list_ratios [2] = 1
-        
-if zones_on_off == "off":
-    if num_stack_plots == 1:
-        diff_list_ratios [0] = 1
-        
-    if num_stack_plots == 2:
-        diff_list_ratios [0] = 1
-        diff_list_ratios [1] = 1
-
-###########################################################################
-###########################################################################
-# Create the individual plots. Below is repeated code depending on how 
-# many taxa there are. The program is limited to 60 taxa. Beyond 60 it is 
-# not really legible on an A4 piece of paper. 
-
-# Obtain information re the overall size of figure required and font to be
-# used throughout changed here from cm to inches.
-fig_size = plt.rcParams["figure.figsize"]
-fig_size[0] = overall_x / 2.54
-fig_size[1] = overall_y / 2.54
-
-plt.rcParams["figure.figsize"] = fig_size
-plt.rcParams.update({'font.family': font_style})
-
-# Set up each basic plot based on number of taxa to be plotted.
-if zones_on_off == "off":
-    diff_list_ratios_dict.pop("Zones")
-                              
-diff_list_ratios = list(diff_list_ratios_dict.values())
-diff_list_ratios = diff_list_ratios [::-1]
-
-fig = plt.figure(facecolor = "white", edgecolor = "none")
-
-gs = GridSpec(len(data_list), 1, width_ratios = [1], 
-              height_ratios = (diff_list_ratios), 
-              hspace = h_space, 
-              left = float(par_dict["Overall title gap"]))
-
-if len(data_list) == 1:
-    ax1 = fig.add_subplot(gs[0])
-    
-    ax_list = [ax1]
-    
-elif len(data_list) == 2:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    
-    ax_list = [ax1, ax2]
-    
-elif len(data_list) == 3:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    
-    ax_list = [ax1, ax2, ax3]
-    
-elif len(data_list) == 4:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    
-    ax_list = [ax1, ax2, ax3, ax4]
-    
-elif len(data_list) == 5:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5]
-    
-elif len(data_list) == 6:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6]
-    
-elif len(data_list) == 7:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7]
-    
-elif len(data_list) == 8:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8]
-    
-elif len(data_list) == 9:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9]
-    
-elif len(data_list) == 10:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10]
-    
-elif len(data_list) == 11:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11]
-    
-elif len(data_list) == 12:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12]
-    
-elif len(data_list) == 13:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13]
-    
-elif len(data_list) == 14:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14]
-    
-elif len(data_list) == 15:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15]
-    
-elif len(data_list) == 16:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16]
-    
-elif len(data_list) == 17:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17]
-    
-elif len(data_list) == 18:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18]
-    
-elif len(data_list) == 19:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7,ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19]
-    
-elif len(data_list) == 20:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20]
-    
-elif len(data_list) == 21:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21]
-    
-elif len(data_list) == 22:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22]
-    
-elif len(data_list) == 23:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23]
-    
-elif len(data_list) == 24:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24]
-    
-elif len(data_list) == 25:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25]
-        
-elif len(data_list) == 26:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26]
-        
-elif len(data_list) == 27:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27]
-        
-elif len(data_list) == 28:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28]
-        
-elif len(data_list) == 29:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26,  ax27, ax28, ax29]
-        
-elif len(data_list) == 30:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, ax30]
-        
-elif len(data_list) == 31:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31]
-        
-elif len(data_list) == 32:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32]
-        
-elif len(data_list) == 33:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33] 
-        
-elif len(data_list) == 34:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34] 
-        
-elif len(data_list) == 35:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35] 
-        
-elif len(data_list) == 36:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36]  
-        
-elif len(data_list) == 37: 
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37]  
-        
-elif len(data_list) == 38:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38]  
-        
-elif len(data_list) == 39:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39]     
-        
-elif len(data_list) == 40:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40]          
-        
-elif len(data_list) == 41:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41]   
-        
-elif len(data_list) == 42:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42]   
-        
-elif len(data_list) == 43:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43]
-         
-elif len(data_list) == 44:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44] 
-        
-elif len(data_list) == 45:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45]    
-        
-elif len(data_list) == 46:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46]   
-        
-elif len(data_list) == 47:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47]   
-        
-elif len(data_list) == 48:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    ax48 = fig.add_subplot(gs[47]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48] 
-        
-elif len(data_list) == 49:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49]   
-        
-elif len(data_list) == 50:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49]) 
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50] 
-        
-elif len(data_list) == 51:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51]    
-        
-elif len(data_list) == 52:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52]   
-
-elif len(data_list) == 53:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])   
-    ax25 = fig.add_subplot(gs[24]) 
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26]) 
-    ax28 = fig.add_subplot(gs[27]) 
-    ax29 = fig.add_subplot(gs[28]) 
-    ax30 = fig.add_subplot(gs[29]) 
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32]) 
-    ax34 = fig.add_subplot(gs[33]) 
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36]) 
-    ax38 = fig.add_subplot(gs[37]) 
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39]) 
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41]) 
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44]) 
-    ax46 = fig.add_subplot(gs[45]) 
-    ax47 = fig.add_subplot(gs[46]) 
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53]  
-    
-elif len(data_list) == 54:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54]
-    
-elif len(data_list) == 55:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-    ax55 = fig.add_subplot(gs[54])
-
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54, ax55]
-
-elif len(data_list) == 56:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-    ax55 = fig.add_subplot(gs[54])
-    ax56 = fig.add_subplot(gs[55])
-
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54, ax55, ax56]   
-
-elif len(data_list) == 57:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36= fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-    ax55 = fig.add_subplot(gs[54])
-    ax56 = fig.add_subplot(gs[55])
-    ax57 = fig.add_subplot(gs[56])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54, ax55, ax56, \
-               ax57]
-
-elif len(data_list) == 58:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-    ax55 = fig.add_subplot(gs[54])
-    ax56 = fig.add_subplot(gs[55])
-    ax57 = fig.add_subplot(gs[56])
-    ax58 = fig.add_subplot(gs[57])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54, ax55, ax56, \
-               ax57, ax58]  
-        
-elif len(data_list) == 59:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-    ax55 = fig.add_subplot(gs[54])
-    ax56 = fig.add_subplot(gs[55])
-    ax57 = fig.add_subplot(gs[56])
-    ax58 = fig.add_subplot(gs[57])
-    ax59 = fig.add_subplot(gs[58])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54, ax55, ax56, \
-               ax57, ax58, ax59]
-
-elif len(data_list) == 60:
-    ax1 = fig.add_subplot(gs[0])
-    ax2 = fig.add_subplot(gs[1])
-    ax3 = fig.add_subplot(gs[2])
-    ax4 = fig.add_subplot(gs[3])
-    ax5 = fig.add_subplot(gs[4])
-    ax6 = fig.add_subplot(gs[5])
-    ax7 = fig.add_subplot(gs[6])
-    ax8 = fig.add_subplot(gs[7])
-    ax9 = fig.add_subplot(gs[8])
-    ax10 = fig.add_subplot(gs[9])
-    ax11 = fig.add_subplot(gs[10])
-    ax12 = fig.add_subplot(gs[11])
-    ax13 = fig.add_subplot(gs[12])
-    ax14 = fig.add_subplot(gs[13])
-    ax15 = fig.add_subplot(gs[14])
-    ax16 = fig.add_subplot(gs[15])
-    ax17 = fig.add_subplot(gs[16])
-    ax18 = fig.add_subplot(gs[17])
-    ax19 = fig.add_subplot(gs[18])
-    ax20 = fig.add_subplot(gs[19])
-    ax21 = fig.add_subplot(gs[20])
-    ax22 = fig.add_subplot(gs[21])
-    ax23 = fig.add_subplot(gs[22])
-    ax24 = fig.add_subplot(gs[23])
-    ax25 = fig.add_subplot(gs[24])
-    ax26 = fig.add_subplot(gs[25])
-    ax27 = fig.add_subplot(gs[26])
-    ax28 = fig.add_subplot(gs[27])
-    ax29 = fig.add_subplot(gs[28])
-    ax30 = fig.add_subplot(gs[29])
-    ax31 = fig.add_subplot(gs[30])
-    ax32 = fig.add_subplot(gs[31])
-    ax33 = fig.add_subplot(gs[32])
-    ax34 = fig.add_subplot(gs[33])
-    ax35 = fig.add_subplot(gs[34])
-    ax36 = fig.add_subplot(gs[35])
-    ax37 = fig.add_subplot(gs[36])
-    ax38 = fig.add_subplot(gs[37])
-    ax39 = fig.add_subplot(gs[38])
-    ax40 = fig.add_subplot(gs[39])
-    ax41 = fig.add_subplot(gs[40])
-    ax42 = fig.add_subplot(gs[41])
-    ax43 = fig.add_subplot(gs[42])
-    ax44 = fig.add_subplot(gs[43])
-    ax45 = fig.add_subplot(gs[44])
-    ax46 = fig.add_subplot(gs[45])
-    ax47 = fig.add_subplot(gs[46])
-    ax48 = fig.add_subplot(gs[47])
-    ax49 = fig.add_subplot(gs[48])
-    ax50 = fig.add_subplot(gs[49])
-    ax51 = fig.add_subplot(gs[50])
-    ax52 = fig.add_subplot(gs[51])
-    ax53 = fig.add_subplot(gs[52])
-    ax54 = fig.add_subplot(gs[53])
-    ax55 = fig.add_subplot(gs[54])
-    ax56 = fig.add_subplot(gs[55])
-    ax57 = fig.add_subplot(gs[56])
-    ax58 = fig.add_subplot(gs[57])
-    ax59 = fig.add_subplot(gs[58])
-    ax60 = fig.add_subplot(gs[59])
-    
-    ax_list = [ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9, ax10, ax11, \
-               ax12, ax13, ax14, ax15, ax16, ax17, ax18, ax19, ax20, \
-               ax21, ax22, ax23, ax24, ax25, ax26, ax27, ax28, ax29, \
-               ax30, ax31, ax32, ax33, ax34, ax35, ax36, ax37, ax38, \
-               ax39, ax40, ax41, ax42, ax43, ax44, ax45, ax46, ax47, \
-               ax48, ax49, ax50, ax51, ax52, ax53, ax54, ax55, ax56, \
-               ax57, ax58, ax59, ax60]             
-
-###########################################################################
-###########################################################################
-# Functions for aesthetics.
+    record_phase("parameter parse")
 
-# Function to turn colour number to colour text this can be added to if 
-# required. See matplotlib available colours. If add extra colours increase
-# number for col_max variable.
-def colour (col):
-    if col == 1:
-        return "black"
-    elif col == 2:
-        return "gray"
-    elif col == 3:
-        return "dimgray"
-    elif col == 4:
-        return "darkgray" 
-    elif col == 5:
-        return "slategray"
-    elif col == 6:
-        return "lightgray"
-    elif col == 7:
-        return "red"
-    elif col == 8:
-        return "darkred"
-    elif col == 9:
-        return "orangered" 
-    elif col == 10:
-        return "coral"
-    elif col == 11:
-        return "green"
-    elif col == 12:
-        return "darkgreen"
-    elif col == 13:
-        return "olive"
-    elif col == 14:
-        return "lightgreen"
-    elif col == 15:
-        return "blue"
-    elif col == 16:
-        return "darkblue"
-    elif col == 17:
-        return "lightblue"
-    elif col == 18:
-        return "cyan"
-    elif col == 19:
-        return "yellow"
-    elif col == 20:
-        return "brown"
-    elif col == 21: 
-        return "magenta"
-    elif col == 22:
-        return "orange"
-    elif col == 23:
-        return "white"
-
-# Function to turn line_style number to line_style text. Can be added to 
-# if required.
-def line_styles (style):
-    if style == 1:
-        return "solid"
-    elif style == 2:
-        return "dotted"
-    elif style == 3:
-        return "dashed"
-    elif style == 4:
-        return "dashdot"
-
-# Function to convert marker number to marker type. Can be added to if 
-# required.
-def marker_type (mark):
-    if mark == 1:
-        return "o"
-    elif mark == 2:
-        return "x"
-    elif mark == 3:
-        return "^"
-    elif mark == 4:
-        return "v"
-    elif mark == 5:
-        return "D"
-    elif mark == 6:
-        return "*"
+    ###########################################################################
+    ###########################################################################
+    # Create the individual plots, one for each taxon to be plotted. There is
+    # no limit on the number of taxa but beyond about 60 it is not really 
+    # legible on an A4 piece of paper so a larger figure size will be needed.
 
-# Bold function.
-def bold_on_off (bold):
-    if bold == "ON" or bold == "on" or bold == 1:
-        return "bold"
-    else:
-        return "normal"
-
-###########################################################################
-###########################################################################
-# Create individual plots for zone column if required and then each taxon
-# in turn. Order is dictated by order in the input csv file. Stack plots
-# (only 2  available at present) need to be listed as the last columns
-# of data before the zone column if zones are used.
-for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
-                                      min_list_round, min_list): 
-    # Y major and minor intervals.
-    y_major_int = y_major_int_0
+    # Obtain information re the overall size of figure required and font to be
+    # used throughout changed here from cm to inches.
+    fig_size = [overall_x / 2.54, overall_y / 2.54]
+
+    plt.rcParams.update({'font.family': font_style})
+
+    # Set up each basic plot based on number of taxa to be plotted.
+    diff_list_ratios = [diff_list_ratios_dict[taxon] for taxon in data_list]
+
+    fig = Figure(figsize = fig_size, facecolor = "white", \
+                 edgecolor = "none")
+
+    gs = GridSpec(len(data_list), 1, width_ratios = [1], 
+                  height_ratios = (diff_list_ratios), 
+                  hspace = h_space, 
+                  left = float(par_dict["Overall title gap"]))
+
+    # Function to create the axes for every panel down the GridSpec, one per
+    # taxon (and zones column if used), in the order of data_list. Any number 
+    # of panels can be created.
+    def create_axes(fig, gs, num_panels):
+        return [fig.add_subplot(gs[i]) for i in range(num_panels)]
+
+    ax_list = create_axes(fig, gs, len(data_list))
+
+    # Function to give every panel the same depth (x) axis. The depth limits 
+    # and major and minor tick locations are worked out once for the whole 
+    # figure and each panel is given them as fixed locations. Only the labelled
+    # panel (the first taxon) formats tick labels, all other panels have their
+    # depth labels hidden so are given a null formatter. Matplotlib's own 
+    # sharex is not used as it checks every other panel each time a panel's 
+    # limits are looked at, which is slower than setting each panel directly
+    # once there are many panels.
+    def share_depth_axis(ax_list, labelled_ax):
+        major_locs = ticker.MultipleLocator(x_major_int).tick_values \
+                     (x_limit_top, x_limit_base)
     
-    if y_minor_ticks_on_off == "on":
-        y_minor_int = y_minor_int_0
+        if x_minor_ticks_on_off == "on":
+            minor_locs = ticker.MultipleLocator(x_minor_int).tick_values \
+                         (x_limit_top, x_limit_base)
     
-    plot_type_1 = plot_type[taxon]
+        for graph in ax_list:
+            graph.set_xlim(x_limit_top, x_limit_base)
+            graph.xaxis.set_major_locator(ticker.FixedLocator(major_locs))
+        
+            if x_minor_ticks_on_off == "on":
+                graph.xaxis.set_minor_locator(ticker.FixedLocator(minor_locs))
+            
+            if graph != labelled_ax:
+                graph.xaxis.set_major_formatter(ticker.NullFormatter())
+
+    # Functions to set the depth (x) axis limits, major and minor tick locators
+    # of a panel. If the shared depth axis is used they have already been set 
+    # for all panels, so nothing is done when each panel is created.
+    def set_depth_axis(graph):
+        if share_depth == False:
+            graph.set_xlim(x_limit_top, x_limit_base)
+            graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+
+    def set_depth_minor_locator(graph):
+        if share_depth == False:
+            graph.xaxis.set_minor_locator(ticker.MultipleLocator(x_minor_int))
+
+    if share_depth == True:
+        share_depth_axis(ax_list, ax_list[-1])
+
+    record_phase("axes creation")
+
+    ###########################################################################
+    ###########################################################################
+    # Functions to draw each panel. Each column is first prepared into a panel
+    # holding its resolved style and y axis scaling and is then drawn by the
+    # renderer registered for its graph type. The first taxon panel carries
+    # the depth scale, so its depth labels, depth title and any RC and INT
+    # ages are added afterwards as a separate step.
+
+    # Function to resolve the style and y axis scaling for a panel.
+    def prepare_panel(taxon, graph, min_0, min_1):
+        # Y major and minor intervals.
+        y_major_int = y_major_int_0
+    
+        if y_minor_ticks_on_off == "on":
+            y_minor_int = y_minor_int_0
+        else:
+            y_minor_int = None
+    
+        plot_type_1 = plot_type[taxon]
                 
-    # Bar colour and width for graph types 1 and 2.
-    bar_col_type_1 = bar_col_type[taxon] 
-    bar_col_type_2 = colour(bar_col_type_1) 
-    bar_wid_1 = bar_wid[taxon] 
-    bar_wid_g1_1 = bar_wid_g1[taxon]
+        # Bar colour and width for graph types 1 and 2.
+        bar_col_type_2 = bar_col_type[taxon]
+        bar_wid_1 = bar_wid[taxon] 
+        bar_wid_g1_1 = bar_wid_g1[taxon]
     
-    # Obtain Y title text colour.
-    if title_text_on_off == "on":
-        title_text_col = colour(title_text_colour) 
-
-    # Obtain line style for use if graph types 2,3,4,5.
-    line_type_1 = line_type[taxon] 
-    line_type_2 = line_styles(line_type_1) 
-
-    # Obtain line colour required for taxon if graph types 2,3,4,5.
-    line_colour_type_1 = line_colour_type[taxon] 
-    line_colour_type_2 = colour(line_colour_type_1) 
-
-    # Obtain fill colour required for graph types 2,4.
-    fill_colour_type_1 = fill_colour_type[taxon]
-    fill_colour_type_2 = colour(fill_colour_type_1)
-
-    # Obtain fill colour transparency required for graph types 2,4.
-    fill_trans_type_1 = fill_trans_type[taxon]
-    
-    # Obtain marker type for graph types 5,6.
-    marker_typ_type_1 = marker_typ_type[taxon]
-    marker_typ_type_2 = marker_type(marker_typ_type_1)
-
-    # Obtain marker face colour for graph types 5,6. 
-    marker_f_col_1 =  marker_f_col[taxon]
-    marker_f_col_2 = colour(marker_f_col_1)
-
-    # Obtain marker edge colour for graph types 5,6.
-    marker_e_col_1 = marker_e_col[taxon]
-    marker_e_col_2 = colour(marker_e_col_1)
-
-    # Obtain line widths marker sizes and marker edge widths.
-    line_width_1 = line_width_type[taxon]
-    marker_s_size_1 = marker_s_size[taxon]
-    marker_e_w_wid_1 = marker_e_w_wid[taxon]
-    
-    # Reset the paremeters if the measure is nominated as NON_STD_SCALING.
-    if taxon == non_std_scaling_1:
-        yl_lim = non_std_scaling_y_min_1
-        yu_lim = non_std_scaling_y_max_1
-        graph.set_ylim(yl_lim, yu_lim)
-        y_major_int = non_std_scaling_y_maj_int_1
-        y_minor_int = non_std_scaling_y_min_int_1
-   
-    elif taxon == non_std_scaling_2:
-        yl_lim = non_std_scaling_y_min_2
-        yu_lim = non_std_scaling_y_max_2
-        graph.set_ylim(yl_lim, yu_lim)
-        y_major_int = non_std_scaling_y_maj_int_2
-        y_minor_int = non_std_scaling_y_min_int_2
-            
-    elif taxon == non_std_scaling_3:
-        yl_lim = non_std_scaling_y_min_3
-        yu_lim = non_std_scaling_y_max_3
-        graph.set_ylim(yl_lim, yu_lim)
-        y_major_int = non_std_scaling_y_maj_int_3
-        y_minor_int = non_std_scaling_y_min_int_3
-        
-    elif taxon == non_std_scaling_4:
-        yl_lim = non_std_scaling_y_min_4
-        yu_lim = non_std_scaling_y_max_4
-        graph.set_ylim(yl_lim, yu_lim)
-        y_major_int = non_std_scaling_y_maj_int_4
-        y_minor_int = non_std_scaling_y_min_int_4
-        
-    elif taxon == non_std_scaling_5:
-        yl_lim = non_std_scaling_y_min_5
-        yu_lim = non_std_scaling_y_max_5
-        graph.set_ylim(yl_lim, yu_lim)
-        y_major_int = non_std_scaling_y_maj_int_5
-        y_minor_int = non_std_scaling_y_min_int_5
-    else:
-        yl_lim = np.round(data_2[taxon].min(), decimals =-1)
-        yu_lim = np.round(data_2[taxon].max(), decimals =-1)
-        y_major_int = y_major_int 
+        # Obtain line style for use if graph types 2,3,4,5.
+        line_type_2 = line_type[taxon]
 
-        if yu_lim < data_2[taxon].max():
-            yu_lim = yu_lim + 5 
+        # Obtain line colour required for taxon if graph types 2,3,4,5.
+        line_colour_type_2 = line_colour_type[taxon]
+
+        # Obtain fill colour required for graph types 2,4.
+        fill_colour_type_2 = fill_colour_type[taxon]
+
+        # Obtain fill colour transparency required for graph types 2,4.
+        fill_trans_type_1 = fill_trans_type[taxon]
+    
+        # Obtain marker type for graph types 5,6.
+        marker_typ_type_2 = marker_typ_type[taxon]
+
+        # Obtain marker face colour for graph types 5,6. 
+        marker_f_col_2 = marker_f_col[taxon]
+
+        # Obtain marker edge colour for graph types 5,6.
+        marker_e_col_2 = marker_e_col[taxon]
+
+        # Obtain line widths marker sizes and marker edge widths.
+        line_width_1 = line_width_type[taxon]
+        marker_s_size_1 = marker_s_size[taxon]
+        marker_e_w_wid_1 = marker_e_w_wid[taxon]
+    
+        # Reset the paremeters if the measure is nominated as NSC (see 
+        # nsc_table above).
+        if taxon in nsc_overrides:
+            yl_lim = nsc_overrides[taxon]["y_min"]
+            yu_lim = nsc_overrides[taxon]["y_max"]
             graph.set_ylim(yl_lim, yu_lim)
+            y_major_int = nsc_overrides[taxon]["y_major_int"]
+            y_minor_int = nsc_overrides[taxon]["y_minor_int"]
+        else:
+            yl_lim = np.round(data_2[taxon].min(), decimals =-1)
+            yu_lim = np.round(data_2[taxon].max(), decimals =-1)
+            y_major_int = y_major_int 
+
+            if yu_lim < data_2[taxon].max():
+                yu_lim = yu_lim + 5 
+                graph.set_ylim(yl_lim, yu_lim)
+
+        return {
+                "taxon": taxon,
+                "graph": graph,
+                "min_0": min_0,
+                "min_1": min_1,
+                "plot_type_1": plot_type_1,
+                "y_major_int": y_major_int,
+                "y_minor_int": y_minor_int,
+                "yl_lim": yl_lim,
+                "yu_lim": yu_lim,
+                "bar_col_type_2": bar_col_type_2,
+                "bar_wid_1": bar_wid_1,
+                "bar_wid_g1_1": bar_wid_g1_1,
+                "line_type_2": line_type_2,
+                "line_colour_type_2": line_colour_type_2,
+                "fill_colour_type_2": fill_colour_type_2,
+                "fill_trans_type_1": fill_trans_type_1,
+                "line_width_1": line_width_1,
+                "marker_typ_type_2": marker_typ_type_2,
+                "marker_f_col_2": marker_f_col_2,
+                "marker_e_col_2": marker_e_col_2,
+                "marker_s_size_1": marker_s_size_1,
+                "marker_e_w_wid_1": marker_e_w_wid_1}
+
+    # The highest dpi the figure is saved at, used to decimate the series
+    # (see decimate_series).
+    if decimate == True:
+        if output_format is None:
+            save_formats = read_save_formats(par_dict)
+        else:
+            save_formats = [output_format]
+
+        save_dpi = max(read_png_dpi(par_dict) if save_format == "png" else \
+                       decimate_dpi for save_format in save_formats)
+
+    # Function to give the depths and values of a column (of samples, the
+    # sample matrix of the Input or Extra Input file) to plot on a panel,
+    # decimated to the pixels of depth of the panel if --decimate is used.
+    def panel_series(graph, samples, column):
+        if decimate == False:
+            return samples["Depth"], samples[column]
+
+        pixels = graph.get_position().width * fig.get_figwidth() * save_dpi
+
+        return decimate_series(samples["Depth"], samples[column], \
+                               abs(x_limit_base - x_limit_top) / pixels)
+
+    ###########################################################################
+    # Function to draw the column area for zones. Graph type 0.
+    def draw_zones_column(panel):
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
 
-###########################################################################
-###########################################################################
-    # Create column area for zones if required.
-    if plot_type_1 == 0:
         yl_lim = 0
 
-        graph.set_xlim(x_limit_top, x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
-        
+    
         if y_ticks_l_r == "on" or y_ticks_l_r == "off" :
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = False, width = y_major_tick_wid, \
                               length = y_major_tick_len) 
-            
+        
             if y_minor_ticks_on_off == "on" or \
                 y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True)
-                                  
+                              
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
                               color = colour(zone_x_tick_maj_colour))
-            
+        
             if  x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
                                   color = colour(zone_x_tick_min_colour))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
                 
+                set_depth_minor_locator(graph)
+            
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = False)
-                        
+                    
         if  x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-        
+    
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction = 'out', \
                           labelbottom = False, rotation = x_lab_rot)
@@ -6968,2860 +3532,93 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                           direction = 'out', \
                           labelright = False, labelleft = False, \
                           rotation = y_lab_rot) 
-        
-        for axis in ['top','bottom','left','right']:
-            graph.spines[axis].set_linewidth(zone_boundary_line_width)
-            graph.spines[axis].set_linestyle(line_styles \
-                                             (zone_boundary_line_style))
-            graph.spines[axis].set_color(colour \
-                                         (zone_boundary_line_colour))
-                   
-        if zone_boundary_line_top == "on":
-            graph.spines['top'].set_visible(True)
-        else:
-            graph.spines['top'].set_visible(False)
-
-        if zone_boundary_line_bottom == "on":
-            graph.spines['bottom'].set_visible(True)
-        else:
-            graph.spines['bottom'].set_visible(False)
-            
-        if zone_boundary_line_left == "on":
-            graph.spines['left'].set_visible(True)
-        else:
-            graph.spines['left'].set_visible(False)
-            
-        if zone_boundary_line_right == "on":
-            graph.spines['right'].set_visible(True)
-        else:
-            graph.spines['right'].set_visible(False)
-            
-        graph.tick_params(left = False)
-        graph.tick_params(top = False)
-        graph.tick_params(labelleft = False)
-        graph.tick_params(labelright = False)
-        
-        if x_all_ticks == "on":
-            graph.tick_params(bottom = False)
-            
-        if x_all_ticks == "off":
-            graph.tick_params(bottom = True)
-            
-        if pd.isnull(zone_title) == False:
-            graph.set_ylabel(zone_title, fontsize = zone_title_font, \
-                             rotation = zone_title_rot, \
-                             weight = bold_on_off(zone_title_bold), \
-                             color = colour(zone_title_colour))
-   
-            graph.yaxis.labelpad = y_lab_gap + 5
-        else:
-            graph.set_ylabel(" ", fontsize = zone_title_font, \
-                             rotation = zone_title_rot, \
-                             color = colour(zone_title_colour))
-
-        if zones_on_off == "on":
-            x_limit_diff_adj = x_limit_diff / 100
-                
-            if zone_labels_on_off == "on":
-                for zop, zo in zip(zone_place, zone_labels):
-                    
-                    if x_limit_diff_adj < 0:
-                        graph.text(zop + x_limit_diff_adj - \
-                                   zone_lab_pos_corr, \
-                                   zone_lab_pos / 100, \
-                                   zo, fontsize = zone_lab_font, \
-                                   rotation = zone_lab_rot, color = \
-                                   colour(zone_label_colour), \
-                                   weight = bold_on_off(zone_label_bold))
-                        
-                    if x_limit_diff_adj > 0:
-                        graph.text(zop - x_limit_diff_adj + \
-                                   zone_lab_pos_corr, \
-                                   zone_lab_pos / 100, \
-                                   zo, fontsize = zone_lab_font, \
-                                   rotation = zone_lab_rot, color = \
-                                   colour(zone_label_colour), \
-                                   weight = bold_on_off(zone_label_bold))
-                           
-###########################################################################
-    # Error checking user inputs for taxon aethetics.
-    if plot_type[taxon] > 7 or plot_type[taxon] < 1  and taxon != "Zones":
-        print("")  
-        print(f"\nError in plot type number designation for {taxon} in "
-              "Input file.")
-        sys.exit()
-        
-    if taxa_taxon_c_col[taxon] > col_max or \
-        taxa_taxon_c_col[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot title colour number designation for"
-              f" {taxon} in Input file.")
-        sys.exit()
-        
-    if taxa_taxon_b_bold[taxon] > 1 or \
-        taxa_taxon_b_bold[taxon] < 0 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot title taxon bold designation for {taxon}"
-              " in Input file.")
-        sys.exit()         
-        
-    if taxa_plot_vs_colour[taxon] > col_max or \
-        taxa_plot_vs_colour[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot taxon vertical spine colour number "
-              f"designation for {taxon} in Input file.")
-        sys.exit()      
-        
-    if taxa_plot_vstyle[taxon] > 4 or \
-        taxa_plot_vstyle[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot taxon vertical spine style number "
-              f"designation for {taxon} in Input file.")
-        sys.exit()
-        
-    if taxa_plot_lstyle[taxon] > 4 or \
-        taxa_plot_lstyle[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot taxon left spine style number designation"
-              f" for {taxon} in Input file.")
-        sys.exit()
-        
-    if taxa_plot_rstyle[taxon] > 4 or \
-       taxa_plot_rstyle[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot taxon right spine style number"
-              f" designation for {taxon} in Input file.")
-        sys.exit()
-        
-    if taxa_plot_ls_colour[taxon] > col_max or \
-        taxa_plot_ls_colour[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot taxon left spine colour number"
-              f" designation for {taxon}.")
-        sys.exit()       
-        
-    if taxa_plot_rs_colour[taxon] > col_max or \
-        taxa_plot_rs_colour[taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot taxon right spine colour number"
-              f" designation for {taxon} in Input file.")
-        sys.exit()
-        
-    if taxa_x_tick_maj_colour [taxon] > col_max or \
-        taxa_x_tick_maj_colour [taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot x major tick colour number designation"
-              f" for {taxon} in Input file.")
-        sys.exit()            
-        
-    if taxa_x_tick_min_colour [taxon] > col_max or \
-        taxa_x_tick_min_colour [taxon] < 1 and taxon != "Zones":
-        print("")
-        print(f"\nError in plot x minor tick colour number designation"
-              f" for {taxon} in Input file.")
-        sys.exit() 
-
-###########################################################################
-###########################################################################
-    # Create plot for first taxon to be plotted based on parameter
-    # choices if  graph type is a barplot. Graph type 1.
-    elif taxon == data_list_1 and plot_type_1 == 1:
-
-###########################################################################
-        # Change the Y lim if exaggeration is being used on any plot.
-        # if exag["exag"].max() > 0: 
-        #     if data_2[taxon].max() < 10:
-        #         graph.set_ylim(0, yu_lim + 20)
-        #     else:
-        #         graph.set_ylim(0, yu_lim)
-                
-###########################################################################
-        markerline, stemlines, baseline = graph.stem(data_2["Depth"], \
-                                        data_2[taxon], \
-                                        linefmt = bar_col_type_2, \
-                                        markerfmt = "",  \
-                                        basefmt ="black", \
-                                        bottom = min_0)
-                    
-        if y_ticks_l_r == "on": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = True, \
-                                  color = colour(x_lab_colour))
-                    
-                graph.tick_params(axis = "x", which ='major', \
-                                  direction ='out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = True)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off  == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                    
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))     
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-        
-        if y_ticks_l_r == "off":
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction ='out', \
-                                  labelbottom =True, \
-                                  color = colour(x_lab_colour))
-                    
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction ='out', \
-                                  labelbottom = True, \
-                                  color = colour(x_lab_colour))
-                    
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which ='minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which ='minor', \
-                                  direction = 'out', bottom = False)
-        
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = False, \
-                              right = True, width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))   
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-        
-        graph.set_xlim(x_limit_top,x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-        
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction = 'out', labelright = True, \
-                          labelleft = False, rotation = y_lab_rot)
-        
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth \
-            (taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color \
-            (colour(taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle \
-            (line_styles(taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-        
-        graph.spines['top'].set_visible(False)
-            
-        plt.setp(stemlines, color = bar_col_type_2, \
-                 linewidth = bar_wid_g1_1)
-        plt.setp(markerline, linewidth = 0, color = "black")
-        plt.setp(baseline, linewidth = 0, color = "black")
-        
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-        
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        graph.yaxis.labelpad = y_lab_gap
-        
-        graph.spines['bottom'].set_position(("data", min_0))  
-        
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-        
-###########################################################################
-        # Add annotations for rc dates
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-                    
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom.
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
-
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
-
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
-            
-###########################################################################
-        # Error checking for bar graph type 1.
-        if bar_col_type[taxon] > col_max or \
-            bar_col_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\n Bar colour number designation for {taxon} in"
-                  f" Input file is out of range (1 - {col_max}).")
-            sys.exit()
-        
-###########################################################################
-###########################################################################
-    # Create plot for first taxon to be plotted based on parameter
-    # choices if graph type is lineplot with depth bars. Graph type 2. 
-        
-    elif taxon == data_list_1 and plot_type_1 == 2:
-
-###########################################################################
-        # Adjustments rerquired if exaggeration has been specified.
-        if taxa_exag_type[taxon] == 3:
-            if taxa_exag_line_col[taxon] not in range (1,col_max) \
-                or taxa_exag_ls[taxon] not in range (1,4):
-                    
-                print("  ")
-                print (f"\n exaggeration aesthetics out of bounds for "
-                       f"{taxon} in Input file.")
-                sys.exit()
-                
-            graph.plot(data_2["Depth"], data_2[taxon] * taxa_exag[taxon], \
-                            color = colour(taxa_exag_line_col[taxon]), \
-                            linewidth = taxa_exag_lw[taxon], \
-                            linestyle = line_styles(taxa_exag_ls[taxon]))
-                
-            graph.set_ylim(0, data_2[taxon].max())
     
-            if data_2[taxon].max() < 10:
-                graph.set_ylim(0, yu_lim + 20)
-            else:
-                graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
-                                           decimals =-1))           
-            
-        if taxa_exag_type[taxon] == 4:
-            if taxa_exag_col[taxon] not in range (1, col_max) \
-                or taxa_exag_line_col[taxon] \
-                not in range (1, col_max) or taxa_exag_ls[taxon] \
-                not in range (1, 4) or taxa_exag_trans[taxon] * 100 \
-                not in range (0, 100):
-                
-                print("  ")    
-                print (f"\n Exaggeration aethetics are out of bounds for "
-                       f"{taxon} in Input file.")
-                sys.exit()
-                
-            graph.fill_between(data_2["Depth"], data_2[taxon] * \
-                               taxa_exag[taxon], \
-                               color = colour(taxa_exag_col[taxon]), \
-                               linewidth = taxa_exag_lw[taxon], \
-                               alpha = taxa_exag_trans[taxon])
-                
-            graph.plot(data_2["Depth"],data_2[taxon] * taxa_exag[taxon], \
-                            color = colour(taxa_exag_line_col[taxon]), \
-                            linewidth = taxa_exag_lw[taxon], \
-                            linestyle = line_styles(taxa_exag_ls[taxon]))
-                
-            graph.set_ylim(0, data_2[taxon].max())
-            
-            if data_2[taxon].max() < 10:
-                graph.set_ylim(0, yu_lim + 20)
-            else:
-                graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
-                                           decimals =-1))
-
-###########################################################################
-        graph.fill_between(data_2["Depth"], data_2[taxon], \
-                           color = fill_colour_type_2, \
-                           linewidth = line_width_1, \
-                           alpha = fill_trans_type_1)
-            
-        markerline, stemlines, baseline = \
-            graph.stem(data_2["Depth"], data_2[taxon], 
-                      linefmt = bar_col_type_2, markerfmt = "", 
-                      basefmt = "black", 
-                      bottom = 0)
-  
-        graph.plot(data_2["Depth"], data_2[taxon], \
-                   color =  line_colour_type_2, \
-                   linewidth = line_width_1, linestyle = line_type_2)
-       
-        graph.set_xlim(x_limit_top,x_limit_base)
-        
-        if y_ticks_l_r == "on":
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out' , \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks== "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction ='out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))  
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False) 
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))   
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-        
-        if y_ticks_l_r =="off": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-
-        
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = False, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))      
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-
-        graph.set_xlim(x_limit_top,x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction= 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction = 'out', labelright = True, \
-                          labelleft = False, rotation = y_lab_rot) 
-        
-        graph.spines['bottom'].set_linestyle \
-            (line_styles(taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color \
-            (colour(taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle \
-            (line_styles(taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles\
-                                            (taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth \
-            (taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)          
-                        
-        plt.setp(stemlines, color = bar_col_type_2, linewidth = bar_wid_1)
-        plt.setp(markerline, linewidth = 0, color = "black")
-        plt.setp(baseline, linewidth = 0, color = "black")    
-        
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment ='bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-        graph.yaxis.labelpad = y_lab_gap
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        
-        graph.spines['bottom'].set_position(("data", 0))
-        graph.set_ylim(0, data_2[taxon].max())
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction ='out', \
-                          labelbottom = True, \
-                          rotation = x_lab_rot)
-
-###########################################################################
-        # Add annotations for rc dates.
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom.
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
-
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
-
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
-            
-###########################################################################
-        # Error checking.
-        if bar_col_type[taxon] > col_max or \
-            bar_col_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nBar colour number designation for {taxon} is out"
-                  f" of range (1 - {col_max}) in Input file.")
-            sys.exit()
-            
-        if line_type[taxon] > 4 or \
-            line_type[taxon] < 0  and taxon != "Zones":
-            print("  ")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-    
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1  and taxon != "Zones":
-            print("  ")
-            print(f"\nError in line colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if fill_colour_type[taxon] > col_max or \
-            fill_colour_type[taxon] < 1  and taxon != "Zones":
-            print("  ")
-            print(f"\nError in fill colour number for {taxon} in Input "
-                  "file.")
-            sys.exit() 
-            
-        if fill_trans_type[taxon] > 1 or \
-            fill_trans_type[taxon] < 0  and taxon != "Zones":
-            print("  ")
-            print(f"\nError in fill colour transparency for {taxon} in "
-                  "Input file.")
-            sys.exit()
-
-###########################################################################
-###########################################################################
-    # Create plot for first taxon to be plotted based on parameter choices
-    # if graph type is a line plot Graph type 3.
-    
-    elif taxon == data_list_1 and plot_type_1 == 3:
-        
-###########################################################################
-        # Adjustments required if exaggeration has been specified.
-        if taxa_exag_type[taxon] == 3:
-            if taxa_exag_line_col[taxon] not in range (1, col_max) or \
-                taxa_exag_ls[taxon] not in range (1, 4):
-                print("  ")                    
-                print (f"\nExaggeration aesthetics are out of bounds for "
-                       f"{taxon} in Input file.")
-                sys.exit()
-                
-            graph.plot(data_2["Depth"], data_2[taxon] * \
-                       taxa_exag[taxon], \
-                       color = colour(taxa_exag_line_col[taxon]), \
-                       linewidth = taxa_exag_lw[taxon], \
-                       linestyle = line_styles(taxa_exag_ls[taxon]))
-                
-            graph.set_ylim(0, data_2[taxon].max())
-            
-            if data_2[taxon].max() < 10:
-                graph.set_ylim(0, yu_lim + 20)
-            else:
-                graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
-                                           decimals =-1))   
-        
-        if taxa_exag_type[taxon] == 4:
-            if taxa_exag_col[taxon] not in range (1, col_max) \
-                or taxa_exag_line_col[taxon] not in range (1, col_max) \
-                or taxa_exag_ls[taxon] not in range (1, 4) or \
-                taxa_exag_trans[taxon] * 100 not in range (0, 100):
-                print("  ")                    
-                print (f"\nExaggeration aesthetics out of bounds for"
-                       f" {taxon} in Input file.")
-                sys.exit() 
-                    
-            graph.fill_between(data_2["Depth"], data_2[taxon] * \
-                               taxa_exag[taxon], \
-                               color = colour(taxa_exag_col[taxon]), \
-                               linewidth = taxa_exag_lw[taxon], \
-                               alpha = taxa_exag_trans[taxon])
-                
-            graph.plot(data_2["Depth"], data_2[taxon] * \
-                       taxa_exag[taxon], \
-                       color = colour(taxa_exag_line_col[taxon]), \
-                       linewidth = taxa_exag_lw[taxon], \
-                       linestyle = line_styles(taxa_exag_ls[taxon]))
-                
-            graph.set_ylim(0, data_2[taxon].max())
-            
-            if data_2[taxon].max() < 10:
-                graph.set_ylim(0, yu_lim + 20)
-            else:
-                graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
-                                           decimals =-1)) 
-                
-###########################################################################
-        graph.fill_between(data_2["Depth"], data_2[taxon], \
-                           color = "white", linewidth = 0, alpha = 1)
-        
-        graph.plot(data_2["Depth"], data_2[taxon], \
-                   color =  line_colour_type_2, \
-                   linewidth = line_width_1, \
-                   linestyle = line_type_2)
-            
-        graph.set_xlim(x_limit_top, x_limit_base)
-        
-        if y_ticks_l_r == "on":  
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction= 'out', labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction ='out', labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon])) 
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which ='minor', \
-                                  direction = 'out', bottom = False)
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))   
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-
-        if y_ticks_l_r == "off": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction ='out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))   
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                    
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False) 
-        
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = False, \
-                              right = True, width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))        
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-        
-        graph.set_xlim(x_limit_top, x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction = 'out', labelright = True, \
-                          labelleft = False, rotation = y_lab_rot) 
-            
-        graph.spines['bottom'].set_linestyle \
-            (line_styles(taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth \
-            (taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color\
-            (colour(taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle \
-            (line_styles(taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth \
-            (taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle \
-            (line_styles(taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)          
-            
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        graph.yaxis.labelpad = y_lab_gap
-        graph.spines['bottom'].set_position(("data", 0))
-        
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-        
-###########################################################################
-        # Add annotations for rc dates.
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-                    
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom.
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
-
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
-
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
-            
-            
-###########################################################################
-        # Error checking for graph type 3.
-        if line_type[taxon] > 4 or \
-            line_type[taxon] < 1 and taxon != "Zones":
-            print("")
-            print(f"\nError in line type number {taxon} in Input file.")
-            sys.exit()
-            
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1  and taxon != "Zones":
-            print("")
-            print(f"\nError in line colour number for {taxon} in "
-                  "Input file.")
-            sys.exit()
-
-###########################################################################
-    # Create plot for first taxon to be plotted based on parameter 
-    # choices if graph type is a line plot with solid shading below 
-    # line. Graph type 4.    
-    
-    elif taxon == data_list_1 and plot_type_1 == 4:
-        
-###########################################################################
-        # Adjustments required if exaggeration has been specified.
-        if taxa_exag_type[taxon] == 3:
-            
-            if taxa_exag_line_col[taxon] not in range (1, col_max) or \
-                taxa_exag_ls[taxon] not in range (1, 4):
-                print("  ")                    
-                print (f"\nExaggeration aesthetics are out of bounds for "
-                       f"{taxon} in Input file.")
-                sys.exit()
-            
-            graph.plot(data_2["Depth"], data_2[taxon] * \
-                       taxa_exag[taxon], \
-                       color = colour(taxa_exag_line_col[taxon]), \
-                       linewidth = taxa_exag_lw[taxon], \
-                       linestyle = line_styles(taxa_exag_ls[taxon]))
-                
-            graph.set_ylim(0, data_2[taxon].max())
-            
-            if data_2[taxon].max() < 10:
-                graph.set_ylim(0, yu_lim + 20)
-            else:
-                graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
-                                           decimals =-1))   
-
-        if taxa_exag_type[taxon] == 4:
-            if taxa_exag_col[taxon] not in range (1, col_max) \
-                or taxa_exag_line_col[taxon] not in range (1, col_max) \
-                or taxa_exag_ls[taxon] not in range (1, 4) or \
-                taxa_exag_trans[taxon] * 100 not in range (0, 100):
-                print("  ")                    
-                print (f"\nExaggeration aesthetics are out of bounds for "
-                       f"{taxon} in Input file.")
-                sys.exit() 
-                    
-            graph.fill_between(data_2["Depth"], data_2[taxon] * \
-                               taxa_exag[taxon], \
-                               color = colour(taxa_exag_col[taxon]), \
-                               linewidth = taxa_exag_lw[taxon], \
-                               alpha = taxa_exag_trans[taxon])
-                
-            graph.plot(data_2["Depth"], data_2[taxon] * \
-                       taxa_exag[taxon], \
-                       color = colour(taxa_exag_line_col[taxon]), \
-                       linewidth = taxa_exag_lw[taxon], \
-                       linestyle = line_styles(taxa_exag_ls[taxon]))
-                
-            graph.set_ylim(0, data_2[taxon].max())
-            
-            if data_2[taxon].max() < 10:
-                graph.set_ylim(0, yu_lim + 20)
-            else:
-                graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
-                                           decimals =-1))
-                
-###########################################################################
-        graph.fill_between(data_2["Depth"], data_2[taxon], \
-                           color = fill_colour_type_2, \
-                           linewidth = line_width_1, \
-                           alpha = fill_trans_type_1)
-            
-        graph.plot(data_2["Depth"], data_2[taxon], \
-                   color = line_colour_type_2, \
-                   linewidth = line_width_1, linestyle = line_type_2)
-        
-        graph.set_xlim(x_limit_top, x_limit_base)
-
-        if y_ticks_l_r == "on": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which ='major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-                    
-        if y_ticks_l_r == "off":
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', labelbottom = False)
-                
-                graph.tick_params(axis = "x",which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon])) 
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False,\
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction ='out', bottom = False)
-        
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = False, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                                             [taxon]))
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width = x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-        
-        graph.set_xlim(x_limit_top,x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction = 'out', labelright = True, \
-                          labelleft = False, rotation = y_lab_rot) 
-
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)          
-            
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        graph.yaxis.labelpad = y_lab_gap
-        graph.spines['bottom'].set_position(("data", 0))
-        
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-        
-###########################################################################
-        # Add annotations for rc dates.
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-                    
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
-
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
-
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
-            
-###########################################################################
-        # Error checking for graph type 4.
-        if line_type[taxon] > 4 or \
-            line_type[taxon] < 0 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in line colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if fill_colour_type[taxon] > col_max or \
-            fill_colour_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in fill colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-
-        if fill_trans_type[taxon] > 1 or \
-            fill_trans_type[taxon] < 0 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in fill colour transparency for {taxon} in"
-                  " Input file.")
-            sys.exit()
-
-###########################################################################
-###########################################################################
-    # Create plot for taxon to be plotted based on parameter chouces if
-    # graph type is a line and marker plot. Graph type 5.
-    
-    elif taxon == data_list_1 and plot_type_1 == 5:
-        
-###########################################################################
-        # Adjustments required if exaggeration has been specified to any
-        # plot.
-        # if exag["exag"].max() > 0: 
-        #     if data_2[taxon].max() < 10:
-        #         graph.set_ylim(0, yu_lim + 20)
-        #     else:
-        #         graph.set_ylim(0, yu_lim)
-
-###########################################################################
-        graph.plot(data_2["Depth"], data_2[taxon], \
-                   color = line_colour_type_2, \
-                   linewidth = line_width_1, \
-                   linestyle = line_type_2, \
-                   marker = marker_typ_type_2, \
-                   ms = marker_s_size_1, \
-                   markeredgecolor = marker_e_col_2, \
-                   markerfacecolor = marker_f_col_2, \
-                   markeredgewidth = marker_e_w_wid_1)
-       
-        graph.set_xlim(x_limit_top, x_limit_base)
-        
-        if y_ticks_l_r == "on":
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom =False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction ='out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))  
-
-            if y_minor_ticks_on_off == "on":
-                
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len,\
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))  
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-        
-        if y_ticks_l_r == "off": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len,\
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length= x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-        
-            graph.tick_params(axis = "y", which='major', \
-                              direction= 'out', \
-                              left = False, right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len,\
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon])) 
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-        
-        graph.set_xlim(x_limit_top, x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction ='out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction = 'out', labelright = True, \
-                          labelleft = False, rotation = y_lab_rot) 
-   
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour \
-                                              [taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)
-        
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        graph.yaxis.labelpad = y_lab_gap
-        graph.spines['bottom'].set_position(("data", min_0))
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-        
-###########################################################################
-        # Add annotations for rc dates.
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-                    
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom.
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
-
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
-
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
-            
-###########################################################################
-        # Error checking for graph type 5.
-        if line_type[taxon] > 4 or \
-            line_type[taxon] < 0 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in line colour number {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if marker_typ_type[taxon] > 6 or \
-            marker_typ_type[taxon] < 1  and taxon != "Zones":
-            print("  ")
-            print(f"\nError in marker type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-
-        if marker_f_col[taxon] > col_max or \
-            marker_f_col[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in marker colour fill number for {taxon} in "
-                  " Input file.")
-            sys.exit()
-
-        if marker_e_col[taxon] > col_max or \
-            marker_f_col[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in marker edge colour number for {taxon} in "
-                  "Input file.")
-            sys.exit()                
-
-###########################################################################
-###########################################################################
-    # Create plot for taxon to be plotted based on parameter choices if
-    # graph type is a scatter plot. Graph type 6.
-        
-    elif taxon == data_list_1 and plot_type_1 == 6:
-        
-###########################################################################
-        # Adjustments required if exaggeration has been specified to any
-        # plot.
-        # if exag["exag"].max() > 0: 
-        #     if data_2[taxon].max() < 10:
-        #         graph.set_ylim(0, yu_lim + 20)
-        #     else:
-        #         graph.set_ylim(0, yu_lim)
-                
-###########################################################################
-        graph.plot(data_2["Depth"], data_2[taxon], \
-                   linewidth = 0, \
-                   marker = marker_typ_type_2, \
-                   ms = marker_s_size_1, \
-                   markeredgecolor = marker_e_col_2, \
-                   markerfacecolor = marker_f_col_2, \
-                   markeredgewidth = marker_e_w_wid_1)
-       
-        graph.set_xlim(x_limit_top, x_limit_base)
-        
-        if y_ticks_l_r == "on":
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))
-                
-            if x_all_ticks== "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction ='out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))  
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False,
-                                  right = False)
-                
-            if  x_minor_ticks_on_off =="on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))    
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width = x_major_tick_wid, \
-                              length = x_major_tick_len)
-        
-        if y_ticks_l_r == "off": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x",which ='major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len)
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off =="on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False) 
-        
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = False, \
-                              right = True, \
-                              width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))      
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-        
-        graph.set_xlim(x_limit_top, x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction ='out', labelright = True, \
-                              labelleft = False, rotation = y_lab_rot) 
-
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour \
-                                       (taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour \
-                                        (taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)            
-        
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation =y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        graph.yaxis.labelpad = y_lab_gap
-        graph.spines['bottom'].set_position(("data", min_0))
-        
-        graph.tick_params(axis = "x" ,labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-        
-###########################################################################
-        # Add annotations for rc dates.
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-                    
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
-
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
-
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
-            
-###########################################################################
-        # Error checking for graph type 6.
-        if marker_typ_type[taxon] > 6 or \
-            marker_typ_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in marker type number for {taxon} in Input "
-                  "file.")
-            sys.exit() 
-            
-        if marker_f_col[taxon] > col_max or \
-            marker_f_col[taxon]< 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in marker fill colour number for {taxon} in "
-                  "Input file.")
-            sys.exit()
-
-        if marker_e_col[taxon] > col_max or \
-            marker_f_col[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nError in marker type edge colour number for {taxon}"
-                  " in Input file.")
-            sys.exit()                
-
-###########################################################################
-###########################################################################
-    # Create plot for taxon to be plotted based on parameter choices. If
-    # graphtype is one of the two possible stack graphs. Graph type 7.    
-        
-    elif taxon == data_list_1 and plot_type_1 == 7:
-        
-###########################################################################
-        # Alter if percentage has been calculated.
-        if num_stack == 1:
-            stack_colours_1 = [colour(x) for x in stack_plot_1_colours]
-            if stack_calc_1 == "yes":
-                graph.stackplot(data_2["Depth"], stack_1_sums_1_calc, \
-                                stack_1_sums_2_calc, stack_1_sums_3_calc, \
-                                stack_1_sums_4_calc, stack_1_sums_5_calc, \
-                                colors = stack_colours_1)
-                
-            graph.stackplot(data_2["Depth"], stack_1_sums_1, \
-                                             stack_1_sums_2, \
-                                             stack_1_sums_3, \
-                                             stack_1_sums_4, \
-                                             stack_1_sums_5, \
-                                             colors = stack_colours_1)
-           
-        if num_stack == 2:
-            stack_colours_2 = [colour(x) for x in stack_plot_2_colours]
-            if stack_calc_2 == "yes":
-                graph.stackplot(data_2["Depth"], stack_2_sums_1_calc, \
-                                                 stack_2_sums_2_calc, \
-                                                 stack_2_sums_3_calc, \
-                                                 stack_2_sums_4_calc, \
-                                                 stack_2_sums_5_calc, \
-                                                 colors = stack_colours_1)
-            
-            graph.stackplot(data_2["Depth"], stack_2_sums_1, \
-                            stack_2_sums_2, stack_2_sums_3, \
-                            stack_2_sums_4, stack_2_sums_5, \
-                            colors = stack_colours_2)
-
-###########################################################################
-        graph.set_xlim(x_limit_top, x_limit_base)
-        
-        if y_ticks_l_r == "on":
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                                 [taxon]))  
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = True, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-               
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length =x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if  x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-                    
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = True, \
-                              right = True, width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))  
-                
-            graph.tick_params(axis = "x", which = 'major', \
-                              direction = 'out', bottom = True, \
-                              width =  x_major_tick_wid, \
-                              length = x_major_tick_len)
-                    
-        if y_ticks_l_r == "off": 
-            if x_all_ticks == "on":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len, \
-                                  color = colour(taxa_x_tick_maj_colour \
-                                  [taxon]))
-                
-            if x_all_ticks == "off":
-                graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                                  direction = 'out', \
-                                  labelbottom = False)
-                
-                graph.tick_params(axis = "x", which = 'major', \
-                                  direction ='out', bottom = True, \
-                                  width = x_major_tick_wid, \
-                                  length = x_major_tick_len)
-                
-            if y_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction = 'out', left = False, \
-                                  right = True, \
-                                  width = y_minor_tick_wid, \
-                                  length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.yaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (y_minor_int))
-                
-            if y_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "y", which = 'minor', \
-                                  direction ='out', left = False, \
-                                  right = False)
-                
-            if x_minor_ticks_on_off == "on":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = True, \
-                                  width = x_minor_tick_wid, \
-                                  length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
-            if x_minor_ticks_on_off == "off":
-                graph.tick_params(axis = "x", which = 'minor', \
-                                  direction = 'out', bottom = False)
-        
-            graph.tick_params(axis = "y", which = 'major', \
-                              direction = 'out', left = False, \
-                              right = True, width = y_major_tick_wid, \
-                              length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))      
-                
-            graph.tick_params(axis = "x", which ='major', \
-                              direction = 'out', bottom = True, \
-                              width = x_major_tick_wid, \
-                              length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-        
-        graph.set_xlim(x_limit_top, x_limit_base)
-        
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
-        graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int)) 
-
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-
-        graph.tick_params(axis = "y", labelsize = y_lab_font, \
-                          direction = 'out', labelright = True, \
-                          labelleft = False, rotation = y_lab_rot) 
-
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
-        graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
-        graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)            
-        
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.2, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
-                         rotation = x_title_rotation, \
-                         color = colour(x_title_text_colour), \
-                         weight = bold_on_off(x_title_text_bold))
-            
-        graph.yaxis.labelpad = y_lab_gap
-        graph.spines['bottom'].set_position(("data", min_0)) 
-        
-        graph.tick_params(axis = "x", labelsize = x_lab_font, \
-                          direction = 'out', labelbottom = True, \
-                          rotation = x_lab_rot)
-        
-        num_stack = num_stack + 1
-        
-###########################################################################
-        # Add annotations for rc dates.
-        if rc_ages_on_off == "on":
-            if rc_age_labels_bold == "on":
-                rc_age_labels_bold = "bold"
-            else:
-                rc_age_labels_bold = "normal"
-                
-            if rc_age_title_on_off == "on":
-                if rc_age_title_bold == "on":
-                    rc_age_title_bold = "bold"
-                else:
-                    rc_age_title_bold = "normal" 
-                
-            for label,depth in zip(rc_age_labels, rc_age_depths):
-                
-                graph.annotate(label, textcoords = "data", \
-                               xy = (depth, rc_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = rc_age_labels_bold, \
-                               fontsize = rc_age_labels_font_size, \
-                               color = colour(rc_age_labels_colour))
-                    
-            if rc_age_title_on_off == "on": 
-                graph.annotate(rc_age_title, textcoords = "data", \
-                               xy = (rc_age_title_depth, \
-                               rc_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = rc_age_title_rotation, \
-                               fontsize = rc_age_title_font_size, \
-                               color = colour(rc_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = rc_age_title_bold)
-                    
-###########################################################################
-        # Add annotations for int dates. Date line.
-        if int_ages_on_off == "on":
-            if int_age_labels_bold == "on":
-                int_age_labels_bold = "bold"
-            else:
-                int_age_labels_bold = "normal"
-                
-            if int_age_title_on_off == "on":
-                if int_age_title_bold == "on":
-                    int_age_title_bold = "bold"
-                else:
-                    int_age_title_bold = "normal"
-            
-            for label,depth in zip(int_age_labels, int_age_depths):
-                
-                graph.annotate(label,textcoords = "data", \
-                               xy = (depth, int_age_location_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_labels_rotation, \
-                               ha = "center", va = "center", \
-                               weight = int_age_labels_bold,\
-                               fontsize = int_age_labels_font_size, \
-                               color = colour(int_age_labels_colour))
-
-            graph.annotate(int_umd_age, textcoords ="data", \
-                           xy = (x_limit_top, int_age_location_offset),\
-                           annotation_clip =False, \
-                           rotation = int_age_labels_rotation, \
-                           ha = "center", va = "center", \
-                           weight = int_age_labels_bold, \
-                           fontsize = int_age_labels_font_size,\
-                           color = colour(int_age_labels_colour))
-                
-            if int_age_title_on_off == "on":
-                graph.annotate(int_age_title,textcoords ="data", \
-                               xy = (int_age_title_depth, \
-                               int_age_title_offset), \
-                               annotation_clip = False, \
-                               rotation = int_age_title_rotation, \
-                               fontsize = int_age_title_font_size, \
-                               color = colour(int_age_title_colour), \
-                               ha = "right", va = "center", \
-                               weight = int_age_title_bold)
-
-            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
-                           int_lines_offset), xycoords = 'data', \
-                           xytext = (x_limit_base + \
-                           int_lines_corr_l, \
-                           int_lines_offset), arrowprops = \
-                           dict(arrowstyle = "-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)
-
-            for depth in int_age_depths:
-                
-                # All depth marker lines except top and bottom.
-                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
-                              int_lines_corr), xycoords= 'data', \
-                              xytext = (depth, int_lines_offset - \
-                              int_lines_depth_length), \
-                              arrowprops = dict(arrowstyle ="-", \
-                              color = colour(int_lines_colour), \
-                              linewidth = int_lines_width), \
-                              annotation_clip = False)
+        for axis in ['top','bottom','left','right']:
+            graph.spines[axis].set_linewidth(zone_boundary_line_width)
+            graph.spines[axis].set_linestyle(line_styles \
+                                             (zone_boundary_line_style))
+            graph.spines[axis].set_color(colour \
+                                         (zone_boundary_line_colour))
+               
+        if zone_boundary_line_top == "on":
+            graph.spines['top'].set_visible(True)
+        else:
+            graph.spines['top'].set_visible(False)
 
-            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_top + 1, int_lines_offset - \
-                           int_lines_depth_length), \
-                           arrowprops = dict(arrowstyle ="-", \
-                           color = colour(int_lines_colour), \
-                           linewidth = int_lines_width), \
-                           annotation_clip = False)            
+        if zone_boundary_line_bottom == "on":
+            graph.spines['bottom'].set_visible(True)
+        else:
+            graph.spines['bottom'].set_visible(False)
+        
+        if zone_boundary_line_left == "on":
+            graph.spines['left'].set_visible(True)
+        else:
+            graph.spines['left'].set_visible(False)
+        
+        if zone_boundary_line_right == "on":
+            graph.spines['right'].set_visible(True)
+        else:
+            graph.spines['right'].set_visible(False)
+        
+        graph.tick_params(left = False)
+        graph.tick_params(top = False)
+        graph.tick_params(labelleft = False)
+        graph.tick_params(labelright = False)
+    
+        if x_all_ticks == "on":
+            graph.tick_params(bottom = False)
+        
+        if x_all_ticks == "off":
+            graph.tick_params(bottom = True)
+        
+        if pd.isnull(zone_title) == False:
+            graph.set_ylabel(zone_title, fontsize = zone_title_font, \
+                             rotation = zone_title_rot, \
+                             weight = bold_on_off(zone_title_bold), \
+                             color = colour(zone_title_colour))
+   
+            graph.yaxis.labelpad = y_lab_gap + 5
+        else:
+            graph.set_ylabel(" ", fontsize = zone_title_font, \
+                             rotation = zone_title_rot, \
+                             color = colour(zone_title_colour))
 
-            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
-                           5 + int_lines_corr), xycoords = 'data', \
-                           xytext = (x_limit_base - 1, int_lines_offset - \
-                           int_lines_depth_length), arrowprops = \
-                           dict(arrowstyle = "-", color = \
-                           colour(int_lines_colour), linewidth = \
-                           int_lines_width), annotation_clip = False)
+        if zones_on_off == "on":
+            x_limit_diff_adj = x_limit_diff / 100
             
-###########################################################################
-###########################################################################
-    # Create plot for taxon (not first) to be plotted based on parameter 
-    # choices if graph type is a bar plot. Graph type 1. 
-    elif plot_type_1 == 1 and taxon != data_list_1:
-        
-###########################################################################
+            if zone_labels_on_off == "on":
+                for zop, zo in zip(zone_place, zone_labels):
+                
+                    if x_limit_diff_adj < 0:
+                        graph.text(zop + x_limit_diff_adj - \
+                                   zone_lab_pos_corr, \
+                                   zone_lab_pos / 100, \
+                                   zo, fontsize = zone_lab_font, \
+                                   rotation = zone_lab_rot, color = \
+                                   colour(zone_label_colour), \
+                                   weight = bold_on_off(zone_label_bold))
+                    
+                    if x_limit_diff_adj > 0:
+                        graph.text(zop - x_limit_diff_adj + \
+                                   zone_lab_pos_corr, \
+                                   zone_lab_pos / 100, \
+                                   zo, fontsize = zone_lab_font, \
+                                   rotation = zone_lab_rot, color = \
+                                   colour(zone_label_colour), \
+                                   weight = bold_on_off(zone_label_bold))
+
+    ###########################################################################
+    # Function to draw a taxon as a bar plot. Graph type 1.
+    def draw_bar_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        min_0 = panel["min_0"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        bar_col_type_2 = panel["bar_col_type_2"]
+        bar_wid_g1_1 = panel["bar_wid_g1_1"]
+
+    ###########################################################################
         # Adjustments required if exaggeration has been specified to any
         # plot.
         # if exag["exag"].max() > 0: 
@@ -9829,17 +3626,18 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         #         graph.set_ylim(0, yu_lim + 20)
         #     else:
         #         graph.set_ylim(0, yu_lim)
-                
-###########################################################################
-        markerline, stemlines, baseline = graph.stem(data_2["Depth"], 
-                                          data_2[taxon], 
-                                          linefmt = bar_col_type_2, 
-                                          markerfmt = "", 
-                                          basefmt="black",
-                                          bottom = min_0)   
+            
+    ###########################################################################
+        # Draw the depth bars as one line collection, skipping samples with
+        # zero height.
+        bar_depths = data_2["Depth"].to_numpy()
+        bar_heights = data_2[taxon].to_numpy()
+        bar_on = bar_heights != min_0
+
+        graph.vlines(bar_depths[bar_on], min_0, bar_heights[bar_on], \
+                     colors = bar_col_type_2, linewidth = bar_wid_g1_1)
 
-        graph.set_xlim(x_limit_top, x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
 
         if y_ticks_l_r =="on":
@@ -9847,46 +3645,42 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon])) 
-            
+                              color = taxa_y_tick_maj_colour[taxon]) 
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                   graph.tick_params(axis = "y", which = 'minor', \
                                     direction = 'out', left = False, \
                                     right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
@@ -9895,40 +3689,36 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_x_tick_maj_colour[taxon])
+        
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                    
+                                  color = taxa_x_tick_min_colour[taxon])
+                
+                set_depth_minor_locator(graph)
+                
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction='out', bottom = False)
-                        
+                    
         if x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))            
-                            
+                              color = taxa_x_tick_maj_colour[taxon])
+                        
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction = 'out', labelbottom = False, \
                           rotation = x_lab_rot)
@@ -9936,101 +3726,79 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         graph.tick_params(axis = "y", labelsize = y_lab_font, \
                           direction = 'out', labelright = True, \
                           labelleft = False, rotation = y_lab_rot) 
-            
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
         
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
+        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
+    
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-        
-        plt.setp(stemlines, color= bar_col_type_2, \
-                 linewidth = bar_wid_g1_1)
-        plt.setp(markerline, linewidth = 0, color = "black")
-        plt.setp(baseline, linewidth = 0, color = "black") 
-            
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
+    
         graph.spines['top'].set_visible(False)
 
         graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
                          rotation = y_title_rotation, \
                          verticalalignment = 'bottom', y = 0.2, \
                          ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
 
         graph.yaxis.labelpad = y_lab_gap
         graph.spines['bottom'].set_position(('data', 0))
 
-###########################################################################
-        # Error checking for bar graph type 1.
-        if bar_col_type[taxon] > col_max or \
-            bar_col_type[taxon] < 1 and taxon != "Zones":
-            print("  ")
-            print(f"\nBar colour number designation for {taxon} in "
-                  f"Input file is out of range (1 - {col_max}).")
-            sys.exit()
-            
-###########################################################################
-    # Create plot for taxon (not first) to be plotted based on parameter 
-    # choices if graph type is line plot with depth bars. Graph type 2.
-    elif plot_type_1 == 2 and taxon != data_list_1: 
-
-###########################################################################
+    ###########################################################################
+    # Function to draw a taxon as a line plot with depth bars. Graph type 2.
+    def draw_bar_line_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        yu_lim = panel["yu_lim"]
+        bar_col_type_2 = panel["bar_col_type_2"]
+        bar_wid_1 = panel["bar_wid_1"]
+        line_type_2 = panel["line_type_2"]
+        line_colour_type_2 = panel["line_colour_type_2"]
+        fill_colour_type_2 = panel["fill_colour_type_2"]
+        fill_trans_type_1 = panel["fill_trans_type_1"]
+        line_width_1 = panel["line_width_1"]
+        depths, values = panel_series(graph, data_2, taxon)
+
+    ###########################################################################
         # Adjustments required if exaggeration has been specified.
         if taxa_exag_type[taxon] == 3:
-            if taxa_exag_line_col[taxon] not in range (1, col_max) or \
-                taxa_exag_ls[taxon] not in range (1, 4):
-                print("  ")
-                print (f"\nExaggeration aesthetics in Input file are "
-                       f"out of bounds for {taxon}.")
-                sys.exit() 
-                
-            graph.plot(data_2["Depth"], data_2[taxon] * taxa_exag[taxon], \
-                            color = colour(taxa_exag_line_col[taxon]), \
+            graph.plot(depths, values * taxa_exag[taxon], \
+                            color = taxa_exag_line_col[taxon], \
                             linewidth = taxa_exag_lw[taxon], \
-                            linestyle = line_styles(taxa_exag_ls[taxon]))
-                
+                            linestyle = taxa_exag_ls[taxon])
+            
             graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                        decimals =-1))   
             #graph.set_ylim(0, data_2[taxon].max())
-            
+        
             if data_2[taxon].max() < 10:
                 graph.set_ylim(0, yu_lim + 20)
             else:
                 graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                            decimals =-1))       
-                    
-        if taxa_exag_type[taxon] == 4:
-            if taxa_exag_col[taxon] not in range (1, col_max) or \
-               taxa_exag_line_col[taxon] not in range (1, col_max) \
-               or taxa_exag_ls[taxon] not in range (1, 4) or \
-               taxa_exag_trans[taxon] * 100 not in range (0, 100):
-                print("  ")                    
-                print (f"\nExaggeration aesthetics are out of bounds for "
-                       f"{taxon} in Input file.")
-                sys.exit()                  
                 
-            graph.fill_between(data_2["Depth"], data_2[taxon] * \
+        if taxa_exag_type[taxon] == 4:
+            graph.fill_between(depths, values * \
                                taxa_exag[taxon], \
-                               color = colour(taxa_exag_col[taxon]), \
+                               color = taxa_exag_col[taxon], \
                                linewidth = taxa_exag_lw[taxon], \
                                alpha = taxa_exag_trans[taxon])
-                
-            graph.plot(data_2["Depth"], data_2[taxon] * \
+            
+            graph.plot(depths, values * \
                        taxa_exag[taxon], \
-                       color = colour(taxa_exag_line_col[taxon]), \
+                       color = taxa_exag_line_col[taxon], \
                        linewidth = taxa_exag_lw[taxon], \
-                       linestyle = line_styles(taxa_exag_ls[taxon]))
-            
+                       linestyle = taxa_exag_ls[taxon])
+        
             graph.set_ylim(0, new_max_taxa_dict[taxon]) 
 
             if data_2[taxon].max() < 10:
@@ -10039,75 +3807,69 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                 graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                            decimals =-1))  
 
-###########################################################################
-        graph.fill_between(data_2["Depth"], data_2[taxon], \
+    ###########################################################################
+        graph.fill_between(depths, values, \
                            color = fill_colour_type_2, \
                            linewidth = line_width_1, \
                            alpha = fill_trans_type_1)
-            
-        markerline, stemlines, baseline = graph.stem(data_2["Depth"], 
-                                          data_2[taxon], 
+        
+        markerline, stemlines, baseline = graph.stem(depths, 
+                                          values, 
                                           linefmt = bar_col_type_2, 
                                           markerfmt = "", 
                                           basefmt = "black", 
                                           bottom = 0)
-            
-        graph.plot(data_2["Depth"],
-                   data_2[taxon], 
+        
+        graph.plot(depths,
+                   values, 
                    color = line_colour_type_2,
                    linewidth = line_width_1,
                    linestyle = line_type_2)
-       
-        graph.set_xlim(x_limit_top, x_limit_base)
-
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+   
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
-        
+    
         if y_ticks_l_r == "on":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon])) 
-            
+                              color = taxa_y_tick_maj_colour[taxon]) 
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
@@ -10116,24 +3878,21 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
+                              color = taxa_x_tick_maj_colour[taxon])
 
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
+                                  color = taxa_x_tick_min_colour[taxon])
+                
+                set_depth_minor_locator(graph)
 
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
@@ -10147,8 +3906,7 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                               direction = 'out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len,\
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))            
+                              color = taxa_x_tick_maj_colour[taxon])
 
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction='out', labelbottom = False, \
@@ -10158,140 +3916,107 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                           direction='out', labelright =True, \
                           labelleft = False, rotation = y_lab_rot) 
 
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
         graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
 
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
 
         plt.setp(stemlines, color= bar_col_type_2, linewidth = bar_wid_1)
         plt.setp(markerline, linewidth = 0, color = "black")
         plt.setp(baseline, linewidth = 0, color = "black") 
-            
+        
         graph.spines['top'].set_visible(False)
 
         graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
                          rotation = y_title_rotation, \
                          verticalalignment = 'bottom', y = 0.0, \
                          ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.yaxis.labelpad = y_lab_gap
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
         
+        graph.yaxis.labelpad = y_lab_gap
+    
         graph.spines['bottom'].set_position(("data", 0)) 
         if taxa_exag_type[taxon] == 0:
             graph.set_ylim(0, data_2[taxon].max())
-        # Error checking.
-        if bar_col_type[taxon] > col_max or \
-            bar_col_type[taxon] < 1 and taxon != "Zones":
-            print("")
-            print(f"\nBar colour number designation for {taxon} in Input "
-                  f"file is out of range (1 - {col_max}).")
-            sys.exit()
-
-        if line_type[taxon] > 4 or \
-            line_type[taxon] < 1 and taxon != "Zones":
-            print("")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1  and taxon != "Zones":
-            print("")
-            print(f"\nError in line colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
 
-###########################################################################
-    # Create plot for taxon (not first) to be plotted based on parameter 
-    # choices if graph type is line plot. Graph type 3.
-    elif plot_type_1 == 3 and taxon != data_list_1: 
-              
-        graph.plot(data_2["Depth"], data_2[taxon], \
+    ###########################################################################
+    # Function to draw a taxon as a line plot. Graph type 3.
+    def draw_line_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        yu_lim = panel["yu_lim"]
+        line_type_2 = panel["line_type_2"]
+        line_colour_type_2 = panel["line_colour_type_2"]
+        line_width_1 = panel["line_width_1"]
+        depths, values = panel_series(graph, data_2, taxon)
+
+        graph.plot(depths, values, \
                    color = line_colour_type_2, \
                    linewidth = line_width_1, linestyle = line_type_2)
 
-###########################################################################
+    ###########################################################################
         # Adjustments required if exaggeration has been specified.
         if taxa_exag[taxon] > 0 and pd.isnull(taxa_exag[taxon]) == False:
             if taxa_exag_type[taxon] == 3:
-                if taxa_exag_line_col[taxon] not in range (1, col_max) \
-                    or taxa_exag_ls[taxon] not in range (1, 4):
-                    print("  ")                    
-                    print (f"\nExaggeration aesthetics are out of bounds"
-                           f" for {taxon} in Input file.")
-                    sys.exit()
-
-                graph.plot(data_2["Depth"], data_2[taxon] * \
+                graph.plot(depths, values * \
                            taxa_exag[taxon], \
-                           color = colour(taxa_exag_line_col[taxon]), \
+                           color = taxa_exag_line_col[taxon], \
                            linewidth = taxa_exag_lw[taxon], \
-                           linestyle = line_styles(taxa_exag_ls[taxon]))
+                           linestyle = taxa_exag_ls[taxon])
 
                 graph.set_ylim(0, data_2[taxon].max())
-                print(taxon)
                 if data_2[taxon].max() < 10:
                     graph.set_ylim(0, yu_lim + 20)
                 else:
                     graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                            decimals =-1)) 
-                    
+                
             if taxa_exag_type[taxon] == 4:
-                if taxa_exag_col[taxon] not in range (1, col_max) or \
-                    taxa_exag_line_col[taxon] not in range (1, col_max) \
-                    or taxa_exag_ls[taxon] not in range (1, 4) or \
-                    taxa_exag_trans[taxon] * 100 not in range (0, 100):
-                    print("  ")                    
-                    print (f"\nExaggeration aesthetics are out of bounds"
-                           f" for {taxon} in Input file.")
-                    sys.exit() 
-                    
-                graph.fill_between(data_2["Depth"], data_2[taxon] * \
+                graph.fill_between(depths, values * \
                                    taxa_exag[taxon], \
-                                   color = colour(taxa_exag_col[taxon]), \
+                                   color = taxa_exag_col[taxon], \
                                    linewidth = taxa_exag_lw[taxon], \
                                    alpha = taxa_exag_trans[taxon])
-                    
-                graph.plot(data_2["Depth"],data_2[taxon] * \
+                
+                graph.plot(depths,values * \
                            taxa_exag[taxon], \
-                           color = colour(taxa_exag_line_col[taxon]), \
+                           color = taxa_exag_line_col[taxon], \
                            linewidth = taxa_exag_lw[taxon], \
-                           linestyle = line_styles(taxa_exag_ls[taxon]))
-                    
-                graph.set_ylim(0, data_2[taxon].max())
+                           linestyle = taxa_exag_ls[taxon])
                 
+                graph.set_ylim(0, data_2[taxon].max())
+            
                 if data_2[taxon].max() < 10:
                     graph.set_ylim(0, yu_lim + 20)
                 else:
                     graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                            decimals =-1)) 
-                
-###########################################################################
-        graph.fill_between(data_2["Depth"], data_2[taxon], \
+            
+    ###########################################################################
+        graph.fill_between(depths, values, \
                            color = "white", linewidth = 0, alpha = 1)
-        
+    
         if extra_yn != "none":
             for x in data_list_extra:
                 if taxon in x:
-                    graph.plot(data_extra_2["Depth"], data_extra_2[x], \
-                               color = colour(line_colour_type_ex[x]), \
+                    extra_depths, extra_values = panel_series(graph, \
+                                                              data_extra_2, x)
+                    graph.plot(extra_depths, extra_values, \
+                               color = line_colour_type_ex[x], \
                                linewidth = line_width_type_ex[x], \
-                               linestyle = line_styles(line_type_ex[x]))
-                        
-        graph.set_xlim(x_limit_top, x_limit_base)
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+                               linestyle = line_type_ex[x])
+                    
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
 
         if y_ticks_l_r == "on":
@@ -10299,47 +4024,43 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len,\
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = True, \
                               width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False,\
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
@@ -10348,29 +4069,26 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction='out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
+                              color = taxa_x_tick_maj_colour[taxon])
 
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
+                                  color = taxa_x_tick_min_colour[taxon])
                 
+                set_depth_minor_locator(graph)
+            
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = False)
-                        
+                    
         if x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
@@ -10379,9 +4097,8 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                               direction = 'out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-        
+                              color = taxa_x_tick_maj_colour[taxon])
+    
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction = 'out', labelbottom = False, \
                           rotation = x_lab_rot)
@@ -10390,155 +4107,60 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                           direction = 'out', labelright =True, \
                           labelleft = False, rotation = y_lab_rot) 
 
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
         graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
+    
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
+        
         graph.spines['top'].set_visible(False)
 
         graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
                          rotation = y_title_rotation, \
                          verticalalignment = 'bottom', y = 0.2, \
                          ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
 
         graph.yaxis.labelpad = y_lab_gap
 
-###########################################################################
-        # Make adjustments if this is a NON STD SCALING plot.
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_start_list[0] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_1))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_2))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_3))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] == "mini":
-            
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_4))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_5))
-                
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_start_list[0] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[0])))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[1])))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[2])))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[3])))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[4])))
-            
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_on_off_1 == "off":
-            graph.spines['bottom'].set_visible(False)
-        if taxon == non_std_scaling_2 and non_std_spine_on_off_2 == "off":
-            graph.spines['bottom'].set_visible(False)
-        if taxon == non_std_scaling_3 and non_std_spine_on_off_3 == "off":
-            graph.spines['bottom'].set_visible(False)
-        if taxon == non_std_scaling_4 and non_std_spine_on_off_4 == "off":
-            graph.spines['bottom'].set_visible(False)
-        if taxon == non_std_scaling_5 and non_std_spine_on_off_5 == "off":
-            graph.spines['bottom'].set_visible(False) 
-        
-        if taxa_exag_type[taxon] == 0:
-            if taxon == non_std_scaling_1 and \
-                non_std_spine_start_list[0] == "mini":
-                    graph.set_ylim(non_std_scaling_y_min_1, 
-                                   non_std_scaling_y_max_1)
-                    
-            elif taxon == non_std_scaling_2 and \
-                non_std_spine_start_list[1] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_2, 
-                              non_std_scaling_y_max_2)
-                
-            elif taxon == non_std_scaling_3 and \
-                non_std_spine_start_list[2] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_3, 
-                               non_std_scaling_y_max_3)
-                
-            elif taxon == non_std_scaling_4 and \
-                non_std_spine_start_list[3] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_4, 
-                               non_std_scaling_y_max_4)
-                
-            elif taxon == non_std_scaling_5 and \
-                non_std_spine_start_list[4] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_5, 
-                               non_std_scaling_y_max_5)
-            
-###########################################################################
-        # Error checking for graph type 2.
-        if line_type[taxon] > 4 or line_type[taxon] < 1 \
-            and taxon != "Zones":
-            print("")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit() 
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1 and taxon != "Zones":
-            print("")
-            print(f"\nError in line colour number for {taxon} in Input "
-                  "file.")
-            sys.exit() 
+    ###########################################################################
+        # Adjustments if this is a NSC plot (see apply_nsc_spine above).
+        apply_nsc_spine(graph, nsc_overrides.get(taxon), \
+                        taxa_exag_type[taxon])
 
-###########################################################################
-###########################################################################
-    # Create plot for taxon (not first) to be plotted based on parameter 
-    # choices if graph type is a line plot with solid shading underneath. 
+    ###########################################################################
+    # Function to draw a taxon as a line plot with solid shading underneath.
     # Graph type 4.
-
-    elif plot_type_1 == 4 and taxon != data_list_1:
-###########################################################################
+    def draw_filled_line_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        yu_lim = panel["yu_lim"]
+        line_type_2 = panel["line_type_2"]
+        line_colour_type_2 = panel["line_colour_type_2"]
+        fill_colour_type_2 = panel["fill_colour_type_2"]
+        fill_trans_type_1 = panel["fill_trans_type_1"]
+        line_width_1 = panel["line_width_1"]
+        depths, values = panel_series(graph, data_2, taxon)
+
+    ###########################################################################
         # Adjustments required if exaggeration has been specified.
         if taxa_exag[taxon] > 0 and pd.isnull(taxa_exag[taxon]) == False:
             if taxa_exag_type[taxon] == 3:
-                if taxa_exag_line_col[taxon] not in range (1, col_max) \
-                    or taxa_exag_ls[taxon] not in range (1, 4):
-                    print("  ")
-                    print (f"\nExaggeration aesthetics out of bounds for "
-                           f"{taxon} in Input file.")
-                    sys.exit()
-                
-                graph.plot(data_2["Depth"], data_2[taxon] * \
+                graph.plot(depths, values * \
                            taxa_exag[taxon], \
-                           color = colour(taxa_exag_line_col[taxon]), \
+                           color = taxa_exag_line_col[taxon], \
                            linewidth = taxa_exag_lw[taxon], \
-                           linestyle = line_styles(taxa_exag_ls[taxon]))
-                    
+                           linestyle = taxa_exag_ls[taxon])
+                
                 graph.set_ylim(0, data_2[taxon].max())
 
                 if data_2[taxon].max() < 10:
@@ -10546,51 +4168,39 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                 else:
                     graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                            decimals =-1))
-    
+
             if taxa_exag_type[taxon] == 4:
-                if taxa_exag_col[taxon] not in range (1, col_max) \
-                    or taxa_exag_line_col[taxon] \
-                    not in range (1, col_max) or taxa_exag_ls[taxon] \
-                    not in range (1, 4) or \
-                    taxa_exag_trans[taxon] * 100 not in range (0, 100):
-                    print("  ")
-                    print (f"\nExaggeration aesthetics out of bounds for "
-                           f"{taxon} in Input file.")
-                    sys.exit() 
-                    
-                graph.fill_between(data_2["Depth"], data_2[taxon] * \
+                graph.fill_between(depths, values * \
                                    taxa_exag[taxon], \
-                                   color = colour(taxa_exag_col[taxon]), \
+                                   color = taxa_exag_col[taxon], \
                                    linewidth = taxa_exag_lw[taxon], \
                                    alpha = taxa_exag_trans[taxon])
-                    
-                graph.plot(data_2["Depth"], data_2[taxon] * \
+                
+                graph.plot(depths, values * \
                            taxa_exag[taxon], \
-                           color = colour(taxa_exag_line_col[taxon]),\
+                           color = taxa_exag_line_col[taxon],\
                            linewidth = taxa_exag_lw[taxon], \
-                           linestyle = line_styles(taxa_exag_ls[taxon]))
-                    
-                graph.set_ylim(0, data_2[taxon].max())
+                           linestyle = taxa_exag_ls[taxon])
                 
+                graph.set_ylim(0, data_2[taxon].max())
+            
                 if data_2[taxon].max() < 10:
                     graph.set_ylim(0, yu_lim + 20)
                 else:
                     graph.set_ylim(0, np.round(new_max_taxa_dict[taxon], \
                                            decimals =-1))
-                
-###########################################################################
-        graph.fill_between(data_2["Depth"], data_2[taxon], \
+            
+    ###########################################################################
+        graph.fill_between(depths, values, \
                            color = fill_colour_type_2, \
                            linewidth = line_width_1, \
                            alpha = fill_trans_type_1)
-            
-        graph.plot(data_2["Depth"], data_2[taxon], \
+        
+        graph.plot(depths, values, \
                    color = line_colour_type_2, \
                    linewidth = line_width_1, linestyle = line_type_2)
-        
-        graph.set_xlim(x_limit_top, x_limit_base) 
-        
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+    
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
 
         if y_ticks_l_r == "on":
@@ -10598,18 +4208,16 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
 
@@ -10617,24 +4225,22 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
 
@@ -10642,7 +4248,7 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-        
+    
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
@@ -10651,35 +4257,31 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                                             [taxon]))
-            
+                              color = taxa_x_tick_maj_colour[taxon])
+        
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
+                                  color = taxa_x_tick_min_colour[taxon])
 
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
-                
+                set_depth_minor_locator(graph)
+            
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = False)
-                        
+                    
         if x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction ='out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))            
-        
+                              color = taxa_x_tick_maj_colour[taxon])
+    
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction = 'out', labelbottom =False, \
                           rotation = x_lab_rot)
@@ -10688,157 +4290,52 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
                           direction = 'out', labelright = True, \
                           labelleft = False, rotation = y_lab_rot)
 
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
         graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
-        
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
+    
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
+        
         graph.spines['top'].set_visible(False)
 
         graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
                          rotation = y_title_rotation, \
                          verticalalignment = 'bottom', y = 0.2, \
                          ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.yaxis.labelpad = y_lab_gap
-
-###########################################################################
-        # Adjustments if plot is NON STD SCALING.
-        if taxon == non_std_scaling_1 and \
-           non_std_spine_start_list[0] == "mini":
-           graph.spines['bottom'].set_position(("data", \
-                                                non_std_scaling_y_min_1))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_2))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_3))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] == "mini":
-           graph.spines['bottom'].set_position(("data", \
-                                                non_std_scaling_y_min_4))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_5))
-            
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_start_list[0] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[0])))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[1])))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[2])))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[3])))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[4])))
-            
-        if taxon == non_std_scaling_1 and non_std_spine_on_off_1 == "off":
-            graph.spines['bottom'].set_visible(False)
-
-        if taxon == non_std_scaling_2 and non_std_spine_on_off_2 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_3 and non_std_spine_on_off_3 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_4 and non_std_spine_on_off_4 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_5 and non_std_spine_on_off_5 == "off":
-            graph.spines['bottom'].set_visible(False) 
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
         
-        if taxa_exag_type[taxon] == 0:
-            if taxon == non_std_scaling_1 and \
-                non_std_spine_start_list[0] == "mini":
-                    graph.set_ylim(non_std_scaling_y_min_1, 
-                                   non_std_scaling_y_max_1)
-                    
-            elif taxon == non_std_scaling_2 and \
-                non_std_spine_start_list[1] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_2, 
-                              non_std_scaling_y_max_2)
-                
-            elif taxon == non_std_scaling_3 and \
-                non_std_spine_start_list[2] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_3, 
-                               non_std_scaling_y_max_3)
-                
-            elif taxon == non_std_scaling_4 and \
-                non_std_spine_start_list[3] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_4, 
-                               non_std_scaling_y_max_4)
-                
-            elif taxon == non_std_scaling_5 and \
-                non_std_spine_start_list[4] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_5, 
-                               non_std_scaling_y_max_5)
-            
-            
-###########################################################################
-        # Error checking for graph type 4.
-        if line_type[taxon] > 4 or line_type[taxon] < 1 \
-            and taxon != "Zones":
-            print(" ")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-    
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1 and taxon != "Zones":
-            print(" ")
-            print(f"\nError in line colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if fill_colour_type[taxon] > col_max or \
-            fill_colour_type[taxon] < 1 and taxon != "Zones":
-            print(" ")
-            print(f"\nError in fill colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if fill_trans_type[taxon] > 1 or fill_trans_type[taxon] < 0 \
-            and taxon != "Zones":
-            print(" ")
-            print(f"\nError in fill colour transparency for {taxon} in "
-                  "Input file.")
-            sys.exit()
+        graph.yaxis.labelpad = y_lab_gap
 
-###########################################################################
-###########################################################################
-    # Create plot for taxon (not first) to be plotted based on parameter 
-    # choices if graph type is a line and marker plot. 
-    # Graph type 5. 
-    elif plot_type_1 == 5 and taxon != data_list_1: 
-        
-###########################################################################
+    ###########################################################################
+        # Adjustments if this is a NSC plot (see apply_nsc_spine above).
+        apply_nsc_spine(graph, nsc_overrides.get(taxon), \
+                        taxa_exag_type[taxon])
+
+    ###########################################################################
+    # Function to draw a taxon as a line and marker plot. Graph type 5.
+    def draw_line_marker_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        line_type_2 = panel["line_type_2"]
+        line_colour_type_2 = panel["line_colour_type_2"]
+        marker_typ_type_2 = panel["marker_typ_type_2"]
+        marker_f_col_2 = panel["marker_f_col_2"]
+        marker_e_col_2 = panel["marker_e_col_2"]
+        line_width_1 = panel["line_width_1"]
+        marker_s_size_1 = panel["marker_s_size_1"]
+        marker_e_w_wid_1 = panel["marker_e_w_wid_1"]
+        depths, values = panel_series(graph, data_2, taxon)
+
+    ###########################################################################
         # Adjustments required if exaggeration has been specified to any
         # plot.
         # if exag["exag"].max() > 0: 
@@ -10847,79 +4344,75 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         #     else:
         #         graph.set_ylim(0, yu_lim)
 
-###########################################################################
-        graph.plot(data_2["Depth"], data_2[taxon], color = \
+    ###########################################################################
+        graph.plot(depths, values, color = \
                    line_colour_type_2, linewidth = line_width_1, \
                    linestyle = line_type_2, marker =marker_typ_type_2, \
                    ms = marker_s_size_1, \
                    markeredgecolor = marker_e_col_2, \
                    markerfacecolor = marker_f_col_2, \
                    markeredgewidth = marker_e_w_wid_1)
-            
+        
         if extra_yn != "none":
             for x in data_list_extra:
-                
+            
                 if taxon in x:
-                    graph.plot(data_extra["Depth"], data_extra[x], \
-                               color = colour(line_colour_type_ex[x]), \
+                    extra_depths, extra_values = panel_series(graph, \
+                                                              data_extra_2, x)
+                    graph.plot(extra_depths, extra_values, \
+                               color = line_colour_type_ex[x], \
                                linewidth = line_width_type_ex[x], \
-                               linestyle = line_styles(line_type_ex[x]), \
-                               marker = marker_type(marker_typ_type_ex[x]), \
+                               linestyle = line_type_ex[x], \
+                               marker = marker_typ_type_ex[x], \
                                ms = marker_s_size_ex[x], \
-                               markeredgecolor = colour(marker_e_col_ex[x]), \
-                               markerfacecolor = colour(marker_f_col_ex[x]), \
+                               markeredgecolor = marker_e_col_ex[x], \
+                               markerfacecolor = marker_f_col_ex[x], \
                                markeredgewidth = marker_e_w_wid_ex[x])
-        
-        graph.set_xlim(x_limit_top, x_limit_base) 
-
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+    
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
-        
+    
         if y_ticks_l_r == "on":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon])) 
-            
+                              color = taxa_y_tick_maj_colour[taxon]) 
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                                 [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y",which ='minor', \
                                   direction = 'out', left = False, \
@@ -10928,40 +4421,36 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_x_tick_maj_colour[taxon])
+        
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                                 [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
+                                  color = taxa_x_tick_min_colour[taxon])
                 
+                set_depth_minor_locator(graph)
+            
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = False)
-                        
+                    
         if x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))            
-                
+                              color = taxa_x_tick_maj_colour[taxon])
+            
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction ='out', labelbottom = False, \
                           rotation = x_lab_rot)
@@ -10969,166 +4458,50 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         graph.tick_params(axis = "y", labelsize = y_lab_font, \
                           direction='out', labelright =True, \
                           labelleft = False, rotation = y_lab_rot) 
-            
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
         
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
+        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
+    
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour \
-                                       (taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
+        
         graph.spines['top'].set_visible(False)
 
         graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
                          rotation = y_title_rotation, \
                          verticalalignment = 'bottom', y = 0.0, \
                          ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
+        
         graph.yaxis.labelpad = y_lab_gap
 
-###########################################################################
-        # Adjustments if this plot is NON STANDARD SCALING.
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_start_list[0] == "mini":
-           graph.spines['bottom'].set_position(("data", \
-                                                non_std_scaling_y_min_1))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_2))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] == "mini":
-            
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_3))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] == "mini":
-           graph.spines['bottom'].set_position(("data", \
-                                                non_std_scaling_y_min_4))
-           
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_5))
-            
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_start_list[0] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[0])))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[1])))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[2])))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[3])))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[4])))
-            
-        if taxon == non_std_scaling_1 and non_std_spine_on_off_1 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_2 and non_std_spine_on_off_2 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_3 and non_std_spine_on_off_3 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_4 and non_std_spine_on_off_4 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_5 and non_std_spine_on_off_5 == "off":
-            graph.spines['bottom'].set_visible(False) 
-            
-        if taxa_exag_type[taxon] == 0:
-            if taxon == non_std_scaling_1 and \
-                non_std_spine_start_list[0] == "mini":
-                    graph.set_ylim(non_std_scaling_y_min_1, 
-                                   non_std_scaling_y_max_1)
-                    
-            elif taxon == non_std_scaling_2 and \
-                non_std_spine_start_list[1] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_2, 
-                              non_std_scaling_y_max_2)
-                
-            elif taxon == non_std_scaling_3 and \
-                non_std_spine_start_list[2] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_3, 
-                               non_std_scaling_y_max_3)
-                
-            elif taxon == non_std_scaling_4 and \
-                non_std_spine_start_list[3] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_4, 
-                               non_std_scaling_y_max_4)
-                
-            elif taxon == non_std_scaling_5 and \
-                non_std_spine_start_list[4] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_5, 
-                               non_std_scaling_y_max_5)
-            
-            
-###########################################################################
-        # Error checking for graph type 5.
-        if line_type[taxon] > 4 or line_type[taxon] < 1 \
-            and taxon != "Zones":
-            print(" ")
-            print(f"\nError in line type number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if  line_colour_type[taxon] > col_max or \
-            line_colour_type[taxon] < 1 and taxon != "Zones":
-            print(" ")
-            print(f"\nError in line colour number for {taxon} in Input "
-                  "file.")
-            sys.exit()
-            
-        if marker_typ_type[taxon] > 6 or marker_typ_type[taxon] < 1 \
-            and taxon != "Zones":
-            print(" ")
-            print(f"\nError in marker type number for {taxon} in Input "
-                  "file.")
-            sys.exit() 
-
-        if marker_f_col[taxon] > col_max or marker_f_col[taxon] < 1 \
-            and taxon != "Zones":
-            print(" ")
-            print(f"\nError in marker type colour fill number for {taxon}"
-                  " in Input file.")
-            sys.exit()
-
-        if marker_e_col[taxon] > col_max or marker_e_col[taxon] < 1 \
-            and taxon != "Zones":
-            print("")
-            print(f"\nError in marker type edge colour number for"
-                  f" {taxon} in Input file.")
-            sys.exit()
-
-###########################################################################
-    # Create plot for taxon (not first) to be plotted based on parameter 
-    # choices. If graph type is a scatterplot. Graph type 6.
-    elif plot_type_1 == 6 and taxon != data_list_1: 
-
-###########################################################################
+    ###########################################################################
+        # Adjustments if this is a NSC plot (see apply_nsc_spine above).
+        apply_nsc_spine(graph, nsc_overrides.get(taxon), \
+                        taxa_exag_type[taxon])
+
+    ###########################################################################
+    # Function to draw a taxon as a scatter plot. Graph type 6.
+    def draw_marker_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        marker_typ_type_2 = panel["marker_typ_type_2"]
+        marker_f_col_2 = panel["marker_f_col_2"]
+        marker_e_col_2 = panel["marker_e_col_2"]
+        marker_s_size_1 = panel["marker_s_size_1"]
+        marker_e_w_wid_1 = panel["marker_e_w_wid_1"]
+        depths, values = panel_series(graph, data_2, taxon)
+
+    ###########################################################################
         # Adjustments required if exaggeration has been specified to any
         # plot.
         # if exag["exag"].max() > 0: 
@@ -11136,77 +4509,73 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         #         graph.set_ylim(0, yu_lim + 20)
         #     else:
         #         graph.set_ylim(0, yu_lim)
-                
-###########################################################################
-        graph.plot(data_2["Depth"], data_2[taxon], linewidth = 0, \
+            
+    ###########################################################################
+        graph.plot(depths, values, linewidth = 0, \
                         marker = marker_typ_type_2, \
                         ms = marker_s_size_1, \
                         markeredgecolor = marker_e_col_2, \
                         markerfacecolor = marker_f_col_2, \
                         markeredgewidth = marker_e_w_wid_1)
-            
+        
         if extra_yn != "none":
             for x in data_list_extra:
-                
+            
                 if taxon in x:
-                    graph.plot(data_extra["Depth"], data_extra[x], \
+                    extra_depths, extra_values = panel_series(graph, \
+                                                              data_extra_2, x)
+                    graph.plot(extra_depths, extra_values, \
                                linewidth = 0, \
-                               marker = marker_type(marker_typ_type_ex[x]), \
+                               marker = marker_typ_type_ex[x], \
                                ms = marker_s_size_ex[x], \
-                               markeredgecolor = colour(marker_e_col_ex[x]), \
-                               markerfacecolor = colour(marker_f_col_ex[x]), \
+                               markeredgecolor = marker_e_col_ex[x], \
+                               markerfacecolor = marker_f_col_ex[x], \
                                markeredgewidth = marker_e_w_wid_ex[x])
-        
-        graph.set_xlim(x_limit_top, x_limit_base) 
-
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
+    
+        set_depth_axis(graph)
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
-        
+    
         if y_ticks_l_r == "on":
             graph.tick_params(axis = "y", which ='major', \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon])) 
-            
+                              color = taxa_y_tick_maj_colour[taxon]) 
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = False, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
@@ -11215,40 +4584,36 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_x_tick_maj_colour[taxon])
+        
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which ='minor', \
                                   direction = 'out', bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
+                                  color = taxa_x_tick_min_colour[taxon])
                 
+                set_depth_minor_locator(graph)
+            
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x", which = 'minor', \
                                   direction = 'out', bottom = False)
-                        
+                    
         if x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))            
-                
+                              color = taxa_x_tick_maj_colour[taxon])
+            
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction = 'out', labelbottom = False, \
                           rotation = x_lab_rot)
@@ -11256,459 +4621,106 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         graph.tick_params(axis = "y", labelsize = y_lab_font, \
                           direction = 'out', labelright = True, \
                           labelleft = False, rotation = y_lab_rot) 
-            
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
         
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
+        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
+    
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)
-        
-        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
-                         rotation = y_title_rotation, \
-                         verticalalignment = 'bottom', y = 0.0, \
-                         ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
-        graph.yaxis.labelpad = y_lab_gap
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
         
-###########################################################################
-        # Make adjustments if this is NON STD SCALING plot.
-        if taxon == non_std_scaling_1 and \
-           non_std_spine_start_list[0] == "mini":
-           graph.spines['bottom'].set_position(("data", \
-                                                non_std_scaling_y_min_1))
-        elif taxon == non_std_scaling_2 and \
-             non_std_spine_start_list[1] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_2))
-        elif taxon == non_std_scaling_3 and \
-             non_std_spine_start_list[2] == "mini":
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_3))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] == "mini":
-            
-           graph.spines['bottom'].set_position(("data", \
-                                                non_std_scaling_y_min_4))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] == "mini":
-            
-            graph.spines['bottom'].set_position(("data", \
-                                                 non_std_scaling_y_min_5))
-            
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_start_list[0] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[0])))
-        elif taxon == non_std_scaling_2 and \
-            non_std_spine_start_list[1] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[1])))
-        elif taxon == non_std_scaling_3 and \
-            non_std_spine_start_list[2] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[2])))
-        elif taxon == non_std_scaling_4 and \
-            non_std_spine_start_list[3] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[3])))
-        elif taxon == non_std_scaling_5 and \
-            non_std_spine_start_list[4] != "mini":
-            graph.spines['bottom'].set_position \
-                (("data", float(non_std_spine_start_list[4])))
-            
-        if taxon == non_std_scaling_1 and \
-            non_std_spine_on_off_1 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_2 and \
-            non_std_spine_on_off_2 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_3 and non_std_spine_on_off_3 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_4 and non_std_spine_on_off_4 == "off":
-            graph.spines['bottom'].set_visible(False)
-            
-        if taxon == non_std_scaling_5 and non_std_spine_on_off_5 == "off":
-            graph.spines['bottom'].set_visible(False) 
-            
-        if taxa_exag_type[taxon] == 0:
-            if taxon == non_std_scaling_1 and \
-                non_std_spine_start_list[0] == "mini":
-                    graph.set_ylim(non_std_scaling_y_min_1, 
-                                   non_std_scaling_y_max_1)
-                    
-            elif taxon == non_std_scaling_2 and \
-                non_std_spine_start_list[1] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_2, 
-                              non_std_scaling_y_max_2)
-                
-            elif taxon == non_std_scaling_3 and \
-                non_std_spine_start_list[2] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_3, 
-                               non_std_scaling_y_max_3)
-                
-            elif taxon == non_std_scaling_4 and \
-                non_std_spine_start_list[3] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_4, 
-                               non_std_scaling_y_max_4)
-                
-            elif taxon == non_std_scaling_5 and \
-                non_std_spine_start_list[4] == "mini":
-                graph.set_ylim(non_std_scaling_y_min_5, 
-                               non_std_scaling_y_max_5)
-                
-            
-###########################################################################
-        # Error checking for graph type 6.
-        if marker_typ_type[taxon] > 6 or marker_typ_type[taxon] < 1 \
-            and taxon != "Zones":
-            print(" ")
-            print(f"\nError in arker type number for {taxon} in Input "
-                  "file.")
-            sys.exit() 
-            
-        if marker_f_col[taxon] > col_max or marker_f_col[taxon] <1 \
-            and taxon != "Zones":
-            print("")
-            print(f"\nError in marker type fill colour number for {taxon}"
-                  " in Input file.")
-            sys.exit()
-
-        if marker_e_col[taxon] > col_max or marker_f_col[taxon] < 1 \
-            and taxon != "Zones":
-            print("")        
-            print(f"\nError in marker type edge colour number for {taxon}"
-                  " in Input file.")
-            sys.exit() 
-            
-###########################################################################
-###########################################################################
-# Stack plots, two are allowed at present but this can be expanded if 
-# required. Graph type 7
-    elif plot_type_1 == 7  and taxon != data_list_1:
-        
-###########################################################################
-        # Adjust if percentage has been calculated.
-        if num_stack == 1:
-            if num_stack_plots == 1 or num_stack_plots == 2:
-                stack_colours_1 = [colour(x) for x in stack_plot_1_colours]
-                
-                if stack_calc_1 == "yes":
-                    stack_line_atts = []
-                    stack_line_atts.append(stack_plot_1_line_colour)
-                    stack_line_atts.append(stack_plot_1_lw)
-                    
-                    if any(i > 0 for i in stack_line_atts):
-                        
-                        stack_2 =[x + y for x, y in zip(stack_1_sums_1, \
-                                                       stack_1_sums_2)]
-                        stack_3 =[x + y + z for x, y, z in \
-                                  zip(stack_1_sums_1, stack_1_sums_2, \
-                                  stack_1_sums_3)]
-                        stack_4 =[x + y + z + a for x, y, z, a in \
-                                 zip(stack_1_sums_1, stack_1_sums_2, \
-                                 stack_1_sums_3, stack_1_sums_4)]
-                            
-                        stack_5 =[x + y + z + a + b for x ,y ,z, a, b \
-                                 in zip(stack_1_sums_1, stack_1_sums_2, \
-                                 stack_1_sums_3, stack_1_sums_4, \
-                                 stack_1_sums_5)]
-                        
-                        graph.stackplot(data_2["Depth"], \
-                                        stack_1_sums_1_calc, \
-                                        stack_1_sums_2_calc, \
-                                        stack_1_sums_3_calc, \
-                                        stack_1_sums_4_calc, \
-                                        stack_1_sums_5_calc, \
-                                        colors = stack_colours_1)
-                            
-                        graph.plot(data_2["Depth"], stack_1_sums_1_calc, \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                        graph.plot(data_2["Depth"], [u + v for u,v in  \
-                                   zip(stack_1_sums_1_calc, \
-                                   stack_1_sums_2_calc)], \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                        graph.plot(data_2["Depth"], [u + v + w for u,v,w \
-                                   in zip(stack_1_sums_1_calc, \
-                                          stack_1_sums_2_calc, \
-                                          stack_1_sums_3_calc)], \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                        graph.plot(data_2["Depth"], [u + v + w + x for \
-                                   u,v,w,x in zip(stack_1_sums_1_calc, \
-                                                  stack_1_sums_2_calc, \
-                                                  stack_1_sums_3_calc, \
-                                                  stack_1_sums_4_calc)], \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                        graph.plot(data_2["Depth"], [u + v + w + x + y \
-                                   for u,v,w,x,y in \
-                                   zip(stack_1_sums_1_calc, \
-                                       stack_1_sums_2_calc, \
-                                       stack_1_sums_3_calc, \
-                                       stack_1_sums_4_calc, \
-                                       stack_1_sums_5_calc)], \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                    else:
-                        graph.stackplot(data_2["Depth"], \
-                                        stack_1_sums_1_calc, \
-                                        stack_1_sums_2_calc, \
-                                        stack_1_sums_3_calc, \
-                                        stack_1_sums_4_calc, \
-                                        stack_1_sums_5_calc, \
-                                        colors = stack_colours_1)
-
-                            
-                if stack_calc_1 == "no" or pd.isnull(stack_calc_1) == True:
-                    stack_line_atts = []
-                    stack_line_atts.append(stack_plot_1_line_colour)
-                    stack_line_atts.append(stack_plot_1_lw)
-                    
-                    if any(i > 0 for i in stack_line_atts):
-                        stack_2 = [x + y for x, y in zip(stack_1_sums_1, \
-                                                         stack_1_sums_2)]
-                        stack_3 = [x + y + z for x, y, z \
-                                   in zip(stack_1_sums_1, \
-                                          stack_1_sums_2, \
-                                          stack_1_sums_3)]
-                        stack_4 = [x + y + z + a for x, y, z, a \
-                                 in zip(stack_1_sums_1, \
-                                        stack_1_sums_2, \
-                                        stack_1_sums_3, \
-                                        stack_1_sums_4)]
-                        stack_5 = [x + y + z + a + b for x, y, z, a, b \
-                                 in zip(stack_1_sums_1, \
-                                        stack_1_sums_2, \
-                                        stack_1_sums_3, \
-                                        stack_1_sums_4, \
-                                        stack_1_sums_5)]
-    
-                        graph.stackplot(data_2["Depth"], stack_1_sums_1, \
-                                                         stack_1_sums_2, \
-                                                         stack_1_sums_3, \
-                                                         stack_1_sums_4, \
-                                                         stack_1_sums_5, \
-                                        colors = stack_colours_1)
-    
-                        graph.plot(data_2["Depth"],stack_1_sums_1, \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                            
-                        graph.plot(data_2["Depth"], stack_2, \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                            
-                        graph.plot(data_2["Depth"], stack_3, \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                            
-                        graph.plot(data_2["Depth"], stack_4, \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                        
-                        graph.plot(data_2["Depth"], stack_5, \
-                                   linewidth = stack_plot_1_lw, \
-                                   color = colour(stack_plot_1_line_colour))
-                    else:
-                        graph.stackplot(data_2["Depth"],stack_1_sums_1, \
-                                                        stack_1_sums_2, \
-                                                        stack_1_sums_3, \
-                                                        stack_1_sums_4, \
-                                                        stack_1_sums_5, \
-                                        colors = stack_colours_1)
-               
-        if num_stack == 2:
-            if num_stack_plots == 2:
-                stack_colours_2 = [colour(x) for x in stack_plot_2_colours]
-                
-                if stack_calc_2 == "yes":
-                    stack_line_atts = []
-                    stack_line_atts.append(stack_plot_2_line_colour)
-                    stack_line_atts.append(stack_plot_2_lw)
-                    
-                    if any(i > 0 for i in stack_line_atts):
-                        
-                        stack_2 =[x + y for x, y in zip(stack_2_sums_1, \
-                                                        stack_2_sums_2)]
-                        stack_3 =[x + y + z for x, y, z \
-                                  in zip(stack_2_sums_1, stack_2_sums_2, \
-                                         stack_2_sums_3)]
-                        stack_4 =[x + y + z + a for x, y, z, a \
-                                 in zip(stack_2_sums_2, stack_2_sums_2, \
-                                        stack_2_sums_3, stack_2_sums_4)]
-                            
-                        stack_5 =[x + y + z + a + b for x ,y ,z, a, b \
-                                 in zip(stack_2_sums_1, stack_2_sums_2, \
-                                        stack_2_sums_3, stack_2_sums_4, \
-                                        stack_2_sums_5)]
-                        
-                        graph.stackplot(data_2["Depth"], \
-                                        stack_2_sums_1_calc, \
-                                        stack_2_sums_2_calc, \
-                                        stack_2_sums_3_calc, \
-                                        stack_2_sums_4_calc, \
-                                        stack_2_sums_5_calc, \
-                                        colors = stack_colours_2)
-                            
-                        graph.plot(data_2["Depth"], stack_2_sums_1_calc, \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                        graph.plot(data_2["Depth"], [u + v for u,v in  \
-                                   zip(stack_2_sums_1_calc, \
-                                   stack_2_sums_2_calc)], \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                        graph.plot(data_2["Depth"], [u + v + w for \
-                                   u,v,w in zip(stack_2_sums_1_calc,
-                                                stack_2_sums_2_calc, \
-                                                stack_2_sums_3_calc)], \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                        graph.plot(data_2["Depth"], [u + v + w + x for \
-                                   u,v,w,x in zip(stack_2_sums_1_calc, \
-                                                  stack_2_sums_2_calc, \
-                                                  stack_2_sums_3_calc, \
-                                                  stack_2_sums_4_calc)], \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                        graph.plot(data_2["Depth"], [u + v + w + x + y \
-                                   for u,v,w,x,y in \
-                                   zip(stack_2_sums_1_calc, \
-                                       stack_2_sums_2_calc, \
-                                       stack_2_sums_3_calc, \
-                                       stack_2_sums_4_calc, \
-                                       stack_2_sums_5_calc)], \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                    else:
-                        graph.stackplot(data_2["Depth"], \
-                                        stack_2_sums_1_calc, \
-                                        stack_2_sums_2_calc, \
-                                        stack_2_sums_3_calc, \
-                                        stack_2_sums_4_calc, \
-                                        stack_2_sums_5_calc, \
-                                        colors = stack_colours_2)
-                            
-                if stack_calc_2 == "no" or pd.isnull(stack_calc_2) == True:
-                    stack_line_atts = []
-                    stack_line_atts.append(stack_plot_2_line_colour)
-                    stack_line_atts.append(stack_plot_2_lw)
-                    
-                    if any(i > 0 for i in stack_line_atts):
-                        stack_2 = [x + y for x, y in zip(stack_2_sums_1, \
-                                                       stack_2_sums_2)]
-                        stack_3 = [x + y + z for x, y, z \
-                                   in zip(stack_2_sums_1, stack_2_sums_2, \
-                                          stack_2_sums_3)]
-                        stack_4 = [x + y + z + a for x, y, z, a \
-                                 in zip(stack_2_sums_1, stack_2_sums_2, \
-                                        stack_2_sums_3, stack_2_sums_4)]
-                        stack_5 = [x + y + z + a + b for x, y, z, a, b \
-                                 in zip(stack_2_sums_1, stack_2_sums_2, \
-                                        stack_2_sums_3, stack_2_sums_4, \
-                                        stack_2_sums_5)]
-    
-                        graph.stackplot(data_2["Depth"], stack_2_sums_1, \
-                                        stack_2_sums_2, stack_2_sums_3, \
-                                        stack_2_sums_4, stack_2_sums_5, \
-                                        colors = stack_colours_2)
-    
-                        graph.plot(data_2["Depth"],stack_2_sums_1, \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                            
-                        graph.plot(data_2["Depth"], stack_2, \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                            
-                        graph.plot(data_2["Depth"], stack_3, \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                            
-                        graph.plot(data_2["Depth"], stack_4, \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                        
-                        graph.plot(data_2["Depth"], stack_5, \
-                                   linewidth = stack_plot_2_lw, \
-                                   color = colour(stack_plot_2_line_colour))
-                    else:
-                        graph.stackplot(data_2["Depth"],stack_2_sums_1, \
-                                        stack_2_sums_2, stack_2_sums_3, \
-                                        stack_2_sums_4, stack_2_sums_5, \
-                                        colors = stack_colours_2)
-
-###########################################################################
-        graph.set_xlim(x_limit_top, x_limit_base)
+        graph.spines['top'].set_visible(False)
+    
+        graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
+                         rotation = y_title_rotation, \
+                         verticalalignment = 'bottom', y = 0.0, \
+                         ha = "left", \
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
+        
+        graph.yaxis.labelpad = y_lab_gap
+    
+    ###########################################################################
+        # Adjustments if this is a NSC plot (see apply_nsc_spine above).
+        apply_nsc_spine(graph, nsc_overrides.get(taxon), \
+                        taxa_exag_type[taxon])
+
+    ###########################################################################
+    # Function to draw one of the stack plots. Graph type 7.
+    def draw_stack_plot(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+        y_major_int = panel["y_major_int"]
+        y_minor_int = panel["y_minor_int"]
+        num_stack = panel["num_stack"]
+
+    ###########################################################################
+        # Each stack plot column draws the next stack plot switched on, the
+        # groups stacked up from the first with the lines between them if a
+        # line width or colour is given. The sums are already percentages 
+        # if a percentage calculation was asked for.
+        if num_stack <= num_stack_plots:
+            stack = stacks["stacks"][num_stack - 1]
+            
+            graph.stackplot(data_2["Depth"], stack["sums"].T, \
+                            colors = [colour(x) for x in stack["colours"]])
+            
+            if stack["line_colour"] > 0 or stack["line_width"] > 0:
+                graph.plot(data_2["Depth"], stack["sums"].cumsum(axis = 1), \
+                           linewidth = stack["line_width"], \
+                           color = colour(stack["line_colour"]))
+
+    ###########################################################################
+        set_depth_axis(graph)
         graph.set_ylim(0, 100) 
-
-        graph.xaxis.set_major_locator(ticker.MultipleLocator(x_major_int))
         graph.yaxis.set_major_locator(ticker.MultipleLocator(y_major_int))
-            
+        
         if y_ticks_l_r == "on":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out', left = True, \
                               right = True, width = y_major_tick_wid, \
                               length= y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon])) 
-            
+                              color = taxa_y_tick_maj_colour[taxon]) 
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = True, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = False)
-                
+            
         if y_ticks_l_r == "off":
             graph.tick_params(axis = "y", which = 'major', \
                               direction = 'out' , left = False, \
                               right = True, width = y_major_tick_wid, \
                               length = y_major_tick_len, \
-                              color = colour(taxa_y_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_y_tick_maj_colour[taxon])
+        
             if y_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
                                   right = True, \
                                   width = y_minor_tick_wid, \
                                   length = y_minor_tick_len, \
-                                  color = colour(taxa_y_tick_min_colour \
-                                  [taxon]))
-                    
+                                  color = taxa_y_tick_min_colour[taxon])
+                
                 graph.yaxis.set_minor_locator(ticker.MultipleLocator \
                                               (y_minor_int))
-                
+            
             if y_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "y", which = 'minor', \
                                   direction = 'out', left = False, \
@@ -11717,47 +4729,42 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         if x_all_ticks == "off":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction='out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction = 'out', bottom = True, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))
-            
+                              color = taxa_x_tick_maj_colour[taxon])
+        
             if x_minor_ticks_on_off == "on":
                 graph.tick_params(axis = "x", which ='minor', \
                                   direction = 'out' , bottom = True, \
                                   width = x_minor_tick_wid, \
                                   length = x_minor_tick_len, \
-                                  color = colour(taxa_x_tick_min_colour \
-                                  [taxon]))
-                    
-                graph.xaxis.set_minor_locator(ticker.MultipleLocator \
-                                              (x_minor_int))
+                                  color = taxa_x_tick_min_colour[taxon])
                 
+                set_depth_minor_locator(graph)
+            
             if x_minor_ticks_on_off == "off":
                 graph.tick_params(axis = "x",which = 'minor', \
                                   direction = 'out', bottom = False)
-                        
+                    
         if x_all_ticks == "on":
             graph.tick_params(axis = "x", labelsize = x_lab_font, \
                               direction = 'out', labelbottom = False)
-            
+        
             graph.tick_params(axis = "x", which = 'major', \
                               direction ='out', bottom = False, \
                               width = x_major_tick_wid, \
                               length = x_major_tick_len, \
-                              color = colour(taxa_x_tick_maj_colour \
-                              [taxon]))            
-                
+                              color = taxa_x_tick_maj_colour[taxon])
+            
             graph.tick_params(axis = "x", which = 'minor', \
                               direction = 'out', bottom = False, \
                               width = x_minor_tick_wid, \
                               length= x_minor_tick_len, \
-                              color = colour(taxa_x_tick_min_colour \
-                              [taxon]))
-                
+                              color = taxa_x_tick_min_colour[taxon])
+            
         graph.tick_params(axis = "x", labelsize = x_lab_font, \
                           direction ='out', labelbottom = False, \
                           rotation = x_lab_rot)
@@ -11765,682 +4772,511 @@ for taxon, graph, min_0, min_1 in zip(data_list, ax_list, \
         graph.tick_params(axis = "y", labelsize = y_lab_font, \
                           direction = 'out', labelright = True, \
                           labelleft = False, rotation = y_lab_rot) 
-            
-        graph.spines['bottom'].set_linestyle(line_styles \
-                                             (taxa_plot_vstyle[taxon]))
-        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
-        graph.spines['bottom'].set_color(colour \
-                                         (taxa_plot_vs_colour[taxon]))
         
-        graph.spines['left'].set_linestyle(line_styles \
-                                           (taxa_plot_lstyle[taxon]))
+        graph.spines['bottom'].set_linestyle(taxa_plot_vstyle[taxon])
+        graph.spines['bottom'].set_linewidth(taxa_plot_vs_width[taxon])
+        graph.spines['bottom'].set_color(taxa_plot_vs_colour[taxon])
+    
+        graph.spines['left'].set_linestyle(taxa_plot_lstyle[taxon])
         graph.spines['left'].set_linewidth(taxa_plot_ls_width[taxon])
-        graph.spines['left'].set_color(colour(taxa_plot_ls_colour[taxon]))
-        
-        graph.spines['right'].set_linestyle(line_styles \
-                                            (taxa_plot_rstyle[taxon]))
+        graph.spines['left'].set_color(taxa_plot_ls_colour[taxon])
+    
+        graph.spines['right'].set_linestyle(taxa_plot_rstyle[taxon])
         graph.spines['right'].set_linewidth(taxa_plot_rs_width[taxon])
-        graph.spines['right'].set_color(colour(taxa_plot_rs_colour[taxon]))
-            
-        graph.spines['top'].set_visible(False)
+        graph.spines['right'].set_color(taxa_plot_rs_colour[taxon])
         
+        graph.spines['top'].set_visible(False)
+    
         graph.set_ylabel(taxon, fontsize = y_title_fontsize, \
                          rotation = y_title_rotation, \
                          verticalalignment = 'bottom', y = 0.0, \
                          ha = "left", \
-                         weight = bold_on_off(taxa_taxon_b_bold[taxon]), \
-                         color = colour(taxa_taxon_c_col[taxon]))
-            
+                         weight = taxa_taxon_b_bold[taxon], \
+                         color = taxa_taxon_c_col[taxon])
+        
         graph.yaxis.labelpad = y_lab_gap
 
-        num_stack = num_stack + 1
+    ###########################################################################
+    # Function to add the depth labels and depth title to the first taxon 
+    # panel once it has been drawn.
+    def decorate_first_panel(panel):
+        taxon = panel["taxon"]
+        graph = panel["graph"]
+
+        graph.tick_params(axis = "x", which = 'major', \
+                          direction = 'out', bottom = True, \
+                          width = x_major_tick_wid, \
+                          length = x_major_tick_len, \
+                          color = taxa_x_tick_maj_colour[taxon])
+
+        if x_minor_ticks_on_off == "on":
+            graph.tick_params(axis = "x", which = 'minor', \
+                              direction = 'out', bottom = True, \
+                              width = x_minor_tick_wid, \
+                              length = x_minor_tick_len, \
+                              color = taxa_x_tick_min_colour[taxon])
+
+            set_depth_minor_locator(graph)
+
+        if x_minor_ticks_on_off == "off":
+            graph.tick_params(axis = "x", which = 'minor', \
+                              direction = 'out', bottom = False)
+
+        graph.tick_params(axis = "x", labelsize = x_lab_font, \
+                          direction = 'out', labelbottom = True, \
+                          rotation = x_lab_rot)
+
+        graph.set_xlabel(x_title, fontsize = x_title_fontsize, \
+                         rotation = x_title_rotation, \
+                         color = colour(x_title_text_colour), \
+                         weight = bold_on_off(x_title_text_bold))
+
+        # The first panel title sits higher to clear the depth labels.
+        graph.yaxis.label.set_y(0.2)
+
+    ###########################################################################
+    # Function to add any RC and INT ages above the first taxon panel.
+    def add_age_annotations(panel):
+        graph = panel["graph"]
+
+        # Add annotations for rc dates
+        if rc_ages_on_off == "on":
+
+            for label,depth in zip(rc_age_labels, rc_age_depths):
+
+                graph.annotate(label, textcoords = "data", \
+                               xy = (depth, rc_age_location_offset), \
+                               annotation_clip = False, \
+                               rotation = rc_age_labels_rotation, \
+                               ha = "center", va = "center", \
+                               weight = bold_on_off(rc_age_labels_bold), \
+                               fontsize = rc_age_labels_font_size, \
+                               color = colour(rc_age_labels_colour))
+
+            if rc_age_title_on_off == "on": 
+                graph.annotate(rc_age_title, textcoords = "data", \
+                               xy = (rc_age_title_depth, \
+                               rc_age_title_offset), \
+                               annotation_clip = False, \
+                               rotation = rc_age_title_rotation, \
+                               fontsize = rc_age_title_font_size, \
+                               color = colour(rc_age_title_colour), \
+                               ha = "right", va = "center", \
+                               weight = bold_on_off(rc_age_title_bold))
+
+    ###########################################################################
+        # Add annotations for int dates. Date line.
+        if int_ages_on_off == "on":
+
+            for label,depth in zip(int_age_labels, int_age_depths):
+
+                graph.annotate(label,textcoords = "data", \
+                               xy = (depth, int_age_location_offset), \
+                               annotation_clip = False, \
+                               rotation = int_age_labels_rotation, \
+                               ha = "center", va = "center", \
+                               weight = bold_on_off(int_age_labels_bold),\
+                               fontsize = int_age_labels_font_size, \
+                               color = colour(int_age_labels_colour))
+
+            graph.annotate(int_umd_age, textcoords ="data", \
+                           xy = (x_limit_top, int_age_location_offset),\
+                           annotation_clip =False, \
+                           rotation = int_age_labels_rotation, \
+                           ha = "center", va = "center", \
+                           weight = bold_on_off(int_age_labels_bold), \
+                           fontsize = int_age_labels_font_size,\
+                           color = colour(int_age_labels_colour))
+
+            if int_age_title_on_off == "on":
+                graph.annotate(int_age_title,textcoords ="data", \
+                               xy = (int_age_title_depth, \
+                               int_age_title_offset), \
+                               annotation_clip = False, \
+                               rotation = int_age_title_rotation, \
+                               fontsize = int_age_title_font_size, \
+                               color = colour(int_age_title_colour), \
+                               ha = "right", va = "center", \
+                               weight = bold_on_off(int_age_title_bold))
+
+            graph.annotate('', xy = (x_limit_top - int_lines_corr_l, \
+                           int_lines_offset), xycoords = 'data', \
+                           xytext = (x_limit_base + \
+                           int_lines_corr_l, \
+                           int_lines_offset), arrowprops = \
+                           dict(arrowstyle = "-", \
+                           color = colour(int_lines_colour), \
+                           linewidth = int_lines_width), \
+                           annotation_clip = False)
+
+            for depth in int_age_depths:
+
+                # All depth marker lines except top and bottom.
+                graph.annotate('', xy = (depth, int_lines_offset + 5 + \
+                              int_lines_corr), xycoords= 'data', \
+                              xytext = (depth, int_lines_offset - \
+                              int_lines_depth_length), \
+                              arrowprops = dict(arrowstyle ="-", \
+                              color = colour(int_lines_colour), \
+                              linewidth = int_lines_width), \
+                              annotation_clip = False)
+
+            graph.annotate('', xy = (x_limit_top + 1, int_lines_offset + \
+                           5 + int_lines_corr), xycoords = 'data', \
+                           xytext = (x_limit_top + 1, int_lines_offset - \
+                           int_lines_depth_length), \
+                           arrowprops = dict(arrowstyle ="-", \
+                           color = colour(int_lines_colour), \
+                           linewidth = int_lines_width), \
+                           annotation_clip = False)            
+
+            graph.annotate('', xy = (x_limit_base - 1, int_lines_offset + \
+                           5 + int_lines_corr), xycoords = 'data', \
+                           xytext = (x_limit_base - 1, int_lines_offset - \
+                           int_lines_depth_length), arrowprops = \
+                           dict(arrowstyle = "-", color = \
+                           colour(int_lines_colour), linewidth = \
+                           int_lines_width), annotation_clip = False)
+
+    # Renderer for each graph type.
+    plot_renderers = {0: draw_zones_column,
+                      1: draw_bar_plot,
+                      2: draw_bar_line_plot,
+                      3: draw_line_plot,
+                      4: draw_filled_line_plot,
+                      5: draw_line_marker_plot,
+                      6: draw_marker_plot,
+                      7: draw_stack_plot}
+
+    ###########################################################################
+    ###########################################################################
+    # Create individual plots for zone column if required and then each taxon
+    # in turn. Order is dictated by order in the input csv file. Stack plots
+    # (only 2  available at present) need to be listed as the last columns
+    # of data before the zone column if zones are used.
+    for taxon, graph in zip(data_list, ax_list): 
+        panel = prepare_panel(taxon, graph, scales["mins_round"][taxon], \
+                              scales["mins"][taxon])
+
+        # Stack plots are numbered in the order they are drawn.
+        if panel["plot_type_1"] == 7:
+            panel["num_stack"] = num_stack
+            num_stack = num_stack + 1
+
+        plot_renderers[panel["plot_type_1"]](panel)
+
+        if taxon == data_list_1 and panel["plot_type_1"] != 0:
+            decorate_first_panel(panel)
+            record_phase("taxon panels", taxon)
+            add_age_annotations(panel)
+            record_phase("RC/INT ages")
+        else:
+            record_phase("taxon panels", taxon)
+
+        print(f"\n **Plotting {taxon}**")
+
+    fig.align_ylabels(ax_list)
+    record_phase("taxon panels", "align y labels")
 
-    fig.align_ylabels(ax_list) 
+    ###########################################################################
+    ###########################################################################
+    # Add in zones to desired depths (see add_zone_lines above).
+    if zones_on_off == "on":
+        add_zone_lines(fig, ax_list[-1], ax_list[0], zone_lines[1:-1], \
+                       scales["mins_round"]["Zones"], zone_line_colour, \
+                       zone_line_style, zone_line_width)
 
-    print(f"\n **Plotting {taxon}**")
+    record_phase("zones")
 
-###########################################################################
-###########################################################################
-# Add in zones to desired depths.
-if zones_on_off == "on":
-    zone_lines = zone_lines[1:-1]
+    ###########################################################################
+    ###########################################################################
+    # Add footer and overall title.
+    if title_text_on_off == "on":
     
-    for zone, zone_col, zone_style, zone_line_w in \
-        zip(zone_lines, zone_line_colour, zone_line_style, \
-        zone_line_width):
-        
-        xy1 = (zone, min_list_round[0])
-        xy2 = (zone, 1)
+        if title_text_bold == "on":
+            title_text_bold = "bold"
+        else:
+            title_text_bold = "normal"
         
-        con = ConnectionPatch(xyA = xy1, xyB = xy2, coordsA = "data", \
-                              coordsB = "data", axesA = ax_list[-1], \
-                              axesB = ax_list[0], \
-                              color = colour(zone_col), \
-                              linestyle = line_styles(zone_style), \
-                              linewidth = zone_line_w) 
-            
-        fig.add_artist(con)
+        fig.text(title_x_pos, title_y_pos, title_text, \
+                 fontsize = title_font_size, \
+                 rotation = title_rotation, \
+                 color = colour(title_text_colour), \
+                 weight = title_text_bold)
+    
+    if footer_text_on_off == "on":
+    
+        if footer_text_bold == "on":
+            footer_text_bold = "bold"
+        else:
+             footer_text_bold = "normal"    
+    
+        fig.text(footer_x_pos, footer_y_pos, footer_text, \
+                 fontsize = footer_font_size, \
+                 rotation = footer_rotation, \
+                 color = colour( footer_text_colour), \
+                 weight = footer_text_bold)
+
+    record_phase("titles and footer")
+
+    ###########################################################################
+    ###########################################################################
+    # Add grouping annotations (see add_group_annotations above).
+    add_group_annotations(fig, dict(zip(data_list, ax_list)), annotations)
+
+    record_phase("group annotations")
 
-###########################################################################
-###########################################################################
-# Add footer and overall title.
-if title_text_on_off == "on":
+    if output_format is None:
+        return fig
     
-    if title_text_bold == "on":
-        title_text_bold = "bold"
-    else:
-        title_text_bold = "normal"
+    return figure_bytes(fig, output_format, par_dict)
+
+###############################################################################
+###############################################################################
+# Functions for watch mode (--watch). The files are kept in memory and
+# the plot is made again whenever the Parameter, Input or Extra Input file
+# is saved. Only a file that has changed is read in again.
+
+# Function to give a value that changes whenever a file is saved (None if
+# the file is missing).
+def file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Function to read a csv file unless it is unchanged since it was last 
+# read, in which case the copy in memory is used.
+def read_if_changed(path, loaded, reader = pd.read_csv):
+    stamp = file_stamp(path)
+    
+    if path not in loaded or loaded[path][0] != stamp:
+        loaded[path] = (stamp, reader(path))
         
-    fig.text(title_x_pos, title_y_pos, title_text, \
-             fontsize = title_font_size, \
-             rotation = title_rotation, \
-             color = colour(title_text_colour), \
-             weight = title_text_bold)
+    return loaded[path][1]
+
+# Function to plot and save from the files in memory, reading in again 
+# only those that have changed. The files used are returned so they can be
+# watched.
+def plot_changed(parameter_file, loaded, share_depth):
+    par = read_if_changed(parameter_file, loaded, \
+                          lambda path: read_parameter_file(path)[0])
     
-if footer_text_on_off == "on":
+    # The essential entries are checked before the files they name are read
+    # (see parse_parameters above). render finds the result already kept.
+    par_dict = run_stage("parameter parse", parse_parameters, par)
     
-    if footer_text_bold == "on":
-        footer_text_bold = "bold"
-    else:
-         footer_text_bold = "normal"    
-    
-    fig.text(footer_x_pos, footer_y_pos, footer_text, \
-             fontsize = footer_font_size, \
-             rotation = footer_rotation, \
-             color = colour( footer_text_colour), \
-             weight = footer_text_bold)
-
-###########################################################################
-###########################################################################
-# Add grouping annotations. Up to 10 are allowed at present. Should be
-# ample.
-group_line_dict = {k: v for k, v in zip(group_list, group_lw)}
-group_corr_dict = {k: v for k, v in zip(group_list, group_corr)}
-group_corr_line_dict = {k: v for k, v in zip(group_list, group_corr_line)}
-
-factor = 0.9
-factor_2 = 1
-
-if group_anno_1 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-    taxon_1_1 = group_anno_1_start
-    
-    group_dict[taxon_1_1].\
-        annotate('', xy = (group_anno_1_line_x_offset_start, \
-        group_anno_1_line_y_offset_start + \
-        group_corr_line_dict["G1"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_1_line_x_offset_end, \
-        group_anno_1_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_1_line_colour), \
-        linewidth = group_anno_1_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_1_1]. \
-        annotate(group_anno_1_title,textcoords = "data", \
-        xy = (group_anno_1_line_x_offset_start - 5, \
-        (group_anno_1_line_y_offset_start + \
-        (group_anno_1_line_y_offset_end \
-         - group_anno_1_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, ha = "center", \
-        va = "top", \
-        weight = bold_on_off(group_anno_1_title_bold), \
-        fontsize =group_anno_1_title_font_size, \
-        color = colour(group_anno_1_title_colour ))
-        
-    group_dict[taxon_1_1]. \
-        annotate('', xy = (group_anno_1_line_x_tag_end, \
-        group_anno_1_line_y_tag_end), \
-        xycoords = 'data', \
-        xytext = (group_anno_1_line_x_offset_start - \
-        group_corr_dict["G1"], \
-        group_anno_1_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_1_line_colour), \
-        linewidth = group_anno_1_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_1_1]. \
-        annotate('', xy = (group_anno_1_line_x_offset_end - \
-        group_corr_dict["G1"], \
-        group_anno_1_line_y_offset_end), \
-        xycoords = 'data', \
-        xytext = (group_anno_1_line_x_tag_end, \
-        group_anno_1_line_y_tag_end + \
-        (group_anno_1_line_y_offset_end - \
-        group_anno_1_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_1_line_colour), \
-        linewidth = group_anno_1_line_width), \
-        annotation_clip = False)
-        
-if group_anno_2 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_2_2 = group_anno_2_start
-    
-    group_dict[taxon_2_2].annotate \
-        ('', xy = (group_anno_2_line_x_offset_start, \
-        group_anno_2_line_y_offset_start + \
-        group_corr_line_dict["G2"]), \
-        xycoords = 'data', xytext = (group_anno_2_line_x_offset_end, \
-        group_anno_2_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_2_line_colour), \
-        linewidth = group_anno_2_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_2_2].annotate \
-        (group_anno_2_title, textcoords = "data", \
-         xy = (group_anno_2_line_x_offset_start - 5, \
-        (group_anno_2_line_y_offset_start + \
-        (group_anno_2_line_y_offset_end - \
-        group_anno_2_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, ha = "center", \
-        va = "top", weight = bold_on_off(group_anno_2_title_bold), \
-        fontsize =group_anno_2_title_font_size, \
-        color = colour(group_anno_2_title_colour ))
-        
-    group_dict[taxon_2_2].\
-        annotate('', xy = (group_anno_2_line_x_tag_end, \
-        group_anno_2_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_2_line_x_offset_start - factor, \
-        group_anno_2_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_2_line_colour), \
-        linewidth = group_anno_2_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_2_2]. \
-        annotate('', xy = (group_anno_2_line_x_offset_end - \
-        factor_2, group_anno_2_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_2_line_x_tag_end, \
-        group_anno_2_line_y_tag_end + \
-        (group_anno_2_line_y_offset_end - \
-        group_anno_2_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_2_line_colour), \
-        linewidth = group_anno_2_line_width), \
-        annotation_clip = False)   
-        
-if group_anno_3 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_3_3 = group_anno_3_start
-    
-    group_dict[taxon_3_3].\
-        annotate('', xy = (group_anno_3_line_x_offset_start, \
-                 group_anno_3_line_y_offset_start + \
-                 group_corr_line_dict["G3"]), \
-                 xycoords = 'data', \
-                 xytext = (group_anno_3_line_x_offset_end, \
-                 group_anno_3_line_y_offset_end ), \
-                 arrowprops = dict(arrowstyle = "-", \
-                 color = colour(group_anno_3_line_colour), \
-                 linewidth = group_anno_3_line_width), \
-                 annotation_clip = False)
-            
-    group_dict[taxon_3_3]. \
-        annotate(group_anno_3_title, textcoords = "data", \
-        xy= (group_anno_3_line_x_offset_start - 5, \
-        (group_anno_3_line_y_offset_start + \
-        (group_anno_3_line_y_offset_end - \
-        group_anno_3_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, \
-        ha = "center", va = "top", \
-        weight = bold_on_off(group_anno_3_title_bold), \
-        fontsize = group_anno_3_title_font_size, \
-        color = colour(group_anno_3_title_colour ))
-        
-    group_dict[taxon_3_3]. \
-        annotate('', xy = (group_anno_3_line_x_tag_end, \
-        group_anno_3_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_3_line_x_offset_start - \
-        factor, group_anno_3_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_3_line_colour), \
-        linewidth = group_anno_3_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_3_3]. \
-        annotate('', xy = (group_anno_3_line_x_offset_end - factor_2, \
-        group_anno_3_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_3_line_x_tag_end, \
-        group_anno_3_line_y_tag_end + \
-        (group_anno_3_line_y_offset_end - \
-        group_anno_3_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_3_line_colour), \
-        linewidth = group_anno_3_line_width), \
-        annotation_clip = False)  
-
-if group_anno_4 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_4_4 = group_anno_4_start
-    
-    group_dict[taxon_4_4]. \
-        annotate('', xy = (group_anno_4_line_x_offset_start, \
-        group_anno_4_line_y_offset_start + \
-        group_corr_line_dict["G4"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_4_line_x_offset_end, \
-        group_anno_4_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_4_line_colour), \
-        linewidth = group_anno_4_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_4_4]. \
-        annotate(group_anno_4_title, textcoords = "data", \
-        xy= (group_anno_4_line_x_offset_start - 5, \
-        (group_anno_4_line_y_offset_start + \
-        (group_anno_4_line_y_offset_end - \
-         group_anno_4_line_y_offset_start) / 2)), \
-         annotation_clip = False, rotation = 90, \
-         ha = "center", va = "top", \
-         weight = bold_on_off(group_anno_4_title_bold), \
-         fontsize = group_anno_4_title_font_size, \
-         color = colour(group_anno_4_title_colour ))
-        
-    group_dict[taxon_4_4]. \
-        annotate('', xy = (group_anno_4_line_x_tag_end, \
-        group_anno_4_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_4_line_x_offset_start - \
-        factor, group_anno_4_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_4_line_colour), \
-        linewidth = group_anno_4_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_4_4]. \
-        annotate('', xy = (group_anno_4_line_x_offset_end - factor_2, \
-        group_anno_4_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_4_line_x_tag_end, \
-        group_anno_4_line_y_tag_end + \
-        (group_anno_4_line_y_offset_end - \
-        group_anno_4_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_4_line_colour), \
-        linewidth = group_anno_4_line_width), \
-        annotation_clip = False)
-            
-if group_anno_5 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_5_5 = group_anno_5_start
-    
-    group_dict[taxon_5_5]. \
-        annotate('', xy = (group_anno_5_line_x_offset_start, \
-        group_anno_5_line_y_offset_start + \
-        group_corr_line_dict["G5"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_5_line_x_offset_end, \
-        group_anno_5_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_5_line_colour), \
-        linewidth = group_anno_5_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_5_5]. \
-        annotate(group_anno_5_title, textcoords = "data", \
-        xy= (group_anno_5_line_x_offset_start - 5, \
-        (group_anno_5_line_y_offset_start + \
-        (group_anno_5_line_y_offset_end - \
-        group_anno_5_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, \
-        ha = "center", va = "top", \
-        weight = bold_on_off(group_anno_5_title_bold), \
-        fontsize = group_anno_5_title_font_size, \
-        color = colour(group_anno_5_title_colour))
-        
-    group_dict[taxon_5_5]. \
-        annotate('', xy = (group_anno_5_line_x_tag_end, \
-        group_anno_5_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_5_line_x_offset_start - \
-        factor, group_anno_5_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_5_line_colour), \
-        linewidth = group_anno_5_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_5_5]. \
-        annotate('', xy = (group_anno_5_line_x_offset_end - factor_2, \
-        group_anno_5_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_5_line_x_tag_end, \
-        group_anno_5_line_y_tag_end + \
-        (group_anno_5_line_y_offset_end - \
-        group_anno_5_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_5_line_colour), \
-        linewidth = group_anno_5_line_width), \
-        annotation_clip = False)  
-        
-if group_anno_6 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_6_6 = group_anno_6_start
-    
-    group_dict[taxon_6_6]. \
-        annotate('', xy = (group_anno_6_line_x_offset_start, \
-                 group_anno_6_line_y_offset_start + \
-                 group_corr_line_dict["G6"]), \
-                 xycoords = 'data', \
-                 xytext = (group_anno_6_line_x_offset_end, \
-                 group_anno_6_line_y_offset_end ), \
-                 arrowprops = dict(arrowstyle = "-", \
-                 color = colour(group_anno_6_line_colour), \
-                 linewidth = group_anno_6_line_width), \
-                 annotation_clip = False)
-            
-    group_dict[taxon_6_6]. \
-        annotate(group_anno_6_title, textcoords = "data", \
-        xy= (group_anno_6_line_x_offset_start - 5, \
-        (group_anno_6_line_y_offset_start + \
-        (group_anno_6_line_y_offset_end - \
-         group_anno_6_line_y_offset_start) / 2)), \
-         annotation_clip = False, rotation = 90, \
-         ha = "center", va = "top", \
-         weight = bold_on_off(group_anno_6_title_bold), \
-         fontsize = group_anno_6_title_font_size, \
-         color = colour(group_anno_6_title_colour ))
-        
-    group_dict[taxon_6_6]. \
-        annotate('', xy = (group_anno_6_line_x_tag_end, \
-        group_anno_6_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_6_line_x_offset_start - \
-        factor, group_anno_6_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_6_line_colour), \
-        linewidth = group_anno_6_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_6_6]. \
-        annotate('', xy = (group_anno_6_line_x_offset_end - factor_2, \
-        group_anno_6_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_6_line_x_tag_end, \
-        group_anno_6_line_y_tag_end + \
-        (group_anno_6_line_y_offset_end - \
-        group_anno_6_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_6_line_colour), \
-        linewidth = group_anno_6_line_width), \
-        annotation_clip = False)  
-        
-if group_anno_7 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-    
-    taxon_7_7 = group_anno_7_start
-    
-    group_dict[taxon_7_7]. \
-        annotate('', xy = (group_anno_7_line_x_offset_start, \
-        group_anno_7_line_y_offset_start + \
-        group_corr_line_dict["G7"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_7_line_x_offset_end, \
-        group_anno_7_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_7_line_colour), \
-        linewidth = group_anno_7_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_7_7]. \
-        annotate(group_anno_7_title, textcoords = "data", \
-        xy= (group_anno_7_line_x_offset_start - 5, \
-        (group_anno_7_line_y_offset_start + \
-        (group_anno_7_line_y_offset_end - \
-        group_anno_7_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, \
-        ha = "center", va = "top", \
-        weight = bold_on_off(group_anno_7_title_bold), \
-        fontsize = group_anno_7_title_font_size, \
-        color = colour(group_anno_7_title_colour ))
-        
-    group_dict[taxon_7_7]. \
-        annotate('', xy = (group_anno_7_line_x_tag_end, \
-        group_anno_7_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_7_line_x_offset_start - \
-        factor, group_anno_7_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_7_line_colour), \
-        linewidth = group_anno_7_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_7_7]. \
-        annotate('', xy = (group_anno_7_line_x_offset_end - factor_2, \
-        group_anno_7_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_7_line_x_tag_end, \
-        group_anno_7_line_y_tag_end + \
-        (group_anno_7_line_y_offset_end - \
-        group_anno_7_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_7_line_colour), \
-        linewidth = group_anno_7_line_width), \
-        annotation_clip = False)  
-            
-if group_anno_8 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_8_8 = group_anno_8_start
-    
-    group_dict[taxon_8_8]. \
-        annotate('', xy = (group_anno_8_line_x_offset_start, \
-        group_anno_8_line_y_offset_start + \
-        group_corr_line_dict["G8"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_8_line_x_offset_end, \
-        group_anno_8_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_8_line_colour), \
-        linewidth = group_anno_8_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_8_8]. \
-        annotate(group_anno_8_title, textcoords = "data", \
-        xy= (group_anno_8_line_x_offset_start - 5, \
-        (group_anno_8_line_y_offset_start + \
-        (group_anno_8_line_y_offset_end - \
-        group_anno_8_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, \
-        ha = "center", va = "top", \
-        weight = bold_on_off(group_anno_8_title_bold), \
-        fontsize = group_anno_8_title_font_size, \
-        color = colour(group_anno_8_title_colour ))
-        
-    group_dict[taxon_8_8]. \
-        annotate('', xy = (group_anno_8_line_x_tag_end, \
-        group_anno_8_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_8_line_x_offset_start - \
-        factor, group_anno_8_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_8_line_colour), \
-        linewidth = group_anno_8_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_8_8]. \
-        annotate('', xy = (group_anno_8_line_x_offset_end - factor_2, \
-        group_anno_8_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_8_line_x_tag_end, \
-        group_anno_8_line_y_tag_end + \
-        (group_anno_8_line_y_offset_end - \
-        group_anno_8_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_8_line_colour), \
-        linewidth = group_anno_8_line_width), \
-        annotation_clip = False)  
-            
-if group_anno_9 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_9_9 = group_anno_9_start
-    
-    group_dict[taxon_9_9]. \
-        annotate('', xy = (group_anno_9_line_x_offset_start, \
-        group_anno_9_line_y_offset_start + \
-        group_corr_line_dict["G9"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_9_line_x_offset_end, \
-        group_anno_9_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_9_line_colour), \
-        linewidth = group_anno_9_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_9_9]. \
-        annotate(group_anno_9_title, textcoords = "data", \
-        xy= (group_anno_9_line_x_offset_start - 5, \
-        (group_anno_9_line_y_offset_start + \
-        (group_anno_9_line_y_offset_end - \
-        group_anno_9_line_y_offset_start) / 2)), \
-        annotation_clip = False, rotation = 90, \
-        ha = "center", va = "top", \
-        weight = bold_on_off(group_anno_9_title_bold), \
-        fontsize = group_anno_9_title_font_size, \
-        color = colour(group_anno_9_title_colour))
-        
-    group_dict[taxon_9_9]. \
-        annotate('', xy = (group_anno_9_line_x_tag_end, \
-        group_anno_9_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_9_line_x_offset_start - \
-        factor, group_anno_9_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_9_line_colour), \
-        linewidth = group_anno_9_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_9_9]. \
-        annotate('', xy = (group_anno_9_line_x_offset_end - factor_2, \
-        group_anno_9_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_9_line_x_tag_end, \
-        group_anno_9_line_y_tag_end + \
-        (group_anno_9_line_y_offset_end - \
-        group_anno_9_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_9_line_colour), \
-        linewidth = group_anno_9_line_width), \
-        annotation_clip = False) 
-            
-if group_anno_10 == "on":
-    group_dict = {taxons: graphs for taxons, graphs \
-                  in zip(data_list, ax_list)}
-        
-    taxon_10_10 = group_anno_10_start
-    
-    group_dict[taxon_10_10]. \
-        annotate('', xy = (group_anno_10_line_x_offset_start, \
-        group_anno_10_line_y_offset_start + \
-        group_corr_line_dict["G10"]), \
-        xycoords = 'data', \
-        xytext = (group_anno_10_line_x_offset_end, \
-        group_anno_10_line_y_offset_end ), \
-        arrowprops = dict(arrowstyle = "-", \
-        color = colour(group_anno_10_line_colour), \
-        linewidth = group_anno_10_line_width), \
-        annotation_clip = False)
-            
-    group_dict[taxon_10_10]. \
-        annotate(group_anno_10_title, textcoords = "data", \
-        xy= (group_anno_10_line_x_offset_start - 5, \
-        (group_anno_10_line_y_offset_start + \
-        (group_anno_10_line_y_offset_end - \
-         group_anno_10_line_y_offset_start) / 2)), \
-         annotation_clip = False, rotation = 90, \
-         ha = "center", va = "top", \
-         weight = bold_on_off(group_anno_10_title_bold), \
-         fontsize = group_anno_10_title_font_size, \
-         color = colour(group_anno_10_title_colour ))
-        
-    group_dict[taxon_10_10]. \
-        annotate('', xy = (group_anno_10_line_x_tag_end, \
-        group_anno_10_line_y_tag_end), xycoords = 'data', \
-        xytext = (group_anno_10_line_x_offset_start - \
-        factor, group_anno_10_line_y_offset_start), \
-        arrowprops = dict(arrowstyle = "-", color = \
-        colour(group_anno_10_line_colour), \
-        linewidth = group_anno_10_line_width), \
-        annotation_clip = False)
-        
-    group_dict[taxon_10_10]. \
-        annotate('', xy = (group_anno_10_line_x_offset_end - factor_2, \
-        group_anno_10_line_y_offset_end), xycoords = 'data', \
-        xytext = (group_anno_10_line_x_tag_end, \
-        group_anno_10_line_y_tag_end + \
-        (group_anno_10_line_y_offset_end - \
-        group_anno_10_line_y_offset_start)), \
-        arrowprops = dict(arrowstyle ="-", \
-        color = colour(group_anno_10_line_colour), \
-        linewidth = group_anno_10_line_width), \
-        annotation_clip = False)  
-
-###########################################################################
-###########################################################################
-# Saves the overall plot to your selected folder stated in the Parameter
-# file. Choose png, svg or pdf in the parameter file. Can choose to save
-# as alltypes in one go if sate all seperate by comma such as svg,png,pdf.
-print("")
-print("\n **Saving {}**".format(par_dict["Save as**"]))
-
-# Obtain saving formate from Parameter file
-save_list = par_dict["Save as**"].replace(" ","").lower()
-save_list = list(save_list.split(","))
-
-# Error check entries and save
-if "pdf" not in save_list and "png" not in save_list and "svg" not in \
-    save_list:
-    print("\nImage format type is not recognised. Is not png, svg or pdf."
-          " Check your parameter file entry.")
-    sys.exit()
-    
-if "pdf" in save_list:
-    plt.savefig(f"{output_name}.pdf")
-    print("")
-    print("\n**The pdf has been saved**")
+    directory = os.path.join(os.path.dirname(parameter_file), \
+                             str(par_dict["Directory**"]))
+    input_path = os.path.join(directory, par_dict["Input file name**"])
+    extra_name = str(par_dict["Extra input file name**"]).strip()
+    watched = [parameter_file, input_path]
     
-if "png" in save_list:
     try:
-        dpi_num = float(str(par_dict["Png dpi"]).replace(" ",""))
+        data = read_if_changed(input_path, loaded)
     except:
-        print("\nProblem with dpi entry in Parameter file. Check it is "
-              "numeric and a sensible value. Values between 75 for a"
-              " coarse resolution and 1000 for a high resolution image"
-              " are most likely.")
-        sys.exit()
-                    
-    if pd.isnull(dpi_num) == True:
-        print("\nDpi entry required in Parameter file if png is"
-              " specified as output format.")
+        print(f"\nProblem loading in Input file. Is {input_path} the "
+              "correct name and in correct location ? Check location and "
+              "spelling of name.")
         sys.exit()
+    
+    if extra_name != "none":
+        extra_path = os.path.join(directory, extra_name)
+        watched.append(extra_path)
         
-    plt.savefig(f"{output_name}.png", dpi = dpi_num)
-    print("")
-    print("\n**The png has been saved**")
+        try:
+            data_extra = read_if_changed(extra_path, loaded)
+        except:
+            print(f"\nProblem loading in Extra Input file. Is {extra_path}"
+                  " the correct name and in correct location ? Check "
+                  "location and spelling of name.")
+            sys.exit()
+    else:
+        data_extra = "none"
     
-if "svg" in save_list:
-    plt.savefig(f"{output_name}.svg")
-    print("")
-    print("\n**The svg has been saved.**")
+    # Drafts are plotted and saved with the draft settings (see 
+    # draft_settings above).
+    with draft_settings():
+        fig = render(par, data, data_extra, share_depth = share_depth)
+        
+        print("")
+        print("\n **Saving {}**".format(par_dict["Save as**"]))
+        
+        save_formats = read_save_formats(par_dict)
+        dpi_num = read_png_dpi(par_dict) if "png" in save_formats else None
+        output_name = os.path.join(directory, par_dict["Output file name**"])
+        
+        export_figure(fig, output_name, save_formats, dpi_num)
+    
+    return watched
 
-# Print closing message about author, year of program production and
-# authors location.
-print("")
-print("# P4 (Python Palaeo Plotting Program) #")
-print("# Written by Dr Antony Blundell #")
-print("# School of Geography #")
-print("# University of Leeds, 2022 #")
-print("")
+# Function to plot and then keep plotting each time a file is saved until
+# stopped with Ctrl+C. A problem in the files, including an error from a
+# file saved part way through an edit, is printed and the files are watched
+# until it is put right.
+def watch_files(parameter_file, share_depth):
+    loaded = {}
+    watched = [parameter_file]
+    
+    try:
+        while True:
+            start = time.perf_counter()
+            
+            try:
+                watched = plot_changed(parameter_file, loaded, share_depth)
+                print(f"\n **Plotted in {time.perf_counter() - start:.1f} "
+                      "s**")
+            except SystemExit:
+                # Files named in a problem are read in again next time.
+                loaded.clear()
+            except Exception as error:
+                print(f"\nProblem plotting from the files: {error!r}. Check "
+                      "the Parameter, Input and Extra Input files.")
+                loaded.clear()
+                
+            print("\n **Watching for changes. Press Ctrl+C to stop**")
+            stamps = [file_stamp(path) for path in watched]
+            
+            while [file_stamp(path) for path in watched] == stamps:
+                time.sleep(0.5)
+    except KeyboardInterrupt:
+        print("")
 
 ###############################################################################
 ###############################################################################
+# Only run the program from the cmd line, not when imported.
+if __name__ == "__main__":
+    # Create argument for command line so initial location for parameter
+    # file and its name can be stated.
+    parser = argparse.ArgumentParser(description = \
+                                "Variables for file and location" )
+    parser.add_argument('--input', action ='store', type = str, nargs = 2)
+    parser.add_argument('--shared-depth', action = 'store_true', \
+                        help = "All panels share one set of depth limits"
+                        " and tick locations, worked out once rather than"
+                        " for each panel.")
+    parser.add_argument('--profile', action = 'store_true', \
+                        help = "Time each phase of the program and save the"
+                        " timings as JSON next to the output.")
+    parser.add_argument('--watch', action = 'store_true', \
+                        help = "Keep running and plot again whenever the"
+                        " Parameter, Input or Extra Input file is saved.")
+    parser.add_argument('--tile-cache', action = 'store_true', \
+                        help = "Keep each panel of a png on disk and only"
+                        " draw panels that have changed when saving again.")
+    parser.add_argument('--panel-workers', action = 'store', type = int, \
+                        default = 1, \
+                        help = "Draw the panels of a png in this many worker"
+                        " processes (not available on windows).")
+    parser.add_argument('--draft', action = 'store_true', \
+                        help = "Save a quick low dpi png draft of the plot,"
+                        " without minor ticks, to check the layout.")
+    parser.add_argument('--draft-samples', action = 'store', type = int, \
+                        help = "Plot each taxon from at most about this many"
+                        " samples in a draft.")
+    parser.add_argument('--decimate', action = 'store_true', \
+                        help = "Plot line, filled line and marker panels"
+                        " from only the samples that can be seen at the"
+                        " dpi saved at, keeping every peak.")
+
+    args = parser.parse_args()
+
+    location = args.input[0]
+    file_name = args.input[1]
+    share_depth = args.shared_depth
+    profile = args.profile
+    watch = args.watch
+    tile_cache = args.tile_cache
+    panel_workers = args.panel_workers
+    draft = args.draft
+    draft_samples = args.draft_samples
+    decimate = args.decimate
+
+    # If using from an IDE comment out argparse part above and use the two
+    # lines below. Fill them in with parameter file location separarted by 
+    # \\. Fill in the parameter file name.
+    # location = "F:\\P4"
+    # file_name = "KM_Macro_Parameter.csv"
+    # share_depth = False
+    # profile = False
+    # watch = False
+    # tile_cache = False
+    # panel_workers = 1
+    # draft = False
+    # draft_samples = None
+    # decimate = False
+
+    # Print out Program title, author and place of origin
+    print("")
+    print("P4 ")
+    print("(PYTHON PALAEO PLOTTING PROGRAM) written by Dr Antony Blundell")
+    print("School of Geography, University of Leeds, 2022")
+
+    # The program uses a user preferences form the Parameter file, the 
+    # location of which is supplied in the information above from the cmd
+    # line.
+    if os.path.isdir(location) == False:
+        print("\nProblem with address of Parameter file. Is it spelt "
+              "correctly, in the correct location or actually exist?")
+        sys.exit()
+
+    parameter_file = os.path.join(location, file_name)
+    
+    # Keep plotting whenever a file is saved if --watch is used. The normal
+    # single plot and save below is not needed.
+    if watch == True:
+        watch_files(parameter_file, share_depth)
+        sys.exit()
+    
+    par, parameter_dir = read_parameter_file(parameter_file)
+    par_dict = {Q: R for Q, R in zip(par["PARAMETERS"], par["ENTRY"])}
 
+    # Drafts are plotted and saved with the draft settings (see 
+    # draft_settings above).
+    with draft_settings():
+        fig = render(parameter_file, share_depth = share_depth)
+
+        # Saves the overall plot to your selected folder stated in the 
+        # Parameter file.
+        print("")
+        print("\n **Saving {}**".format(par_dict["Save as**"]))
+
+        save_formats = read_save_formats(par_dict)
+        dpi_num = read_png_dpi(par_dict) if "png" in save_formats else None
+
+        # Determine stated output file name for pdf, png and svg outputs 
+        # from Parameters.csv file.
+        output_name = os.path.join(location, str(par_dict["Directory**"]), \
+                                   par_dict["Output file name**"])
+
+        export_figure(fig, output_name, save_formats, dpi_num)
+
+    if draft == True:
+        print("")
+        print(f"\n**The draft took "
+              f"{time.perf_counter() - program_start:.1f} s**")
+
+    # Save the phase timings next to the output if --profile is used.
+    if profile == True:
+        phase_times["total"] = time.perf_counter() - program_start
+    
+        with open(f"{output_name}_profile.json", "w") as profile_file:
+            json.dump(phase_times, profile_file, indent = 4)
+        
+        print("")
+        print(f"\n**The profile has been saved as "
+              f"{output_name}_profile.json**")
+
+    # Print closing message about author, year of program production and
+    # authors location.
+    print("")
+    print("# P4 (Python Palaeo Plotting Program) #")
+    print("# Written by Dr Antony Blundell #")
+    print("# School of Geography #")
+    print("# University of Leeds, 2022 #")
+    print("")
+
+###############################################################################
 ###############################################################################
-###############################################################################
\ No newline at end of file
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""###############################################################################
+   P4 TESTS
+
+    Checks of P4_v02.py run with pytest from the program directory
+
+    python -m pytest test_P4_v02.py
+
+###############################################################################"""
+
+import numpy as np
+import pandas as pd
+import os
+import matplotlib.image
+import matplotlib.pyplot as plt
+import P4_v02
+
+# The examples and the program itself are kept in the same directory as this
+# file.
+program_dir = os.path.dirname(os.path.abspath(__file__))
+
+###############################################################################
+###############################################################################
+# Function to write a copy of the KM_Macro Parameter file that saves a png
+# into the given directory. Returns the Parameter file and output name.
+def km_macro_parameters(run_dir):
+    par = pd.read_csv(os.path.join(program_dir, "KM_Macro_Parameter.csv"))
+    output_name = os.path.join(run_dir, "output")
+    entries = {"Directory**": program_dir, \
+               "Output file name**": output_name, \
+               "Save as**": "png", \
+               "Png dpi": 100}
+
+    for name, entry in entries.items():
+        par.loc[par["PARAMETERS"] == name, "ENTRY"] = entry
+
+    parameter_file = os.path.join(run_dir, "KM_Macro_Parameter.csv")
+    par.to_csv(parameter_file, index = False)
+
+    return parameter_file, output_name
+
+# Function to plot the Parameter file and save it as a png with or without
+# the tile cache. Returns the pixels saved.
+def saved_png(parameter_file, output_name, tile_cache):
+    fig = P4_v02.render(parameter_file)
+
+    try:
+        P4_v02.tile_cache = tile_cache
+        P4_v02.save_figure(fig, output_name, "png", 100)
+    finally:
+        P4_v02.tile_cache = False
+        plt.close(fig)
+
+    return matplotlib.image.imread(f"{output_name}.png")
+
+###############################################################################
+###############################################################################
+# A png saved from an empty tile cache (cold) and from the tiles saved by it
+# (warm) both match the png saved without the cache to within rounding.
+def test_tile_cache_matches_plain_png(tmp_path):
+    parameter_file, output_name = km_macro_parameters(str(tmp_path))
+
+    plain = saved_png(parameter_file, output_name, False)
+    cold = saved_png(parameter_file, output_name, True)
+    warm = saved_png(parameter_file, output_name, True)
+
+    for cached in [cold, warm]:
+        assert cached.shape == plain.shape
+        assert np.abs(cached - plain).max() <= 1 / 255 + 1e-6